@@ -31,6 +31,8 @@ from reddit_insight.analysis.competitive import (
     to_dict,
     to_markdown,
 )
+from reddit_insight.analysis.context import AnalysisContext
+from reddit_insight.analysis.corpus import PostCorpus, as_corpus, iter_post_texts
 from reddit_insight.analysis.demand_analyzer import (
     DemandAnalyzer,
     DemandCluster,
@@ -53,6 +55,7 @@ from reddit_insight.analysis.demand_patterns import (
     DemandMatch,
     DemandPattern,
     DemandPatternLibrary,
+    DemandPatternScanner,
 )
 from reddit_insight.analysis.entity_recognition import (
     ENTITY_PATTERNS,
@@ -64,6 +67,7 @@ from reddit_insight.analysis.entity_recognition import (
     PatternEntityExtractor,
     ProductEntity,
 )
+from reddit_insight.analysis.keyword_matcher import KeywordMatcher
 from reddit_insight.analysis.keywords import (
     Keyword,
     KeywordExtractorConfig,
@@ -91,6 +95,7 @@ from reddit_insight.analysis.sentiment import (
     EntitySentiment,
     EntitySentimentAnalyzer,
     RuleBasedSentimentAnalyzer,
+    ScoredTokens,
     Sentiment,
     SentimentAnalyzerConfig,
     SentimentScore,
@@ -100,7 +105,7 @@ from reddit_insight.analysis.stopwords import (
     ensure_nltk_data,
     get_default_stopwords,
 )
-from reddit_insight.analysis.tfidf import TFIDFAnalyzer, TFIDFConfig
+from reddit_insight.analysis.tfidf import DocumentKeywords, TFIDFAnalyzer, TFIDFConfig
 from reddit_insight.analysis.time_series import (
     TimeGranularity,
     TimePoint,
@@ -125,6 +130,11 @@ __all__ = [
     "StopwordManager",
     "get_default_stopwords",
     "ensure_nltk_data",
+    # Corpus and shared context
+    "PostCorpus",
+    "AnalysisContext",
+    "as_corpus",
+    "iter_post_texts",
     # Keywords - Data Classes
     "Keyword",
     "KeywordResult",
@@ -136,6 +146,7 @@ __all__ = [
     # TF-IDF
     "TFIDFAnalyzer",
     "TFIDFConfig",
+    "DocumentKeywords",
     # Time Series
     "TimeSeries",
     "TimePoint",
@@ -148,6 +159,7 @@ __all__ = [
     "TrendMetrics",
     "KeywordTrendAnalyzer",
     "KeywordTrendResult",
+    "KeywordMatcher",
     # Rising Keywords
     "RisingScore",
     "RisingConfig",
@@ -160,6 +172,7 @@ __all__ = [
     "DemandPattern",
     "DemandMatch",
     "DemandPatternLibrary",
+    "DemandPatternScanner",
     "ENGLISH_PATTERNS",
     "KOREAN_PATTERNS",
     # Demand Detector
@@ -189,6 +202,7 @@ __all__ = [
     "SentimentScore",
     "SentimentAnalyzerConfig",
     "RuleBasedSentimentAnalyzer",
+    "ScoredTokens",
     "EntitySentiment",
     "EntitySentimentAnalyzer",
     # Sentiment Lexicons
@@ -22,9 +22,7 @@ from datetime import datetime
 from enum import Enum
 from typing import TYPE_CHECKING
 
-if TYPE_CHECKING:
-    from reddit_insight.reddit.models import Post
-
+from reddit_insight.analysis.corpus import PostCorpus, as_corpus
 from reddit_insight.analysis.entity_recognition import (
     EntityRecognizer,
     EntityType,
@@ -37,6 +35,18 @@ from reddit_insight.analysis.sentiment import (
     SentimentScore,
 )
 
+if TYPE_CHECKING:
+    from reddit_insight.analysis.context import AnalysisContext
+    from reddit_insight.reddit.models import Post
+
+
+def _lowercase(text: str, context: AnalysisContext | None) -> str:
+    """Lowercase text, reusing the shared analysis context when available."""
+    if context is not None:
+        return context.lower(text)
+    return text.lower()
+
+
 # ============================================================================
 # Complaint Types and Data Structures
 # ============================================================================
@@ -232,6 +242,7 @@ class ComplaintExtractor:
 
     _entity_recognizer: EntityRecognizer | None = field(default=None, repr=False)
     _sentiment_analyzer: RuleBasedSentimentAnalyzer | None = field(default=None, repr=False)
+    context: AnalysisContext | None = field(default=None, repr=False)
     _compiled_patterns: dict[str, re.Pattern[str]] = field(
         default_factory=dict, init=False, repr=False
     )
@@ -241,7 +252,7 @@ class ComplaintExtractor:
         if self._entity_recognizer is None:
             self._entity_recognizer = EntityRecognizer()
         if self._sentiment_analyzer is None:
-            self._sentiment_analyzer = RuleBasedSentimentAnalyzer()
+            self._sentiment_analyzer = RuleBasedSentimentAnalyzer(context=self.context)
 
         # Compile patterns
         for pattern_id, regex, _, _ in COMPLAINT_PATTERNS:
@@ -260,7 +271,7 @@ class ComplaintExtractor:
         Returns:
             ComplaintType classification
         """
-        text_lower = text.lower()
+        text_lower = _lowercase(text, self.context)
 
         # Count keyword matches for each type
         type_scores: dict[ComplaintType, int] = {}
@@ -333,7 +344,7 @@ class ComplaintExtractor:
         Returns:
             List of detected keywords
         """
-        text_lower = text.lower()
+        text_lower = _lowercase(text, self.context)
         keywords = []
 
         for keyword_set in COMPLAINT_TYPE_KEYWORDS.values():
@@ -577,6 +588,7 @@ class AlternativeExtractor:
 
     _entity_recognizer: EntityRecognizer | None = field(default=None, repr=False)
     _sentiment_analyzer: RuleBasedSentimentAnalyzer | None = field(default=None, repr=False)
+    context: AnalysisContext | None = field(default=None, repr=False)
     _compiled_patterns: dict[str, re.Pattern[str]] = field(
         default_factory=dict, init=False, repr=False
     )
@@ -586,7 +598,7 @@ class AlternativeExtractor:
         if self._entity_recognizer is None:
             self._entity_recognizer = EntityRecognizer()
         if self._sentiment_analyzer is None:
-            self._sentiment_analyzer = RuleBasedSentimentAnalyzer()
+            self._sentiment_analyzer = RuleBasedSentimentAnalyzer(context=self.context)
 
         # Compile patterns
         for pattern_id, regex, _, _ in ALTERNATIVE_PATTERNS:
@@ -626,7 +638,7 @@ class AlternativeExtractor:
         assert self._sentiment_analyzer is not None
 
         # Find context around entity mention
-        text_lower = text.lower()
+        text_lower = _lowercase(text, self.context)
         entity_lower = entity_name.lower()
         pos = text_lower.find(entity_lower)
 
@@ -824,17 +836,36 @@ class CompetitiveAnalyzer:
     _sentiment_analyzer: EntitySentimentAnalyzer | None = field(default=None, repr=False)
     _complaint_extractor: ComplaintExtractor | None = field(default=None, repr=False)
     _alternative_extractor: AlternativeExtractor | None = field(default=None, repr=False)
+    context: AnalysisContext | None = field(default=None, repr=False)
 
     def __post_init__(self) -> None:
-        """Initialize all sub-analyzers."""
+        """
+        Initialize all sub-analyzers.
+
+        Default sub-analyzers share one rule-based sentiment analyzer and the
+        analysis context, so a complaint or comparison context is tokenized
+        once no matter how many extractors score it.
+        """
         if self._entity_recognizer is None:
-            self._entity_recognizer = EntityRecognizer()
+            self._entity_recognizer = EntityRecognizer(context=self.context)
+        rule_based = RuleBasedSentimentAnalyzer(context=self.context)
         if self._sentiment_analyzer is None:
-            self._sentiment_analyzer = EntitySentimentAnalyzer()
+            self._sentiment_analyzer = EntitySentimentAnalyzer(
+                _entity_recognizer=self._entity_recognizer,
+                _sentiment_analyzer=rule_based,
+            )
         if self._complaint_extractor is None:
-            self._complaint_extractor = ComplaintExtractor()
+            self._complaint_extractor = ComplaintExtractor(
+                _entity_recognizer=self._entity_recognizer,
+                _sentiment_analyzer=rule_based,
+                context=self.context,
+            )
         if self._alternative_extractor is None:
-            self._alternative_extractor = AlternativeExtractor()
+            self._alternative_extractor = AlternativeExtractor(
+                _entity_recognizer=self._entity_recognizer,
+                _sentiment_analyzer=rule_based,
+                context=self.context,
+            )
 
     def _combine_post_text(self, post: Post) -> str:
         """Combine post title and selftext."""
@@ -904,12 +935,15 @@ class CompetitiveAnalyzer:
 
         return recommendations
 
-    def analyze_posts(self, posts: list[Post]) -> CompetitiveReport:
+    def analyze_posts(self, posts: list[Post] | PostCorpus) -> CompetitiveReport:
         """
         Analyze posts for competitive insights.
 
+        Posts are converted to a PostCorpus once and shared with the
+        entity recognizer and sentiment analyzer.
+
         Args:
-            posts: List of Post objects to analyze
+            posts: List of Post objects or a PostCorpus to analyze
 
         Returns:
             CompetitiveReport with comprehensive insights
@@ -927,11 +961,11 @@ class CompetitiveAnalyzer:
         assert self._alternative_extractor is not None
 
         # Collect all text
-        all_texts = [self._combine_post_text(p) for p in posts]
-        combined_text = " ".join(all_texts)
+        corpus = as_corpus(posts)
+        all_texts = list(corpus.texts())
 
         # Extract entities
-        entity_dict = self._entity_recognizer.recognize_in_posts(posts)
+        entity_dict = self._entity_recognizer.recognize_in_posts(corpus)
 
         # Extract complaints
         all_complaints: list[Complaint] = []
@@ -958,7 +992,7 @@ class CompetitiveAnalyzer:
         ]
 
         # Get entity sentiments
-        entity_sentiments = self._sentiment_analyzer.analyze_posts(posts)
+        entity_sentiments = self._sentiment_analyzer.analyze_posts(corpus)
 
         # Build insights per entity
         insights: list[CompetitiveInsight] = []
@@ -1032,7 +1066,7 @@ class CompetitiveAnalyzer:
         )
 
     def get_entity_insight(
-        self, entity_name: str, posts: list[Post]
+        self, entity_name: str, posts: list[Post] | PostCorpus
     ) -> CompetitiveInsight | None:
         """
         Get insight for a specific entity.
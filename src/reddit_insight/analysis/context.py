@@ -0,0 +1,137 @@
+"""
+Shared per-run text analysis context.
+
+A full analysis run feeds the same post texts to several analyzers (keywords,
+trends, demand, competitive), each of which used to lowercase, clean and
+tokenize them on its own. ``AnalysisContext`` computes those derived views once
+per document and caches them for the lifetime of the run.
+
+Pass one context to every analyzer of a run and drop it when the run ends;
+analyzers without a context behave exactly as before and cache nothing.
+
+Example:
+    >>> context = AnalysisContext()
+    >>> keywords = UnifiedKeywordExtractor(context=context).extract_from_posts(corpus)
+    >>> demands = DemandAnalyzer(context=context).analyze_posts(corpus)
+    >>> competitive = CompetitiveAnalyzer(context=context).analyze_posts(corpus)
+"""
+
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from reddit_insight.analysis.stopwords import clean_reddit_text
+from reddit_insight.analysis.tokenizer import RedditTokenizer
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+T = TypeVar("T")
+
+# Characters that end a sentence for context extraction
+_BOUNDARY_PATTERN = re.compile(r"[.!?\n]")
+
+
+class AnalysisContext:
+    """
+    Per-run cache of derived text views, keyed by document text.
+
+    Built-in views are lowercased text, Reddit-cleaned text, RedditTokenizer
+    tokens, whitespace-split lowercase words and sentence boundary positions.
+    Analyzers can cache their own views with ``memo``.
+
+    Cached values are shared between analyzers and must not be mutated.
+
+    Attributes:
+        hits: Number of lookups served from the cache
+        misses: Number of lookups that computed a new value
+    """
+
+    def __init__(self, tokenizer: RedditTokenizer | None = None) -> None:
+        """
+        Initialize an empty context.
+
+        Args:
+            tokenizer: Tokenizer for ``tokens`` (default: RedditTokenizer with
+                default config, created on first use)
+        """
+        self._tokenizer = tokenizer
+        self._views: dict[str, dict[str, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"AnalysisContext(views={sorted(self._views)}, "
+            f"hits={self.hits}, misses={self.misses})"
+        )
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Caches are run-scoped; never pickle them (e.g. with a saved TF-IDF model)
+        return {"_tokenizer": self._tokenizer}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self._tokenizer = state.get("_tokenizer")
+        self._views = {}
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def tokenizer(self) -> RedditTokenizer:
+        """Tokenizer used for the ``tokens`` view."""
+        if self._tokenizer is None:
+            self._tokenizer = RedditTokenizer()
+        return self._tokenizer
+
+    def memo(self, view: str, text: str, compute: Callable[[str], T]) -> T:
+        """
+        Return ``compute(text)``, computing it at most once per view and text.
+
+        Args:
+            view: Cache namespace (one per kind of derived value)
+            text: Document text
+            compute: Function deriving the value from the text
+
+        Returns:
+            Cached or freshly computed value
+        """
+        cache = self._views.get(view)
+        if cache is None:
+            cache = self._views[view] = {}
+        try:
+            value: T = cache[text]
+        except KeyError:
+            self.misses += 1
+            value = cache[text] = compute(text)
+        else:
+            self.hits += 1
+        return value
+
+    def lower(self, text: str) -> str:
+        """Lowercased text."""
+        return self.memo("lower", text, str.lower)
+
+    def cleaned(self, text: str) -> str:
+        """Text with Reddit-specific noise (URLs, mentions, markdown) removed."""
+        return self.memo("cleaned", text, clean_reddit_text)
+
+    def tokens(self, text: str) -> list[str]:
+        """Normalized RedditTokenizer tokens."""
+        return self.memo("tokens", text, self.tokenizer.tokenize)
+
+    def words(self, text: str) -> list[str]:
+        """Whitespace-split lowercase words."""
+        return self.memo("words", text, lambda t: self.lower(t).split())
+
+    def sentence_boundaries(self, text: str) -> list[int]:
+        """Sorted positions of sentence boundary characters (``.!?`` and newline)."""
+        return self.memo(
+            "sentence_boundaries",
+            text,
+            lambda t: [m.start() for m in _BOUNDARY_PATTERN.finditer(t)],
+        )
+
+    def clear(self) -> None:
+        """Drop all cached views."""
+        self._views.clear()
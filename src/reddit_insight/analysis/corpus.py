@@ -0,0 +1,417 @@
+"""
+Columnar in-memory post corpus.
+
+Stores a collection of posts as parallel NumPy arrays (timestamps, scores,
+comment counts) plus a single text buffer with offsets, instead of one
+Pydantic ``Post`` object per post. Analyzers in this package accept either
+``list[Post]`` or a ``PostCorpus``; building the corpus once and sharing it
+between analyzers avoids re-deriving ``title + " " + selftext`` per analyzer.
+
+Example:
+    >>> corpus = PostCorpus.from_posts(posts)
+    >>> keywords = UnifiedKeywordExtractor().extract_from_posts(corpus)
+    >>> trends = KeywordTrendAnalyzer().analyze_multiple_keywords(corpus, ["python"])
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from itertools import pairwise
+from typing import TYPE_CHECKING, Union
+
+import numpy as np
+
+from reddit_insight.analysis.time_series import TimeGranularity
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, Iterable, Iterator, Sequence
+
+    from numpy.typing import NDArray
+
+    from reddit_insight.reddit.models import Post
+
+
+SECONDS_PER_HOUR = 3_600
+SECONDS_PER_DAY = 86_400
+# 1970-01-01 was a Thursday (weekday 3)
+_EPOCH_WEEKDAY = 3
+
+
+class PostCorpus:
+    """
+    Columnar, read-only collection of posts.
+
+    Text is stored once: each post occupies ``buffer[offsets[i]:offsets[i + 1]]``
+    holding the combined ``"title selftext"`` text (just the title when there is
+    no selftext). Title and selftext can still be recovered separately via
+    ``title_ends``. Subreddit names are interned into a small lookup table.
+
+    Attributes:
+        ids: Reddit post IDs
+        created_utc: Creation time as UTC epoch seconds (float64)
+        score: Post scores (int64)
+        num_comments: Comment counts (int64)
+    """
+
+    __slots__ = (
+        "_bucket_cache",
+        "_buffer",
+        "_naive_timestamps",
+        "_offsets",
+        "_subreddit_codes",
+        "_subreddit_names",
+        "_title_ends",
+        "created_utc",
+        "ids",
+        "num_comments",
+        "score",
+    )
+
+    def __init__(
+        self,
+        ids: list[str],
+        created_utc: NDArray[np.float64],
+        score: NDArray[np.int64],
+        num_comments: NDArray[np.int64],
+        buffer: str,
+        offsets: NDArray[np.int64],
+        title_ends: NDArray[np.int64],
+        subreddit_codes: NDArray[np.int32],
+        subreddit_names: list[str],
+        naive_timestamps: bool = False,
+    ) -> None:
+        """
+        Initialize from prebuilt columns. Use from_posts() in most cases.
+
+        Args:
+            ids: Reddit post IDs
+            created_utc: UTC epoch seconds per post
+            score: Score per post
+            num_comments: Comment count per post
+            buffer: Concatenated post texts
+            offsets: Text start offsets (length n + 1)
+            title_ends: End offset of each title within the buffer
+            subreddit_codes: Index into subreddit_names per post
+            subreddit_names: Interned subreddit names
+            naive_timestamps: Return naive (UTC) datetimes, matching the source posts
+        """
+        n = len(ids)
+        if not (
+            len(created_utc) == len(score) == len(num_comments) == len(title_ends) == n
+            and len(subreddit_codes) == n
+            and len(offsets) == n + 1
+        ):
+            raise ValueError("PostCorpus columns must have matching lengths")
+
+        self.ids = ids
+        self.created_utc = created_utc
+        self.score = score
+        self.num_comments = num_comments
+        self._buffer = buffer
+        self._offsets = offsets
+        self._title_ends = title_ends
+        self._subreddit_codes = subreddit_codes
+        self._subreddit_names = subreddit_names
+        self._naive_timestamps = naive_timestamps
+        self._bucket_cache: dict[TimeGranularity, tuple[list[datetime], NDArray[np.intp]]] = {}
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_posts(cls, posts: Iterable[Post]) -> PostCorpus:
+        """
+        Build a corpus from Post objects.
+
+        Args:
+            posts: Posts to convert (any iterable, consumed once)
+
+        Returns:
+            New PostCorpus
+        """
+        builder = _CorpusBuilder()
+        builder.extend(posts)
+        return builder.build()
+
+    @classmethod
+    async def from_stream(cls, chunks: AsyncIterable[list[Post]]) -> PostCorpus:
+        """
+        Build a corpus from an async stream of post chunks.
+
+        Pairs with ``PostRepository.stream_by_subreddit`` so that only one chunk
+        of Post objects is alive at a time while loading.
+
+        Args:
+            chunks: Async iterable yielding lists of posts
+
+        Returns:
+            New PostCorpus
+        """
+        builder = _CorpusBuilder()
+        async for chunk in chunks:
+            builder.extend(chunk)
+        return builder.build()
+
+    # ------------------------------------------------------------------
+    # Access
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __repr__(self) -> str:
+        return f"PostCorpus(posts={len(self)}, nbytes={self.nbytes})"
+
+    def text(self, index: int) -> str:
+        """Combined title and selftext of one post."""
+        return self._buffer[self._offsets[index] : self._offsets[index + 1]]
+
+    def title(self, index: int) -> str:
+        """Title of one post."""
+        return self._buffer[self._offsets[index] : self._title_ends[index]]
+
+    def selftext(self, index: int) -> str:
+        """Selftext of one post (empty string if none)."""
+        start = self._title_ends[index] + 1
+        end = self._offsets[index + 1]
+        return self._buffer[start:end] if start <= end else ""
+
+    def texts(self) -> Iterator[str]:
+        """Iterate combined texts in corpus order."""
+        buffer = self._buffer
+        offsets = self._offsets.tolist()
+        for start, end in pairwise(offsets):
+            yield buffer[start:end]
+
+    def subreddit(self, index: int) -> str:
+        """Subreddit name of one post."""
+        return self._subreddit_names[int(self._subreddit_codes[index])]
+
+    def created_at(self, index: int) -> datetime:
+        """Creation time of one post as a datetime."""
+        return self._to_datetime(float(self.created_utc[index]))
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory used by the columns and text buffer."""
+        arrays = (
+            self.created_utc,
+            self.score,
+            self.num_comments,
+            self._offsets,
+            self._title_ends,
+            self._subreddit_codes,
+        )
+        text_bytes = len(self._buffer.encode("utf-8"))
+        id_bytes = sum(len(i) for i in self.ids)
+        return sum(a.nbytes for a in arrays) + text_bytes + id_bytes
+
+    # ------------------------------------------------------------------
+    # Selection and time bucketing
+    # ------------------------------------------------------------------
+
+    def take(self, indices: Sequence[int] | NDArray[np.intp]) -> PostCorpus:
+        """
+        Build a sub-corpus from the given post indices.
+
+        Args:
+            indices: Post positions to keep, in the desired order
+
+        Returns:
+            New PostCorpus containing only those posts
+        """
+        idx = np.asarray(indices, dtype=np.intp)
+        builder = _CorpusBuilder()
+        for i in idx.tolist():
+            builder.append(
+                self.ids[i],
+                self.title(i),
+                self.selftext(i),
+                self.subreddit(i),
+                float(self.created_utc[i]),
+                int(self.score[i]),
+                int(self.num_comments[i]),
+            )
+        builder.naive_timestamps = self._naive_timestamps
+        return builder.build()
+
+    def between(self, start: datetime, end: datetime) -> PostCorpus:
+        """
+        Posts created in ``[start, end)``.
+
+        Args:
+            start: Start of range (inclusive)
+            end: End of range (exclusive)
+
+        Returns:
+            New PostCorpus containing matching posts
+        """
+        lo = _epoch_seconds(start)
+        hi = _epoch_seconds(end)
+        mask = (self.created_utc >= lo) & (self.created_utc < hi)
+        return self.take(np.flatnonzero(mask))
+
+    def bucket_index(
+        self, granularity: TimeGranularity
+    ) -> tuple[list[datetime], NDArray[np.intp]]:
+        """
+        Assign every post to a time bucket.
+
+        Equivalent to calling ``bucket_timestamp`` per post, but vectorized and
+        cached per granularity.
+
+        Args:
+            granularity: Time unit for buckets
+
+        Returns:
+            Tuple of (sorted bucket start datetimes, bucket position per post)
+        """
+        cached = self._bucket_cache.get(granularity)
+        if cached is not None:
+            return cached
+
+        starts = _bucket_starts(self.created_utc, granularity)
+        unique, inverse = np.unique(starts, return_inverse=True)
+        buckets = [self._to_datetime(float(ts)) for ts in unique.tolist()]
+        result = (buckets, inverse.astype(np.intp, copy=False))
+        self._bucket_cache[granularity] = result
+        return result
+
+    def _to_datetime(self, epoch: float) -> datetime:
+        dt = datetime.fromtimestamp(epoch, tz=UTC)
+        return dt.replace(tzinfo=None) if self._naive_timestamps else dt
+
+
+class _CorpusBuilder:
+    """Accumulates posts into column lists before freezing them into arrays."""
+
+    def __init__(self) -> None:
+        self.ids: list[str] = []
+        self.parts: list[str] = []
+        self.offsets: list[int] = [0]
+        self.title_ends: list[int] = []
+        self.created: list[float] = []
+        self.scores: list[int] = []
+        self.comments: list[int] = []
+        self.codes: list[int] = []
+        self.names: dict[str, int] = {}
+        self.naive_timestamps: bool | None = None
+
+    def extend(self, posts: Iterable[Post]) -> None:
+        for post in posts:
+            created = post.created_utc
+            naive = created.tzinfo is None
+            if self.naive_timestamps is None:
+                self.naive_timestamps = naive
+            self.append(
+                post.id,
+                post.title,
+                post.selftext,
+                post.subreddit,
+                _epoch_seconds(created),
+                post.score,
+                post.num_comments,
+            )
+
+    def append(
+        self,
+        post_id: str,
+        title: str,
+        selftext: str,
+        subreddit: str,
+        created: float,
+        score: int,
+        num_comments: int,
+    ) -> None:
+        start = self.offsets[-1]
+        self.ids.append(post_id)
+        self.parts.append(title)
+        title_end = start + len(title)
+        end = title_end
+        if selftext:
+            self.parts.append(" ")
+            self.parts.append(selftext)
+            end += 1 + len(selftext)
+        self.title_ends.append(title_end)
+        self.offsets.append(end)
+        self.created.append(created)
+        self.scores.append(score)
+        self.comments.append(num_comments)
+        self.codes.append(self.names.setdefault(subreddit, len(self.names)))
+
+    def build(self) -> PostCorpus:
+        return PostCorpus(
+            ids=self.ids,
+            created_utc=np.asarray(self.created, dtype=np.float64),
+            score=np.asarray(self.scores, dtype=np.int64),
+            num_comments=np.asarray(self.comments, dtype=np.int64),
+            buffer="".join(self.parts),
+            offsets=np.asarray(self.offsets, dtype=np.int64),
+            title_ends=np.asarray(self.title_ends, dtype=np.int64),
+            subreddit_codes=np.asarray(self.codes, dtype=np.int32),
+            subreddit_names=list(self.names),
+            naive_timestamps=bool(self.naive_timestamps),
+        )
+
+
+# Analyzer input: a list of Post objects or a prebuilt corpus
+PostSource = Union["Sequence[Post]", PostCorpus]
+
+
+def as_corpus(posts: PostSource) -> PostCorpus:
+    """
+    Return posts as a PostCorpus, converting only if needed.
+
+    Args:
+        posts: Post list or existing corpus
+
+    Returns:
+        PostCorpus (the same object if one was passed)
+    """
+    if isinstance(posts, PostCorpus):
+        return posts
+    return PostCorpus.from_posts(posts)
+
+
+def iter_post_texts(posts: PostSource) -> Iterator[str]:
+    """
+    Iterate combined ``"title selftext"`` texts of posts.
+
+    Args:
+        posts: Post list or corpus
+
+    Yields:
+        Combined text per post (title only when there is no selftext)
+    """
+    if isinstance(posts, PostCorpus):
+        yield from posts.texts()
+        return
+    for post in posts:
+        yield f"{post.title} {post.selftext}" if post.selftext else post.title
+
+
+def _epoch_seconds(dt: datetime) -> float:
+    """Datetime to UTC epoch seconds; naive datetimes are treated as UTC."""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=UTC)
+    return dt.timestamp()
+
+
+def _bucket_starts(
+    created_utc: NDArray[np.float64], granularity: TimeGranularity
+) -> NDArray[np.int64]:
+    """Vectorized ``bucket_timestamp`` on epoch seconds."""
+    seconds = np.floor(created_utc).astype(np.int64)
+    if granularity == TimeGranularity.HOUR:
+        return seconds - seconds % SECONDS_PER_HOUR
+    if granularity == TimeGranularity.DAY:
+        return seconds - seconds % SECONDS_PER_DAY
+    if granularity == TimeGranularity.WEEK:
+        days = seconds // SECONDS_PER_DAY
+        monday = days - (days + _EPOCH_WEEKDAY) % 7
+        return monday * SECONDS_PER_DAY
+    if granularity == TimeGranularity.MONTH:
+        months = seconds.astype("datetime64[s]").astype("datetime64[M]")
+        return months.astype("datetime64[s]").astype(np.int64)
+    raise ValueError(f"Unknown granularity: {granularity}")
@@ -14,8 +14,10 @@ Example:
 from __future__ import annotations
 
 import math
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from itertools import chain, pairwise
 from typing import TYPE_CHECKING
 
 from reddit_insight.analysis.demand_detector import (
@@ -27,6 +29,10 @@ from reddit_insight.analysis.demand_patterns import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Set as AbstractSet
+
+    from reddit_insight.analysis.context import AnalysisContext
+    from reddit_insight.analysis.corpus import PostCorpus
     from reddit_insight.analysis.keywords import UnifiedKeywordExtractor
     from reddit_insight.reddit.models import Post
 
@@ -98,16 +104,116 @@ class DemandCluster:
         return sum(m.confidence for m in self.matches) / len(self.matches)
 
 
+# MinHash 해시 함수 h(x) = (a * x + b) mod p 의 소수 (2^31 - 1)
+_MINHASH_PRIME = (1 << 31) - 1
+# MinHash 계수 생성 시드 (실행마다 같은 클러스터를 얻기 위해 고정)
+_MINHASH_SEED = 0x5EED
+
+
+def _jaccard(keywords1: AbstractSet[str], keywords2: AbstractSet[str]) -> float:
+    """두 키워드 집합의 Jaccard 유사도 (빈 집합이면 0)."""
+    if not keywords1 or not keywords2:
+        return 0.0
+    intersection = len(keywords1 & keywords2)
+    return intersection / (len(keywords1) + len(keywords2) - intersection)
+
+
+def _lsh_band_shape(threshold: float, num_perm: int, recall: float) -> tuple[int, int]:
+    """
+    임계값에서 목표 재현율을 만족하는 (밴드 수, 밴드당 행 수) 선택.
+
+    Jaccard가 threshold인 쌍이 후보가 될 확률은 1 - (1 - t^r)^b 이다.
+    재현율을 만족하는 가장 큰 r(가장 적은 오탐)을 고른다.
+    """
+    for rows in range(num_perm, 0, -1):
+        if num_perm % rows:
+            continue
+        bands = num_perm // rows
+        if 1.0 - (1.0 - threshold**rows) ** bands >= recall:
+            return bands, rows
+    return num_perm, 1
+
+
+def _lsh_buckets(
+    keyword_sets: list[frozenset[str]],
+    bands: int,
+    rows: int,
+) -> list[list[list[int]]]:
+    """
+    MinHash 서명을 밴드로 나눠 LSH 버킷 구성.
+
+    Args:
+        keyword_sets: 비어 있지 않은 서로 다른 키워드 집합 목록
+        bands: 밴드 수
+        rows: 밴드당 행 수 (서명 길이 = bands * rows)
+
+    Returns:
+        집합별로, 밴드마다 같은 버킷에 속한 집합 인덱스 목록
+    """
+    import numpy as np
+
+    vocabulary = {
+        kw: i for i, kw in enumerate(dict.fromkeys(chain.from_iterable(keyword_sets)))
+    }
+    tokens = np.fromiter(
+        map(vocabulary.__getitem__, chain.from_iterable(keyword_sets)), dtype=np.intp
+    )
+    sizes = np.fromiter(map(len, keyword_sets), dtype=np.intp, count=len(keyword_sets))
+    starts = np.cumsum(sizes) - sizes
+
+    rng = np.random.default_rng(_MINHASH_SEED)
+    num_perm = bands * rows
+    coef_a = rng.integers(1, _MINHASH_PRIME, size=num_perm, dtype=np.uint64)
+    coef_b = rng.integers(0, _MINHASH_PRIME, size=num_perm, dtype=np.uint64)
+
+    # 해시는 어휘 단위로 한 번 계산하고, 순열마다 토큰 위치로 모아 집합별 최솟값을 구한다
+    token_ids = np.arange(len(vocabulary), dtype=np.uint64)
+    token_hashes = (
+        (coef_a[:, None] * token_ids[None, :] + coef_b[:, None]) % np.uint64(_MINHASH_PRIME)
+    ).astype(np.uint32)
+    signatures = np.empty((num_perm, len(keyword_sets)), dtype=np.uint32)
+    for k in range(num_perm):
+        signatures[k] = np.minimum.reduceat(token_hashes[k].take(tokens), starts)
+
+    # 밴드의 행들을 하나의 64비트 키로 접는다 (충돌은 후보만 늘리고 정확 검증된다)
+    mixers = rng.integers(1, np.iinfo(np.uint64).max, size=rows, dtype=np.uint64)
+    mixers |= np.uint64(1)
+    members: list[list[list[int]]] = [[] for _ in keyword_sets]
+    for band in range(bands):
+        block = signatures[band * rows:(band + 1) * rows].astype(np.uint64)
+        with np.errstate(over="ignore"):
+            keys = (block * mixers[:, None]).sum(axis=0, dtype=np.uint64)
+        _, labels, counts = np.unique(keys, return_inverse=True, return_counts=True)
+        # 대부분의 버킷은 집합 하나뿐이므로 공유 버킷만 파이썬 리스트로 만든다
+        shared = np.flatnonzero(counts[labels] > 1)
+        if not len(shared):
+            continue
+        shared = shared[np.argsort(labels[shared], kind="stable")]
+        bounds = [0, *(np.flatnonzero(np.diff(labels[shared])) + 1).tolist(), len(shared)]
+        shared_list = shared.tolist()
+        for start, end in pairwise(bounds):
+            bucket = shared_list[start:end]
+            for set_idx in bucket:
+                members[set_idx].append(bucket)
+    return members
+
+
 @dataclass
 class DemandClusterer:
     """
     유사한 수요를 그룹화하는 클러스터러.
 
     키워드 겹침 기반으로 유사한 수요 표현을 클러스터링한다.
+    매칭 수가 lsh_min_matches 이상이면 전체 쌍 비교 대신 MinHash/LSH로
+    후보 쌍만 찾고 정확한 Jaccard로 검증한다.
 
     Attributes:
         keyword_extractor: 키워드 추출기 (None이면 내부 생성)
         similarity_threshold: 유사도 임계값 (0-1)
+        context: 공유 분석 컨텍스트 (컨텍스트별 키워드 집합을 한 번만 계산)
+        lsh_min_matches: LSH 모드를 사용할 최소 매칭 수
+        lsh_num_perm: MinHash 서명 길이
+        lsh_recall: 임계값 유사도 쌍을 후보로 찾을 목표 확률 (밴드 구성 결정)
 
     Example:
         >>> clusterer = DemandClusterer(similarity_threshold=0.7)
@@ -117,6 +223,10 @@ class DemandClusterer:
 
     keyword_extractor: UnifiedKeywordExtractor | None = None
     similarity_threshold: float = 0.7
+    context: AnalysisContext | None = field(default=None, repr=False)
+    lsh_min_matches: int = 2000
+    lsh_num_perm: int = 128
+    lsh_recall: float = 0.999
     _initialized: bool = field(default=False, repr=False)
 
     def __post_init__(self) -> None:
@@ -125,7 +235,7 @@ class DemandClusterer:
             # Lazy import to avoid circular dependency
             from reddit_insight.analysis.keywords import UnifiedKeywordExtractor
 
-            self.keyword_extractor = UnifiedKeywordExtractor()
+            self.keyword_extractor = UnifiedKeywordExtractor(context=self.context)
         self._initialized = True
 
     def _extract_keywords_from_text(self, text: str) -> set[str]:
@@ -138,10 +248,16 @@ class DemandClusterer:
             text: 입력 텍스트
 
         Returns:
-            소문자 키워드 집합
+            소문자 키워드 집합 (컨텍스트가 있으면 공유 캐시 값이므로 수정하지 않는다)
         """
+        if self.context is not None:
+            return self.context.memo("demand_keywords", text, self._keyword_set)
+        return self._keyword_set(text)
+
+    def _keyword_set(self, text: str) -> set[str]:
+        """불용어와 짧은 단어를 제외한 소문자 단어 집합."""
         # Simple word-based extraction for fast similarity
-        words = text.lower().split()
+        words = self.context.words(text) if self.context is not None else text.lower().split()
         # Filter short words and common stopwords
         stopwords = {
             "i", "a", "an", "the", "to", "for", "of", "is", "was", "with",
@@ -172,17 +288,8 @@ class DemandClusterer:
         keywords1 = self._extract_keywords_from_text(match1.context)
         keywords2 = self._extract_keywords_from_text(match2.context)
 
-        if not keywords1 or not keywords2:
-            return 0.0
-
         # Jaccard similarity
-        intersection = keywords1 & keywords2
-        union = keywords1 | keywords2
-
-        if not union:
-            return 0.0
-
-        return len(intersection) / len(union)
+        return _jaccard(keywords1, keywords2)
 
     def _extract_representative(self, matches: list[DemandMatch]) -> str:
         """
@@ -219,23 +326,26 @@ class DemandClusterer:
     def _extract_cluster_keywords(
         self,
         matches: list[DemandMatch],
+        keyword_sets: list[set[str]] | None = None,
     ) -> list[str]:
         """
         클러스터에서 공통 키워드 추출.
 
         Args:
             matches: 클러스터 내 매칭 목록
+            keyword_sets: 매칭별로 미리 추출한 키워드 집합 (None이면 새로 추출)
 
         Returns:
             공통 키워드 목록
         """
         if not matches:
             return []
+        if keyword_sets is None:
+            keyword_sets = [self._extract_keywords_from_text(m.context) for m in matches]
 
         # Collect all keywords
         all_keywords: dict[str, int] = {}
-        for match in matches:
-            keywords = self._extract_keywords_from_text(match.context)
+        for keywords in keyword_sets:
             for kw in keywords:
                 all_keywords[kw] = all_keywords.get(kw, 0) + 1
 
@@ -251,6 +361,109 @@ class DemandClusterer:
 
         return common_keywords[:10]  # Limit to top 10
 
+    def _greedy_groups(self, keyword_sets: list[set[str]]) -> list[list[int]]:
+        """
+        전체 쌍 비교 그리디 클러스터링.
+
+        Args:
+            keyword_sets: 신뢰도 순으로 정렬된 매칭별 키워드 집합
+
+        Returns:
+            클러스터별 매칭 인덱스 목록 (시드 먼저, 이후 인덱스 순)
+        """
+        groups: list[list[int]] = []
+        used: set[int] = set()
+
+        for i, keywords in enumerate(keyword_sets):
+            if i in used:
+                continue
+
+            # Start new cluster
+            group = [i]
+            used.add(i)
+
+            # Find similar matches
+            for j, other in enumerate(keyword_sets):
+                if j in used:
+                    continue
+
+                if _jaccard(keywords, other) >= self.similarity_threshold:
+                    group.append(j)
+                    used.add(j)
+
+            groups.append(group)
+
+        return groups
+
+    def _greedy_groups_lsh(self, keyword_sets: list[set[str]]) -> list[list[int]]:
+        """
+        LSH 후보 기반 그리디 클러스터링.
+
+        _greedy_groups와 같은 순서로 시드를 고르되, 시드와 LSH 버킷을 공유하는
+        키워드 집합만 정확한 Jaccard로 검증한다. 같은 키워드 집합을 가진 매칭은
+        유사도가 같으므로 집합 단위로 함께 처리한다. 임계값 이상인 쌍을 LSH가
+        놓치지 않는 한 결과는 _greedy_groups와 같다.
+
+        Args:
+            keyword_sets: 신뢰도 순으로 정렬된 매칭별 키워드 집합
+
+        Returns:
+            클러스터별 매칭 인덱스 목록 (시드 먼저, 이후 인덱스 순)
+        """
+        # 매칭을 서로 다른 키워드 집합으로 묶는다 (빈 집합은 누구와도 유사도 0)
+        set_index: dict[frozenset[str], int] = {}
+        distinct: list[frozenset[str]] = []
+        pending: list[deque[int]] = []
+        set_of_match: list[int] = []
+        for i, keywords in enumerate(keyword_sets):
+            if not keywords:
+                set_of_match.append(-1)
+                continue
+            key = frozenset(keywords)
+            idx = set_index.get(key)
+            if idx is None:
+                idx = set_index[key] = len(distinct)
+                distinct.append(key)
+                pending.append(deque())
+            pending[idx].append(i)
+            set_of_match.append(idx)
+
+        bands, rows = _lsh_band_shape(
+            min(self.similarity_threshold, 1.0), self.lsh_num_perm, self.lsh_recall
+        )
+        buckets = _lsh_buckets(distinct, bands, rows) if distinct else []
+
+        groups: list[list[int]] = []
+        used = [False] * len(keyword_sets)
+        for i, seed_set in enumerate(set_of_match):
+            if used[i]:
+                continue
+            used[i] = True
+            if seed_set == -1:
+                groups.append([i])
+                continue
+
+            seed_keywords = distinct[seed_set]
+            joined: list[int] = []
+            candidates = {seed_set}
+            for bucket in buckets[seed_set]:
+                candidates.update(bucket)
+            for cand in candidates:
+                queue = pending[cand]
+                while queue and used[queue[0]]:
+                    queue.popleft()
+                if not queue:
+                    continue
+                if _jaccard(seed_keywords, distinct[cand]) >= self.similarity_threshold:
+                    joined.extend(queue)
+                    for j in queue:
+                        used[j] = True
+                    queue.clear()
+            joined.sort()
+            groups.append([i, *joined])
+
+        return groups
+
     def cluster_demands(
         self,
         matches: list[DemandMatch],
@@ -259,6 +472,8 @@ class DemandClusterer:
         유사한 수요를 그룹화.
 
         그리디 클러스터링 알고리즘을 사용하여 유사한 수요를 묶는다.
+        각 컨텍스트는 한 번만 토큰화하며, 큰 입력에서는 LSH 후보 생성으로
+        전체 쌍 비교를 피한다.
 
         Args:
             matches: 수요 매칭 목록
@@ -279,33 +494,22 @@ class DemandClusterer:
             matches, key=lambda m: m.confidence, reverse=True
         )
 
-        # Greedy clustering
-        clusters: list[list[DemandMatch]] = []
-        used: set[int] = set()
-
-        for i, match in enumerate(sorted_matches):
-            if i in used:
-                continue
-
-            # Start new cluster
-            cluster_matches = [match]
-            used.add(i)
-
-            # Find similar matches
-            for j, other in enumerate(sorted_matches):
-                if j in used:
-                    continue
-
-                similarity = self._calculate_similarity(match, other)
-                if similarity >= self.similarity_threshold:
-                    cluster_matches.append(other)
-                    used.add(j)
-
-            clusters.append(cluster_matches)
+        # Tokenize each context once
+        keyword_sets = [
+            self._extract_keywords_from_text(m.context) for m in sorted_matches
+        ]
+        if (
+            len(sorted_matches) >= self.lsh_min_matches
+            and self.similarity_threshold > 0
+        ):
+            groups = self._greedy_groups_lsh(keyword_sets)
+        else:
+            groups = self._greedy_groups(keyword_sets)
 
         # Convert to DemandCluster objects
         result: list[DemandCluster] = []
-        for idx, cluster_matches in enumerate(clusters):
+        for idx, group in enumerate(groups):
+            cluster_matches = [sorted_matches[i] for i in group]
             # Collect unique categories
             categories = list({m.category for m in cluster_matches})
 
@@ -315,7 +519,9 @@ class DemandClusterer:
                 matches=cluster_matches,
                 frequency=len(cluster_matches),
                 categories=categories,
-                keywords=self._extract_cluster_keywords(cluster_matches),
+                keywords=self._extract_cluster_keywords(
+                    cluster_matches, [keyword_sets[i] for i in group]
+                ),
             )
             result.append(cluster)
 
@@ -656,6 +862,7 @@ class DemandAnalyzer:
         detector: 수요 탐지기
         clusterer: 수요 클러스터러
         priority_calculator: 우선순위 계산기
+        context: 공유 분석 컨텍스트
 
     Example:
         >>> analyzer = DemandAnalyzer()
@@ -668,6 +875,7 @@ class DemandAnalyzer:
         detector: DemandDetector | None = None,
         clusterer: DemandClusterer | None = None,
         priority_calculator: PriorityCalculator | None = None,
+        context: AnalysisContext | None = None,
     ) -> None:
         """
         수요 분석기 초기화.
@@ -676,9 +884,11 @@ class DemandAnalyzer:
             detector: 수요 탐지기 (None이면 기본 탐지기 사용)
             clusterer: 수요 클러스터러 (None이면 기본 클러스터러 사용)
             priority_calculator: 우선순위 계산기 (None이면 기본 계산기 사용)
+            context: 공유 분석 컨텍스트 (기본 탐지기/클러스터러에 전달)
         """
-        self.detector = detector or DemandDetector()
-        self.clusterer = clusterer or DemandClusterer()
+        self.context = context
+        self.detector = detector or DemandDetector(context=context)
+        self.clusterer = clusterer or DemandClusterer(context=context)
         self.priority_calculator = priority_calculator or PriorityCalculator()
 
     def _determine_business_potential(
@@ -815,8 +1025,9 @@ class DemandAnalyzer:
 
     def analyze_posts(
         self,
-        posts: list[Post],
+        posts: list[Post] | PostCorpus,
         top_n: int = 10,
+        workers: int = 1,
     ) -> DemandReport:
         """
         게시물에서 수요 분석 수행.
@@ -824,8 +1035,9 @@ class DemandAnalyzer:
         전체 파이프라인을 실행하여 수요 리포트를 생성한다.
 
         Args:
-            posts: Reddit Post 객체 목록
+            posts: Reddit Post 객체 목록 또는 PostCorpus
             top_n: 상위 기회 수 (기본값: 10)
+            workers: 수요 탐지 프로세스 수 (기본값: 1, 직렬 탐지)
 
         Returns:
             수요 분석 리포트
@@ -835,7 +1047,7 @@ class DemandAnalyzer:
             >>> print(f"Found {report.total_clusters} clusters")
         """
         # Step 1: Detect demands
-        all_matches = self.detector.detect_in_posts(posts)
+        all_matches = self.detector.detect_in_posts(posts, workers=workers)
 
         # Step 2: Cluster demands
         clusters = self.clusterer.cluster_demands(all_matches)
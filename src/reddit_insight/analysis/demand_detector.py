@@ -13,10 +13,12 @@ Example:
 
 from __future__ import annotations
 
-import re
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
+from reddit_insight.analysis.corpus import PostCorpus
 from reddit_insight.analysis.demand_patterns import (
     DemandCategory,
     DemandMatch,
@@ -25,8 +27,17 @@ from reddit_insight.analysis.demand_patterns import (
 )
 
 if TYPE_CHECKING:
+    import re
+
+    from reddit_insight.analysis.context import AnalysisContext
     from reddit_insight.reddit.models import Post
 
+# 문장 경계 문자 (마침표, 느낌표, 물음표, 줄바꿈)
+_SENTENCE_BOUNDARIES = ".!?\n"
+
+# 워커당 샤드 수 (샤드 크기 편차에 따른 부하 불균형 완화)
+_SHARDS_PER_WORKER = 4
+
 
 @dataclass
 class DemandDetectorConfig:
@@ -92,6 +103,7 @@ class DemandDetector:
     Attributes:
         _library: 패턴 라이브러리
         _config: 탐지기 설정
+        _context: 공유 분석 컨텍스트 (소문자 텍스트와 문장 경계를 문서당 한 번 계산)
 
     Example:
         >>> detector = DemandDetector()
@@ -103,6 +115,7 @@ class DemandDetector:
         self,
         pattern_library: DemandPatternLibrary | None = None,
         config: DemandDetectorConfig | None = None,
+        context: AnalysisContext | None = None,
     ) -> None:
         """
         수요 탐지기 초기화.
@@ -110,8 +123,10 @@ class DemandDetector:
         Args:
             pattern_library: 패턴 라이브러리 (None이면 기본 영어 라이브러리 사용)
             config: 탐지기 설정 (None이면 기본 설정 사용)
+            context: 공유 분석 컨텍스트 (None이면 캐시하지 않음)
         """
         self._config = config or DemandDetectorConfig()
+        self._context = context
 
         # 라이브러리 설정
         if pattern_library is not None:
@@ -135,6 +150,27 @@ class DemandDetector:
         """Get the pattern library."""
         return self._library
 
+    def _find_boundary(self, text: str, start: int, end: int) -> int:
+        """
+        [start, end) 범위에서 첫 문장 경계 위치 찾기.
+
+        컨텍스트가 있으면 캐시된 경계 위치를 이진 탐색한다.
+
+        Returns:
+            경계 위치 (없으면 -1)
+        """
+        if self._context is not None:
+            boundaries = self._context.sentence_boundaries(text)
+            idx = bisect_left(boundaries, start)
+            if idx < len(boundaries) and boundaries[idx] < end:
+                return boundaries[idx]
+            return -1
+
+        for i in range(start, end):
+            if text[i] in _SENTENCE_BOUNDARIES:
+                return i
+        return -1
+
     def _extract_context(
         self,
         text: str,
@@ -165,20 +201,17 @@ class DemandDetector:
         context_end = min(len(text), match_end + window)
 
         # 문장 경계 찾기 (앞쪽)
-        sentence_boundaries = ".!?\n"
-        for i in range(context_start, match_start):
-            if text[i] in sentence_boundaries:
-                # 경계 다음 문자부터 시작 (공백 건너뜀)
-                context_start = i + 1
-                while context_start < match_start and text[context_start].isspace():
-                    context_start += 1
-                break
+        boundary = self._find_boundary(text, context_start, match_start)
+        if boundary != -1:
+            # 경계 다음 문자부터 시작 (공백 건너뜀)
+            context_start = boundary + 1
+            while context_start < match_start and text[context_start].isspace():
+                context_start += 1
 
         # 문장 경계 찾기 (뒤쪽)
-        for i in range(match_end, context_end):
-            if text[i] in sentence_boundaries:
-                context_end = i + 1
-                break
+        boundary = self._find_boundary(text, match_end, context_end)
+        if boundary != -1:
+            context_end = boundary + 1
 
         return text[context_start:context_end].strip()
 
@@ -208,7 +241,7 @@ class DemandDetector:
         # 키워드 보너스: 키워드가 많이 포함될수록 신뢰도 증가
         keyword_bonus = 0.0
         if pattern.keywords:
-            text_lower = text.lower()
+            text_lower = self._context.lower(text) if self._context is not None else text.lower()
             matched_keywords = sum(
                 1 for kw in pattern.keywords if kw.lower() in text_lower
             )
@@ -235,6 +268,8 @@ class DemandDetector:
         중복 매칭 제거.
 
         겹치는 span을 가진 매칭 중 가장 높은 신뢰도를 가진 것만 유지한다.
+        유지된 span을 시작 위치 순으로 관리하여 겹침 검사를 이진 탐색으로
+        수행한다.
 
         Args:
             matches: 중복 가능성이 있는 매칭 목록
@@ -248,62 +283,58 @@ class DemandDetector:
         # 신뢰도 기준 내림차순 정렬
         sorted_matches = sorted(matches, key=lambda m: m.confidence, reverse=True)
 
-        # 이미 처리된 span 범위 추적
-        used_ranges: list[tuple[int, int]] = []
+        # 유지된 span (시작 위치 순, 빈 span 제외 시 서로 겹치지 않음)
+        used_starts: list[int] = []
+        used_spans: list[tuple[int, int]] = []
         deduplicated: list[DemandMatch] = []
 
         for match in sorted_matches:
             start, end = match.matched_span
 
-            # 기존 범위와 겹치는지 확인
+            # end 이전에 시작하는 유지된 span 중 start 이후에 끝나는 것이 있으면
+            # 겹친다 (빈 span은 자신을 엄격히 포함하는 span과만 겹친다).
+            # 유지된 빈 span은 다른 span의 끝을 가리지 않으므로 건너뛴다
+            k = bisect_left(used_starts, end if end > start else start) - 1
             overlaps = False
-            for used_start, used_end in used_ranges:
-                # 범위가 겹치는 경우
-                if not (end <= used_start or start >= used_end):
+            while k >= 0:
+                used_start, used_end = used_spans[k]
+                if used_end > start:
                     overlaps = True
                     break
+                if used_end > used_start:
+                    break
+                k -= 1
+            if overlaps:
+                continue
 
-            if not overlaps:
-                deduplicated.append(match)
-                used_ranges.append((start, end))
+            position = bisect_left(used_starts, start)
+            used_starts.insert(position, start)
+            used_spans.insert(position, (start, end))
+            deduplicated.append(match)
 
         # 원래 텍스트 순서대로 정렬
         deduplicated.sort(key=lambda m: m.matched_span[0])
         return deduplicated
 
-    def _match_pattern(
+    def _scan(
         self,
         text: str,
-        pattern: DemandPattern,
+        category: DemandCategory | None = None,
     ) -> list[DemandMatch]:
         """
-        단일 패턴 매칭 수행.
-
-        주어진 패턴으로 텍스트를 검색하고 매칭 결과를 반환한다.
+        컴파일된 스캐너로 모든 패턴 매칭 수행.
 
         Args:
             text: 검색할 텍스트
-            pattern: 적용할 패턴
+            category: 선택적 카테고리 필터
 
         Returns:
-            매칭 결과 목록
+            매칭 결과 목록 (패턴 순서, 패턴 내 위치 순서)
         """
+        scanner = self._library.get_scanner(category, self._config.case_sensitive)
         matches: list[DemandMatch] = []
 
-        # 컴파일된 패턴 가져오기
-        compiled = self._library.get_compiled_pattern(pattern.pattern_id)
-        if compiled is None:
-            return matches
-
-        # 대소문자 구분 설정에 따라 패턴 재컴파일
-        if self._config.case_sensitive:
-            try:
-                compiled = re.compile(pattern.regex_pattern)
-            except re.error:
-                return matches
-
-        # 모든 매칭 찾기
-        for match in compiled.finditer(text):
+        for pattern, match in scanner.scan(text):
             confidence = self._calculate_confidence(text, pattern, match)
 
             # 최소 신뢰도 이하면 건너뜀
@@ -347,15 +378,8 @@ class DemandDetector:
         if not text or not text.strip():
             return []
 
-        all_matches: list[DemandMatch] = []
-
-        # 모든 패턴에 대해 매칭 수행
-        for pattern in self._library.get_patterns():
-            pattern_matches = self._match_pattern(text, pattern)
-            all_matches.extend(pattern_matches)
-
-        # 중복 제거 후 반환
-        return self._deduplicate_matches(all_matches)
+        # 모든 패턴을 한 번의 스캔으로 매칭한 뒤 중복 제거
+        return self._deduplicate_matches(self._scan(text))
 
     def detect_in_post(self, post: Post) -> list[DemandMatch]:
         """
@@ -381,29 +405,89 @@ class DemandDetector:
 
         return self.detect(combined_text)
 
-    def detect_in_posts(self, posts: list[Post]) -> list[DemandMatch]:
+    def detect_in_posts(
+        self,
+        posts: list[Post] | PostCorpus,
+        workers: int = 1,
+    ) -> list[DemandMatch]:
         """
         여러 게시물에서 수요 패턴 일괄 탐지.
 
+        workers가 2 이상이면 게시물을 샤드로 나누어 프로세스 풀에서 탐지한다.
+        각 워커는 패턴을 한 번만 컴파일하고 (패턴 번호, span, 신뢰도, 컨텍스트)
+        형태로 결과를 돌려주며, 결과는 직렬 탐지와 같다.
+
         Args:
-            posts: Reddit Post 객체 목록
+            posts: Reddit Post 객체 목록 또는 PostCorpus
+            workers: 탐지 프로세스 수 (기본값: 1, 직렬 탐지)
 
         Returns:
             모든 게시물에서 탐지된 수요 매칭 목록
 
+        Raises:
+            ValueError: workers가 1보다 작은 경우
+
         Example:
             >>> posts = [post1, post2, post3]
             >>> all_matches = detector.detect_in_posts(posts)
             >>> print(f"Found {len(all_matches)} total demands")
         """
+        if workers < 1:
+            raise ValueError(f"workers must be >= 1, got {workers}")
+
+        if workers > 1 and len(posts) > 1:
+            return self._detect_parallel(_combined_texts(posts), workers)
+
         all_matches: list[DemandMatch] = []
 
+        if isinstance(posts, PostCorpus):
+            for text in _combined_texts(posts):
+                all_matches.extend(self.detect(text))
+            return all_matches
+
         for post in posts:
             matches = self.detect_in_post(post)
             all_matches.extend(matches)
 
         return all_matches
 
+    def _detect_parallel(self, texts: list[str], workers: int) -> list[DemandMatch]:
+        """
+        프로세스 풀에서 텍스트 샤드별 탐지 수행.
+
+        Args:
+            texts: 분석할 텍스트 목록
+            workers: 프로세스 수
+
+        Returns:
+            텍스트 순서대로 이어 붙인 수요 매칭 목록
+        """
+        patterns = self._library.get_patterns()
+        shard_size = -(-len(texts) // (workers * _SHARDS_PER_WORKER))
+        shards = [texts[i : i + shard_size] for i in range(0, len(texts), shard_size)]
+
+        all_matches: list[DemandMatch] = []
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(shards)),
+            initializer=_init_worker,
+            initargs=(self._library, self._config),
+        ) as executor:
+            for shard, shard_matches in zip(
+                shards, executor.map(_detect_shard, shards), strict=True
+            ):
+                for text, compact in zip(shard, shard_matches, strict=True):
+                    for pattern_index, start, end, confidence, context in compact:
+                        all_matches.append(
+                            DemandMatch(
+                                pattern=patterns[pattern_index],
+                                text=text,
+                                matched_span=(start, end),
+                                context=context,
+                                confidence=confidence,
+                            )
+                        )
+        return all_matches
+
     def detect_by_category(
         self,
         text: str,
@@ -425,14 +509,8 @@ class DemandDetector:
         if not text or not text.strip():
             return []
 
-        all_matches: list[DemandMatch] = []
-
         # 해당 카테고리 패턴만 사용
-        for pattern in self._library.get_patterns(category):
-            pattern_matches = self._match_pattern(text, pattern)
-            all_matches.extend(pattern_matches)
-
-        return self._deduplicate_matches(all_matches)
+        return self._deduplicate_matches(self._scan(text, category))
 
     def get_category_stats(
         self,
@@ -516,3 +594,53 @@ class DemandDetector:
             f"DemandDetector(library={self._library!r}, "
             f"config={self._config!r})"
         )
+
+
+# =============================================================================
+# PROCESS POOL WORKERS
+# =============================================================================
+
+# 워커 프로세스의 탐지기와 패턴 번호 (프로세스 풀 initializer가 설정)
+_worker_detector: DemandDetector | None = None
+_worker_pattern_index: dict[int, int] = {}
+
+# 압축된 매칭: (패턴 번호, 시작, 끝, 신뢰도, 컨텍스트)
+_CompactMatch = tuple[int, int, int, float, str]
+
+
+def _combined_texts(posts: list[Post] | PostCorpus) -> list[str]:
+    """detect_in_post와 같은 방식으로 게시물의 제목과 본문을 결합."""
+    if isinstance(posts, PostCorpus):
+        texts = []
+        for i in range(len(posts)):
+            title = posts.title(i)
+            selftext = posts.selftext(i)
+            texts.append(f"{title}\n\n{selftext}" if selftext else title)
+        return texts
+    return [
+        f"{post.title}\n\n{post.selftext}" if post.selftext else post.title
+        for post in posts
+    ]
+
+
+def _init_worker(library: DemandPatternLibrary, config: DemandDetectorConfig) -> None:
+    """워커 프로세스마다 탐지기를 한 번 생성."""
+    global _worker_detector, _worker_pattern_index
+    _worker_detector = DemandDetector(pattern_library=library, config=config)
+    _worker_pattern_index = {
+        id(pattern): index for index, pattern in enumerate(library.get_patterns())
+    }
+
+
+def _detect_shard(texts: list[str]) -> list[list[_CompactMatch]]:
+    """샤드의 각 텍스트에서 수요를 탐지하여 압축된 매칭으로 반환."""
+    detector = _worker_detector
+    assert detector is not None, "worker not initialized"
+    index = _worker_pattern_index
+    return [
+        [
+            (index[id(m.pattern)], *m.matched_span, m.confidence, m.context)
+            for m in detector.detect(text)
+        ]
+        for text in texts
+    ]
@@ -65,6 +65,9 @@ class DemandPattern:
         category: 수요 카테고리
         regex_pattern: 정규식 패턴 문자열
         keywords: 트리거 키워드 목록
+        required_literals: 모든 매칭에 하나 이상 포함되는 리터럴 목록 (소문자).
+            스캐너가 이 중 하나도 없는 텍스트를 건너뛰는 데 사용한다.
+            비어 있으면 항상 정규식을 검사한다.
         language: 언어 코드 (기본값: "en")
         weight: 중요도 가중치 (기본값: 1.0)
         examples: 예시 문장 목록
@@ -75,6 +78,7 @@ class DemandPattern:
         ...     category=DemandCategory.FEATURE_REQUEST,
         ...     regex_pattern=r"i wish (?:there was|someone would)",
         ...     keywords=["wish", "there was"],
+        ...     required_literals=["i wish "],
         ...     examples=["I wish there was a better tool for this"]
         ... )
     """
@@ -83,6 +87,7 @@ class DemandPattern:
     category: DemandCategory
     regex_pattern: str
     keywords: list[str] = field(default_factory=list)
+    required_literals: list[str] = field(default_factory=list)
     language: str = "en"
     weight: float = 1.0
     examples: list[str] = field(default_factory=list)
@@ -157,6 +162,7 @@ ENGLISH_PATTERNS: list[DemandPattern] = [
         category=DemandCategory.FEATURE_REQUEST,
         regex_pattern=r"i wish (?:there was|someone would|we had|i could)",
         keywords=["wish", "there was", "someone would"],
+        required_literals=["i wish "],
         language="en",
         weight=1.0,
         examples=[
@@ -170,6 +176,7 @@ ENGLISH_PATTERNS: list[DemandPattern] = [
         category=DemandCategory.FEATURE_REQUEST,
         regex_pattern=r"(?:would|it'?d) (?:be (?:great|nice|awesome|cool)|love) (?:to see|if|to have)",
         keywords=["would be great", "would love", "would be nice"],
+        required_literals=["d be ", "d love "],
         language="en",
         weight=1.0,
         examples=[
@@ -183,6 +190,7 @@ ENGLISH_PATTERNS: list[DemandPattern] = [
         category=DemandCategory.FEATURE_REQUEST,
         regex_pattern=r"(?:we|i|really) need (?:a|an|something|some kind of)",
         keywords=["need", "really need"],
+        required_literals=[" need "],
         language="en",
         weight=0.9,
         examples=[
@@ -196,6 +204,7 @@ ENGLISH_PATTERNS: list[DemandPattern] = [
         category=DemandCategory.FEATURE_REQUEST,
         regex_pattern=r"why (?:isn't|is there no|doesn't|can't) (?:there|it|this)",
         keywords=["why isn't", "why is there no", "why doesn't"],
+        required_literals=["why isn't ", "why is there no ", "why doesn't ", "why can't "],
         language="en",
         weight=0.9,
         examples=[
@@ -212,6 +221,7 @@ ENGLISH_PATTERNS: list[DemandPattern] = [
         category=DemandCategory.PAIN_POINT,
         regex_pattern=r"(?:so |really |very )?frustrated (?:with|by|that|when)",
         keywords=["frustrated", "frustrating"],
+        required_literals=["frustrated "],
         language="en",
         weight=0.9,
         examples=[
@@ -225,6 +235,7 @@ ENGLISH_PATTERNS: list[DemandPattern] = [
         category=DemandCategory.PAIN_POINT,
         regex_pattern=r"(?:so |really |very )?annoying (?:that|when|how)",
         keywords=["annoying", "annoys me"],
+        required_literals=["annoying "],
         language="en",
         weight=0.85,
         examples=[
@@ -238,6 +249,7 @@ ENGLISH_PATTERNS: list[DemandPattern] = [
         category=DemandCategory.PAIN_POINT,
         regex_pattern=r"(?:i )?(?:hate|can't stand) (?:how|when|that|it when)",
         keywords=["hate", "can't stand"],
+        required_literals=["hate ", "can't stand "],
         language="en",
         weight=0.85,
         examples=[
@@ -251,6 +263,7 @@ ENGLISH_PATTERNS: list[DemandPattern] = [
         category=DemandCategory.PAIN_POINT,
         regex_pattern=r"why (?:can't|won't|doesn't) (?:it|this|the app)",
         keywords=["why can't", "why won't", "why doesn't"],
+        required_literals=["why can't ", "why won't ", "why doesn't "],
         language="en",
         weight=0.8,
         examples=[
@@ -267,6 +280,7 @@ ENGLISH_PATTERNS: list[DemandPattern] = [
         category=DemandCategory.SEARCH_QUERY,
         regex_pattern=r"(?:i'm |i am )?(?:looking|searching) for (?:a|an|something|any)",
         keywords=["looking for", "searching for"],
+        required_literals=["looking for ", "searching for "],
         language="en",
         weight=0.95,
         examples=[
@@ -280,6 +294,7 @@ ENGLISH_PATTERNS: list[DemandPattern] = [
         category=DemandCategory.SEARCH_QUERY,
         regex_pattern=r"does anyone (?:know (?:of|about|if)|have (?:a|any))",
         keywords=["does anyone know", "does anyone have"],
+        required_literals=["does anyone "],
         language="en",
         weight=0.95,
         examples=[
@@ -293,6 +308,7 @@ ENGLISH_PATTERNS: list[DemandPattern] = [
         category=DemandCategory.SEARCH_QUERY,
         regex_pattern=r"is there (?:a|an|any|anything)",
         keywords=["is there", "is there any"],
+        required_literals=["is there a"],
         language="en",
         weight=0.9,
         examples=[
@@ -306,6 +322,7 @@ ENGLISH_PATTERNS: list[DemandPattern] = [
         category=DemandCategory.SEARCH_QUERY,
         regex_pattern=r"(?:can anyone|could someone|anybody) recommend",
         keywords=["recommend", "recommendations"],
+        required_literals=[" recommend"],
         language="en",
         weight=0.95,
         examples=[
@@ -319,6 +336,7 @@ ENGLISH_PATTERNS: list[DemandPattern] = [
         category=DemandCategory.SEARCH_QUERY,
         regex_pattern=r"(?:any |looking for )?suggestions? (?:for|on|about)",
         keywords=["suggestions", "suggest"],
+        required_literals=["suggestion"],
         language="en",
         weight=0.9,
         examples=[
@@ -335,6 +353,7 @@ ENGLISH_PATTERNS: list[DemandPattern] = [
         category=DemandCategory.WILLINGNESS_TO_PAY,
         regex_pattern=r"(?:i'?d|i would|would) pay (?:\$?\d+|good money|for)",
         keywords=["would pay", "I'd pay"],
+        required_literals=["d pay "],
         language="en",
         weight=1.2,
         examples=[
@@ -348,6 +367,7 @@ ENGLISH_PATTERNS: list[DemandPattern] = [
         category=DemandCategory.WILLINGNESS_TO_PAY,
         regex_pattern=r"(?:willing|happy|glad) to pay",
         keywords=["willing to pay", "happy to pay"],
+        required_literals=[" to pay"],
         language="en",
         weight=1.2,
         examples=[
@@ -361,6 +381,7 @@ ENGLISH_PATTERNS: list[DemandPattern] = [
         category=DemandCategory.WILLINGNESS_TO_PAY,
         regex_pattern=r"(?:take|shut up and take) my money",
         keywords=["take my money", "shut up and take my money"],
+        required_literals=["take my money"],
         language="en",
         weight=1.3,
         examples=[
@@ -377,6 +398,7 @@ ENGLISH_PATTERNS: list[DemandPattern] = [
         category=DemandCategory.ALTERNATIVE_SEEKING,
         regex_pattern=r"(?:looking for an? |any )?(?:alternative|replacement) (?:to|for)",
         keywords=["alternative to", "replacement for"],
+        required_literals=["alternative ", "replacement "],
         language="en",
         weight=1.0,
         examples=[
@@ -390,6 +412,7 @@ ENGLISH_PATTERNS: list[DemandPattern] = [
         category=DemandCategory.ALTERNATIVE_SEEKING,
         regex_pattern=r"(?:something|anything) (?:like|similar to|comparable to)",
         keywords=["something like", "similar to", "anything like"],
+        required_literals=["thing like", "thing similar to", "thing comparable to"],
         language="en",
         weight=1.0,
         examples=[
@@ -403,6 +426,7 @@ ENGLISH_PATTERNS: list[DemandPattern] = [
         category=DemandCategory.ALTERNATIVE_SEEKING,
         regex_pattern=r"(?:better|cheaper|free|open.?source) (?:alternative|option|version)",
         keywords=["better alternative", "cheaper alternative", "free alternative"],
+        required_literals=[" alternative", " option", " version"],
         language="en",
         weight=1.0,
         examples=[
@@ -416,6 +440,7 @@ ENGLISH_PATTERNS: list[DemandPattern] = [
         category=DemandCategory.ALTERNATIVE_SEEKING,
         regex_pattern=r"(?:want to |trying to |need to )?(?:switch|migrate|move) (?:from|away from)",
         keywords=["switch from", "migrate from", "move away from"],
+        required_literals=["switch ", "migrate ", "move "],
         language="en",
         weight=0.95,
         examples=[
@@ -440,6 +465,7 @@ KOREAN_PATTERNS: list[DemandPattern] = [
         category=DemandCategory.FEATURE_REQUEST,
         regex_pattern=r"(?:있었으면|있으면) (?:좋겠|좋을 것 같)",
         keywords=["있었으면 좋겠다", "있으면 좋겠다"],
+        required_literals=["으면 좋"],
         language="ko",
         weight=1.0,
         examples=[
@@ -452,6 +478,7 @@ KOREAN_PATTERNS: list[DemandPattern] = [
         category=DemandCategory.FEATURE_REQUEST,
         regex_pattern=r"(?:하는|할 수 있는) (?:거|것|앱|도구) 없나요",
         keywords=["없나요", "없을까요"],
+        required_literals=[" 없나요"],
         language="ko",
         weight=0.95,
         examples=[
@@ -467,6 +494,7 @@ KOREAN_PATTERNS: list[DemandPattern] = [
         category=DemandCategory.SEARCH_QUERY,
         regex_pattern=r"(?:찾고|구하고) (?:있는데|있어요)",
         keywords=["찾고 있는데", "구하고 있는데"],
+        required_literals=["고 있"],
         language="ko",
         weight=0.95,
         examples=[
@@ -479,6 +507,7 @@ KOREAN_PATTERNS: list[DemandPattern] = [
         category=DemandCategory.SEARCH_QUERY,
         regex_pattern=r"(?:할 수 있는|하는) 방법",
         keywords=["할 수 있는 방법", "하는 방법"],
+        required_literals=[" 방법"],
         language="ko",
         weight=0.9,
         examples=[
@@ -494,6 +523,7 @@ KOREAN_PATTERNS: list[DemandPattern] = [
         category=DemandCategory.PAIN_POINT,
         regex_pattern=r"해결책 없을까요",
         keywords=["해결책", "해결 방법"],
+        required_literals=["해결책 없을까요"],
         language="ko",
         weight=0.9,
         examples=[
@@ -504,6 +534,86 @@ KOREAN_PATTERNS: list[DemandPattern] = [
 ]
 
 
+# =============================================================================
+# DEMAND PATTERN SCANNER
+# =============================================================================
+
+
+class DemandPatternScanner:
+    """
+    패턴 집합을 필수 리터럴 사전 검사로 빠르게 훑는 컴파일된 스캐너.
+
+    패턴의 ``required_literals`` 중 하나라도 텍스트에 있을 때만 그 패턴의
+    finditer를 실행한다. 리터럴 검사는 패턴과 같은 플래그로 컴파일한
+    정규식으로 하므로 대소문자 처리가 패턴과 똑같고, 결과는 모든 패턴에
+    finditer를 돌린 것과 같다 (패턴 순서, 위치 순서).
+    ``required_literals``가 없는 패턴은 항상 검사한다.
+
+    Attributes:
+        patterns: 스캔 대상 패턴 (컴파일에 실패한 패턴 제외)
+        case_sensitive: 대소문자 구분 여부
+    """
+
+    def __init__(
+        self,
+        patterns: list[DemandPattern],
+        case_sensitive: bool = False,
+    ) -> None:
+        """
+        스캐너 컴파일.
+
+        Args:
+            patterns: 스캔할 패턴 목록
+            case_sensitive: 대소문자 구분 여부
+        """
+        flags = 0 if case_sensitive else re.IGNORECASE
+        self.case_sensitive = case_sensitive
+        self.patterns: list[DemandPattern] = []
+        self._compiled: list[re.Pattern[str]] = []
+        self._prefilters: list[re.Pattern[str] | None] = []
+
+        # 같은 리터럴 집합을 쓰는 패턴은 사전 검사 정규식을 공유한다
+        prefilters: dict[tuple[str, ...], re.Pattern[str]] = {}
+        for pattern in patterns:
+            try:
+                compiled = re.compile(pattern.regex_pattern, flags)
+            except re.error:
+                continue
+            prefilter = None
+            if pattern.required_literals:
+                literals = tuple(sorted(set(pattern.required_literals)))
+                prefilter = prefilters.get(literals)
+                if prefilter is None:
+                    prefilter = prefilters[literals] = re.compile(
+                        "|".join(map(re.escape, literals)), flags
+                    )
+            self.patterns.append(pattern)
+            self._compiled.append(compiled)
+            self._prefilters.append(prefilter)
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def scan(self, text: str) -> list[tuple[DemandPattern, re.Match[str]]]:
+        """
+        텍스트에서 모든 패턴 매칭 찾기.
+
+        Args:
+            text: 검색할 텍스트
+
+        Returns:
+            (패턴, 매칭) 목록 (패턴 순서, 패턴 내 위치 순서)
+        """
+        hits: list[tuple[DemandPattern, re.Match[str]]] = []
+        for pattern, compiled, prefilter in zip(
+            self.patterns, self._compiled, self._prefilters, strict=True
+        ):
+            if prefilter is not None and prefilter.search(text) is None:
+                continue
+            hits.extend((pattern, match) for match in compiled.finditer(text))
+        return hits
+
+
 # =============================================================================
 # DEMAND PATTERN LIBRARY
 # =============================================================================
@@ -527,6 +637,9 @@ class DemandPatternLibrary:
     language: str = "en"
     _patterns: list[DemandPattern] = field(default_factory=list)
     _compiled: dict[str, re.Pattern[str]] = field(default_factory=dict, repr=False)
+    _scanners: dict[
+        tuple[DemandCategory | None, bool], DemandPatternScanner
+    ] = field(default_factory=dict, repr=False)
 
     def __post_init__(self) -> None:
         """Initialize compiled patterns if patterns exist."""
@@ -536,6 +649,7 @@ class DemandPatternLibrary:
     def _compile_patterns(self) -> None:
         """Compile all regex patterns for efficient matching."""
         self._compiled = {}
+        self._scanners = {}
         for pattern in self._patterns:
             try:
                 # Use case-insensitive matching for better coverage
@@ -554,6 +668,7 @@ class DemandPatternLibrary:
             pattern: DemandPattern to add
         """
         self._patterns.append(pattern)
+        self._scanners = {}
         # Compile the new pattern
         try:
             self._compiled[pattern.pattern_id] = re.compile(
@@ -605,6 +720,34 @@ class DemandPatternLibrary:
         """
         return self._compiled.get(pattern_id)
 
+    def get_scanner(
+        self,
+        category: DemandCategory | None = None,
+        case_sensitive: bool = False,
+    ) -> DemandPatternScanner:
+        """
+        Get a compiled scanner for the library's patterns.
+
+        Scanners are cached per (category, case_sensitive) configuration and
+        rebuilt after patterns change. Patterns that failed to compile are
+        excluded, as with get_compiled_pattern.
+
+        Args:
+            category: Optional category filter
+            case_sensitive: Whether matching is case-sensitive
+
+        Returns:
+            DemandPatternScanner over the selected patterns
+        """
+        key = (category, case_sensitive)
+        scanner = self._scanners.get(key)
+        if scanner is None:
+            patterns = [
+                p for p in self.get_patterns(category) if p.pattern_id in self._compiled
+            ]
+            scanner = self._scanners[key] = DemandPatternScanner(patterns, case_sensitive)
+        return scanner
+
     def load_default_patterns(self, language: str = "en") -> None:
         """
         Load default patterns for the specified language.
@@ -615,6 +758,7 @@ class DemandPatternLibrary:
         self.language = language
         self._patterns = []
         self._compiled = {}
+        self._scanners = {}
 
         if language == "en":
             for pattern in ENGLISH_PATTERNS:
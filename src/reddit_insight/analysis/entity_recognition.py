@@ -20,12 +20,20 @@ Example:
 
 from __future__ import annotations
 
+import heapq
+import math
 import re
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import TYPE_CHECKING
 
+from reddit_insight.analysis.corpus import iter_post_texts
+
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from reddit_insight.analysis.context import AnalysisContext
+    from reddit_insight.analysis.corpus import PostCorpus
     from reddit_insight.reddit.models import Post
 
 
@@ -528,6 +536,99 @@ class PatternEntityExtractor:
         return mentions
 
 
+class _MergeIndex:
+    """
+    Candidate index over merged entity names for ``_merge_entities``.
+
+    ``EntityRecognizer._calculate_similarity`` is
+    ``0.4 * jaccard + 0.3 * len_sim + 0.3 * prefix_sim`` with every term in
+    [0, 1] and ``prefix_sim <= len_sim``. A threshold ``t`` therefore implies
+    ``len_sim >= (t - 0.4) / 0.6`` and ``prefix_sim >= (t - 0.7) / 0.3``, so
+    only names within a length window (sharing the first character when
+    ``t > 0.7``) can match. Names are bucketed by length and first character,
+    and candidates are scored in insertion order so the first match is the
+    same key a linear scan would pick.
+
+    Keys are only ever added, and always with a later insertion order, so the
+    earliest match for a name never changes once found; results are cached per
+    name and repeated mentions of a known entity cost one dict lookup.
+    """
+
+    # Slack for floating point error in the similarity bounds
+    _EPSILON = 1e-9
+
+    def __init__(
+        self, threshold: float, similarity: Callable[[str, str], float]
+    ) -> None:
+        self._threshold = threshold
+        self._similarity = similarity
+        self._min_len_ratio = (threshold - 0.4) / 0.6
+        self._needs_prefix = (threshold - 0.7) / 0.3 > self._EPSILON
+        self._keys: list[str] = []
+        self._order: dict[str, int] = {}
+        self._resolved: dict[str, str] = {}
+        # length -> first character -> insertion orders (ascending)
+        self._buckets: dict[int, dict[str, list[int]]] = {}
+
+    def add(self, key: str) -> None:
+        """Register a new merged key."""
+        order = len(self._keys)
+        self._keys.append(key)
+        self._order.setdefault(key, order)
+        if self._threshold <= 1.0:
+            self._resolved.setdefault(key, key)
+        by_char = self._buckets.setdefault(len(key), {})
+        by_char.setdefault(key[:1], []).append(order)
+
+    def _candidates(self, name: str) -> Iterator[int]:
+        """Yield insertion orders of keys that may reach the threshold."""
+        if self._min_len_ratio <= self._EPSILON or not name:
+            # Bounds prune nothing: fall back to scanning every key
+            yield from range(len(self._keys))
+            return
+
+        ratio = self._min_len_ratio
+        low = max(1, math.ceil(len(name) * ratio - self._EPSILON))
+        high = math.floor(len(name) / ratio + self._EPSILON)
+        lists: list[list[int]] = []
+        for length in range(low, high + 1):
+            by_char = self._buckets.get(length)
+            if not by_char:
+                continue
+            if self._needs_prefix:
+                orders = by_char.get(name[0])
+                if orders:
+                    lists.append(orders)
+            else:
+                lists.extend(by_char.values())
+        yield from heapq.merge(*lists)
+
+    def find(self, name: str) -> str | None:
+        """
+        Find the earliest key similar enough to a name.
+
+        Args:
+            name: Normalized entity name
+
+        Returns:
+            Matching key, or None if no key reaches the threshold
+        """
+        resolved = self._resolved.get(name)
+        if resolved is not None:
+            return resolved
+
+        # An exact key always matches, so only earlier keys need scoring
+        exact = self._order.get(name) if self._threshold <= 1.0 else None
+        for order in self._candidates(name):
+            if exact is not None and order >= exact:
+                break
+            key = self._keys[order]
+            if self._similarity(name, key) >= self._threshold:
+                self._resolved[name] = key
+                return key
+        return self._keys[exact] if exact is not None else None
+
+
 @dataclass
 class EntityRecognizerConfig:
     """
@@ -561,11 +662,15 @@ class EntityRecognizer:
     """
 
     config: EntityRecognizerConfig = field(default_factory=EntityRecognizerConfig)
+    context: AnalysisContext | None = field(default=None, repr=False)
     _pattern_extractor: PatternEntityExtractor = field(init=False, repr=False)
+    # Context cache namespace; results depend on the config
+    _memo_view: str = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
         """Initialize extractors."""
         self._pattern_extractor = PatternEntityExtractor()
+        self._memo_view = f"entities:{self.config!r}"
 
     def _calculate_similarity(self, name1: str, name2: str) -> float:
         """
@@ -616,6 +721,9 @@ class EntityRecognizer:
         Merge similar entities together.
 
         Groups entities with similar names and combines their mention counts.
+        Each entity joins the earliest merged name within the similarity
+        threshold; a length/first-character index limits which names are
+        scored, so merging stays near-linear in the number of entities.
 
         Args:
             entities: List of entities to merge
@@ -628,15 +736,11 @@ class EntityRecognizer:
 
         # Group by normalized name
         merged: dict[str, ProductEntity] = {}
+        index = _MergeIndex(self.config.similarity_threshold, self._calculate_similarity)
 
         for entity in entities:
             # Check if we already have a similar entity
-            matched_key = None
-            for key in merged:
-                similarity = self._calculate_similarity(entity.normalized_name, key)
-                if similarity >= self.config.similarity_threshold:
-                    matched_key = key
-                    break
+            matched_key = index.find(entity.normalized_name)
 
             if matched_key:
                 # Merge with existing entity
@@ -657,6 +761,7 @@ class EntityRecognizer:
                     existing.confidence = max(existing.confidence, entity.confidence)
             else:
                 # New entity
+                index.add(entity.normalized_name)
                 merged[entity.normalized_name] = ProductEntity(
                     name=entity.name,
                     normalized_name=entity.normalized_name,
@@ -672,31 +777,58 @@ class EntityRecognizer:
         """
         Recognize entities in text.
 
+        With an analysis context the result is computed once per text, so
+        callers that recognize the same post twice (e.g. entity aggregation
+        and entity sentiment) share one pattern scan. Returned entities may
+        then be shared and must not be mutated.
+
         Args:
             text: Input text to analyze
 
         Returns:
             List of recognized entities
         """
-        if not text or not text.strip():
-            return []
+        return self.recognize_with_mentions(text)[0]
+
+    def recognize_with_mentions(
+        self, text: str
+    ) -> tuple[list[ProductEntity], list[EntityMention]]:
+        """
+        Recognize entities in text together with the mentions they came from.
 
-        # Extract mentions using pattern extractor
-        mentions = self._pattern_extractor.extract(text)
+        Shares the pattern scan (and context cache) with ``recognize``.
+
+        Args:
+            text: Input text to analyze
+
+        Returns:
+            Tuple of (recognized entities, mentions passing the confidence
+            filter sorted by position). Mentions hold the unmerged entities.
+        """
+        if not text or not text.strip():
+            return [], []
 
-        # Convert mentions to entities
-        entities = [m.entity for m in mentions]
+        if self.context is not None:
+            entities, mentions = self.context.memo(self._memo_view, text, self._recognize)
+            return list(entities), list(mentions)
+        return self._recognize(text)
 
-        # Filter by confidence
-        entities = [e for e in entities if e.confidence >= self.config.min_confidence]
+    def _recognize(self, text: str) -> tuple[list[ProductEntity], list[EntityMention]]:
+        """Run pattern extraction, filtering and merging for one text."""
+        # Extract mentions using pattern extractor, filtered by confidence
+        mentions = [
+            m
+            for m in self._pattern_extractor.extract(text)
+            if m.entity.confidence >= self.config.min_confidence
+        ]
 
-        # Merge similar entities
-        entities = self._merge_entities(entities)
+        # Convert mentions to entities and merge similar ones
+        entities = self._merge_entities([m.entity for m in mentions])
 
         # Sort by confidence (highest first)
         entities.sort(key=lambda e: e.confidence, reverse=True)
 
-        return entities
+        return entities, mentions
 
     def recognize_in_post(self, post: Post) -> list[ProductEntity]:
         """
@@ -718,12 +850,14 @@ class EntityRecognizer:
         combined_text = " ".join(text_parts)
         return self.recognize(combined_text)
 
-    def recognize_in_posts(self, posts: list[Post]) -> dict[str, ProductEntity]:
+    def recognize_in_posts(
+        self, posts: list[Post] | PostCorpus
+    ) -> dict[str, ProductEntity]:
         """
         Recognize and aggregate entities across multiple posts.
 
         Args:
-            posts: List of Post objects
+            posts: List of Post objects or a PostCorpus
 
         Returns:
             Dictionary mapping normalized entity names to aggregated entities
@@ -733,9 +867,8 @@ class EntityRecognizer:
 
         # Collect all entities
         all_entities: list[ProductEntity] = []
-        for post in posts:
-            entities = self.recognize_in_post(post)
-            all_entities.extend(entities)
+        for text in iter_post_texts(posts):
+            all_entities.extend(self.recognize(text))
 
         # Merge entities with updated mention counts
         merged = self._merge_entities(all_entities)
@@ -0,0 +1,148 @@
+"""
+Single-pass multi-keyword matching.
+
+Counting K keywords with one ``str.find`` loop each rescans every text K times.
+``KeywordMatcher`` compiles all keywords into one trie-shaped regular
+expression, so a single scan of a text reports every occurrence of every
+keyword, with the same overlapping substring semantics as repeated ``find``.
+For a handful of keywords it keeps the plain ``find`` loops, which are faster.
+
+Example:
+    >>> matcher = KeywordMatcher(["py", "python", "rust"])
+    >>> matcher.count("Python or PyPy? Rust!")
+    {'py': 3, 'python': 1, 'rust': 1}
+"""
+
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+# Trie node key marking the end of a keyword
+_END = ""
+# Up to this many keywords, one C-level str.find loop per keyword beats the
+# per-position regex scan
+_FIND_LIMIT = 8
+
+
+def _trie_pattern(node: dict[str, Any]) -> str:
+    """
+    Build a regex matching the longest keyword of a trie at one position.
+
+    Children are disjoint by first character, and an optional (greedy) tail
+    after a keyword end makes the engine prefer the longer keyword.
+    """
+    branches = [
+        re.escape(char) + _trie_pattern(child)
+        for char, child in sorted(node.items())
+        if char != _END
+    ]
+    if not branches:
+        return ""
+    body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+    if _END in node:
+        body = f"(?:{body})?"
+    return body
+
+
+class KeywordMatcher:
+    """
+    Case-insensitive matcher counting many keywords in one pass.
+
+    Keywords are lowercased and deduplicated; empty keywords never match.
+    Matching is plain substring matching and counts overlapping occurrences,
+    like repeatedly calling ``str.find`` from ``pos + 1``.
+
+    Attributes:
+        keywords: Distinct lowercased keywords, in first-seen order
+    """
+
+    def __init__(self, keywords: Iterable[str]) -> None:
+        """
+        Compile the matcher.
+
+        Args:
+            keywords: Keywords to match (any case)
+        """
+        self.keywords: list[str] = []
+        self._index: dict[str, int] = {}
+        for keyword in keywords:
+            lowered = keyword.lower()
+            if lowered and lowered not in self._index:
+                self._index[lowered] = len(self.keywords)
+                self.keywords.append(lowered)
+
+        trie: dict[str, Any] = {}
+        for keyword in self.keywords:
+            node = trie
+            for char in keyword:
+                node = node.setdefault(char, {})
+            node[_END] = True
+
+        # Every keyword matching at a position is a prefix of the longest one,
+        # so one regex hit expands to that keyword's chain of keyword prefixes
+        self._chains: dict[str, tuple[int, ...]] = {}
+        for keyword in self.keywords:
+            self._chains[keyword] = tuple(
+                self._index[keyword[:end]]
+                for end in range(1, len(keyword) + 1)
+                if keyword[:end] in self._index
+            )
+
+        self._pattern: re.Pattern[str] | None = None
+        if len(self.keywords) > _FIND_LIMIT:
+            self._pattern = re.compile(f"(?=({_trie_pattern(trie)}))")
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def index_of(self, keyword: str) -> int | None:
+        """
+        Position of a keyword in ``keywords``.
+
+        Args:
+            keyword: Keyword (any case)
+
+        Returns:
+            Index, or None if the keyword is empty or unknown
+        """
+        return self._index.get(keyword.lower())
+
+    def iter_matches(self, text_lower: str) -> Iterator[int]:
+        """
+        Yield the keyword index of every occurrence in a lowercased text.
+
+        Args:
+            text_lower: Text already lowercased by the caller
+
+        Yields:
+            Index into ``keywords``, once per occurrence
+        """
+        if self._pattern is None:
+            for index, keyword in enumerate(self.keywords):
+                pos = text_lower.find(keyword)
+                while pos != -1:
+                    yield index
+                    pos = text_lower.find(keyword, pos + 1)
+            return
+        chains = self._chains
+        for match in self._pattern.finditer(text_lower):
+            yield from chains[match.group(1)]
+
+    def count(self, text: str) -> dict[str, int]:
+        """
+        Count every keyword in a text.
+
+        Args:
+            text: Text to search (any case)
+
+        Returns:
+            Occurrences per lowercased keyword, including zero counts
+        """
+        counts = [0] * len(self.keywords)
+        for index in self.iter_matches(text.lower()):
+            counts[index] += 1
+        return dict(zip(self.keywords, counts, strict=True))
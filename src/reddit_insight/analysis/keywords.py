@@ -22,6 +22,7 @@ from typing import TYPE_CHECKING
 
 import yake
 
+from reddit_insight.analysis.corpus import iter_post_texts
 from reddit_insight.analysis.stopwords import (
     StopwordManager,
     clean_reddit_text,
@@ -29,6 +30,8 @@ from reddit_insight.analysis.stopwords import (
 )
 
 if TYPE_CHECKING:
+    from reddit_insight.analysis.context import AnalysisContext
+    from reddit_insight.analysis.corpus import PostCorpus
     from reddit_insight.reddit.models import Post
 
 
@@ -99,6 +102,7 @@ class YAKEExtractor:
     """
 
     config: KeywordExtractorConfig = field(default_factory=KeywordExtractorConfig)
+    context: AnalysisContext | None = field(default=None, repr=False)
     _yake_extractor: yake.KeywordExtractor = field(init=False, repr=False)
     _stopword_manager: StopwordManager = field(init=False, repr=False)
 
@@ -138,7 +142,8 @@ class YAKEExtractor:
         """
         Preprocess text before keyword extraction.
 
-        Cleans Reddit-specific patterns if enabled in config.
+        Cleans Reddit-specific patterns if enabled in config. With an
+        analysis context the cleaned text is computed once per document.
 
         Args:
             text: Input text
@@ -147,6 +152,8 @@ class YAKEExtractor:
             Preprocessed text
         """
         if self.config.clean_reddit_text:
+            if self.context is not None:
+                return self.context.cleaned(text)
             return clean_reddit_text(text)
         return text
 
@@ -275,14 +282,14 @@ class YAKEExtractor:
         keywords.sort(key=lambda k: k.score, reverse=True)
         return keywords[:self.config.num_keywords]
 
-    def extract_from_posts(self, posts: list[Post]) -> list[Keyword]:
+    def extract_from_posts(self, posts: list[Post] | PostCorpus) -> list[Keyword]:
         """
         Extract keywords from Reddit Post objects.
 
         Combines title and selftext from each post.
 
         Args:
-            posts: List of Post objects
+            posts: List of Post objects or a PostCorpus
 
         Returns:
             List of Keyword objects from all posts
@@ -290,15 +297,7 @@ class YAKEExtractor:
         if not posts:
             return []
 
-        texts = []
-        for post in posts:
-            # Combine title and selftext
-            text_parts = [post.title]
-            if post.selftext:
-                text_parts.append(post.selftext)
-            texts.append(" ".join(text_parts))
-
-        return self.extract_from_texts(texts)
+        return self.extract_from_texts(list(iter_post_texts(posts)))
 
 
 class KeywordMethod(Enum):
@@ -359,12 +358,13 @@ class UnifiedKeywordExtractor:
     """
 
     method: KeywordMethod = KeywordMethod.YAKE
+    context: AnalysisContext | None = field(default=None, repr=False)
     _yake: YAKEExtractor = field(init=False, repr=False)
     _tfidf: TFIDFAnalyzer | None = field(init=False, repr=False, default=None)
 
     def __post_init__(self) -> None:
         """Initialize extractors."""
-        self._yake = YAKEExtractor()
+        self._yake = YAKEExtractor(context=self.context)
 
     def _get_tfidf(self) -> TFIDFAnalyzer:
         """Lazy initialization of TF-IDF analyzer."""
@@ -372,7 +372,7 @@ class UnifiedKeywordExtractor:
             # Import here to avoid circular dependency
             from reddit_insight.analysis.tfidf import TFIDFAnalyzer
 
-            self._tfidf = TFIDFAnalyzer()
+            self._tfidf = TFIDFAnalyzer(context=self.context)
         return self._tfidf
 
     def _merge_keywords(
@@ -492,7 +492,7 @@ class UnifiedKeywordExtractor:
 
     def extract_from_posts(
         self,
-        posts: list[Post],
+        posts: list[Post] | PostCorpus,
         num_keywords: int = 20,
         method: KeywordMethod | None = None,
     ) -> KeywordResult:
@@ -500,7 +500,7 @@ class UnifiedKeywordExtractor:
         Extract keywords from Reddit Post objects.
 
         Args:
-            posts: List of Post objects
+            posts: List of Post objects or a PostCorpus
             num_keywords: Number of keywords to extract
             method: Extraction method (uses instance default if None)
 
@@ -515,11 +515,6 @@ class UnifiedKeywordExtractor:
             )
 
         # Convert posts to texts
-        texts = []
-        for post in posts:
-            text_parts = [post.title]
-            if post.selftext:
-                text_parts.append(post.selftext)
-            texts.append(" ".join(text_parts))
+        texts = list(iter_post_texts(posts))
 
         return self.extract_keywords(texts, num_keywords, method)
@@ -27,6 +27,7 @@ from reddit_insight.analysis.ml.base import (
     MLAnalyzerConfig,
 )
 from reddit_insight.analysis.ml.models import (
+    AnomalyMatrixResult,
     AnomalyPoint,
     AnomalyResult,
     Cluster,
@@ -65,6 +66,7 @@ __all__ = [
     "AnomalyDetectorConfig",
     "detect_anomalies_simple",
     # Anomaly detection models
+    "AnomalyMatrixResult",
     "AnomalyPoint",
     "AnomalyResult",
     # Topic modeling
@@ -35,7 +35,7 @@ from reddit_insight.analysis.ml.base import (
     MLAnalyzerBase,
     MLAnalyzerConfig,
 )
-from reddit_insight.analysis.ml.models import AnomalyPoint, AnomalyResult
+from reddit_insight.analysis.ml.models import AnomalyMatrixResult, AnomalyPoint, AnomalyResult
 
 if TYPE_CHECKING:
     from reddit_insight.analysis.time_series import TimeSeries
@@ -174,9 +174,7 @@ class AnomalyDetector(MLAnalyzerBase):
             )
 
         # Select method
-        method = cfg.method
-        if method == "auto":
-            method = self._auto_select_method(values)
+        method = self._auto_select_method(values) if cfg.method == "auto" else cfg.method
 
         # Perform detection based on method
         if method == "zscore":
@@ -216,7 +214,11 @@ class AnomalyDetector(MLAnalyzerBase):
         Returns:
             Selected method name
         """
-        n = len(values)
+        return self._select_method_for_length(len(values))
+
+    @staticmethod
+    def _select_method_for_length(n: int) -> str:
+        """Detection method for series of ``n`` points (see _auto_select_method)."""
         if n < 30:
             return "zscore"
         elif n <= 100:
@@ -224,122 +226,96 @@ class AnomalyDetector(MLAnalyzerBase):
         else:
             return "isolation_forest"
 
-    def _detect_zscore(
-        self,
-        values: list[float],
-        timestamps: list[datetime],
-    ) -> tuple[list[AnomalyPoint], float]:
+    def detect_many(self, values: np.ndarray | list[list[float]]) -> AnomalyMatrixResult:
         """
-        Detect anomalies using Z-score method.
+        Detect anomalies in many series at once.
 
-        Z-score measures how many standard deviations a point is from the mean.
-        Points with |z-score| > threshold are classified as anomalies.
+        Each row is one series (e.g. a keyword) and each column one time
+        bucket. Z-score and IQR statistics are computed for all rows in one
+        vectorized pass; Isolation Forest is fitted per row.
 
         Args:
-            values: List of values to analyze
-            timestamps: Corresponding timestamps
+            values: 2-D matrix of values (series x time buckets)
 
         Returns:
-            Tuple of (anomaly points, threshold used)
+            AnomalyMatrixResult with per-point scores and flags
+
+        Raises:
+            ValueError: If values is not 2-D or the method is unknown
         """
+        matrix = np.asarray(values, dtype=np.float64)
+        if matrix.ndim != 2:
+            raise ValueError(f"values must be 2-D, got {matrix.ndim}-D")
         cfg = self.detector_config
-        arr = np.array(values, dtype=np.float64)
-        threshold = cfg.threshold
+        n = matrix.shape[1]
+
+        if n < cfg.min_data_points:
+            return AnomalyMatrixResult(
+                scores=np.zeros_like(matrix),
+                is_anomaly=np.zeros(matrix.shape, dtype=bool),
+                expected_values=matrix.copy(),
+                method="insufficient_data",
+                threshold=cfg.threshold,
+                parameters={"min_required": cfg.min_data_points},
+            )
+
+        # Selection depends only on series length, shared by all rows
+        method = self._select_method_for_length(n) if cfg.method == "auto" else cfg.method
 
-        if cfg.window_size > 0 and len(arr) > cfg.window_size:
-            # Rolling statistics
-            anomalies = self._detect_zscore_rolling(arr, timestamps, threshold)
+        if method == "zscore":
+            scores, flags, expected, _ = _zscore_matrix(matrix, cfg.threshold, cfg.window_size)
+            threshold = cfg.threshold
+        elif method == "iqr":
+            scores, flags, expected, _ = _iqr_matrix(matrix, cfg.iqr_multiplier, cfg.window_size)
+            threshold = cfg.iqr_multiplier
+        elif method == "isolation_forest":
+            scores = np.empty_like(matrix)
+            flags = np.empty(matrix.shape, dtype=bool)
+            expected = np.empty_like(matrix)
+            for row in range(matrix.shape[0]):
+                flags[row], scores[row], median = self._isolation_forest_scores(matrix[row])
+                expected[row] = median
+            threshold = cfg.contamination
         else:
-            # Global statistics
-            mean = float(np.mean(arr))
-            std = float(np.std(arr))
-
-            if std == 0:
-                # No variation - no anomalies
-                return [
-                    AnomalyPoint(
-                        timestamp=ts,
-                        value=val,
-                        anomaly_score=0.0,
-                        is_anomaly=False,
-                        expected_value=mean,
-                        deviation=0.0,
-                    )
-                    for ts, val in zip(timestamps, values)
-                ], threshold
-
-            anomalies = []
-            for ts, val in zip(timestamps, values):
-                z_score = abs((val - mean) / std)
-                is_anomaly = z_score > threshold
-                deviation = val - mean
-
-                anomalies.append(
-                    AnomalyPoint(
-                        timestamp=ts,
-                        value=val,
-                        anomaly_score=z_score,
-                        is_anomaly=is_anomaly,
-                        expected_value=mean,
-                        deviation=deviation,
-                    )
-                )
+            raise ValueError(f"Unknown method: {method}")
 
-        return anomalies, threshold
+        return AnomalyMatrixResult(
+            scores=scores,
+            is_anomaly=flags,
+            expected_values=expected,
+            method=method,
+            threshold=threshold,
+            parameters={
+                "window_size": cfg.window_size,
+                "iqr_multiplier": cfg.iqr_multiplier,
+            },
+        )
 
-    def _detect_zscore_rolling(
+    def _detect_zscore(
         self,
-        arr: np.ndarray,
+        values: list[float],
         timestamps: list[datetime],
-        threshold: float,
-    ) -> list[AnomalyPoint]:
+    ) -> tuple[list[AnomalyPoint], float]:
         """
-        Detect anomalies using rolling Z-score.
+        Detect anomalies using Z-score method.
 
-        Uses a sliding window to compute local statistics, which helps
-        detect anomalies in data with trends or seasonality.
+        Z-score measures how many standard deviations a point is from the mean.
+        Points with |z-score| > threshold are classified as anomalies. With a
+        window size, local statistics come from a centered rolling window,
+        which helps detect anomalies in data with trends or seasonality.
 
         Args:
-            arr: Numpy array of values
+            values: List of values to analyze
             timestamps: Corresponding timestamps
-            threshold: Z-score threshold
 
         Returns:
-            List of anomaly points
+            Tuple of (anomaly points, threshold used)
         """
         cfg = self.detector_config
-        window = cfg.window_size
-        anomalies = []
-
-        for i, (ts, val) in enumerate(zip(timestamps, arr)):
-            # Get window of values centered on current point
-            start_idx = max(0, i - window // 2)
-            end_idx = min(len(arr), i + window // 2 + 1)
-            window_vals = arr[start_idx:end_idx]
-
-            mean = float(np.mean(window_vals))
-            std = float(np.std(window_vals))
-
-            if std == 0:
-                z_score = 0.0
-            else:
-                z_score = abs((float(val) - mean) / std)
-
-            is_anomaly = z_score > threshold
-            deviation = float(val) - mean
-
-            anomalies.append(
-                AnomalyPoint(
-                    timestamp=ts,
-                    value=float(val),
-                    anomaly_score=z_score,
-                    is_anomaly=is_anomaly,
-                    expected_value=mean,
-                    deviation=deviation,
-                )
-            )
-
-        return anomalies
+        arr = np.array([values], dtype=np.float64)
+        threshold = cfg.threshold
+        scores, flags, expected, deviation = _zscore_matrix(arr, threshold, cfg.window_size)
+        return _to_points(timestamps, values, scores, flags, expected, deviation), threshold
 
     def _detect_iqr(
         self,
@@ -351,6 +327,7 @@ class AnomalyDetector(MLAnalyzerBase):
 
         IQR is robust to outliers and doesn't assume normal distribution.
         Outliers are points outside [Q1 - k*IQR, Q3 + k*IQR] where k=1.5.
+        With a window size, quartiles come from a centered rolling window.
 
         Args:
             values: List of values to analyze
@@ -360,51 +337,12 @@ class AnomalyDetector(MLAnalyzerBase):
             Tuple of (anomaly points, threshold based on IQR)
         """
         cfg = self.detector_config
-        arr = np.array(values, dtype=np.float64)
+        arr = np.array([values], dtype=np.float64)
         k = cfg.iqr_multiplier
-
-        q1 = float(np.percentile(arr, 25))
-        q3 = float(np.percentile(arr, 75))
-        iqr = q3 - q1
-
-        lower_bound = q1 - k * iqr
-        upper_bound = q3 + k * iqr
-
-        median = float(np.median(arr))
-
-        anomalies = []
-        for ts, val in zip(timestamps, values):
-            is_anomaly = val < lower_bound or val > upper_bound
-
-            # Calculate anomaly score based on distance from bounds
-            if val < lower_bound:
-                distance = lower_bound - val
-            elif val > upper_bound:
-                distance = val - upper_bound
-            else:
-                distance = 0.0
-
-            # Normalize score by IQR (if IQR is 0, use absolute distance)
-            if iqr > 0:
-                anomaly_score = distance / iqr
-            else:
-                anomaly_score = distance if distance > 0 else 0.0
-
-            deviation = val - median
-
-            anomalies.append(
-                AnomalyPoint(
-                    timestamp=ts,
-                    value=val,
-                    anomaly_score=anomaly_score,
-                    is_anomaly=is_anomaly,
-                    expected_value=median,
-                    deviation=deviation,
-                )
-            )
+        scores, flags, expected, deviation = _iqr_matrix(arr, k, cfg.window_size)
 
         # Return threshold as the IQR multiplier used
-        return anomalies, k
+        return _to_points(timestamps, values, scores, flags, expected, deviation), k
 
     def _detect_isolation_forest(
         self,
@@ -424,6 +362,35 @@ class AnomalyDetector(MLAnalyzerBase):
         Returns:
             Tuple of (anomaly points, contamination threshold)
         """
+        flags, scores, median = self._isolation_forest_scores(
+            np.array(values, dtype=np.float64)
+        )
+
+        anomalies = []
+        for i, (ts, val) in enumerate(zip(timestamps, values)):
+            anomalies.append(
+                AnomalyPoint(
+                    timestamp=ts,
+                    value=val,
+                    anomaly_score=float(scores[i]),
+                    is_anomaly=bool(flags[i]),
+                    expected_value=median,
+                    deviation=val - median,
+                )
+            )
+
+        return anomalies, self.detector_config.contamination
+
+    def _isolation_forest_scores(self, arr: np.ndarray) -> tuple[np.ndarray, np.ndarray, float]:
+        """
+        Fit an Isolation Forest on one series.
+
+        Args:
+            arr: 1-D array of values
+
+        Returns:
+            Tuple of (anomaly flags, anomaly scores, median value)
+        """
         try:
             from sklearn.ensemble import IsolationForest
         except ImportError as e:
@@ -433,40 +400,19 @@ class AnomalyDetector(MLAnalyzerBase):
             ) from e
 
         cfg = self.detector_config
-        arr = np.array(values, dtype=np.float64).reshape(-1, 1)
-        contamination = cfg.contamination
+        column = arr.reshape(-1, 1)
 
         # Fit Isolation Forest
         model = IsolationForest(
-            contamination=contamination,
+            contamination=cfg.contamination,
             random_state=cfg.random_state,
             n_estimators=100,
         )
-        predictions = model.fit_predict(arr)
-        scores = -model.decision_function(arr)  # Higher = more anomalous
-
-        # Calculate expected value as median
-        median = float(np.median(arr))
+        predictions = model.fit_predict(column)
+        scores = -model.decision_function(column)  # Higher = more anomalous
 
-        anomalies = []
-        for i, (ts, val) in enumerate(zip(timestamps, values)):
-            # prediction: -1 = anomaly, 1 = normal
-            is_anomaly = predictions[i] == -1
-            anomaly_score = float(scores[i])
-            deviation = val - median
-
-            anomalies.append(
-                AnomalyPoint(
-                    timestamp=ts,
-                    value=val,
-                    anomaly_score=anomaly_score,
-                    is_anomaly=is_anomaly,
-                    expected_value=median,
-                    deviation=deviation,
-                )
-            )
-
-        return anomalies, contamination
+        # prediction: -1 = anomaly, 1 = normal
+        return predictions == -1, scores, float(np.median(column))
 
     def _calculate_confidence(self, data_size: int, anomaly_count: int) -> float:
         """
@@ -508,6 +454,170 @@ class AnomalyDetector(MLAnalyzerBase):
         return min(size_confidence * rate_confidence, 1.0)
 
 
+# =============================================================================
+# VECTORIZED STATISTICS
+# =============================================================================
+
+# Upper bound on elements materialized at once for rolling quantile windows
+_QUANTILE_CHUNK_ELEMENTS = 4_000_000
+
+
+def _window_bounds(n: int, window: int) -> tuple[np.ndarray, np.ndarray]:
+    """Start and end (exclusive) of the centered window around each index."""
+    half = window // 2
+    index = np.arange(n)
+    return np.maximum(0, index - half), np.minimum(n, index + half + 1)
+
+
+def _rolling_mean_std(values: np.ndarray, window: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Centered rolling mean and population std of each row in O(n).
+
+    Window sums come from cumulative sums of the row-centered values (for
+    numerical stability). Windows holding a single distinct value get an
+    exact std of 0 and a mean equal to that value.
+    """
+    rows, n = values.shape
+    starts, ends = _window_bounds(n, window)
+    counts = ends - starts
+
+    row_mean = values.mean(axis=1, keepdims=True)
+    centered = values - row_mean
+    sums = np.zeros((rows, n + 1))
+    np.cumsum(centered, axis=1, out=sums[:, 1:])
+    squares = np.zeros((rows, n + 1))
+    np.cumsum(centered * centered, axis=1, out=squares[:, 1:])
+
+    window_mean = (sums[:, ends] - sums[:, starts]) / counts
+    variance = (squares[:, ends] - squares[:, starts]) / counts - window_mean**2
+    mean = window_mean + row_mean
+    std = np.sqrt(np.maximum(variance, 0.0))
+
+    # changes[:, k] counts value changes between positions j-1 and j for j < k
+    changes = np.zeros((rows, n + 1), dtype=np.intp)
+    np.cumsum(values[:, 1:] != values[:, :-1], axis=1, out=changes[:, 2:])
+    constant = changes[:, ends] == changes[:, starts + 1]
+    return np.where(constant, values, mean), np.where(constant, 0.0, std)
+
+
+def _rolling_percentiles(
+    values: np.ndarray, window: int, percentiles: tuple[float, ...]
+) -> np.ndarray:
+    """
+    Centered rolling percentiles of each row.
+
+    Interior points use a strided sliding-window view; the shorter windows at
+    both edges are computed column by column.
+
+    Returns:
+        Array of shape (len(percentiles), rows, n)
+    """
+    rows, n = values.shape
+    half = window // 2
+    width = 2 * half + 1
+    result = np.empty((len(percentiles), rows, n))
+
+    if n >= width:
+        windows = np.lib.stride_tricks.sliding_window_view(values, width, axis=1)
+        chunk = max(1, _QUANTILE_CHUNK_ELEMENTS // (windows.shape[1] * width))
+        for row in range(0, rows, chunk):
+            result[:, row : row + chunk, half : n - half] = np.percentile(
+                windows[row : row + chunk], percentiles, axis=-1
+            )
+
+    starts, ends = _window_bounds(n, window)
+    for column in (*range(min(half, n)), *range(max(n - half, half), n)):
+        result[:, :, column] = np.percentile(
+            values[:, starts[column] : ends[column]], percentiles, axis=1
+        )
+    return result
+
+
+def _zscore_matrix(
+    values: np.ndarray, threshold: float, window: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Z-score anomaly scores for each row of a matrix.
+
+    Returns:
+        Tuple of (scores, anomaly flags, expected values, deviations)
+    """
+    n = values.shape[1]
+    if window > 0 and n > window:
+        # Rolling statistics
+        mean, std = _rolling_mean_std(values, window)
+        deviation = values - mean
+    else:
+        # Global statistics (no variation in a row -> no deviation)
+        mean = np.broadcast_to(values.mean(axis=1, keepdims=True), values.shape)
+        std = np.broadcast_to(values.std(axis=1, keepdims=True), values.shape)
+        deviation = np.where(std == 0, 0.0, values - mean)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scores = np.where(std == 0, 0.0, np.abs(deviation / std))
+    return scores, scores > threshold, np.array(mean), deviation
+
+
+def _iqr_matrix(
+    values: np.ndarray, k: float, window: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    IQR anomaly scores for each row of a matrix.
+
+    Returns:
+        Tuple of (scores, anomaly flags, expected values, deviations)
+    """
+    n = values.shape[1]
+    if window > 0 and n > window:
+        q1, q3, median = _rolling_percentiles(values, window, (25, 75, 50))
+    else:
+        q1, q3 = np.percentile(values, (25, 75), axis=1, keepdims=True)
+        median = np.median(values, axis=1, keepdims=True)
+    iqr = q3 - q1
+
+    lower_bound = q1 - k * iqr
+    upper_bound = q3 + k * iqr
+    below = values < lower_bound
+    above = values > upper_bound
+
+    # Distance from bounds, normalized by IQR (absolute distance if IQR is 0)
+    distance = np.where(below, lower_bound - values, np.where(above, values - upper_bound, 0.0))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scores = np.where(iqr > 0, distance / iqr, distance)
+    median = np.broadcast_to(median, values.shape)
+    return scores, below | above, np.array(median), values - median
+
+
+def _to_points(
+    timestamps: list[datetime],
+    values: list[float],
+    scores: np.ndarray,
+    flags: np.ndarray,
+    expected: np.ndarray,
+    deviation: np.ndarray,
+) -> list[AnomalyPoint]:
+    """Convert the first row of vectorized results to anomaly points."""
+    return [
+        AnomalyPoint(
+            timestamp=ts,
+            value=val,
+            anomaly_score=score,
+            is_anomaly=flag,
+            expected_value=exp,
+            deviation=dev,
+        )
+        for ts, val, score, flag, exp, dev in zip(
+            timestamps,
+            values,
+            scores[0].tolist(),
+            flags[0].tolist(),
+            expected[0].tolist(),
+            deviation[0].tolist(),
+            strict=True,
+        )
+    ]
+
+
 def detect_anomalies_simple(
     values: list[float],
     timestamps: list[datetime] | None = None,
@@ -4,6 +4,7 @@ ML Analysis result data models.
 Provides specific data models for different types of ML analysis results:
 - PredictionResult: Time series prediction results
 - AnomalyResult: Anomaly detection results
+- AnomalyMatrixResult: Anomaly detection results for many series
 - ClusterResult: Clustering analysis results
 - TopicResult: Topic modeling results
 
@@ -22,6 +23,8 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
+import numpy as np
+
 
 @dataclass
 class PredictionResult:
@@ -188,6 +191,58 @@ class AnomalyResult:
         }
 
 
+@dataclass
+class AnomalyMatrixResult:
+    """
+    Result of anomaly detection over many series at once.
+
+    Row ``i`` of every matrix belongs to input series ``i`` and column ``j``
+    to time bucket ``j``.
+
+    Attributes:
+        scores: Anomaly score per point (higher = more anomalous)
+        is_anomaly: Boolean anomaly flag per point
+        expected_values: Expected normal value per point
+        method: Detection method used
+        threshold: Score threshold used for classification
+        parameters: Additional method-specific parameters
+
+    Example:
+        >>> result = detector.detect_many(counts)  # keywords x days
+        >>> for row in result.anomalous_rows():
+        ...     print(keywords[row], result.anomaly_counts[row])
+    """
+
+    scores: np.ndarray
+    is_anomaly: np.ndarray
+    expected_values: np.ndarray
+    method: str
+    threshold: float
+    parameters: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def anomaly_counts(self) -> np.ndarray:
+        """Number of anomalies per series."""
+        counts: np.ndarray = self.is_anomaly.sum(axis=1)
+        return counts
+
+    def anomalous_rows(self) -> list[int]:
+        """Indices of series with at least one anomaly."""
+        return np.flatnonzero(self.is_anomaly.any(axis=1)).tolist()
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary representation."""
+        return {
+            "scores": self.scores.tolist(),
+            "is_anomaly": self.is_anomaly.tolist(),
+            "expected_values": self.expected_values.tolist(),
+            "method": self.method,
+            "threshold": self.threshold,
+            "anomaly_counts": self.anomaly_counts.tolist(),
+            "parameters": self.parameters,
+        }
+
+
 @dataclass
 class Cluster:
     """
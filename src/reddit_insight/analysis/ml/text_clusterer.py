@@ -4,6 +4,11 @@ Text clustering module for Reddit analysis.
 Provides K-means and Agglomerative clustering for grouping similar texts
 such as Reddit posts with similar demands or complaints.
 
+Large corpora (``large_corpus_threshold`` documents or more) take a scalable
+K-means path that never densifies the TF-IDF matrix: optional TruncatedSVD
+reduction, MiniBatchKMeans warm-started across candidate k, and sampled
+silhouette scores for k selection.
+
 Example:
     >>> from reddit_insight.analysis.ml.text_clusterer import TextClusterer, TextClustererConfig
     >>> clusterer = TextClusterer(TextClustererConfig(n_clusters=3))
@@ -20,10 +25,13 @@ from typing import TYPE_CHECKING, Any, Literal
 
 import numpy as np
 from numpy.typing import NDArray
-from scipy.sparse import spmatrix
-from sklearn.cluster import AgglomerativeClustering, KMeans
+from scipy.sparse import csr_matrix, issparse, spmatrix
+from sklearn.cluster import AgglomerativeClustering, KMeans, MiniBatchKMeans
+from sklearn.decomposition import TruncatedSVD
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics import silhouette_score
+from sklearn.pipeline import Pipeline, make_pipeline
+from sklearn.preprocessing import Normalizer
 
 from reddit_insight.analysis.ml.base import (
     AnalysisResult,
@@ -54,6 +62,13 @@ class TextClustererConfig(MLAnalyzerConfig):
         n_keywords: Number of keywords to extract per cluster
         min_df: Minimum document frequency for terms
         max_df: Maximum document frequency for terms
+        large_corpus_threshold: Document count from which K-means uses the
+            scalable path (MiniBatchKMeans, sampled silhouette)
+        svd_components: TruncatedSVD dimensions for the scalable path
+            (None to cluster the sparse TF-IDF matrix directly)
+        silhouette_sample_size: Documents sampled per silhouette score on
+            the scalable path
+        batch_size: Mini-batch size for MiniBatchKMeans
     """
 
     n_clusters: int | None = None
@@ -64,6 +79,10 @@ class TextClustererConfig(MLAnalyzerConfig):
     n_keywords: int = 5
     min_df: int = 1
     max_df: float = 0.95
+    large_corpus_threshold: int = 2000
+    svd_components: int | None = 100
+    silhouette_sample_size: int = 2000
+    batch_size: int = 1024
 
 
 class TextClusterer(MLAnalyzerBase):
@@ -72,6 +91,8 @@ class TextClusterer(MLAnalyzerBase):
 
     Groups similar texts together based on TF-IDF representations.
     Supports automatic cluster count selection using silhouette score.
+    K-means on large corpora runs on the sparse (or SVD-reduced) matrix
+    with MiniBatchKMeans instead of densifying it.
 
     Example:
         >>> config = TextClustererConfig(n_clusters=3)
@@ -93,7 +114,8 @@ class TextClusterer(MLAnalyzerBase):
         super().__init__(self._config)
         self._tokenizer = RedditTokenizer()
         self._vectorizer: TfidfVectorizer | None = None
-        self._model: KMeans | AgglomerativeClustering | None = None
+        self._model: KMeans | MiniBatchKMeans | AgglomerativeClustering | None = None
+        self._reducer: Pipeline | None = None
         self._feature_names: list[str] | None = None
         self._tfidf_matrix: spmatrix | None = None
         self._labels: NDArray[np.int_] | None = None
@@ -168,6 +190,130 @@ class TextClusterer(MLAnalyzerBase):
 
         return best_k
 
+    def _reduce(self, X: spmatrix) -> NDArray[np.float64] | spmatrix:
+        """
+        Reduce the TF-IDF matrix with TruncatedSVD (LSA) for the scalable path.
+
+        Rows are re-normalized after projection so Euclidean K-means on the
+        reduced vectors still approximates cosine similarity.
+
+        Args:
+            X: Sparse TF-IDF matrix
+
+        Returns:
+            Dense reduced matrix, or X unchanged if reduction is disabled
+            or would not shrink the feature space
+        """
+        n_components = self._config.svd_components
+        if n_components is None or n_components >= min(X.shape) - 1:
+            self._reducer = None
+            return X
+
+        self._reducer = make_pipeline(
+            TruncatedSVD(n_components=n_components, random_state=self._config.random_state),
+            Normalizer(copy=False),
+        )
+        return self._reducer.fit_transform(X)
+
+    def _create_minibatch_model(
+        self,
+        n_clusters: int,
+        init: NDArray[np.float64] | str = "k-means++",
+        n_init: int | None = None,
+    ) -> MiniBatchKMeans:
+        """Create a MiniBatchKMeans model for the scalable path."""
+        if n_init is None:
+            n_init = 3 if isinstance(init, str) else 1
+        return MiniBatchKMeans(
+            n_clusters=n_clusters,
+            init=init,
+            n_init=n_init,
+            batch_size=self._config.batch_size,
+            random_state=self._config.random_state,
+        )
+
+    def _sampled_silhouette(
+        self,
+        X: NDArray[np.float64] | spmatrix,
+        labels: NDArray[np.int_],
+    ) -> float:
+        """
+        Silhouette score on a fixed random sample of documents.
+
+        Raises:
+            ValueError: If labels contain a single cluster
+        """
+        sample_size = min(X.shape[0], self._config.silhouette_sample_size)
+        return float(
+            silhouette_score(
+                X,
+                labels,
+                sample_size=sample_size,
+                random_state=self._config.random_state,
+            )
+        )
+
+    def _search_k_minibatch(
+        self,
+        X: NDArray[np.float64] | spmatrix,
+        max_k: int,
+    ) -> MiniBatchKMeans:
+        """
+        Select the number of clusters on the scalable path.
+
+        Each k is warm-started from the centers found for k - 1 plus one new
+        center drawn k-means++-style (proportional to squared distance from
+        the existing centers). A cold k-means++ fit is run alongside and the
+        model with the lower inertia is kept, so one poor split does not
+        carry over to larger k. Models are scored with a sampled silhouette.
+
+        Args:
+            X: Document matrix (reduced or sparse TF-IDF)
+            max_k: Maximum number of clusters to try
+
+        Returns:
+            Fitted model with the best silhouette score
+        """
+        n_samples = X.shape[0]
+        min_k = 2
+        max_k = min(max_k, n_samples - 1, n_samples // self._config.min_cluster_size)
+        if max_k < min_k:
+            return self._create_minibatch_model(min_k).fit(X)
+
+        rng = np.random.default_rng(self._config.random_state)
+        best_model: MiniBatchKMeans | None = None
+        best_score = -1.0
+        model: MiniBatchKMeans | None = None
+
+        for k in range(min_k, max_k + 1):
+            if model is None:
+                model = self._create_minibatch_model(k).fit(X)
+            else:
+                distances = model.transform(X).min(axis=1) ** 2
+                total = distances.sum()
+                if total <= 0:
+                    # Every document sits on a center; more clusters cannot help
+                    break
+                index = int(rng.choice(n_samples, p=distances / total))
+                new_center = X[index].toarray() if issparse(X) else X[index : index + 1]
+                init = np.vstack([model.cluster_centers_, new_center])
+                warm = self._create_minibatch_model(k, init=init).fit(X)
+                # A bad early split would be inherited by every later k, so
+                # keep a cold k-means++ fit when it explains the data better
+                cold = self._create_minibatch_model(k, n_init=1).fit(X)
+                model = warm if warm.inertia_ <= cold.inertia_ else cold
+
+            try:
+                score = self._sampled_silhouette(X, model.labels_)
+            except ValueError:
+                # May fail if all points in one cluster
+                continue
+            if score > best_score:
+                best_score = score
+                best_model = model
+
+        return best_model if best_model is not None else model
+
     def _create_model(
         self,
         method: ClusterMethod,
@@ -195,6 +341,33 @@ class TextClusterer(MLAnalyzerBase):
                 n_init=10,
             )
 
+    def _cluster_means(
+        self,
+        X: spmatrix,
+        labels: NDArray[np.int_],
+    ) -> tuple[NDArray[np.int_], NDArray[np.float64]]:
+        """
+        Mean TF-IDF vector of every cluster without densifying X.
+
+        Uses one sparse product of a (clusters x documents) averaging matrix
+        with the document-term matrix.
+
+        Args:
+            X: TF-IDF matrix
+            labels: Cluster assignments
+
+        Returns:
+            Tuple of (cluster IDs, matrix of cluster means, one row per ID)
+        """
+        unique_labels, rows, counts = np.unique(labels, return_inverse=True, return_counts=True)
+        averaging = csr_matrix(
+            (1.0 / counts[rows], (rows, np.arange(len(labels)))),
+            shape=(len(unique_labels), len(labels)),
+        )
+        means = averaging @ X
+        means = means.toarray() if issparse(means) else np.asarray(means)
+        return unique_labels, means
+
     def _extract_cluster_keywords(
         self,
         X: spmatrix,
@@ -212,28 +385,9 @@ class TextClusterer(MLAnalyzerBase):
         Returns:
             Dictionary mapping cluster ID to list of keywords
         """
-        X_dense = X.toarray() if hasattr(X, "toarray") else X
         cluster_keywords: dict[int, list[str]] = {}
 
-        unique_labels = np.unique(labels)
-
-        for cluster_id in unique_labels:
-            # Get indices of documents in this cluster
-            cluster_mask = labels == cluster_id
-
-            if not np.any(cluster_mask):
-                cluster_keywords[int(cluster_id)] = []
-                continue
-
-            # Calculate mean TF-IDF for cluster
-            cluster_center = X_dense[cluster_mask].mean(axis=0)
-
-            # Ensure it's 1D
-            if hasattr(cluster_center, "A1"):
-                cluster_center = cluster_center.A1
-            else:
-                cluster_center = np.asarray(cluster_center).flatten()
-
+        for cluster_id, cluster_center in zip(*self._cluster_means(X, labels), strict=True):
             # Get top keywords by weight
             top_indices = cluster_center.argsort()[::-1][: self._config.n_keywords]
             keywords = [
@@ -259,30 +413,11 @@ class TextClusterer(MLAnalyzerBase):
         Returns:
             Dictionary mapping cluster ID to centroid coordinates
         """
-        X_dense = X.toarray() if hasattr(X, "toarray") else X
-        centroids: dict[int, list[float]] = {}
-
-        unique_labels = np.unique(labels)
-
-        for cluster_id in unique_labels:
-            cluster_mask = labels == cluster_id
-
-            if not np.any(cluster_mask):
-                centroids[int(cluster_id)] = []
-                continue
-
-            # Calculate centroid as mean of cluster points
-            center = X_dense[cluster_mask].mean(axis=0)
-
-            # Convert to list
-            if hasattr(center, "A1"):
-                center_list = center.A1.tolist()
-            else:
-                center_list = np.asarray(center).flatten().tolist()
-
-            centroids[int(cluster_id)] = center_list
-
-        return centroids
+        unique_labels, means = self._cluster_means(X, labels)
+        return {
+            int(cluster_id): center.tolist()
+            for cluster_id, center in zip(unique_labels, means, strict=True)
+        }
 
     def _get_representative_items(
         self,
@@ -305,14 +440,11 @@ class TextClusterer(MLAnalyzerBase):
         unique_labels = np.unique(labels)
 
         for cluster_id in unique_labels:
-            cluster_mask = labels == cluster_id
-            cluster_texts = [
-                texts[i] for i in range(len(texts)) if cluster_mask[i]
-            ]
+            indices = np.flatnonzero(labels == cluster_id)[:n_items]
 
             # Take first n_items as representatives (could be improved with
             # selection based on distance to centroid)
-            representatives[int(cluster_id)] = cluster_texts[:n_items]
+            representatives[int(cluster_id)] = [texts[i] for i in indices]
 
         return representatives
 
@@ -344,37 +476,56 @@ class TextClusterer(MLAnalyzerBase):
         self._tfidf_matrix = self._vectorizer.fit_transform(valid_texts)
         self._feature_names = list(self._vectorizer.get_feature_names_out())
 
-        # Determine number of clusters
-        n_clusters = self._config.n_clusters
-        if n_clusters is None:
-            # Auto-select optimal k
-            max_k = min(self._config.max_clusters, len(valid_texts) - 1)
-            n_clusters = self._find_optimal_k(self._tfidf_matrix, max_k)
-        else:
-            # Ensure n_clusters doesn't exceed data size
-            n_clusters = min(n_clusters, len(valid_texts) - 1)
-
         # Determine method
         method: ClusterMethod = self._config.method
         if method == "auto":
             # K-means is generally faster and works well for text
             method = "kmeans"
 
-        # Create and fit model
-        self._model = self._create_model(method, n_clusters)
+        max_k = min(self._config.max_clusters, len(valid_texts) - 1)
+        n_clusters = self._config.n_clusters
+        if n_clusters is not None:
+            # Ensure n_clusters doesn't exceed data size
+            n_clusters = min(n_clusters, len(valid_texts) - 1)
 
-        # Get dense matrix for fitting
-        X_dense = self._tfidf_matrix.toarray()
+        scalable = (
+            method == "kmeans" and len(valid_texts) >= self._config.large_corpus_threshold
+        )
+        if scalable:
+            # Sparse/reduced input, MiniBatchKMeans and sampled silhouette
+            X = self._reduce(self._tfidf_matrix)
+            if n_clusters is None:
+                self._model = self._search_k_minibatch(X, max_k)
+            else:
+                self._model = self._create_minibatch_model(n_clusters).fit(X)
+            self._labels = self._model.labels_
+            self._is_fitted = True
 
-        # Fit and get labels
-        self._labels = self._model.fit_predict(X_dense)
-        self._is_fitted = True
+            try:
+                sil_score = self._sampled_silhouette(X, self._labels)
+            except ValueError:
+                sil_score = 0.0
+        else:
+            self._reducer = None
+            if n_clusters is None:
+                # Auto-select optimal k
+                n_clusters = self._find_optimal_k(self._tfidf_matrix, max_k)
 
-        # Calculate silhouette score
-        try:
-            sil_score = float(silhouette_score(X_dense, self._labels))
-        except ValueError:
-            sil_score = 0.0
+            # Create and fit model
+            self._model = self._create_model(method, n_clusters)
+
+            # Get dense matrix for fitting
+            X_dense = self._tfidf_matrix.toarray()
+
+            # Fit and get labels
+            self._labels = self._model.fit_predict(X_dense)
+            self._is_fitted = True
+
+            # Calculate silhouette score
+            try:
+                sil_score = float(silhouette_score(X_dense, self._labels))
+            except ValueError:
+                sil_score = 0.0
 
         # Extract cluster information
         cluster_keywords = self._extract_cluster_keywords(
@@ -416,7 +567,7 @@ class TextClusterer(MLAnalyzerBase):
 
         # Get inertia for K-means
         inertia: float | None = None
-        if isinstance(self._model, KMeans):
+        if isinstance(self._model, KMeans | MiniBatchKMeans):
             inertia = float(self._model.inertia_)
 
         processing_time = (time.time() - start_time) * 1000
@@ -434,6 +585,10 @@ class TextClusterer(MLAnalyzerBase):
                 "n_keywords": self._config.n_keywords,
                 "processing_time_ms": processing_time,
                 "n_documents": len(valid_texts),
+                "scalable": scalable,
+                "svd_components": (
+                    self._config.svd_components if self._reducer is not None else None
+                ),
             },
         )
 
@@ -457,6 +612,10 @@ class TextClusterer(MLAnalyzerBase):
         tfidf_vec = self._vectorizer.transform([text])
 
         # For K-means, use predict
+        if isinstance(self._model, MiniBatchKMeans):
+            if self._reducer is not None:
+                tfidf_vec = self._reducer.transform(tfidf_vec)
+            return int(self._model.predict(tfidf_vec)[0])
         if isinstance(self._model, KMeans):
             return int(self._model.predict(tfidf_vec.toarray())[0])
 
@@ -19,7 +19,6 @@ from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Literal
 
 import numpy as np
-from numpy.typing import NDArray
 from scipy.sparse import spmatrix
 from sklearn.decomposition import LatentDirichletAllocation, NMF
 from sklearn.feature_extraction.text import TfidfVectorizer
@@ -33,10 +32,11 @@ from reddit_insight.analysis.ml.models import Topic, TopicResult
 from reddit_insight.analysis.tokenizer import RedditTokenizer
 
 if TYPE_CHECKING:
-    pass
+    from numpy.typing import NDArray
 
 
 TopicMethod = Literal["lda", "nmf", "auto"]
+CoherenceMeasure = Literal["umass", "npmi"]
 
 
 @dataclass
@@ -52,6 +52,7 @@ class TopicModelerConfig(MLAnalyzerConfig):
         max_df: Maximum document frequency for terms (float for proportion)
         n_top_words: Number of top words to extract per topic
         max_iter: Maximum iterations for model fitting
+        coherence_measure: Co-occurrence coherence variant ("umass" or "npmi")
     """
 
     n_topics: int = 5
@@ -61,6 +62,7 @@ class TopicModelerConfig(MLAnalyzerConfig):
     max_df: float = 0.95
     n_top_words: int = 10
     max_iter: int = 100
+    coherence_measure: CoherenceMeasure = "umass"
 
 
 class TopicModeler(MLAnalyzerBase):
@@ -204,10 +206,18 @@ class TopicModeler(MLAnalyzerBase):
         feature_names: list[str],
     ) -> float:
         """
-        Calculate a simplified coherence score based on co-occurrence.
+        Calculate a co-occurrence coherence score for the topics.
 
-        This is a simplified version of the UMass coherence score.
-        Higher values indicate more coherent topics.
+        Document co-occurrence counts for all topic words come from a single
+        sparse product of the binary occurrence matrix restricted to the
+        topic-word columns. Each topic's score is also stored on the topic.
+
+        Measures (``coherence_measure``), averaged over keyword pairs (i, j)
+        with i ranked above j:
+
+        - "umass": simplified UMass, log((D(i, j) + 1) / D(i)).
+          Higher values indicate more coherent topics.
+        - "npmi": normalized pointwise mutual information in [-1, 1].
 
         Args:
             topics: List of topics with keywords
@@ -220,43 +230,44 @@ class TopicModeler(MLAnalyzerBase):
         # Build feature name to index mapping
         feature_to_idx = {name: idx for idx, name in enumerate(feature_names)}
 
-        # Convert to dense array for easier computation
-        doc_term_matrix = (tfidf_matrix > 0).toarray()  # Binary occurrence matrix
+        # Topic keyword columns that exist in vocabulary
+        topic_columns = [
+            [feature_to_idx[kw] for kw in topic.keywords if kw in feature_to_idx]
+            for topic in topics
+        ]
+        columns = sorted({col for cols in topic_columns for col in cols})
+        if not columns:
+            return 0.0
+        local = {col: pos for pos, col in enumerate(columns)}
 
-        topic_coherences = []
+        # Binary occurrence for topic words only, then all pair counts at once
+        occurrence = (tfidf_matrix.tocsc()[:, columns] > 0).astype(np.float64)
+        co_counts = (occurrence.T @ occurrence).toarray()
+        doc_freq = np.diag(co_counts)
+        n_documents = tfidf_matrix.shape[0]
 
-        for topic in topics:
-            # Get indices for topic keywords that exist in vocabulary
-            word_indices = [
-                feature_to_idx[kw]
-                for kw in topic.keywords
-                if kw in feature_to_idx
-            ]
+        topic_coherences = []
 
-            if len(word_indices) < 2:
+        for topic, cols in zip(topics, topic_columns, strict=True):
+            if len(cols) < 2:
                 continue
 
-            # Calculate pairwise co-occurrence coherence
-            coherence_sum = 0.0
-            pair_count = 0
+            idx = np.array([local[col] for col in cols])
+            first, second = np.triu_indices(len(idx), k=1)
+            first, second = idx[first], idx[second]
+            both = co_counts[first, second]
 
-            for i in range(len(word_indices)):
-                for j in range(i + 1, len(word_indices)):
-                    # Count documents where both words appear
-                    both = np.sum(
-                        doc_term_matrix[:, word_indices[i]]
-                        & doc_term_matrix[:, word_indices[j]]
-                    )
-                    # Count documents where first word appears
-                    first = np.sum(doc_term_matrix[:, word_indices[i]])
-
-                    if first > 0:
-                        # Log probability ratio (simplified UMass)
-                        coherence_sum += np.log((both + 1) / first)
-                        pair_count += 1
+            if self._config.coherence_measure == "npmi":
+                pair_scores = _npmi(both, doc_freq[first], doc_freq[second], n_documents)
+            else:
+                first_freq = doc_freq[first]
+                valid = first_freq > 0
+                # Log probability ratio (simplified UMass)
+                pair_scores = np.log((both[valid] + 1) / first_freq[valid])
 
-            if pair_count > 0:
-                topic_coherences.append(coherence_sum / pair_count)
+            if len(pair_scores) > 0:
+                topic.coherence = float(pair_scores.mean())
+                topic_coherences.append(topic.coherence)
 
         if not topic_coherences:
             return 0.0
@@ -282,17 +293,16 @@ class TopicModeler(MLAnalyzerBase):
         # Transform to get document-topic matrix
         doc_topics = self._model.transform(tfidf_matrix)
 
-        # Normalize to probabilities per document
-        distributions = []
-        for doc_vec in doc_topics:
-            total = doc_vec.sum()
-            if total > 0:
-                normalized = (doc_vec / total).tolist()
-            else:
-                normalized = [1.0 / len(doc_vec)] * len(doc_vec)
-            distributions.append(normalized)
-
-        return distributions
+        # Normalize to probabilities per document (uniform for empty rows)
+        totals = doc_topics.sum(axis=1, keepdims=True)
+        distributions = np.divide(
+            doc_topics,
+            totals,
+            out=np.full_like(doc_topics, 1.0 / doc_topics.shape[1]),
+            where=totals > 0,
+        )
+        rows: list[list[float]] = distributions.tolist()
+        return rows
 
     def fit_transform(self, texts: list[str]) -> TopicResult:
         """
@@ -377,6 +387,7 @@ class TopicModeler(MLAnalyzerBase):
                 "max_df": self._config.max_df,
                 "n_top_words": self._config.n_top_words,
                 "max_iter": self._config.max_iter,
+                "coherence_measure": self._config.coherence_measure,
                 "processing_time_ms": processing_time,
                 "n_documents": len(valid_texts),
             },
@@ -448,3 +459,32 @@ class TopicModeler(MLAnalyzerBase):
             )
         except ValueError as e:
             return self._create_error_result("topic", str(e))
+
+
+def _npmi(
+    both: NDArray[np.float64],
+    first: NDArray[np.float64],
+    second: NDArray[np.float64],
+    n_documents: int,
+) -> NDArray[np.float64]:
+    """
+    Normalized pointwise mutual information of word pairs.
+
+    Pairs that never co-occur score -1; pairs occurring in every document
+    score 1.
+
+    Args:
+        both: Documents containing both words
+        first: Documents containing the first word
+        second: Documents containing the second word
+        n_documents: Total number of documents
+
+    Returns:
+        NPMI per pair, in [-1, 1]
+    """
+    p_both = both / n_documents
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pmi = np.log(p_both * n_documents * n_documents / (first * second))
+        scores = pmi / -np.log(p_both)
+    scores = np.where(both == 0, -1.0, scores)
+    return np.where(p_both >= 1.0, 1.0, scores)
@@ -11,6 +11,8 @@ from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING
 
+from reddit_insight.analysis.corpus import PostCorpus, as_corpus
+
 if TYPE_CHECKING:
     from reddit_insight.analysis.keywords import Keyword, UnifiedKeywordExtractor
     from reddit_insight.analysis.ml.models import AnomalyPoint
@@ -325,21 +327,24 @@ class RisingKeywordDetector:
 
     def _filter_by_time(
         self,
-        posts: list[Post],
+        posts: list[Post] | PostCorpus,
         start: datetime,
         end: datetime,
-    ) -> list[Post]:
+    ) -> list[Post] | PostCorpus:
         """
         Filter posts by time range.
 
         Args:
-            posts: List of posts to filter
+            posts: List of posts or a PostCorpus to filter
             start: Start of time range (inclusive)
             end: End of time range (exclusive)
 
         Returns:
-            Posts within the time range
+            Posts within the time range (same container type as the input)
         """
+        if isinstance(posts, PostCorpus):
+            return posts.between(start, end)
+
         filtered = []
         for post in posts:
             if start <= post.created_utc < end:
@@ -348,7 +353,7 @@ class RisingKeywordDetector:
 
     def _count_keywords_in_period(
         self,
-        posts: list[Post],
+        posts: list[Post] | PostCorpus,
         start: datetime,
         end: datetime,
     ) -> dict[str, int]:
@@ -359,7 +364,7 @@ class RisingKeywordDetector:
         and counts their occurrences.
 
         Args:
-            posts: List of posts to analyze
+            posts: List of posts or a PostCorpus to analyze
             start: Start of time range
             end: End of time range
 
@@ -417,7 +422,7 @@ class RisingKeywordDetector:
 
     def detect_rising(
         self,
-        posts: list[Post],
+        posts: list[Post] | PostCorpus,
         top_n: int = 20,
         reference_time: datetime | None = None,
     ) -> list[RisingScore]:
@@ -428,7 +433,7 @@ class RisingKeywordDetector:
         comparison periods to identify rising keywords.
 
         Args:
-            posts: List of posts to analyze
+            posts: List of posts or a PostCorpus to analyze
             top_n: Number of top rising keywords to return
             reference_time: Reference point for time periods (default: now)
 
@@ -437,6 +442,7 @@ class RisingKeywordDetector:
         """
         if not posts:
             return []
+        posts = as_corpus(posts)
 
         # Use reference time or now
         if reference_time is None:
@@ -720,7 +726,7 @@ class TrendReporter:
 
     def generate_report(
         self,
-        posts: list[Post],
+        posts: list[Post] | PostCorpus,
         subreddit: str | None = None,
         num_rising: int = 10,
         num_top: int = 20,
@@ -731,7 +737,7 @@ class TrendReporter:
         Analyzes posts to identify both rising and top keywords.
 
         Args:
-            posts: List of posts to analyze
+            posts: List of posts or a PostCorpus to analyze
             subreddit: Subreddit name for labeling (None = all)
             num_rising: Number of rising keywords to include
             num_top: Number of top keywords to include
@@ -742,6 +748,8 @@ class TrendReporter:
         now = datetime.now(UTC)
         detector = self._get_detector()
         extractor = self._get_extractor()
+        if posts:
+            posts = as_corpus(posts)
 
         # Detect rising keywords
         rising = detector.detect_rising(posts, top_n=num_rising, reference_time=now)
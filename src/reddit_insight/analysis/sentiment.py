@@ -14,12 +14,27 @@ Example:
 
 from __future__ import annotations
 
+import re
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
+import numpy as np
+
+from reddit_insight.analysis.corpus import iter_post_texts
+
 if TYPE_CHECKING:
-    from reddit_insight.analysis.entity_recognition import EntityRecognizer, ProductEntity
+    from collections.abc import Iterable
+
+    from reddit_insight.analysis.context import AnalysisContext
+    from reddit_insight.analysis.corpus import PostCorpus
+    from reddit_insight.analysis.entity_recognition import (
+        EntityMention,
+        EntityRecognizer,
+        ProductEntity,
+    )
     from reddit_insight.reddit.models import Post
 
 
@@ -808,6 +823,165 @@ NEGATIVE_EMOTICONS: dict[str, float] = {
 }
 
 
+# Emoticons kept as single tokens
+_EMOTICON_PATTERN = re.compile(r"[:;=]['\-]?[)(DPp\[\]/\\|]|<3|[xX][Dd]|-_-|>:\(")
+
+# Words, and emoticon placeholders inserted by _split_tokens
+_WORD_PATTERN = re.compile(r"\b[\w'-]+\b")
+_WORD_OR_PLACEHOLDER_PATTERN = re.compile(r"\b[\w'-]+\b|__EMO\d+__")
+
+# Emoticons or words, with offsets into the original text
+_TOKEN_SPAN_PATTERN = re.compile(
+    rf"(?P<emoticon>{_EMOTICON_PATTERN.pattern})|\b[\w'-]+\b"
+)
+
+
+@dataclass
+class ScoredTokens:
+    """
+    Tokens of one text with their offsets and document-context scores.
+
+    Attributes:
+        tokens: Tokens (words lowercased, emoticons as-is)
+        starts: Start offset of each token
+        ends: End offset of each token
+        scores: Sentiment score of each token given its preceding tokens
+    """
+
+    tokens: list[str]
+    starts: list[int]
+    ends: list[int]
+    scores: list[float]
+
+
+class _LexiconTable:
+    """
+    Lexicon lookup table for vectorized token scoring.
+
+    Every token that the lexicons give a meaning to gets an id; all other
+    tokens share id 0, which has no polarity and no modifier role. Per-id
+    NumPy arrays hold the polarity, emoticon score, single-word modifier and
+    negator flag, so scoring a token stream is a few array gathers and shifts
+    that reproduce ``RuleBasedSentimentAnalyzer._calculate_word_sentiment``.
+    """
+
+    def __init__(self) -> None:
+        self.vocab: dict[str, int] = {}
+        words = [
+            *POSITIVE_EMOTICONS,
+            *NEGATIVE_EMOTICONS,
+            *POSITIVE_WORDS,
+            *NEGATIVE_WORDS,
+            *INTENSIFIERS,
+            *DIMINISHERS,
+            *NEGATORS,
+            *(part for phrase in DIMINISHERS for part in phrase.split()),
+        ]
+        for word in words:
+            if " " not in word:
+                self.vocab.setdefault(word, len(self.vocab) + 1)
+
+        size = len(self.vocab) + 1
+        # Fixed score of emoticons (applied without modifiers)
+        self.emoticon = np.zeros(size, dtype=bool)
+        self.emoticon_score = np.zeros(size)
+        # Base polarity of sentiment words (0 for others)
+        self.polarity = np.zeros(size)
+        # Intensifier/diminisher multiplier as the previous token
+        self.modifier = np.ones(size)
+        self.has_modifier = np.zeros(size, dtype=bool)
+        self.negator = np.zeros(size, dtype=bool)
+
+        for word, index in self.vocab.items():
+            lowered = word.lower()
+            if word in POSITIVE_EMOTICONS:
+                self.emoticon[index] = True
+                self.emoticon_score[index] = POSITIVE_EMOTICONS[word]
+            elif word in NEGATIVE_EMOTICONS:
+                self.emoticon[index] = True
+                self.emoticon_score[index] = -NEGATIVE_EMOTICONS[word]
+            elif lowered in POSITIVE_WORDS:
+                self.polarity[index] = 0.7
+            elif lowered in NEGATIVE_WORDS:
+                self.polarity[index] = -0.7
+
+            if lowered in INTENSIFIERS:
+                self.modifier[index] = INTENSIFIERS[lowered]
+                self.has_modifier[index] = True
+            elif lowered in DIMINISHERS:
+                self.modifier[index] = DIMINISHERS[lowered]
+                self.has_modifier[index] = True
+            self.negator[index] = lowered in NEGATORS
+
+        # Two-word diminishers keyed by (first id * size + second id)
+        pairs: dict[int, float] = {}
+        for phrase, multiplier in DIMINISHERS.items():
+            parts = phrase.split()
+            if len(parts) == 2 and all(part in self.vocab for part in parts):
+                pairs[self.vocab[parts[0]] * size + self.vocab[parts[1]]] = multiplier
+        self._size = size
+        self._pair_keys = np.array(sorted(pairs), dtype=np.int64)
+        self._pair_values = np.array([pairs[key] for key in sorted(pairs)])
+
+    def score(
+        self,
+        ids: np.ndarray,
+        offsets: np.ndarray,
+        config: SentimentAnalyzerConfig,
+    ) -> np.ndarray:
+        """
+        Score a flat stream of token ids made of several texts.
+
+        Args:
+            ids: Token ids of all texts, concatenated
+            offsets: Start index of each text in ``ids`` (plus the total)
+            config: Analyzer configuration (modifier/negation switches)
+
+        Returns:
+            Per-token sentiment scores
+        """
+        # Previous and second previous token ids, 0 across text starts
+        prev = np.zeros_like(ids)
+        prev[1:] = ids[:-1]
+        prev_prev = np.zeros_like(ids)
+        prev_prev[2:] = ids[:-2]
+        starts = offsets[:-1][offsets[:-1] < len(ids)]
+        prev[starts] = 0
+        prev_prev[starts] = 0
+        second = starts + 1
+        prev_prev[second[second < len(ids)]] = 0
+
+        scores = self.polarity[ids]
+        if config.use_intensifiers:
+            multiplier = self.modifier[prev]
+            if len(self._pair_keys):
+                # Two-word diminishers apply only without a one-word modifier
+                keys = prev_prev.astype(np.int64) * self._size + prev
+                slot = np.searchsorted(self._pair_keys, keys)
+                slot[slot == len(self._pair_keys)] = 0
+                is_pair = (self._pair_keys[slot] == keys) & ~self.has_modifier[prev]
+                multiplier = np.where(is_pair, self._pair_values[slot], multiplier)
+            scores = scores * multiplier
+
+        if config.use_negation:
+            negated = self.negator[prev]
+            scores = np.where(
+                negated,
+                scores * -0.8,
+                np.where(self.negator[prev_prev], scores * -0.6, scores),
+            )
+
+        scores = np.clip(scores, -1.0, 1.0)
+        result: np.ndarray = np.where(self.emoticon[ids], self.emoticon_score[ids], scores)
+        return result
+
+
+@lru_cache(maxsize=1)
+def _lexicon_table() -> _LexiconTable:
+    """Build the lexicon lookup table once."""
+    return _LexiconTable()
+
+
 # ============================================================================
 # Sentiment Analyzer Configuration
 # ============================================================================
@@ -856,12 +1030,20 @@ class RuleBasedSentimentAnalyzer:
     """
 
     config: SentimentAnalyzerConfig = field(default_factory=SentimentAnalyzerConfig)
+    context: AnalysisContext | None = field(default=None, repr=False)
+    # Context cache namespace; scores depend on the config
+    _scored_tokens_view: str = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Derive the context cache namespace from the config."""
+        self._scored_tokens_view = f"sentiment_scored_tokens:{self.config!r}"
 
     def _tokenize_simple(self, text: str) -> list[str]:
         """
         Simple tokenization for sentiment analysis.
 
-        Preserves emoticons and handles contractions.
+        Preserves emoticons and handles contractions. With an analysis
+        context the tokens are computed once per text.
 
         Args:
             text: Input text
@@ -869,14 +1051,19 @@ class RuleBasedSentimentAnalyzer:
         Returns:
             List of tokens (lowercase)
         """
-        import re
-
         if not text:
             return []
+        if self.context is not None:
+            return self.context.memo("sentiment_tokens", text, self._split_tokens)
+        return self._split_tokens(text)
 
+    @staticmethod
+    def _split_tokens(text: str) -> list[str]:
+        """Tokenize text, keeping emoticons as single tokens."""
         # Preserve emoticons by extracting them first
-        emoticon_pattern = r"[:;=]['\-]?[)(DPp\[\]/\\|]|<3|[xX][Dd]|-_-|>:\("
-        emoticons = re.findall(emoticon_pattern, text)
+        emoticons = _EMOTICON_PATTERN.findall(text)
+        if not emoticons:
+            return _WORD_PATTERN.findall(text.lower())
 
         # Replace emoticons with placeholders
         placeholder_text = text
@@ -887,7 +1074,7 @@ class RuleBasedSentimentAnalyzer:
             placeholder_text = placeholder_text.replace(emo, f" {placeholder} ", 1)
 
         # Basic tokenization: split on whitespace and punctuation
-        tokens = re.findall(r"\b[\w'-]+\b|__EMO\d+__", placeholder_text.lower())
+        tokens = _WORD_OR_PLACEHOLDER_PATTERN.findall(placeholder_text.lower())
 
         # Restore emoticons
         result = []
@@ -899,6 +1086,95 @@ class RuleBasedSentimentAnalyzer:
 
         return result
 
+    def score_tokens(self, text: str) -> ScoredTokens:
+        """
+        Tokenize and score a whole text once, keeping token offsets.
+
+        With an analysis context the result is computed once per text.
+
+        Args:
+            text: Input text
+
+        Returns:
+            ScoredTokens for the text
+        """
+        if self.context is not None:
+            return self.context.memo(self._scored_tokens_view, text, self._score_token_spans)
+        return self._score_token_spans(text)
+
+    def _score_token_spans(self, text: str) -> ScoredTokens:
+        """Score every token of a text in its document context."""
+        tokens: list[str] = []
+        starts: list[int] = []
+        ends: list[int] = []
+        for match in _TOKEN_SPAN_PATTERN.finditer(text):
+            token = match.group()
+            # Words are lowercased; emoticons keep their case (e.g. ":D")
+            tokens.append(token if match.lastgroup == "emoticon" else token.lower())
+            starts.append(match.start())
+            ends.append(match.end())
+
+        table = _lexicon_table()
+        ids = np.fromiter(
+            (table.vocab.get(token, 0) for token in tokens), dtype=np.intp, count=len(tokens)
+        )
+        scores = table.score(ids, np.array([0, len(ids)]), self.config).tolist()
+        return ScoredTokens(tokens=tokens, starts=starts, ends=ends, scores=scores)
+
+    def analyze_span(
+        self,
+        text: str,
+        start: int,
+        end: int,
+        scored: ScoredTokens | None = None,
+    ) -> SentimentScore:
+        """
+        Analyze sentiment of the tokens lying within ``text[start:end]``.
+
+        Pass the text's ``score_tokens`` result to analyze many windows of
+        one text at the cost of the window sizes only. The result equals
+        ``analyze(text[start:end])``: modifiers and negators before ``start``
+        are ignored, and windows containing emoticons or cutting a token are
+        analyzed on their own.
+
+        Args:
+            text: Full text
+            start: Window start offset
+            end: Window end offset
+            scored: Precomputed ``score_tokens(text)`` (computed if None)
+
+        Returns:
+            SentimentScore for the window
+        """
+        window = text[start:end]
+        if not window.strip():
+            return self.analyze("")
+
+        if scored is None:
+            scored = self.score_tokens(text)
+        first = bisect_left(scored.starts, start)
+        last = bisect_right(scored.ends, end)
+        cuts_token = (first > 0 and scored.ends[first - 1] > start) or (
+            last < len(scored.starts) and scored.starts[last] < end
+        )
+        if cuts_token or _EMOTICON_PATTERN.search(window):
+            # analyze() tokenizes emoticons through placeholders and would see
+            # only part of a token cut by the window; such windows are rare
+            # enough to analyze on their own
+            return self.analyze(window)
+        if first >= last:
+            return self._aggregate_scores([])
+
+        word_scores = scored.scores[first:last]
+        # Rescore the first two tokens without modifiers outside the window
+        tokens = scored.tokens
+        word_scores[0] = self._calculate_word_sentiment(tokens[first], None, None)
+        if last - first > 1:
+            word_scores[1] = self._calculate_word_sentiment(
+                tokens[first + 1], tokens[first], None
+            )
+        return self._aggregate_scores(word_scores)
+
     def _tokenize_with_context(self, text: str) -> list[tuple[str, str | None, str | None]]:
         """
         Tokenize text with surrounding context for modifier handling.
@@ -1121,6 +1397,145 @@ class RuleBasedSentimentAnalyzer:
         # Aggregate scores
         return self._aggregate_scores(word_scores)
 
+    def analyze_many(self, texts: Iterable[str]) -> list[SentimentScore]:
+        """
+        Analyze the sentiment of many texts in one batch.
+
+        Tokens of all texts are mapped through a lexicon lookup table and
+        scored together with NumPy array shifts for the negation and modifier
+        windows. Results are the same as calling ``analyze`` on each text.
+
+        Args:
+            texts: Input texts to analyze
+
+        Returns:
+            SentimentScore per text, in input order
+        """
+        table = _lexicon_table()
+        vocab_get = table.vocab.get
+
+        token_lists: list[list[str] | None] = []
+        lengths: list[int] = []
+        ids: list[int] = []
+        for text in texts:
+            if not text or not text.strip():
+                token_lists.append(None)
+                lengths.append(0)
+                continue
+            tokens = self._tokenize_simple(text)
+            token_lists.append(tokens)
+            lengths.append(len(tokens))
+            ids.extend([vocab_get(token, 0) for token in tokens])
+
+        offsets = np.zeros(len(lengths) + 1, dtype=np.intp)
+        np.cumsum(lengths, out=offsets[1:])
+        scores = table.score(np.array(ids, dtype=np.intp), offsets, self.config)
+
+        return self._aggregate_many(scores, offsets, token_lists)
+
+    def _aggregate_many(
+        self,
+        scores: np.ndarray,
+        offsets: np.ndarray,
+        token_lists: list[list[str] | None],
+    ) -> list[SentimentScore]:
+        """
+        Vectorized ``_aggregate_scores`` over the texts of a batch.
+
+        Sums are accumulated token by token in text order, so every
+        intermediate value (and thus every rounded score) equals the
+        per-text computation.
+
+        Args:
+            scores: Per-token scores of all texts, concatenated
+            offsets: Start index of each text in ``scores`` (plus the total)
+            token_lists: Tokens per text (None for blank texts)
+
+        Returns:
+            SentimentScore per text
+        """
+        # Sentiment-bearing tokens, in text order
+        nonzero = np.flatnonzero(scores)
+        values = scores[nonzero]
+        bounds = np.searchsorted(nonzero, offsets)
+        counts = np.diff(bounds)
+        text_count = len(counts)
+
+        # Sequential sums: step k adds the k-th sentiment word of every text
+        # that has more than k of them
+        pos_sum = np.zeros(text_count)
+        neg_sum = np.zeros(text_count)
+        pos_count = np.zeros(text_count, dtype=np.intp)
+        order = np.argsort(-counts, kind="stable")
+        sorted_counts = counts[order]
+        for k in range(int(sorted_counts[0]) if text_count else 0):
+            active = order[: np.searchsorted(-sorted_counts, -k, side="left")]
+            value = values[bounds[active] + k]
+            positive = value > 0
+            pos_sum[active] = np.where(positive, pos_sum[active] + value, pos_sum[active])
+            neg_sum[active] = np.where(positive, neg_sum[active], neg_sum[active] + -value)
+            pos_count[active] += positive
+        sentiment_words = counts
+
+        # Same formulas as _aggregate_scores
+        alpha = 15
+        with np.errstate(divide="ignore", invalid="ignore"):
+            norm_pos = np.where(pos_sum > 0, pos_sum / (pos_sum + alpha), 0.0)
+            norm_neg = np.where(neg_sum > 0, neg_sum / (neg_sum + alpha), 0.0)
+            compound = (pos_sum - neg_sum) / (pos_sum + neg_sum + alpha)
+            total_words = np.diff(offsets)
+            neutral_score = np.clip(1.0 - (sentiment_words / total_words), 0.0, 1.0)
+        total_score = norm_pos + norm_neg + 0.001
+        positive_score = norm_pos / total_score
+        negative_score = norm_neg / total_score
+
+        mixed_threshold = self.config.mixed_threshold
+        sentiment_index = np.where(
+            (positive_score > mixed_threshold) & (negative_score > mixed_threshold),
+            0,
+            np.where(
+                np.abs(compound) < self.config.neutral_threshold,
+                1,
+                np.where(compound > 0, 2, 3),
+            ),
+        )
+        word_confidence = np.minimum(1.0, sentiment_words / 5.0)
+        confidence = np.where(
+            sentiment_words == 0,
+            0.3,
+            0.4 + 0.3 * word_confidence + 0.3 * np.abs(compound),
+        )
+
+        classes = (Sentiment.MIXED, Sentiment.NEUTRAL, Sentiment.POSITIVE, Sentiment.NEGATIVE)
+        rows = zip(
+            token_lists,
+            sentiment_index.tolist(),
+            positive_score.tolist(),
+            negative_score.tolist(),
+            neutral_score.tolist(),
+            compound.tolist(),
+            confidence.tolist(),
+            strict=True,
+        )
+        results: list[SentimentScore] = []
+        for tokens, index, positive, negative, neutral, comp, conf in rows:
+            if tokens is None:
+                results.append(self.analyze(""))
+            elif not tokens:
+                results.append(self._aggregate_scores([]))
+            else:
+                results.append(
+                    SentimentScore(
+                        sentiment=classes[index],
+                        positive_score=round(positive, 4),
+                        negative_score=round(negative, 4),
+                        neutral_score=round(neutral, 4),
+                        compound=round(comp, 4),
+                        confidence=round(conf, 4),
+                    )
+                )
+        return results
+
 
 # ============================================================================
 # Entity-Sentiment Integration
@@ -1181,15 +1596,15 @@ class EntitySentimentAnalyzer:
 
             self._entity_recognizer = EntityRecognizer()
 
-    def _extract_entity_context(
+    def _entity_context_bounds(
         self,
         text: str,
         entity_start: int,
         entity_end: int,
         window: int | None = None,
-    ) -> str:
+    ) -> tuple[int, int]:
         """
-        Extract context window around an entity mention.
+        Compute the context window around an entity mention.
 
         Args:
             text: Full text
@@ -1198,7 +1613,7 @@ class EntitySentimentAnalyzer:
             window: Context window size (characters on each side)
 
         Returns:
-            Context string containing the entity and surrounding text
+            Tuple of (start, end) offsets, extended to word boundaries
         """
         if window is None:
             window = self._context_window
@@ -1213,33 +1628,39 @@ class EntitySentimentAnalyzer:
         while end < len(text) and text[end].isalnum():
             end += 1
 
-        return text[start:end].strip()
+        return start, end
 
-    def _find_entity_position(self, text: str, entity_name: str) -> tuple[int, int] | None:
+    def _extract_entity_context(
+        self,
+        text: str,
+        entity_start: int,
+        entity_end: int,
+        window: int | None = None,
+    ) -> str:
         """
-        Find position of entity in text (case-insensitive).
+        Extract context window around an entity mention.
 
         Args:
-            text: Text to search
-            entity_name: Entity name to find
+            text: Full text
+            entity_start: Start position of entity
+            entity_end: End position of entity
+            window: Context window size (characters on each side)
 
         Returns:
-            Tuple of (start, end) positions or None if not found
+            Context string containing the entity and surrounding text
         """
-        import re
-
-        # Case-insensitive search
-        pattern = re.compile(re.escape(entity_name), re.IGNORECASE)
-        match = pattern.search(text)
-
-        if match:
-            return (match.start(), match.end())
-        return None
+        start, end = self._entity_context_bounds(text, entity_start, entity_end, window)
+        return text[start:end].strip()
 
     def analyze_text(self, text: str) -> list[EntitySentiment]:
         """
         Analyze text for entities and their associated sentiment.
 
+        Each entity is located by its first recognized mention, and its
+        context is scored from the text's token scores, which are computed
+        once per text, so the cost grows with the text length rather than
+        with entities x text length.
+
         Args:
             text: Input text to analyze
 
@@ -1251,28 +1672,33 @@ class EntitySentimentAnalyzer:
 
         # Recognize entities
         assert self._entity_recognizer is not None
-        entities = self._entity_recognizer.recognize(text)
+        entities, mentions = self._entity_recognizer.recognize_with_mentions(text)
 
         if not entities:
             return []
 
+        # Tokenize and score the whole text once for all entity windows
+        scored = self._sentiment_analyzer.score_tokens(text)
+
+        # First mention of each entity name (mentions are sorted by position)
+        first_mentions: dict[str, EntityMention] = {}
+        for mention in mentions:
+            first_mentions.setdefault(mention.entity.normalized_name, mention)
+
         results: list[EntitySentiment] = []
 
         for entity in entities:
-            # Find entity position for context extraction
-            position = self._find_entity_position(text, entity.name)
+            first = first_mentions.get(entity.normalized_name)
 
-            if position:
-                # Extract context around entity
-                context = self._extract_entity_context(
-                    text, position[0], position[1]
-                )
+            if first is not None:
+                # Score the context around the mention from the token scores
+                start, end = self._entity_context_bounds(text, first.start, first.end)
+                context = text[start:end].strip()
+                sentiment = self._sentiment_analyzer.analyze_span(text, start, end, scored)
             else:
                 # Fallback: use entity's stored context or full text
                 context = entity.context if entity.context else text[:200]
-
-            # Analyze sentiment of the context
-            sentiment = self._sentiment_analyzer.analyze(context)
+                sentiment = self._sentiment_analyzer.analyze(context)
 
             results.append(
                 EntitySentiment(
@@ -1380,12 +1806,14 @@ class EntitySentimentAnalyzer:
 
         return result
 
-    def analyze_posts(self, posts: list[Post]) -> dict[str, EntitySentiment]:
+    def analyze_posts(
+        self, posts: list[Post] | PostCorpus
+    ) -> dict[str, EntitySentiment]:
         """
         Analyze multiple posts and aggregate entity sentiments.
 
         Args:
-            posts: List of Post objects
+            posts: List of Post objects or a PostCorpus
 
         Returns:
             Dictionary mapping entity names to aggregated EntitySentiment
@@ -1395,9 +1823,8 @@ class EntitySentimentAnalyzer:
 
         # Collect all entity sentiments
         all_sentiments: list[EntitySentiment] = []
-        for post in posts:
-            sentiments = self.analyze_post(post)
-            all_sentiments.extend(sentiments)
+        for text in iter_post_texts(posts):
+            all_sentiments.extend(self.analyze_text(text))
 
         # Aggregate by entity
         return self._aggregate_entity_sentiments(all_sentiments)
@@ -124,6 +124,8 @@ class StopwordManager:
         self._custom_stopwords: set[str] = set()
         self._reddit_stopwords: set[str] = set(self.REDDIT_STOPWORDS)
         self._excluded_stopwords: set[str] = set()
+        # Combined active set, rebuilt lazily after any modification
+        self._active_stopwords: frozenset[str] | None = None
 
     @property
     def language(self) -> str:
@@ -138,12 +140,18 @@ class StopwordManager:
             Combined set of base, custom, and Reddit stopwords,
             minus any explicitly excluded words.
         """
-        all_stopwords = (
-            self._base_stopwords
-            | self._custom_stopwords
-            | self._reddit_stopwords
-        )
-        return all_stopwords - self._excluded_stopwords
+        return set(self._active())
+
+    def _active(self) -> frozenset[str]:
+        """Return the cached set of active stopwords, rebuilding it if stale."""
+        if self._active_stopwords is None:
+            all_stopwords = (
+                self._base_stopwords
+                | self._custom_stopwords
+                | self._reddit_stopwords
+            )
+            self._active_stopwords = frozenset(all_stopwords - self._excluded_stopwords)
+        return self._active_stopwords
 
     def add_stopwords(self, words: Iterable[str]) -> None:
         """
@@ -153,6 +161,7 @@ class StopwordManager:
             words: Iterable of words to add as stopwords
         """
         self._custom_stopwords.update(word.lower() for word in words)
+        self._active_stopwords = None
 
     def remove_stopwords(self, words: Iterable[str]) -> None:
         """
@@ -162,6 +171,7 @@ class StopwordManager:
             words: Iterable of words to exclude from stopwords
         """
         self._excluded_stopwords.update(word.lower() for word in words)
+        self._active_stopwords = None
 
     def is_stopword(self, word: str) -> bool:
         """
@@ -173,19 +183,17 @@ class StopwordManager:
         Returns:
             True if the word is a stopword, False otherwise
         """
-        word_lower = word.lower()
-        if word_lower in self._excluded_stopwords:
-            return False
-        return word_lower in self.get_stopwords()
+        return word.lower() in self._active()
 
     def reset(self) -> None:
         """Reset custom and excluded stopwords to defaults."""
         self._custom_stopwords.clear()
         self._excluded_stopwords.clear()
+        self._active_stopwords = None
 
     def __len__(self) -> int:
         """Return the number of active stopwords."""
-        return len(self.get_stopwords())
+        return len(self._active())
 
     def __contains__(self, word: str) -> bool:
         """Check if a word is a stopword using 'in' operator."""
@@ -3,6 +3,10 @@ TF-IDF analysis module.
 
 Provides TF-IDF (Term Frequency-Inverse Document Frequency) analysis
 for corpus-based keyword extraction using scikit-learn.
+
+Per-document top keywords are selected directly on the CSR arrays of the
+TF-IDF matrix and returned as a compact ``DocumentKeywords`` table; Keyword
+objects are only created when a document's keywords are requested.
 """
 
 from __future__ import annotations
@@ -10,14 +14,20 @@ from __future__ import annotations
 import pickle
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import numpy as np
-from scipy.sparse import spmatrix
+from scipy.sparse import csr_matrix, spmatrix
 from sklearn.feature_extraction.text import TfidfVectorizer
 
 from reddit_insight.analysis.keywords import Keyword
 from reddit_insight.analysis.tokenizer import RedditTokenizer
 
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+    from reddit_insight.analysis.context import AnalysisContext
+
 
 @dataclass
 class TFIDFConfig:
@@ -39,6 +49,101 @@ class TFIDFConfig:
     use_idf: bool = True
 
 
+@dataclass
+class DocumentKeywords:
+    """
+    Top TF-IDF keywords of many documents in CSR layout.
+
+    The keywords of document ``i`` are ``term_ids[indptr[i]:indptr[i + 1]]``
+    with matching ``scores``, sorted by score (highest first, ties by term
+    id). Only positive scores are kept.
+
+    Attributes:
+        indptr: Row offsets into term_ids and scores (length documents + 1)
+        term_ids: Vocabulary index of each selected keyword
+        scores: TF-IDF score of each selected keyword
+        feature_names: Vocabulary terms indexed by term id
+    """
+
+    indptr: NDArray[np.int64]
+    term_ids: NDArray[np.int64]
+    scores: NDArray[np.float64]
+    feature_names: list[str] = field(repr=False)
+
+    def __len__(self) -> int:
+        return len(self.indptr) - 1
+
+    def row(self, index: int) -> tuple[NDArray[np.int64], NDArray[np.float64]]:
+        """
+        Term ids and scores of one document.
+
+        Args:
+            index: Document index
+
+        Returns:
+            Tuple of (term ids, scores)
+        """
+        start, end = self.indptr[index], self.indptr[index + 1]
+        return self.term_ids[start:end], self.scores[start:end]
+
+    def keywords(self, index: int) -> list[Keyword]:
+        """
+        Keyword objects of one document.
+
+        Args:
+            index: Document index
+
+        Returns:
+            List of Keyword objects sorted by score (highest first)
+        """
+        term_ids, scores = self.row(index)
+        names = self.feature_names
+        return [
+            Keyword(keyword=names[term_id], score=score)
+            for term_id, score in zip(term_ids.tolist(), scores.tolist(), strict=True)
+        ]
+
+    def to_keywords(self) -> list[list[Keyword]]:
+        """Keyword objects of every document."""
+        return [self.keywords(i) for i in range(len(self))]
+
+
+def top_k_per_row(
+    matrix: spmatrix, k: int
+) -> tuple[NDArray[np.int64], NDArray[np.int64], NDArray[np.float64]]:
+    """
+    Select the k largest positive entries of every row of a sparse matrix.
+
+    Works on the CSR ``indptr/indices/data`` arrays: all stored entries are
+    sorted once by (row, -score, column), then each row keeps its first k.
+
+    Args:
+        matrix: Sparse matrix
+        k: Maximum entries per row
+
+    Returns:
+        Tuple of (indptr, column indices, scores) in CSR layout
+    """
+    csr = csr_matrix(matrix)
+    n_rows = csr.shape[0]
+    positive = csr.data > 0
+    rows = np.repeat(np.arange(n_rows), np.diff(csr.indptr))[positive]
+    columns = csr.indices[positive].astype(np.int64)
+    data = csr.data[positive]
+
+    order = np.lexsort((columns, -data, rows))
+    rows, columns, data = rows[order], columns[order], data[order]
+
+    counts = np.bincount(rows, minlength=n_rows)
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    rank = np.arange(len(rows)) - starts[rows]
+    keep = rank < max(k, 0)
+
+    indptr = np.zeros(n_rows + 1, dtype=np.int64)
+    np.cumsum(np.minimum(counts, max(k, 0)), out=indptr[1:])
+    return indptr, columns[keep], data[keep]
+
+
 @dataclass
 class TFIDFAnalyzer:
     """
@@ -55,6 +160,7 @@ class TFIDFAnalyzer:
     """
 
     config: TFIDFConfig = field(default_factory=TFIDFConfig)
+    context: AnalysisContext | None = field(default=None, repr=False)
     _vectorizer: TfidfVectorizer = field(init=False, repr=False)
     _tokenizer: RedditTokenizer = field(init=False, repr=False)
     _fitted: bool = field(init=False, default=False)
@@ -81,7 +187,8 @@ class TFIDFAnalyzer:
         """
         Tokenize text for TF-IDF.
 
-        Uses RedditTokenizer for consistent preprocessing.
+        Uses RedditTokenizer for consistent preprocessing. With an analysis
+        context the tokens are computed once per document.
 
         Args:
             text: Input text
@@ -89,6 +196,8 @@ class TFIDFAnalyzer:
         Returns:
             List of tokens
         """
+        if self.context is not None:
+            return self.context.tokens(text)
         return self._tokenizer.tokenize(text)
 
     def fit(self, texts: list[str]) -> TFIDFAnalyzer:
@@ -192,27 +301,36 @@ class TFIDFAnalyzer:
         Raises:
             RuntimeError: If vectorizer is not fitted
         """
-        if not self._fitted:
-            raise RuntimeError("Vectorizer not fitted. Call fit() first.")
+        return self.get_document_keyword_table([text], n).keywords(0)
 
-        # Transform single document
-        tfidf_vector = self._vectorizer.transform([text])
-        scores = np.array(tfidf_vector.toarray()).flatten()
+    def get_document_keyword_table(self, texts: list[str], n: int = 5) -> DocumentKeywords:
+        """
+        Get top keyword ids and scores for each document as arrays.
 
-        # Get top indices
-        top_indices = scores.argsort()[::-1][:n]
+        Nothing is densified and no Keyword objects are created; use
+        ``DocumentKeywords.keywords(i)`` to materialize one document.
 
-        keywords = []
-        for idx in top_indices:
-            if scores[idx] > 0:
-                keywords.append(
-                    Keyword(
-                        keyword=self._feature_names[idx],  # type: ignore
-                        score=float(scores[idx]),
-                    )
-                )
+        Args:
+            texts: List of document texts
+            n: Number of keywords per document
 
-        return keywords
+        Returns:
+            DocumentKeywords table with one row per document
+
+        Raises:
+            RuntimeError: If vectorizer is not fitted
+        """
+        if not self._fitted:
+            raise RuntimeError("Vectorizer not fitted. Call fit() first.")
+
+        tfidf_matrix = self._vectorizer.transform(texts)
+        indptr, term_ids, scores = top_k_per_row(tfidf_matrix, n)
+        return DocumentKeywords(
+            indptr=indptr,
+            term_ids=term_ids,
+            scores=scores,
+            feature_names=self._feature_names,  # type: ignore[arg-type]
+        )
 
     def get_keywords_by_document(
         self, texts: list[str], n: int = 5
@@ -230,30 +348,7 @@ class TFIDFAnalyzer:
         Raises:
             RuntimeError: If vectorizer is not fitted
         """
-        if not self._fitted:
-            raise RuntimeError("Vectorizer not fitted. Call fit() first.")
-
-        # Transform all documents
-        tfidf_matrix = self._vectorizer.transform(texts)
-
-        results = []
-        for i in range(tfidf_matrix.shape[0]):
-            scores = np.array(tfidf_matrix[i].toarray()).flatten()
-            top_indices = scores.argsort()[::-1][:n]
-
-            doc_keywords = []
-            for idx in top_indices:
-                if scores[idx] > 0:
-                    doc_keywords.append(
-                        Keyword(
-                            keyword=self._feature_names[idx],  # type: ignore
-                            score=float(scores[idx]),
-                        )
-                    )
-
-            results.append(doc_keywords)
-
-        return results
+        return self.get_document_keyword_table(texts, n).to_keywords()
 
     def get_vocabulary(self) -> dict[str, int]:
         """
@@ -13,6 +13,8 @@ from datetime import UTC, datetime
 from enum import Enum
 from typing import TYPE_CHECKING
 
+from reddit_insight.analysis.corpus import PostCorpus, as_corpus
+from reddit_insight.analysis.keyword_matcher import KeywordMatcher
 from reddit_insight.analysis.time_series import (
     TimeGranularity,
     TimePoint,
@@ -22,6 +24,7 @@ from reddit_insight.analysis.time_series import (
 
 if TYPE_CHECKING:
 
+    from reddit_insight.analysis.context import AnalysisContext
     from reddit_insight.analysis.keywords import UnifiedKeywordExtractor
     from reddit_insight.analysis.ml.models import PredictionResult
     from reddit_insight.analysis.ml.trend_predictor import TrendPredictor
@@ -419,6 +422,8 @@ class KeywordTrendAnalyzer:
     Attributes:
         keyword_extractor: Extractor for identifying keywords in text
         trend_calculator: Calculator for trend metrics
+        context: Shared analysis context (lowercased text is computed once
+            per post instead of once per keyword)
         _predictor: Lazy-initialized TrendPredictor for forecasting
 
     Example:
@@ -433,6 +438,7 @@ class KeywordTrendAnalyzer:
 
     keyword_extractor: UnifiedKeywordExtractor | None = None
     trend_calculator: TrendCalculator | None = None
+    context: AnalysisContext | None = field(default=None, repr=False)
     _predictor: TrendPredictor | None = field(default=None, repr=False)
 
     def __post_init__(self) -> None:
@@ -445,7 +451,7 @@ class KeywordTrendAnalyzer:
         if self.keyword_extractor is None:
             from reddit_insight.analysis.keywords import UnifiedKeywordExtractor
 
-            self.keyword_extractor = UnifiedKeywordExtractor()
+            self.keyword_extractor = UnifiedKeywordExtractor(context=self.context)
         return self.keyword_extractor
 
     def _count_keyword_in_text(self, text: str, keyword: str) -> int:
@@ -465,7 +471,7 @@ class KeywordTrendAnalyzer:
             return 0
 
         # Simple case-insensitive word boundary matching
-        text_lower = text.lower()
+        text_lower = self.context.lower(text) if self.context is not None else text.lower()
         keyword_lower = keyword.lower()
 
         # Count occurrences
@@ -482,7 +488,7 @@ class KeywordTrendAnalyzer:
 
     def build_keyword_timeseries(
         self,
-        posts: list[Post],
+        posts: list[Post] | PostCorpus,
         keyword: str,
         granularity: TimeGranularity = TimeGranularity.DAY,
     ) -> TimeSeries:
@@ -490,10 +496,11 @@ class KeywordTrendAnalyzer:
         Build a time series for a specific keyword.
 
         Counts keyword occurrences in posts and aggregates them
-        by the specified time granularity.
+        by the specified time granularity. With a PostCorpus the time
+        bucketing is vectorized and reused across keywords.
 
         Args:
-            posts: List of Post objects to analyze
+            posts: List of Post objects or a PostCorpus to analyze
             keyword: Keyword to track
             granularity: Time unit for aggregation
 
@@ -507,6 +514,9 @@ class KeywordTrendAnalyzer:
                 points=[],
             )
 
+        if isinstance(posts, PostCorpus):
+            return self._build_corpus_timeseries(posts, keyword, granularity)
+
         # Import defaultdict here to avoid circular imports
         from collections import defaultdict
 
@@ -544,33 +554,113 @@ class KeywordTrendAnalyzer:
             points=points,
         )
 
+    def _build_corpus_timeseries(
+        self,
+        corpus: PostCorpus,
+        keyword: str,
+        granularity: TimeGranularity,
+    ) -> TimeSeries:
+        """
+        Vectorized build_keyword_timeseries for a PostCorpus.
+
+        Args:
+            corpus: Posts to analyze
+            keyword: Keyword to track
+            granularity: Time unit for aggregation
+
+        Returns:
+            TimeSeries with keyword frequency over time
+        """
+        return self._build_corpus_multiple(corpus, [keyword], granularity)[keyword]
+
+    def _build_corpus_multiple(
+        self,
+        corpus: PostCorpus,
+        keywords: list[str],
+        granularity: TimeGranularity,
+    ) -> dict[str, TimeSeries]:
+        """
+        Count all keywords in one pass over a PostCorpus.
+
+        Each post is lowercased and scanned once by a KeywordMatcher, and every
+        hit is added straight to its (bucket, keyword) cell, so the cost no
+        longer grows with the number of keywords times the corpus size.
+
+        Args:
+            corpus: Posts to analyze
+            keywords: Keywords to track
+            granularity: Time unit for aggregation
+
+        Returns:
+            Dictionary mapping keywords to their time series
+        """
+        import numpy as np
+
+        buckets, bucket_of_post = corpus.bucket_index(granularity)
+        matcher = KeywordMatcher(keywords)
+        width = len(matcher)
+
+        cells: list[int] = []
+        if width:
+            context = self.context
+            for bucket, text in zip(
+                bucket_of_post.tolist(), corpus.texts(), strict=True
+            ):
+                text_lower = context.lower(text) if context is not None else text.lower()
+                base = bucket * width
+                cells.extend(base + index for index in matcher.iter_matches(text_lower))
+
+        totals = np.bincount(
+            np.asarray(cells, dtype=np.intp), minlength=len(buckets) * width
+        ).reshape(len(buckets), width)
+        post_counts = np.bincount(bucket_of_post, minlength=len(buckets)).tolist()
+
+        result: dict[str, TimeSeries] = {}
+        for keyword in keywords:
+            index = matcher.index_of(keyword)
+            values = [0] * len(buckets) if index is None else totals[:, index].tolist()
+            result[keyword] = TimeSeries(
+                keyword=keyword,
+                granularity=granularity,
+                points=[
+                    TimePoint(timestamp=timestamp, value=float(total), count=int(count))
+                    for timestamp, total, count in zip(
+                        buckets, values, post_counts, strict=True
+                    )
+                ],
+            )
+        return result
+
     def build_multiple_timeseries(
         self,
-        posts: list[Post],
+        posts: list[Post] | PostCorpus,
         keywords: list[str],
         granularity: TimeGranularity = TimeGranularity.DAY,
     ) -> dict[str, TimeSeries]:
         """
         Build time series for multiple keywords.
 
+        All keywords are counted in a single pass over the posts instead of
+        one scan per keyword.
+
         Args:
-            posts: List of Post objects to analyze
+            posts: List of Post objects or a PostCorpus to analyze
             keywords: List of keywords to track
             granularity: Time unit for aggregation
 
         Returns:
             Dictionary mapping keywords to their time series
         """
-        result = {}
-        for keyword in keywords:
-            result[keyword] = self.build_keyword_timeseries(
-                posts, keyword, granularity
-            )
-        return result
+        if not posts:
+            return {
+                keyword: TimeSeries(keyword=keyword, granularity=granularity, points=[])
+                for keyword in keywords
+            }
+        return self._build_corpus_multiple(as_corpus(posts), keywords, granularity)
 
     def analyze_keyword_trend(
         self,
-        posts: list[Post],
+        posts: list[Post] | PostCorpus,
         keyword: str,
         granularity: TimeGranularity = TimeGranularity.DAY,
     ) -> KeywordTrendResult:
@@ -581,7 +671,7 @@ class KeywordTrendAnalyzer:
         the specified keyword.
 
         Args:
-            posts: List of Post objects to analyze
+            posts: List of Post objects or a PostCorpus to analyze
             keyword: Keyword to analyze
             granularity: Time unit for aggregation
 
@@ -602,30 +692,39 @@ class KeywordTrendAnalyzer:
 
     def analyze_multiple_keywords(
         self,
-        posts: list[Post],
+        posts: list[Post] | PostCorpus,
         keywords: list[str],
         granularity: TimeGranularity = TimeGranularity.DAY,
     ) -> list[KeywordTrendResult]:
         """
         Analyze trends for multiple keywords.
 
+        Posts are converted to a PostCorpus once and all keywords are counted
+        in a single pass, sharing text extraction and time bucketing.
+
         Args:
-            posts: List of Post objects to analyze
+            posts: List of Post objects or a PostCorpus to analyze
             keywords: List of keywords to analyze
             granularity: Time unit for aggregation
 
         Returns:
             List of KeywordTrendResult objects
         """
-        results = []
-        for keyword in keywords:
-            result = self.analyze_keyword_trend(posts, keyword, granularity)
-            results.append(result)
-        return results
+        series_by_keyword = self.build_multiple_timeseries(posts, keywords, granularity)
+        calculator = self.trend_calculator
+        assert calculator is not None  # set in __post_init__
+        return [
+            KeywordTrendResult(
+                keyword=keyword,
+                series=series_by_keyword[keyword],
+                metrics=calculator.calculate_trend(series_by_keyword[keyword]),
+            )
+            for keyword in keywords
+        ]
 
     def find_trending_keywords(
         self,
-        posts: list[Post],
+        posts: list[Post] | PostCorpus,
         num_keywords: int = 10,
         granularity: TimeGranularity = TimeGranularity.DAY,
     ) -> list[KeywordTrendResult]:
@@ -636,7 +735,7 @@ class KeywordTrendAnalyzer:
         returning results sorted by trend strength.
 
         Args:
-            posts: List of Post objects to analyze
+            posts: List of Post objects or a PostCorpus to analyze
             num_keywords: Number of top keywords to analyze
             granularity: Time unit for aggregation
 
@@ -645,6 +744,7 @@ class KeywordTrendAnalyzer:
         """
         if not posts:
             return []
+        posts = as_corpus(posts)
 
         # Extract keywords from all posts
         extractor = self._get_extractor()
@@ -684,7 +784,7 @@ class KeywordTrendAnalyzer:
 
     def analyze_with_forecast(
         self,
-        posts: list[Post],
+        posts: list[Post] | PostCorpus,
         keywords: list[str],
         granularity: TimeGranularity = TimeGranularity.DAY,
         forecast_periods: int = 7,
@@ -697,7 +797,7 @@ class KeywordTrendAnalyzer:
         for each keyword's time series.
 
         Args:
-            posts: List of Post objects to analyze
+            posts: List of Post objects or a PostCorpus to analyze
             keywords: List of keywords to analyze
             granularity: Time unit for aggregation
             forecast_periods: Number of future periods to predict
@@ -12,6 +12,7 @@ import logging
 import sys
 from collections.abc import Sequence
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from rich.console import Console
 from rich.logging import RichHandler
@@ -28,7 +29,15 @@ from rich.progress import (
 )
 from rich.table import Table
 
-from reddit_insight.pipeline.collector import Collector, CollectorConfig
+from reddit_insight.pipeline.collector import CollectionResult, Collector, CollectorConfig
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator
+
+    from rich.progress import TaskID
+
+    from reddit_insight.analysis.corpus import PostCorpus
+    from reddit_insight.reddit.models import Post
 
 console = Console()
 
@@ -273,27 +282,27 @@ async def cmd_collect_list(args: argparse.Namespace) -> int:
 
     console.print()
 
-    results = []
+    configs = [
+        CollectorConfig(
+            subreddit=subreddit,
+            sort=args.sort,
+            limit=args.limit,
+            include_comments=args.comments,
+            comment_limit=args.comment_limit,
+            time_filter=args.time_filter,
+        )
+        for subreddit in subreddits
+    ]
 
     with create_simple_progress() as progress:
         task = progress.add_task("수집 중...", total=len(subreddits))
 
-        async with Collector() as collector:
-            for subreddit in subreddits:
-                progress.update(task, description=f"r/{subreddit} 수집 중...")
-
-                config = CollectorConfig(
-                    subreddit=subreddit,
-                    sort=args.sort,
-                    limit=args.limit,
-                    include_comments=args.comments,
-                    comment_limit=args.comment_limit,
-                    time_filter=args.time_filter,
-                )
-                result = await collector.collect_subreddit(config)
-                results.append(result)
+        def on_result(result: CollectionResult) -> None:
+            progress.update(task, description=f"r/{result.subreddit} 완료")
+            progress.advance(task)
 
-                progress.advance(task)
+        async with Collector(max_concurrency=args.workers) as collector:
+            results = await collector.collect_multiple(configs, on_result=on_result)
 
     # 결과 테이블 출력
     table = Table(title="수집 결과 요약", show_header=True)
@@ -339,6 +348,17 @@ async def cmd_collect_list(args: argparse.Namespace) -> int:
 # =============================================================================
 
 
+async def _report_loaded(
+    chunks: AsyncIterable[list[Post]], progress: Progress, task: TaskID
+) -> AsyncIterator[list[Post]]:
+    """로드된 게시물 수를 진행 표시줄에 반영하며 청크를 그대로 전달한다."""
+    loaded = 0
+    async for chunk in chunks:
+        loaded += len(chunk)
+        progress.update(task, description=f"게시물 {loaded}개 로드됨...")
+        yield chunk
+
+
 async def cmd_analyze_full(args: argparse.Namespace) -> int:
     """전체 분석 파이프라인 실행.
 
@@ -351,12 +371,14 @@ async def cmd_analyze_full(args: argparse.Namespace) -> int:
     from sqlalchemy import select
 
     from reddit_insight.analysis.competitive import CompetitiveAnalyzer
+    from reddit_insight.analysis.context import AnalysisContext
+    from reddit_insight.analysis.corpus import PostCorpus
     from reddit_insight.analysis.demand_analyzer import DemandAnalyzer
     from reddit_insight.analysis.keywords import UnifiedKeywordExtractor
     from reddit_insight.analysis.trends import KeywordTrendAnalyzer
-    from reddit_insight.reddit.models import Post
     from reddit_insight.storage.database import Database
-    from reddit_insight.storage.models import PostModel, SubredditModel
+    from reddit_insight.storage.models import SubredditModel
+    from reddit_insight.storage.repository import PostRepository
 
     console.print(
         Panel(
@@ -367,8 +389,8 @@ async def cmd_analyze_full(args: argparse.Namespace) -> int:
         )
     )
 
-    # 데이터베이스에서 게시물 가져오기
-    posts: list[Post] = []
+    # 데이터베이스에서 게시물을 청크 단위로 읽어 바로 corpus로 쌓는다
+    corpus: PostCorpus | None = None
 
     with create_progress() as progress:
         task = progress.add_task("데이터베이스에서 게시물 로드 중...", total=None)
@@ -390,72 +412,54 @@ async def cmd_analyze_full(args: argparse.Namespace) -> int:
                     )
                     return 1
 
-                # 게시물 조회
-                posts_result = await session.execute(
-                    select(PostModel)
-                    .where(PostModel.subreddit_id == subreddit.id)
-                    .order_by(PostModel.reddit_created_utc.desc())
-                    .limit(args.limit)
-                )
-                post_models = posts_result.scalars().all()
-
-                # 모델을 Post 객체로 변환
-                for pm in post_models:
-                    posts.append(Post(
-                        id=pm.reddit_id,
-                        title=pm.title,
-                        selftext=pm.selftext or "",
-                        author=pm.author,
-                        subreddit=subreddit.name,
-                        score=pm.score,
-                        num_comments=pm.num_comments,
-                        created_utc=pm.reddit_created_utc,
-                        url=pm.url,
-                        permalink=pm.permalink,
-                        is_self=pm.is_self,
-                    ))
+                # 게시물 스트리밍 조회 (필요한 컬럼만, 청크 단위)
+                repo = PostRepository(session)
+                chunks = repo.stream_by_subreddit(subreddit.id, subreddit.name, limit=args.limit)
+                corpus = await PostCorpus.from_stream(_report_loaded(chunks, progress, task))
 
         progress.update(task, completed=100, total=100)
 
-    if not posts:
+    if not corpus:
         print_error(
             f"r/{args.subreddit}에서 분석할 게시물이 없습니다.",
             hint="먼저 데이터를 수집하세요: reddit-insight collect " + args.subreddit,
         )
         return 1
 
-    console.print(f"\n[green]{len(posts)}개[/green] 게시물을 분석합니다.\n")
+    console.print(f"\n[green]{len(corpus)}개[/green] 게시물을 분석합니다.\n")
 
     # 분석 실행
     results: dict[str, object] = {}
+    # 모든 분석기가 같은 corpus와 토큰화 캐시를 공유한다
+    context = AnalysisContext()
 
     with create_progress() as progress:
         # 1. 키워드 추출
         task1 = progress.add_task("키워드 추출 중...", total=100)
-        extractor = UnifiedKeywordExtractor()
-        keyword_result = extractor.extract_from_posts(posts, num_keywords=20)
+        extractor = UnifiedKeywordExtractor(context=context)
+        keyword_result = extractor.extract_from_posts(corpus, num_keywords=20)
         results["keywords"] = keyword_result
         progress.update(task1, completed=100)
 
         # 2. 트렌드 분석
         task2 = progress.add_task("트렌드 분석 중...", total=100)
-        trend_analyzer = KeywordTrendAnalyzer()
+        trend_analyzer = KeywordTrendAnalyzer(context=context)
         keywords = [kw.keyword for kw in keyword_result.keywords[:10]]
-        trend_results = trend_analyzer.analyze_multiple_keywords(posts, keywords)
+        trend_results = trend_analyzer.analyze_multiple_keywords(corpus, keywords)
         results["trends"] = trend_results
         progress.update(task2, completed=100)
 
         # 3. 수요 분석
         task3 = progress.add_task("수요 분석 중...", total=100)
-        demand_analyzer = DemandAnalyzer()
-        demand_report = demand_analyzer.analyze_posts(posts)
+        demand_analyzer = DemandAnalyzer(context=context)
+        demand_report = demand_analyzer.analyze_posts(corpus)
         results["demand"] = demand_report
         progress.update(task3, completed=100)
 
         # 4. 경쟁 분석
         task4 = progress.add_task("경쟁 분석 중...", total=100)
-        competitive_analyzer = CompetitiveAnalyzer()
-        competitive_report = competitive_analyzer.analyze_posts(posts)
+        competitive_analyzer = CompetitiveAnalyzer(context=context)
+        competitive_report = competitive_analyzer.analyze_posts(corpus)
         results["competitive"] = competitive_report
         progress.update(task4, completed=100)
 
@@ -539,10 +543,11 @@ async def cmd_report_generate(args: argparse.Namespace) -> int:
     from sqlalchemy import select
 
     from reddit_insight.analysis.competitive import CompetitiveAnalyzer
+    from reddit_insight.analysis.context import AnalysisContext
+    from reddit_insight.analysis.corpus import PostCorpus
     from reddit_insight.analysis.demand_analyzer import DemandAnalyzer
     from reddit_insight.analysis.keywords import UnifiedKeywordExtractor
     from reddit_insight.analysis.trends import KeywordTrendAnalyzer
-    from reddit_insight.reddit.models import Post
     from reddit_insight.reports.generator import (
         ReportConfig,
         ReportDataCollector,
@@ -550,7 +555,8 @@ async def cmd_report_generate(args: argparse.Namespace) -> int:
         TrendReportData,
     )
     from reddit_insight.storage.database import Database
-    from reddit_insight.storage.models import PostModel, SubredditModel
+    from reddit_insight.storage.models import SubredditModel
+    from reddit_insight.storage.repository import PostRepository
 
     output_dir = Path(args.output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
@@ -564,8 +570,8 @@ async def cmd_report_generate(args: argparse.Namespace) -> int:
         )
     )
 
-    # 데이터베이스에서 게시물 가져오기
-    posts: list[Post] = []
+    # 데이터베이스에서 게시물을 청크 단위로 읽어 바로 corpus로 쌓는다
+    corpus: PostCorpus | None = None
 
     with create_progress() as progress:
         task = progress.add_task("데이터 로드 중...", total=None)
@@ -586,50 +592,34 @@ async def cmd_report_generate(args: argparse.Namespace) -> int:
                     )
                     return 1
 
-                posts_result = await session.execute(
-                    select(PostModel)
-                    .where(PostModel.subreddit_id == subreddit.id)
-                    .order_by(PostModel.reddit_created_utc.desc())
-                    .limit(args.limit)
+                repo = PostRepository(session)
+                corpus = await PostCorpus.from_stream(
+                    repo.stream_by_subreddit(subreddit.id, subreddit.name, limit=args.limit)
                 )
-                post_models = posts_result.scalars().all()
-
-                for pm in post_models:
-                    posts.append(Post(
-                        id=pm.reddit_id,
-                        title=pm.title,
-                        selftext=pm.selftext or "",
-                        author=pm.author,
-                        subreddit=subreddit.name,
-                        score=pm.score,
-                        num_comments=pm.num_comments,
-                        created_utc=pm.reddit_created_utc,
-                        url=pm.url,
-                        permalink=pm.permalink,
-                        is_self=pm.is_self,
-                    ))
 
         progress.update(task, completed=100, total=100)
 
-    if not posts:
+    if not corpus:
         print_error("분석할 게시물이 없습니다.")
         return 1
 
     # 분석 실행 및 리포트 데이터 수집
+    context = AnalysisContext()
+
     with create_progress() as progress:
         # 키워드 및 트렌드
         task1 = progress.add_task("키워드/트렌드 분석 중...", total=100)
-        extractor = UnifiedKeywordExtractor()
-        keyword_result = extractor.extract_from_posts(posts, num_keywords=20)
+        extractor = UnifiedKeywordExtractor(context=context)
+        keyword_result = extractor.extract_from_posts(corpus, num_keywords=20)
 
-        trend_analyzer = KeywordTrendAnalyzer()
+        trend_analyzer = KeywordTrendAnalyzer(context=context)
         keywords = [kw.keyword for kw in keyword_result.keywords[:10]]
-        trend_results = trend_analyzer.analyze_multiple_keywords(posts, keywords)
+        trend_results = trend_analyzer.analyze_multiple_keywords(corpus, keywords)
 
         # TrendReportData 생성
         trend_data = TrendReportData(
             title=f"r/{args.subreddit} Trend Report",
-            summary=f"Analyzed {len(posts)} posts from r/{args.subreddit}",
+            summary=f"Analyzed {len(corpus)} posts from r/{args.subreddit}",
             top_keywords=[
                 {"keyword": kw.keyword, "score": kw.score}
                 for kw in keyword_result.keywords[:10]
@@ -644,14 +634,14 @@ async def cmd_report_generate(args: argparse.Namespace) -> int:
 
         # 수요 분석
         task2 = progress.add_task("수요 분석 중...", total=100)
-        demand_analyzer = DemandAnalyzer()
-        demand_report = demand_analyzer.analyze_posts(posts)
+        demand_analyzer = DemandAnalyzer(context=context)
+        demand_report = demand_analyzer.analyze_posts(corpus)
         progress.update(task2, completed=100)
 
         # 경쟁 분석
         task3 = progress.add_task("경쟁 분석 중...", total=100)
-        competitive_analyzer = CompetitiveAnalyzer()
-        competitive_report = competitive_analyzer.analyze_posts(posts)
+        competitive_analyzer = CompetitiveAnalyzer(context=context)
+        competitive_report = competitive_analyzer.analyze_posts(corpus)
         progress.update(task3, completed=100)
 
         # 리포트 생성 (인사이트 리포트는 별도 생성 없이 다른 리포트로 대체)
@@ -662,7 +652,7 @@ async def cmd_report_generate(args: argparse.Namespace) -> int:
             demand_report=demand_report,
             competitive_report=competitive_report,
             insight_report=None,  # 인사이트는 수요/경쟁 분석에서 추출
-            metadata={"subreddit": args.subreddit, "post_count": len(posts)},
+            metadata={"subreddit": args.subreddit, "post_count": len(corpus)},
         )
 
         config = ReportConfig(
@@ -959,6 +949,13 @@ Examples:
         default="week",
         help="top 정렬 시 기간 필터 (기본: week)",
     )
+    collect_list_parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=4,
+        help="동시에 수집할 서브레딧 수 (기본: 4)",
+    )
 
     # =========================================================================
     # analyze 명령 그룹
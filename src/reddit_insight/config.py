@@ -65,11 +65,29 @@ class Settings(BaseSettings):
         description="Reddit API User Agent",
     )
 
+    # Scraping
+    scraping_cache_dir: Path | None = Field(
+        default=None,
+        description="스크래핑 HTTP 응답 캐시 디렉토리 (미지정 시 캐시 미사용)",
+    )
+    scraping_cache_max_mb: int = Field(
+        default=256,
+        description="스크래핑 HTTP 응답 캐시 최대 크기 (MB)",
+    )
+
     # Database
     database_url: str = Field(
         default="sqlite:///./data/reddit_insight.db",
         description="데이터베이스 연결 URL",
     )
+    database_profile: Literal["default", "production"] = Field(
+        default="production",
+        description="SQLite 연결 프로파일 (production: WAL, busy_timeout, mmap 등 적용)",
+    )
+    database_read_pool_size: int = Field(
+        default=5,
+        description="대시보드 읽기 전용 연결 풀 크기 (SQLite)",
+    )
 
     # LLM API
     llm_provider: Literal["claude", "openai"] = Field(
@@ -100,6 +118,18 @@ class Settings(BaseSettings):
         default=86400,
         description="LLM 응답 캐시 TTL (초, 기본 24시간)",
     )
+    llm_cache_backend: Literal["sqlite", "memory", "none"] = Field(
+        default="sqlite",
+        description="LLM 응답 캐시 백엔드 (sqlite: 프로세스 간 공유 영속 캐시, memory, none)",
+    )
+    llm_cache_path: Path | None = Field(
+        default=None,
+        description="SQLite LLM 캐시 파일 경로 (미지정 시 data_dir/llm_cache.db)",
+    )
+    llm_cache_max_size: int = Field(
+        default=10000,
+        description="LLM 응답 캐시 최대 항목 수",
+    )
 
     # Alert & Notification
     smtp_host: str | None = Field(
@@ -9,6 +9,7 @@ import asyncio
 from datetime import UTC, datetime
 
 from reddit_insight.analysis.competitive import CompetitiveAnalyzer
+from reddit_insight.analysis.context import AnalysisContext
 from reddit_insight.analysis.demand_analyzer import DemandAnalyzer
 from reddit_insight.analysis.keywords import UnifiedKeywordExtractor
 from reddit_insight.analysis.trends import KeywordTrendAnalyzer
@@ -28,7 +29,9 @@ async def collect_and_analyze(subreddit: str, limit: int = 100) -> AnalysisData:
 
     # 2. 키워드 추출
     print("2. 키워드 분석 중...")
-    extractor = UnifiedKeywordExtractor()
+    # 분석기 전체가 텍스트 정규화/토큰화 결과를 공유한다
+    context = AnalysisContext()
+    extractor = UnifiedKeywordExtractor(context=context)
     keyword_result = extractor.extract_from_posts(posts, num_keywords=30)
     keywords_data = [
         {"keyword": kw.keyword, "score": kw.score, "frequency": kw.frequency}
@@ -38,7 +41,7 @@ async def collect_and_analyze(subreddit: str, limit: int = 100) -> AnalysisData:
 
     # 3. 트렌드 분석
     print("3. 트렌드 분석 중...")
-    trend_analyzer = KeywordTrendAnalyzer()
+    trend_analyzer = KeywordTrendAnalyzer(context=context)
     top_keywords = [kw.keyword for kw in keyword_result.keywords[:10]]
     trend_results = trend_analyzer.analyze_multiple_keywords(posts, top_keywords)
     trends_data = [
@@ -55,7 +58,7 @@ async def collect_and_analyze(subreddit: str, limit: int = 100) -> AnalysisData:
 
     # 4. 수요 분석
     print("4. 수요 분석 중...")
-    demand_analyzer = DemandAnalyzer()
+    demand_analyzer = DemandAnalyzer(context=context)
     demand_report = demand_analyzer.analyze_posts(posts)
     demands_data = {
         "total_demands": demand_report.total_demands,
@@ -76,7 +79,7 @@ async def collect_and_analyze(subreddit: str, limit: int = 100) -> AnalysisData:
 
     # 5. 경쟁 분석
     print("5. 경쟁 분석 중...")
-    competitive_analyzer = CompetitiveAnalyzer()
+    competitive_analyzer = CompetitiveAnalyzer(context=context)
     competitive_report = competitive_analyzer.analyze_posts(posts)
     competition_data = {
         "entities_analyzed": competitive_report.entities_analyzed,
@@ -58,6 +58,12 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down Reddit Insight Dashboard...")
     stop_scheduler()
+
+    # LLM 클라이언트와 게시물 조회 연결 풀 종료
+    from reddit_insight.dashboard.services.llm_service import close_llm_service
+    from reddit_insight.dashboard.services_module import close_dashboard_service
+    await close_llm_service()
+    await close_dashboard_service()
     logger.info("Dashboard shutdown complete")
 
 
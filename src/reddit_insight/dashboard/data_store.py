@@ -2,6 +2,7 @@
 
 분석 결과를 데이터베이스에 저장하고 서비스들이 접근할 수 있게 한다.
 SQLite/PostgreSQL을 지원하며, 메모리 캐시를 통해 성능을 최적화한다.
+조회는 읽기 전용 연결 풀(ReadSessionLocal)을 사용해 수집 쓰기와 분리한다.
 """
 
 import json
@@ -12,6 +13,7 @@ from typing import Any
 
 from reddit_insight.dashboard.database import (
     AnalysisResult,
+    ReadSessionLocal,
     SessionLocal,
     init_db,
 )
@@ -143,7 +145,7 @@ def load_from_database(subreddit: str | None = None) -> AnalysisData | None:
     except Exception:
         return None
 
-    db = SessionLocal()
+    db = ReadSessionLocal()
     try:
         query = db.query(AnalysisResult)
 
@@ -178,7 +180,7 @@ def get_all_subreddits() -> list[str]:
     except Exception:
         return []
 
-    db = SessionLocal()
+    db = ReadSessionLocal()
     try:
         results = (
             db.query(AnalysisResult.subreddit)
@@ -202,7 +204,7 @@ def get_analysis_history(
     except Exception:
         return []
 
-    db = SessionLocal()
+    db = ReadSessionLocal()
     try:
         query = db.query(AnalysisResult)
 
@@ -282,7 +284,7 @@ def load_analysis_by_id(analysis_id: int) -> AnalysisData | None:
     except Exception:
         return None
 
-    db = SessionLocal()
+    db = ReadSessionLocal()
     try:
         result = db.query(AnalysisResult).filter(AnalysisResult.id == analysis_id).first()
 
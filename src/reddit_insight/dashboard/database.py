@@ -2,9 +2,13 @@
 
 SQLAlchemy를 사용하여 분석 결과를 영구 저장한다.
 기본적으로 SQLite를 사용하며, DATABASE_URL 환경변수로 PostgreSQL 전환 가능.
+
+SQLite에서는 Settings.database_profile 프로파일(기본: production, WAL)을 적용하고,
+대시보드 조회용으로 쓰기가 금지된 별도 읽기 전용 연결 풀(ReadSessionLocal)을 둔다.
 """
 
 import os
+from collections.abc import Iterator
 from datetime import UTC, datetime
 from typing import Any
 
@@ -16,6 +20,7 @@ from sqlalchemy import (
     String,
     Text,
     create_engine,
+    make_url,
 )
 from sqlalchemy.orm import (
     DeclarativeBase,
@@ -25,6 +30,9 @@ from sqlalchemy.orm import (
     sessionmaker,
 )
 
+from reddit_insight.config import get_settings
+from reddit_insight.storage.sqlite_profile import apply_sqlite_profile, get_profile
+
 # 데이터베이스 URL (기본: SQLite)
 DATABASE_URL = os.getenv(
     "DATABASE_URL",
@@ -35,15 +43,34 @@ DATABASE_URL = os.getenv(
 if DATABASE_URL.startswith("postgres://"):
     DATABASE_URL = DATABASE_URL.replace("postgres://", "postgresql://", 1)
 
+_IS_SQLITE = "sqlite" in DATABASE_URL
+_settings = get_settings()
+DATABASE_PROFILE = get_profile(_settings.database_profile)
+
 # 엔진 생성
 engine = create_engine(
     DATABASE_URL,
-    connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {},
+    connect_args={"check_same_thread": False} if _IS_SQLITE else {},
     echo=False,
 )
+apply_sqlite_profile(engine, DATABASE_PROFILE)
+
+# 읽기 전용 엔진 (SQLite 파일: query_only 연결 풀, 그 외: 쓰기 엔진 공유)
+# 인메모리 SQLite는 연결마다 별도 데이터베이스이므로 쓰기 엔진을 공유한다
+if _IS_SQLITE and make_url(DATABASE_URL).database not in (None, "", ":memory:"):
+    read_engine = create_engine(
+        DATABASE_URL,
+        connect_args={"check_same_thread": False},
+        pool_size=_settings.database_read_pool_size,
+        echo=False,
+    )
+    apply_sqlite_profile(read_engine, DATABASE_PROFILE, read_only=True)
+else:
+    read_engine = engine
 
 # 세션 팩토리
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
 
 
 class Base(DeclarativeBase):
@@ -160,10 +187,19 @@ def get_db() -> Session:
         raise
 
 
-def get_db_context():
+def get_db_context() -> Iterator[Session]:
     """FastAPI 의존성 주입용 제너레이터."""
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+
+def get_read_db_context() -> Iterator[Session]:
+    """FastAPI 의존성 주입용 읽기 전용 세션 제너레이터."""
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
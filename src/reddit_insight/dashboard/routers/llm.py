@@ -1,18 +1,20 @@
 """LLM 분석 라우터.
 
 LLM 기반 분석 기능을 제공하는 라우터:
-- AI 요약: 게시물 핵심 내용 추출
+- AI 요약: 게시물 핵심 내용 추출 (SSE 스트리밍 지원)
 - 카테고리화: 텍스트 자동 분류
 - 심층 감성 분석: 뉘앙스 있는 감성 분석
 - 인사이트 생성: 비즈니스 기회 해석
 """
 
+import json
 import logging
+from collections.abc import AsyncIterator
 from dataclasses import asdict
 from typing import Any
 
 from fastapi import APIRouter, Depends, Form, Query, Request
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse
 from fastapi.templating import Jinja2Templates
 from pydantic import BaseModel, Field
 
@@ -128,7 +130,7 @@ async def get_summary_partial(
     templates = get_templates(request)
 
     # 분석 데이터에서 게시물 가져오기
-    analysis = dashboard_service.get_analysis_by_subreddit(subreddit)
+    analysis = await dashboard_service.get_analysis_by_subreddit(subreddit)
 
     if not analysis or not analysis.get("raw_data"):
         context = {
@@ -172,7 +174,7 @@ async def get_summary_json(
     Returns:
         JSONResponse: 요약 데이터
     """
-    analysis = dashboard_service.get_analysis_by_subreddit(subreddit)
+    analysis = await dashboard_service.get_analysis_by_subreddit(subreddit)
 
     if not analysis or not analysis.get("raw_data"):
         return JSONResponse(
@@ -193,6 +195,79 @@ async def get_summary_json(
         )
 
 
+@router.get("/summary/stream")
+async def stream_summary(
+    request: Request,
+    subreddit: str = Query(..., description="서브레딧 이름"),
+    llm_service: LLMService = Depends(get_llm_service),
+    dashboard_service: DashboardService = Depends(get_dashboard_service),
+) -> StreamingResponse:
+    """AI 요약을 생성되는 대로 SSE로 스트리밍한다.
+
+    이벤트 형식:
+        - {"type": "chunk", "text": ...}: 요약 텍스트 조각
+        - {"type": "done", "post_count": ...}: 생성 완료 (결과는 캐시됨)
+        - {"type": "error", "message": ...}: 오류
+
+    Args:
+        request: FastAPI Request 객체
+        subreddit: 분석할 서브레딧
+        llm_service: LLMService 인스턴스
+        dashboard_service: DashboardService 인스턴스
+
+    Returns:
+        StreamingResponse: SSE 스트림
+    """
+    analysis = await dashboard_service.get_analysis_by_subreddit(subreddit)
+    posts: list[dict[str, Any]] | None = None
+    if analysis and analysis.get("raw_data"):
+        posts = analysis["raw_data"].get("posts", [])
+
+    async def event_generator() -> AsyncIterator[str]:
+        """SSE 이벤트 생성기."""
+        if posts is None:
+            yield _format_sse(
+                {
+                    "type": "error",
+                    "message": f"'{subreddit}' 서브레딧의 분석 데이터가 없습니다.",
+                }
+            )
+            return
+
+        try:
+            async for chunk in llm_service.stream_summary(subreddit, posts):
+                if await request.is_disconnected():
+                    logger.info("요약 스트림 클라이언트 연결 종료: %s", subreddit)
+                    return
+                yield _format_sse({"type": "chunk", "text": chunk})
+            yield _format_sse({"type": "done", "post_count": len(posts)})
+        except Exception as e:
+            logger.error("요약 스트리밍 실패: %s", e)
+            yield _format_sse({"type": "error", "message": f"요약 생성 실패: {e}"})
+
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",  # Nginx 버퍼링 비활성화
+        },
+    )
+
+
+def _format_sse(data: dict[str, Any]) -> str:
+    """SSE 형식으로 데이터를 포맷팅한다.
+
+    Args:
+        data: 전송할 데이터
+
+    Returns:
+        SSE 형식 문자열
+    """
+    return f"data: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
 # =============================================================================
 # CATEGORIZATION ENDPOINTS
 # =============================================================================
@@ -356,7 +431,7 @@ async def get_insights_partial(
     templates = get_templates(request)
 
     # 분석 데이터 가져오기
-    analysis = dashboard_service.get_analysis_by_subreddit(subreddit)
+    analysis = await dashboard_service.get_analysis_by_subreddit(subreddit, post_limit=0)
 
     if not analysis:
         context = {
@@ -406,7 +481,7 @@ async def get_insights_json(
     Returns:
         JSONResponse: 인사이트 목록
     """
-    analysis = dashboard_service.get_analysis_by_subreddit(subreddit)
+    analysis = await dashboard_service.get_analysis_by_subreddit(subreddit, post_limit=0)
 
     if not analysis:
         return JSONResponse(
@@ -48,6 +48,7 @@ async def run_analysis_job(subreddit: str, limit: int = 100) -> dict[str, Any]:
     try:
         # 분석 모듈 임포트 (지연 임포트로 순환 참조 방지)
         from reddit_insight.analysis.competitive import CompetitiveAnalyzer
+        from reddit_insight.analysis.context import AnalysisContext
         from reddit_insight.analysis.demand_analyzer import DemandAnalyzer
         from reddit_insight.analysis.keywords import UnifiedKeywordExtractor
         from reddit_insight.analysis.trends import KeywordTrendAnalyzer
@@ -63,7 +64,9 @@ async def run_analysis_job(subreddit: str, limit: int = 100) -> dict[str, Any]:
             return {"status": "warning", "message": "No posts found"}
 
         # 2. 키워드 추출
-        extractor = UnifiedKeywordExtractor()
+        # 분석기 전체가 텍스트 정규화/토큰화 결과를 공유한다
+        context = AnalysisContext()
+        extractor = UnifiedKeywordExtractor(context=context)
         keyword_result = extractor.extract_from_posts(posts, num_keywords=30)
         keywords_data = [
             {"keyword": kw.keyword, "score": kw.score, "frequency": kw.frequency}
@@ -71,7 +74,7 @@ async def run_analysis_job(subreddit: str, limit: int = 100) -> dict[str, Any]:
         ]
 
         # 3. 트렌드 분석
-        trend_analyzer = KeywordTrendAnalyzer()
+        trend_analyzer = KeywordTrendAnalyzer(context=context)
         top_keywords = [kw.keyword for kw in keyword_result.keywords[:10]]
         trend_results = trend_analyzer.analyze_multiple_keywords(posts, top_keywords)
         trends_data = [
@@ -86,7 +89,7 @@ async def run_analysis_job(subreddit: str, limit: int = 100) -> dict[str, Any]:
         ]
 
         # 4. 수요 분석
-        demand_analyzer = DemandAnalyzer()
+        demand_analyzer = DemandAnalyzer(context=context)
         demand_report = demand_analyzer.analyze_posts(posts)
         demands_data = {
             "total_demands": demand_report.total_demands,
@@ -108,7 +111,7 @@ async def run_analysis_job(subreddit: str, limit: int = 100) -> dict[str, Any]:
         }
 
         # 5. 경쟁 분석
-        competitive_analyzer = CompetitiveAnalyzer()
+        competitive_analyzer = CompetitiveAnalyzer(context=context)
         competitive_report = competitive_analyzer.analyze_posts(posts)
         competition_data = {
             "entities_analyzed": competitive_report.entities_analyzed,
@@ -51,11 +51,13 @@ from reddit_insight.dashboard.services.insight_service import (
 
 # LLM 서비스
 from reddit_insight.dashboard.services.llm_service import (
+    CoalescingStats,
     LLMCategoryView,
     LLMInsightView,
     LLMSentimentView,
     LLMService,
     LLMSummaryView,
+    close_llm_service,
     get_llm_service,
     reset_llm_service,
 )
@@ -134,8 +136,10 @@ __all__ = [
     "LLMCategoryView",
     "LLMSentimentView",
     "LLMInsightView",
+    "CoalescingStats",
     "get_llm_service",
     "reset_llm_service",
+    "close_llm_service",
     # Prediction service
     "PredictionService",
     "PredictionView",
@@ -8,9 +8,11 @@ from datetime import UTC, datetime
 from functools import lru_cache
 from typing import Any
 
+import numpy as np
+
 from reddit_insight.analysis.ml import AnomalyDetector, AnomalyDetectorConfig
 from reddit_insight.analysis.time_series import TimeGranularity, TimePoint, TimeSeries
-from reddit_insight.dashboard.trend_service import TrendService, get_trend_service
+from reddit_insight.dashboard.trend_service import TimelinePoint, TrendService, get_trend_service
 
 
 @dataclass
@@ -225,37 +227,13 @@ class AnomalyService:
 
         try:
             result = detector.detect(time_series)
-
-            # AnomalyView로 변환
-            anomaly_points = []
-            is_anomaly_list = []
-            dates = [str(point.date) for point in timeline]
-            values = [float(point.count) for point in timeline]
-
-            for ap in result.anomalies:
-                is_anomaly_list.append(ap.is_anomaly)
-                if ap.is_anomaly:
-                    # 해당 인덱스의 날짜 찾기
-                    idx = result.anomalies.index(ap)
-                    anomaly_points.append(
-                        AnomalyPointView(
-                            date=dates[idx] if idx < len(dates) else ap.timestamp.strftime("%Y-%m-%d"),
-                            value=ap.value,
-                            score=ap.anomaly_score,
-                            is_anomaly=True,
-                            expected_value=ap.expected_value,
-                            deviation=ap.deviation,
-                        )
-                    )
-
-            return AnomalyView(
+            return self._create_view(
                 keyword=keyword,
-                dates=dates,
-                values=values,
-                is_anomaly=is_anomaly_list,
-                anomaly_points=anomaly_points,
-                anomaly_count=result.anomaly_count,
-                total_points=result.total_points,
+                timeline=timeline,
+                is_anomaly=[ap.is_anomaly for ap in result.anomalies],
+                scores=[ap.anomaly_score for ap in result.anomalies],
+                expected_values=[ap.expected_value for ap in result.anomalies],
+                deviations=[ap.deviation for ap in result.anomalies],
                 method=result.method,
                 threshold=result.threshold,
             )
@@ -269,7 +247,146 @@ class AnomalyService:
                 error_message=str(e),
             )
 
-    def _create_time_series(self, keyword: str, timeline: list) -> TimeSeries:
+    def detect_anomalies_many(
+        self,
+        keywords: list[str],
+        days: int = 30,
+        method: str = "auto",
+        threshold: float = 3.0,
+    ) -> dict[str, AnomalyView]:
+        """여러 키워드 시계열의 이상 포인트를 한 번에 탐지한다.
+
+        같은 날짜 구간을 가진 키워드들을 하나의 행렬(키워드 x 날짜)로 묶어
+        AnomalyDetector.detect_many로 일괄 탐지한다. 알림 경로에서 추적 중인
+        모든 키워드를 매 주기마다 검사할 때 사용한다.
+
+        Args:
+            keywords: 분석할 키워드 목록
+            days: 분석 기간 (7-90일)
+            method: 탐지 방법 ("auto", "zscore", "iqr", "isolation_forest")
+            threshold: 이상 판정 임계값 (z-score 방법에서 사용)
+
+        Returns:
+            키워드별 AnomalyView 딕셔너리 (입력 순서 유지)
+        """
+        days = max(7, min(90, days))
+        threshold = max(1.0, min(5.0, threshold))
+
+        timelines = {
+            keyword: self._trend_service.get_keyword_timeline(keyword=keyword, days=days)
+            for keyword in dict.fromkeys(keywords)
+        }
+
+        # 날짜 구간이 같은 키워드끼리 묶기
+        groups: dict[tuple[str, ...], list[str]] = {}
+        views: dict[str, AnomalyView] = {}
+        for keyword, timeline in timelines.items():
+            if len(timeline) < self._default_config.min_data_points:
+                views[keyword] = self._create_empty_result(
+                    keyword=keyword,
+                    timeline=timeline,
+                    method=method,
+                    threshold=threshold,
+                )
+                continue
+            dates = tuple(str(point.date) for point in timeline)
+            groups.setdefault(dates, []).append(keyword)
+
+        config = AnomalyDetectorConfig(
+            method=method,  # type: ignore[arg-type]
+            threshold=threshold,
+            contamination=self._default_config.contamination,
+            min_data_points=self._default_config.min_data_points,
+        )
+        detector = AnomalyDetector(config)
+
+        for group in groups.values():
+            matrix = np.array(
+                [[float(point.count) for point in timelines[keyword]] for keyword in group]
+            )
+            try:
+                result = detector.detect_many(matrix)
+            except Exception as e:
+                for keyword in group:
+                    views[keyword] = self._create_empty_result(
+                        keyword=keyword,
+                        timeline=timelines[keyword],
+                        method=method,
+                        threshold=threshold,
+                        error_message=str(e),
+                    )
+                continue
+
+            deviations = matrix - result.expected_values
+            for row, keyword in enumerate(group):
+                views[keyword] = self._create_view(
+                    keyword=keyword,
+                    timeline=timelines[keyword],
+                    is_anomaly=result.is_anomaly[row].tolist(),
+                    scores=result.scores[row].tolist(),
+                    expected_values=result.expected_values[row].tolist(),
+                    deviations=deviations[row].tolist(),
+                    method=result.method,
+                    threshold=result.threshold,
+                )
+
+        return {keyword: views[keyword] for keyword in timelines}
+
+    def _create_view(
+        self,
+        keyword: str,
+        timeline: list[TimelinePoint],
+        is_anomaly: list[bool],
+        scores: list[float],
+        expected_values: list[float | None],
+        deviations: list[float | None],
+        method: str,
+        threshold: float,
+    ) -> AnomalyView:
+        """포인트별 탐지 결과를 AnomalyView로 변환한다.
+
+        Args:
+            keyword: 키워드
+            timeline: 과거 타임라인 데이터
+            is_anomaly: 포인트별 이상 여부
+            scores: 포인트별 이상 점수
+            expected_values: 포인트별 예상값
+            deviations: 포인트별 편차
+            method: 사용된 탐지 방법
+            threshold: 사용된 임계값
+
+        Returns:
+            AnomalyView 객체
+        """
+        dates = [str(point.date) for point in timeline]
+        values = [float(point.count) for point in timeline]
+
+        anomaly_points = [
+            AnomalyPointView(
+                date=dates[idx],
+                value=values[idx],
+                score=scores[idx],
+                is_anomaly=True,
+                expected_value=expected_values[idx],
+                deviation=deviations[idx],
+            )
+            for idx, flag in enumerate(is_anomaly)
+            if flag
+        ]
+
+        return AnomalyView(
+            keyword=keyword,
+            dates=dates,
+            values=values,
+            is_anomaly=is_anomaly,
+            anomaly_points=anomaly_points,
+            anomaly_count=len(anomaly_points),
+            total_points=len(is_anomaly),
+            method=method,
+            threshold=threshold,
+        )
+
+    def _create_time_series(self, keyword: str, timeline: list[TimelinePoint]) -> TimeSeries:
         """TimelinePoint 목록을 TimeSeries로 변환한다.
 
         Args:
@@ -294,7 +411,7 @@ class AnomalyService:
     def _create_empty_result(
         self,
         keyword: str,
-        timeline: list,
+        timeline: list[TimelinePoint],
         method: str,
         threshold: float,
         error_message: str | None = None,
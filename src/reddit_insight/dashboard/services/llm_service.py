@@ -1,15 +1,18 @@
 """LLM 대시보드 서비스.
 
 LLM 기반 분석 기능을 대시보드에 제공하는 서비스 레이어.
-캐싱을 적용하여 API 비용을 최적화한다.
+캐싱을 적용하여 API 비용을 최적화하고, 같은 요청이 동시에 들어오면
+하나의 LLM 호출을 공유한다(single-flight).
 """
 
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, TypeVar
 
 from reddit_insight.llm import (
     CategoryResult,
@@ -21,13 +24,18 @@ from reddit_insight.llm import (
 from reddit_insight.dashboard.services.cache_service import (
     CacheService,
     get_cache_service,
+    hash_texts,
 )
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Callable
+
     from reddit_insight.llm import LLMClient
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 # =============================================================================
 # DATA CLASSES FOR VIEW MODELS
@@ -157,16 +165,74 @@ class LLMInsightView:
 # =============================================================================
 
 
+@dataclass
+class CoalescingStats:
+    """동일 요청 병합(single-flight) 통계.
+
+    Attributes:
+        executed: 실제로 LLM 분석을 실행한 요청 수
+        coalesced: 진행 중인 같은 요청의 결과를 기다린 요청 수
+    """
+
+    executed: int = 0
+    coalesced: int = 0
+
+    @property
+    def coalesce_rate(self) -> float:
+        """병합된 요청 비율 (0.0 ~ 1.0)."""
+        total = self.executed + self.coalesced
+        return self.coalesced / total if total else 0.0
+
+
+@dataclass
+class _ChunkFeed:
+    """스트리밍 작업 하나가 만든 조각을 여러 구독자에게 전달한다.
+
+    늦게 합류한 구독자도 처음 조각부터 받는다.
+    """
+
+    chunks: list[str] = field(default_factory=list)
+    done: bool = False
+    _changed: asyncio.Event = field(default_factory=asyncio.Event)
+
+    def push(self, chunk: str) -> None:
+        self.chunks.append(chunk)
+        self._notify()
+
+    def close(self) -> None:
+        self.done = True
+        self._notify()
+
+    def _notify(self) -> None:
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    async def follow(self) -> AsyncIterator[str]:
+        """지금까지의 조각과 이후 조각을 스트림이 끝날 때까지 전달한다."""
+        index = 0
+        while True:
+            while index < len(self.chunks):
+                yield self.chunks[index]
+                index += 1
+            if self.done:
+                return
+            await self._changed.wait()
+
+
 class LLMService:
     """LLM 대시보드 서비스.
 
     LLMAnalyzer를 래핑하여 대시보드에 필요한 기능을 제공한다.
     캐싱을 적용하여 API 호출 비용을 최적화한다.
 
+    요약(스트리밍 포함), 인사이트, 트렌드 해석, 심층 감성 분석은 같은 키의 요청이 진행 중이면
+    새로 호출하지 않고 진행 중인 작업의 결과를 함께 기다린다.
+
     Attributes:
         analyzer: LLMAnalyzer 인스턴스
         cache: CacheService 인스턴스
         is_configured: LLM API가 설정되었는지 여부
+        coalescing: 동일 요청 병합 통계
     """
 
     # 캐시 TTL (초)
@@ -175,6 +241,10 @@ class LLMService:
     SENTIMENT_CACHE_TTL = 86400  # 24시간
     INSIGHTS_CACHE_TTL = 1800  # 30분
 
+    # 카테고리 분류: 프롬프트당 텍스트 수와 동시 요청 수
+    CATEGORY_BATCH_SIZE = 20
+    CATEGORY_MAX_CONCURRENCY = 4
+
     def __init__(
         self,
         analyzer: LLMAnalyzer | None = None,
@@ -189,6 +259,50 @@ class LLMService:
         self.analyzer = analyzer
         self.cache = cache or get_cache_service()
         self.is_configured = analyzer is not None
+        self.coalescing = CoalescingStats()
+        # 키 -> 진행 중인 작업
+        self._in_flight: dict[str, asyncio.Task[Any]] = {}
+        # 키 -> 진행 중인 스트리밍 작업의 조각 (스트리밍 요청이 시작한 작업만)
+        self._feeds: dict[str, _ChunkFeed] = {}
+
+    @staticmethod
+    def _subreddit_key(kind: str, subreddit: str) -> str:
+        """서브레딧 단위 결과(summary, insights)의 캐시/병합 키."""
+        return f"llm:{kind}:{subreddit.lower()}"
+
+    def _flight(self, key: str, factory: Callable[[], Awaitable[T]]) -> asyncio.Task[T]:
+        """같은 키의 작업이 진행 중이면 그 작업을, 없으면 새 작업을 반환한다."""
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._finish_flight(key, done))
+            self.coalescing.executed += 1
+        else:
+            self.coalescing.coalesced += 1
+            logger.debug("진행 중인 LLM 요청에 합류: %s", key)
+        return task
+
+    async def _single_flight(self, key: str, factory: Callable[[], Awaitable[T]]) -> T:
+        """같은 키의 작업이 진행 중이면 그 결과를 함께 기다린다.
+
+        작업은 별도 Task로 실행되므로 기다리던 요청 하나가 취소되어도
+        다른 요청과 작업 자체는 영향을 받지 않는다. 작업이 실패하면
+        기다리던 모든 요청이 같은 예외를 받고, 다음 요청은 새로 실행한다.
+
+        Args:
+            key: 요청 식별 키 (보통 캐시 키)
+            factory: 작업 코루틴을 만드는 함수
+
+        Returns:
+            작업 결과
+        """
+        return await asyncio.shield(self._flight(key, factory))
+
+    def _finish_flight(self, key: str, task: asyncio.Task[Any]) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+            self._feeds.pop(key, None)
 
     # =========================================================================
     # SUMMARY
@@ -220,7 +334,7 @@ class LLMService:
                 subreddit=subreddit,
             )
 
-        cache_key = f"llm:summary:{subreddit.lower()}"
+        cache_key = self._subreddit_key("summary", subreddit)
 
         # 캐시 확인
         if use_cache:
@@ -238,12 +352,120 @@ class LLMService:
                 subreddit=subreddit,
             )
 
+        return await self._single_flight(
+            cache_key, lambda: self._generate_summary(subreddit, posts, use_cache)
+        )
+
+    async def _generate_summary(
+        self,
+        subreddit: str,
+        posts: list[dict[str, Any]],
+        use_cache: bool,
+    ) -> LLMSummaryView:
+        """요약을 생성하고 캐시에 저장한다."""
         summary = await self.analyzer.summarize_posts(posts)  # type: ignore[union-attr]
 
+        result = self._save_summary(subreddit, summary, len(posts), use_cache)
+        logger.info("LLM 요약 생성 완료: %s (%d 게시물)", subreddit, len(posts))
+        return result
+
+    async def stream_summary(
+        self,
+        subreddit: str,
+        posts: list[dict[str, Any]],
+        use_cache: bool = True,
+    ) -> AsyncIterator[str]:
+        """서브레딧 분석 요약을 생성되는 대로 스트리밍한다.
+
+        스트림이 끝나면 get_summary()와 같은 캐시 키로 결과를 저장하므로
+        이후 get_summary() 호출은 LLM을 다시 호출하지 않는다.
+
+        같은 서브레딧의 요약이 이미 생성 중이면 LLM을 다시 호출하지 않는다.
+        진행 중인 스트림에는 합류해 처음 조각부터 받고, 진행 중인 get_summary()에는
+        완료를 기다려 결과를 한 조각으로 받는다. 생성은 별도 Task에서 진행되므로
+        구독자 하나가 연결을 끊어도 다른 구독자와 캐시 저장은 영향을 받지 않는다.
+
+        Args:
+            subreddit: 서브레딧 이름
+            posts: 분석할 게시물 목록
+            use_cache: 캐시 사용 여부
+
+        Yields:
+            요약 텍스트 조각 (마크다운)
+
+        Raises:
+            LLMError: LLM API 호출 실패 시
+        """
+        if not self.is_configured:
+            yield "LLM API가 설정되지 않았습니다. 환경변수를 확인하세요."
+            return
+
+        cache_key = self._subreddit_key("summary", subreddit)
+
+        if use_cache:
+            cached = self.cache.get(cache_key)
+            if cached:
+                logger.debug("LLM 요약 캐시 히트: %s", subreddit)
+                yield cached["summary"]
+                return
+
+        if not posts:
+            yield "분석할 게시물이 없습니다."
+            return
+
+        starts_flight = cache_key not in self._in_flight
+        new_feed = _ChunkFeed()
+        task = self._flight(
+            cache_key,
+            lambda: self._stream_summary_to_feed(subreddit, posts, use_cache, new_feed),
+        )
+        if starts_flight:
+            self._feeds[cache_key] = new_feed
+        feed = self._feeds.get(cache_key)
+
+        if feed is None:
+            # 스트리밍이 아닌 get_summary() 작업에 합류한 경우
+            result = await asyncio.shield(task)
+            yield result.summary
+            return
+
+        async for chunk in feed.follow():
+            yield chunk
+        # 생성이 실패했으면 같은 예외를 전달한다
+        await asyncio.shield(task)
+
+    async def _stream_summary_to_feed(
+        self,
+        subreddit: str,
+        posts: list[dict[str, Any]],
+        use_cache: bool,
+        feed: _ChunkFeed,
+    ) -> LLMSummaryView:
+        """요약을 스트리밍으로 생성해 feed에 전달하고 캐시에 저장한다."""
+        chunks: list[str] = []
+        try:
+            async for chunk in self.analyzer.stream_summary(posts):  # type: ignore[union-attr]
+                chunks.append(chunk)
+                feed.push(chunk)
+        finally:
+            feed.close()
+
+        result = self._save_summary(subreddit, "".join(chunks), len(posts), use_cache)
+        logger.info("LLM 요약 스트리밍 완료: %s (%d 게시물)", subreddit, len(posts))
+        return result
+
+    def _save_summary(
+        self,
+        subreddit: str,
+        summary: str,
+        post_count: int,
+        use_cache: bool,
+    ) -> LLMSummaryView:
+        """요약 뷰를 만들고 캐시에 저장한다."""
         result = LLMSummaryView(
             summary=summary,
             generated_at=datetime.now().isoformat(),
-            post_count=len(posts),
+            post_count=post_count,
             subreddit=subreddit,
             cached=False,
         )
@@ -252,9 +474,12 @@ class LLMService:
         if use_cache:
             cache_data = asdict(result)
             del cache_data["cached"]
-            self.cache.set(cache_key, cache_data, ttl=self.SUMMARY_CACHE_TTL)
+            self.cache.set(
+                self._subreddit_key("summary", subreddit),
+                cache_data,
+                ttl=self.SUMMARY_CACHE_TTL,
+            )
 
-        logger.info("LLM 요약 생성 완료: %s (%d 게시물)", subreddit, len(posts))
         return result
 
     # =========================================================================
@@ -292,7 +517,12 @@ class LLMService:
         if not texts:
             return []
 
-        results = await self.analyzer.categorize_content(texts, categories)  # type: ignore[union-attr]
+        results = await self.analyzer.categorize_content(  # type: ignore[union-attr]
+            texts,
+            categories,
+            batch_size=self.CATEGORY_BATCH_SIZE,
+            max_concurrency=self.CATEGORY_MAX_CONCURRENCY,
+        )
         return [LLMCategoryView.from_result(r) for r in results]
 
     async def categorize_single(
@@ -344,6 +574,13 @@ class LLMService:
                 score=0.0,
             )
 
+        return await self._single_flight(
+            f"llm:sentiment:{hash_texts([text])}",
+            lambda: self._analyze_sentiment(text),
+        )
+
+    async def _analyze_sentiment(self, text: str) -> LLMSentimentView:
+        """심층 감성 분석을 실행한다."""
         result = await self.analyzer.analyze_sentiment_deep(text)  # type: ignore[union-attr]
         return LLMSentimentView.from_result(result)
 
@@ -376,7 +613,7 @@ class LLMService:
         if not analysis_data:
             return []
 
-        cache_key = f"llm:insights:{subreddit.lower()}"
+        cache_key = self._subreddit_key("insights", subreddit)
 
         # 캐시 확인
         if use_cache:
@@ -385,7 +622,17 @@ class LLMService:
                 logger.debug("LLM 인사이트 캐시 히트: %s", subreddit)
                 return [LLMInsightView(**item) for item in cached]
 
-        # LLM 호출
+        return await self._single_flight(
+            cache_key, lambda: self._generate_insights(analysis_data, subreddit, use_cache)
+        )
+
+    async def _generate_insights(
+        self,
+        analysis_data: dict[str, Any],
+        subreddit: str,
+        use_cache: bool,
+    ) -> list[LLMInsightView]:
+        """인사이트를 생성하고 캐시에 저장한다."""
         insights = await self.analyzer.generate_insights(  # type: ignore[union-attr]
             analysis_data,
             subreddit=subreddit,
@@ -396,7 +643,11 @@ class LLMService:
         # 캐시 저장
         if use_cache and views:
             cache_data = [asdict(v) for v in views]
-            self.cache.set(cache_key, cache_data, ttl=self.INSIGHTS_CACHE_TTL)
+            self.cache.set(
+                self._subreddit_key("insights", subreddit),
+                cache_data,
+                ttl=self.INSIGHTS_CACHE_TTL,
+            )
 
         logger.info("LLM 인사이트 생성 완료: %s (%d개)", subreddit, len(views))
         return views
@@ -426,11 +677,19 @@ class LLMService:
         if not self.is_configured:
             return "LLM API가 설정되지 않았습니다."
 
-        return await self.analyzer.interpret_trends(  # type: ignore[union-attr]
-            trend_data=trend_data,
-            rising_keywords=rising_keywords,
-            declining_keywords=declining_keywords,
-            target=target,
+        request = json.dumps(
+            [trend_data, rising_keywords, declining_keywords],
+            sort_keys=True,
+            default=str,
+        )
+        return await self._single_flight(
+            f"llm:trends:{target}:{hash_texts([request])}",
+            lambda: self.analyzer.interpret_trends(  # type: ignore[union-attr]
+                trend_data=trend_data,
+                rising_keywords=rising_keywords,
+                declining_keywords=declining_keywords,
+                target=target,
+            ),
         )
 
     # =========================================================================
@@ -446,14 +705,26 @@ class LLMService:
         return {
             "configured": self.is_configured,
             "cache_stats": self.cache.stats() if self.cache else {},
+            "coalescing": {
+                **asdict(self.coalescing),
+                "coalesce_rate": round(self.coalescing.coalesce_rate, 4),
+                "in_flight": len(self._in_flight),
+            },
         }
 
+    async def aclose(self) -> None:
+        """LLM 클라이언트의 연결 풀과 응답 캐시를 닫는다."""
+        if self.analyzer is not None:
+            await self.analyzer.client.aclose()
+
 
 # =============================================================================
 # SINGLETON INSTANCE
 # =============================================================================
 
 _llm_service: LLMService | None = None
+# 이벤트 루프 안에서 reset_llm_service()가 예약한 종료 작업 (GC 방지용 참조)
+_closing: set[asyncio.Task[None]] = set()
 
 
 def get_llm_service() -> LLMService:
@@ -477,18 +748,18 @@ def _create_llm_service() -> LLMService:
     """LLMService 인스턴스를 생성한다."""
     try:
         from reddit_insight.config import get_settings
-        from reddit_insight.llm import get_llm_client
+        from reddit_insight.llm import create_llm_cache, get_llm_client
 
         settings = get_settings()
 
         # API 키 확인 (Claude 또는 OpenAI)
         if settings.anthropic_api_key:
-            client = get_llm_client(provider="claude")
+            client = get_llm_client(provider="claude", cache=create_llm_cache(settings))
             analyzer = LLMAnalyzer(client=client)
             logger.info("LLMService 초기화 완료 (Claude)")
             return LLMService(analyzer=analyzer)
         elif settings.openai_api_key:
-            client = get_llm_client(provider="openai")
+            client = get_llm_client(provider="openai", cache=create_llm_cache(settings))
             analyzer = LLMAnalyzer(client=client)
             logger.info("LLMService 초기화 완료 (OpenAI)")
             return LLMService(analyzer=analyzer)
@@ -501,7 +772,37 @@ def _create_llm_service() -> LLMService:
         return LLMService(analyzer=None)
 
 
+async def _close_quietly(service: LLMService) -> None:
+    try:
+        await service.aclose()
+    except Exception as e:
+        logger.warning("LLM 클라이언트 종료 실패: %s", e)
+
+
+async def close_llm_service() -> None:
+    """LLMService 싱글톤의 클라이언트 연결을 닫고 리셋한다 (애플리케이션 종료 시)."""
+    global _llm_service
+    service, _llm_service = _llm_service, None
+    if service is not None:
+        await _close_quietly(service)
+
+
 def reset_llm_service() -> None:
-    """LLMService 싱글톤을 리셋한다 (테스트용)."""
+    """LLMService 싱글톤을 리셋한다 (테스트용).
+
+    기존 인스턴스의 클라이언트 연결도 닫는다. 실행 중인 이벤트 루프 안에서
+    호출되면 닫기 작업을 그 루프에 예약한다.
+    """
     global _llm_service
-    _llm_service = None
+    service, _llm_service = _llm_service, None
+    if service is None:
+        return
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        asyncio.run(_close_quietly(service))
+        return
+    task = loop.create_task(_close_quietly(service))
+    _closing.add(task)
+    task.add_done_callback(_closing.discard)
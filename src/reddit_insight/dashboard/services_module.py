@@ -3,10 +3,19 @@
 분석 모듈과 대시보드 UI를 연결하여 요약 데이터와 분석 기록을 제공한다.
 """
 
-from dataclasses import dataclass
+import asyncio
+import logging
+from dataclasses import asdict, dataclass
 from datetime import datetime
+from typing import Any
+
+from sqlalchemy.exc import SQLAlchemyError
 
 from reddit_insight.dashboard.data_store import get_analysis_history, get_current_data
+from reddit_insight.storage.database import Database
+from reddit_insight.storage.repository import PostRepository, SubredditRepository
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -51,10 +60,16 @@ class DashboardService:
     분석 모듈에서 데이터를 가져와 대시보드에 필요한 형태로 변환한다.
     """
 
-    def __init__(self) -> None:
-        """DashboardService를 초기화한다."""
+    def __init__(self, database_url: str | None = None) -> None:
+        """DashboardService를 초기화한다.
+
+        Args:
+            database_url: 수집 게시물 데이터베이스 URL (None이면 Settings 사용)
+        """
         # 추후 분석 모듈 의존성 주입
         self._analyses: list[AnalysisRecord] = []
+        # 게시물 조회용 연결 (첫 조회 때 연결하고 aclose()에서 닫는다)
+        self._database = Database(database_url)
 
     def get_summary(self) -> DashboardSummary:
         """대시보드 요약 데이터를 반환한다.
@@ -116,6 +131,63 @@ class DashboardService:
         )
         return sorted_analyses[:limit]
 
+    async def get_analysis_by_subreddit(
+        self, subreddit: str, post_limit: int = 50
+    ) -> dict[str, Any] | None:
+        """서브레딧의 최신 분석 결과와 수집된 게시물을 반환한다.
+
+        분석 결과에는 게시물 원문이 저장되지 않으므로, 수집 데이터베이스에서
+        최신 게시물을 post_limit개까지 읽어 raw_data["posts"]에 담는다.
+
+        Args:
+            subreddit: 서브레딧 이름 (대소문자 무관)
+            post_limit: 함께 읽을 최대 게시물 수 (0이면 읽지 않음)
+
+        Returns:
+            분석 필드(keywords, trends, demands, competition, insights)와
+            raw_data를 담은 딕셔너리. 분석 결과가 없으면 None.
+        """
+        data = await asyncio.to_thread(get_current_data, subreddit)
+        if data is None or data.subreddit.lower() != subreddit.lower():
+            return None
+
+        analysis = asdict(data)
+        posts = await self._load_posts(subreddit, post_limit) if post_limit > 0 else []
+        analysis["raw_data"] = {"posts": posts}
+        return analysis
+
+    async def _load_posts(self, subreddit: str, limit: int) -> list[dict[str, Any]]:
+        """수집 데이터베이스에서 서브레딧의 최신 게시물을 읽는다.
+
+        연결 풀은 서비스 수명 동안 재사용하며, 스키마는 수집기가 만들므로
+        여기서는 테이블을 생성하지 않는다.
+        """
+        await self._database.connect(create_tables=False)
+        try:
+            async with self._database.session() as session:
+                model = await SubredditRepository(session).get_by_name(subreddit)
+                if model is None:
+                    return []
+                rows = await PostRepository(session).get_by_subreddit(model.id, limit=limit)
+        except SQLAlchemyError as e:
+            # 아직 수집하지 않아 테이블이 없는 경우 등
+            logger.warning("게시물 조회 실패 (%s): %s", subreddit, e)
+            return []
+
+        return [
+            {
+                "title": row.title,
+                "body": row.selftext or "",
+                "score": row.score,
+                "num_comments": row.num_comments,
+            }
+            for row in rows
+        ]
+
+    async def aclose(self) -> None:
+        """게시물 조회용 데이터베이스 연결 풀을 닫는다."""
+        await self._database.disconnect()
+
     def add_analysis_record(self, record: AnalysisRecord) -> None:
         """분석 기록을 추가한다.
 
@@ -153,3 +225,11 @@ def get_dashboard_service() -> DashboardService:
     if _dashboard_service is None:
         _dashboard_service = DashboardService()
     return _dashboard_service
+
+
+async def close_dashboard_service() -> None:
+    """DashboardService 싱글톤의 연결을 닫고 리셋한다 (애플리케이션 종료 시)."""
+    global _dashboard_service
+    service, _dashboard_service = _dashboard_service, None
+    if service is not None:
+        await service.aclose()
@@ -14,6 +14,8 @@ from enum import Enum
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from datetime import datetime
+
     from reddit_insight.reddit.client import RedditClient
     from reddit_insight.reddit.models import Comment, Post, SubredditInfo
     from reddit_insight.scraping.reddit_scraper import RedditScraper
@@ -158,14 +160,19 @@ class UnifiedDataSource:
     def __init__(
         self,
         strategy: DataSourceStrategy = DataSourceStrategy.API_FIRST,
+        api_concurrency: int = 1,
     ) -> None:
         """UnifiedDataSource 초기화.
 
         Args:
             strategy: 데이터 소스 전략 (기본: API_FIRST)
+            api_concurrency: 동시에 실행할 PRAW 호출 수 (기본: 1).
+                PRAW 인스턴스는 스레드 안전하지 않으며 하나의 요청 할당량을
+                공유하므로, 여러 수집 작업이 동시에 실행되어도 이 값을 넘지 않는다.
         """
         self._strategy = strategy
         self._status = SourceStatus()
+        self._api_semaphore = asyncio.Semaphore(api_concurrency)
 
         # Lazy initialization
         self._api_client: RedditClient | None = None
@@ -220,9 +227,18 @@ class UnifiedDataSource:
         """
         if self._scraper is None:
             try:
+                from reddit_insight.config import get_settings
+                from reddit_insight.scraping.http_cache import HTTPResponseCache
                 from reddit_insight.scraping.reddit_scraper import RedditScraper
 
-                self._scraper = RedditScraper()
+                settings = get_settings()
+                cache = None
+                if settings.scraping_cache_dir is not None:
+                    cache = HTTPResponseCache(
+                        settings.scraping_cache_dir,
+                        max_bytes=settings.scraping_cache_max_mb * 1024 * 1024,
+                    )
+                self._scraper = RedditScraper(cache=cache)
                 logger.info("스크래퍼 초기화 완료")
             except Exception as e:
                 logger.error(f"스크래퍼 초기화 실패: {e}")
@@ -416,6 +432,18 @@ class UnifiedDataSource:
 
     # ========== 내부 헬퍼 메서드 ==========
 
+    async def _call_api(self, api_func: Callable[[], Any]) -> Any:
+        """공유 PRAW 할당량 안에서 동기 API 함수를 스레드로 실행.
+
+        Args:
+            api_func: API 호출 함수 (동기)
+
+        Returns:
+            API 호출 결과
+        """
+        async with self._api_semaphore:
+            return await asyncio.to_thread(api_func)
+
     async def _execute_with_fallback(
         self,
         api_func: Callable[[], Any],
@@ -445,7 +473,7 @@ class UnifiedDataSource:
                 logger.debug(f"API로 {operation_name} 수행")
                 client = self._get_api_client()
                 # API는 동기이므로 to_thread로 래핑
-                result = await asyncio.to_thread(api_func)
+                result = await self._call_api(api_func)
                 self._record_api_success()
                 return result
             except Exception as e:
@@ -482,7 +510,7 @@ class UnifiedDataSource:
                     try:
                         logger.info(f"API로 {operation_name} 폴백")
                         client = self._get_api_client()
-                        result = await asyncio.to_thread(api_func)
+                        result = await self._call_api(api_func)
                         self._record_api_success()
                         return result
                     except Exception as fallback_e:
@@ -536,13 +564,18 @@ class UnifiedDataSource:
         )
 
     async def get_new_posts(
-        self, subreddit: str, limit: int = 100
+        self,
+        subreddit: str,
+        limit: int = 100,
+        since: datetime | None = None,
     ) -> list[Post]:
         """New 게시물 수집.
 
         Args:
             subreddit: 서브레딧 이름
             limit: 수집할 게시물 수 (기본: 100)
+            since: 워터마크 시각. 주어지면 이 시각 이후(포함) 게시물만 수집하고
+                워터마크에 도달하는 즉시 페이지 요청을 멈춤
 
         Returns:
             Post 모델 리스트
@@ -553,11 +586,11 @@ class UnifiedDataSource:
 
         def api_call() -> list[Post]:
             client = self._get_api_client()
-            return client.posts.get_new(subreddit, limit=limit)
+            return client.posts.get_new(subreddit, limit=limit, since=since)
 
         async def scraping_call() -> list[Post]:
             scraper = self._get_scraper()
-            return await scraper.get_new(subreddit, limit=limit)
+            return await scraper.get_new(subreddit, limit=limit, since=since)
 
         return await self._execute_with_fallback(
             api_call, scraping_call, f"r/{subreddit} new 수집"
@@ -12,7 +12,7 @@ from reddit_insight.llm.client import (
     get_llm_client,
 )
 from reddit_insight.llm.rate_limiter import RateLimiter
-from reddit_insight.llm.cache import LLMCache
+from reddit_insight.llm.cache import LLMCache, SQLiteLLMCache, create_llm_cache
 from reddit_insight.llm.analyzer import (
     LLMAnalyzer,
     CategoryResult,
@@ -32,6 +32,8 @@ __all__ = [
     # Rate Limiting & Caching
     "RateLimiter",
     "LLMCache",
+    "SQLiteLLMCache",
+    "create_llm_cache",
     # Analyzer
     "LLMAnalyzer",
     "CategoryResult",
@@ -47,6 +49,7 @@ def __getattr__(name: str):
         "PromptTemplate",
         "SUMMARIZE_POSTS",
         "CATEGORIZE_CONTENT",
+        "CATEGORIZE_BATCH",
         "EXTRACT_INSIGHTS",
         "SENTIMENT_ANALYSIS",
         "TREND_INTERPRETATION",
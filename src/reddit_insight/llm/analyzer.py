@@ -9,6 +9,7 @@ LLM을 사용하여 Reddit 게시물을 분석하는 기능을 제공한다:
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import re
@@ -18,6 +19,8 @@ from typing import TYPE_CHECKING, Any
 from reddit_insight.llm.prompts import get_template
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
     from reddit_insight.llm.client import LLMClient
 
 logger = logging.getLogger(__name__)
@@ -133,6 +136,11 @@ class LLMAnalyzer:
         "News",
     ]
 
+    # 배치 프롬프트에서 텍스트 하나당 최대 글자 수
+    BATCH_ITEM_MAX_CHARS = 1000
+    # 배치 응답에서 항목 하나당 예상 출력 토큰 수
+    BATCH_TOKENS_PER_ITEM = 160
+
     def __init__(
         self,
         client: LLMClient,
@@ -173,16 +181,9 @@ class LLMAnalyzer:
         if not posts:
             return "분석할 게시물이 없습니다."
 
-        # 게시물을 텍스트로 포맷팅
-        posts_text = self._format_posts_for_prompt(posts[:max_posts])
-
-        # 프롬프트 생성
-        template = get_template("summarize_posts")
-        prompt = template.format(posts=posts_text)
-
         # LLM 호출
         result = await self.client.complete_with_retry(
-            prompt=prompt,
+            prompt=self._summary_prompt(posts[:max_posts]),
             max_retries=self.max_retries,
             temperature=temperature,
             max_tokens=2048,
@@ -191,6 +192,46 @@ class LLMAnalyzer:
         logger.info("게시물 %d개 요약 완료", len(posts[:max_posts]))
         return result
 
+    async def stream_summary(
+        self,
+        posts: list[dict[str, Any]],
+        max_posts: int = 50,
+        temperature: float = 0.5,
+    ) -> AsyncIterator[str]:
+        """summarize_posts()의 스트리밍 버전.
+
+        같은 프롬프트와 파라미터를 사용하므로 LLM 응답 캐시를 공유한다.
+        일부가 이미 전달된 뒤에는 재시도할 수 없으므로 재시도하지 않는다.
+
+        Args:
+            posts: 게시물 목록 (각 게시물은 title, body, score 등 포함)
+            max_posts: 분석할 최대 게시물 수
+            temperature: 창의성 조절 (낮을수록 일관적)
+
+        Yields:
+            요약 텍스트 조각 (마크다운 형식)
+
+        Raises:
+            LLMError: API 호출 실패 시
+        """
+        if not posts:
+            yield "분석할 게시물이 없습니다."
+            return
+
+        async for chunk in self.client.stream(
+            prompt=self._summary_prompt(posts[:max_posts]),
+            temperature=temperature,
+            max_tokens=2048,
+        ):
+            yield chunk
+
+        logger.info("게시물 %d개 요약 스트리밍 완료", len(posts[:max_posts]))
+
+    def _summary_prompt(self, posts: list[dict[str, Any]]) -> str:
+        """게시물 요약 프롬프트를 생성한다."""
+        template = get_template("summarize_posts")
+        return template.format(posts=self._format_posts_for_prompt(posts))
+
     # =========================================================================
     # CONTENT CATEGORIZATION
     # =========================================================================
@@ -200,20 +241,34 @@ class LLMAnalyzer:
         texts: list[str],
         categories: list[str] | None = None,
         temperature: float = 0.3,
+        batch_size: int = 1,
+        max_concurrency: int = 1,
     ) -> list[CategoryResult]:
         """텍스트를 카테고리로 분류한다.
 
+        batch_size개의 텍스트를 하나의 구조화된 프롬프트로 묶어 요청하고,
+        최대 max_concurrency개의 요청을 동시에 보낸다. 모든 요청은 클라이언트의
+        RateLimiter를 거친다. 배치 응답에서 일부 항목을 파싱하지 못하면 누락된
+        항목을 반으로 나누어 다시 요청하며, 단일 항목은 개별 프롬프트로 분류한다.
+
         Args:
             texts: 분류할 텍스트 목록
             categories: 사용할 카테고리 목록 (None이면 기본 카테고리 사용)
             temperature: 창의성 조절 (낮을수록 일관적)
+            batch_size: 한 프롬프트에 묶을 텍스트 수 (1이면 텍스트별 요청)
+            max_concurrency: 동시에 진행할 최대 요청 수
 
         Returns:
-            CategoryResult 목록
+            CategoryResult 목록 (입력 순서 유지)
 
         Raises:
-            LLMError: API 호출 실패 시
+            ValueError: batch_size 또는 max_concurrency가 1 미만인 경우
         """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be >= 1, got {batch_size}")
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be >= 1, got {max_concurrency}")
+
         if not texts:
             return []
 
@@ -221,46 +276,146 @@ class LLMAnalyzer:
             categories = self.DEFAULT_CATEGORIES
 
         categories_text = "\n".join(f"- {cat}" for cat in categories)
-        results: list[CategoryResult] = []
+        semaphore = asyncio.Semaphore(max_concurrency)
+        results: list[CategoryResult | None] = [None] * len(texts)
+
+        batches = [
+            list(range(start, min(start + batch_size, len(texts))))
+            for start in range(0, len(texts), batch_size)
+        ]
+        await asyncio.gather(
+            *(
+                self._categorize_indices(
+                    texts, indices, categories_text, temperature, semaphore, results
+                )
+                for indices in batches
+            )
+        )
 
-        for text in texts:
-            try:
-                template = get_template("categorize_content")
-                prompt = template.format(text=text, categories=categories_text)
+        logger.info("텍스트 %d개 카테고리 분류 완료", len(results))
+        return results  # type: ignore[return-value]
+
+    async def _categorize_indices(
+        self,
+        texts: list[str],
+        indices: list[int],
+        categories_text: str,
+        temperature: float,
+        semaphore: asyncio.Semaphore,
+        results: list[CategoryResult | None],
+    ) -> None:
+        """지정된 텍스트들을 한 번의 배치 요청으로 분류해 results에 기록한다.
 
+        Args:
+            texts: 전체 텍스트 목록
+            indices: 이번 배치에 포함된 텍스트 인덱스
+            categories_text: 프롬프트용 카테고리 목록
+            temperature: 창의성 조절
+            semaphore: 동시 요청 수 제한
+            results: 인덱스별 결과를 기록할 목록
+        """
+        if len(indices) == 1:
+            index = indices[0]
+            async with semaphore:
+                results[index] = await self._categorize_one(
+                    texts[index], categories_text, temperature
+                )
+            return
+
+        numbered = "\n\n".join(
+            f"[{pos}] {texts[index][: self.BATCH_ITEM_MAX_CHARS]}"
+            for pos, index in enumerate(indices, 1)
+        )
+        prompt = get_template("categorize_batch").format(
+            count=str(len(indices)),
+            texts=numbered,
+            categories=categories_text,
+        )
+
+        try:
+            async with semaphore:
                 response = await self.client.complete_with_retry(
                     prompt=prompt,
                     max_retries=self.max_retries,
                     temperature=temperature,
-                    max_tokens=512,
-                )
-
-                # JSON 파싱
-                parsed = self._parse_json_response(response)
-
-                result = CategoryResult(
-                    text=text[:200],  # 원본 텍스트 (축약)
-                    category=parsed.get("primary_category", "Unknown"),
-                    confidence=float(parsed.get("confidence", 50)),
-                    reason=parsed.get("reason", ""),
-                    secondary_categories=parsed.get("secondary_categories", []),
+                    max_tokens=min(4096, 256 + self.BATCH_TOKENS_PER_ITEM * len(indices)),
                 )
-                results.append(result)
-
-            except Exception as e:
-                logger.warning("텍스트 분류 실패: %s", e)
-                # 실패 시 기본값으로 처리
-                results.append(
-                    CategoryResult(
-                        text=text[:200],
-                        category="Unknown",
-                        confidence=0,
-                        reason=f"분류 실패: {e}",
+        except Exception as e:
+            logger.warning("배치 분류 실패 (%d개): %s", len(indices), e)
+            for index in indices:
+                results[index] = self._failed_category(texts[index], e)
+            return
+
+        items = self._parse_batch_response(response, len(indices))
+        missing = []
+        for pos, index in enumerate(indices, 1):
+            parsed = items.get(pos)
+            try:
+                if parsed is None:
+                    raise ValueError("missing item")
+                results[index] = self._to_category_result(texts[index], parsed)
+            except (TypeError, ValueError):
+                missing.append(index)
+
+        if missing:
+            # 파싱하지 못한 항목은 반으로 나누어 재요청
+            logger.debug("배치 응답에서 %d/%d개 항목 누락, 분할 재시도", len(missing), len(indices))
+            mid = (len(missing) + 1) // 2
+            await asyncio.gather(
+                *(
+                    self._categorize_indices(
+                        texts, part, categories_text, temperature, semaphore, results
                     )
+                    for part in (missing[:mid], missing[mid:])
+                    if part
                 )
+            )
 
-        logger.info("텍스트 %d개 카테고리 분류 완료", len(results))
-        return results
+    async def _categorize_one(
+        self,
+        text: str,
+        categories_text: str,
+        temperature: float,
+    ) -> CategoryResult:
+        """단일 텍스트를 개별 프롬프트로 분류한다."""
+        try:
+            template = get_template("categorize_content")
+            prompt = template.format(text=text, categories=categories_text)
+
+            response = await self.client.complete_with_retry(
+                prompt=prompt,
+                max_retries=self.max_retries,
+                temperature=temperature,
+                max_tokens=512,
+            )
+
+            # JSON 파싱
+            parsed = self._parse_json_response(response)
+            return self._to_category_result(text, parsed)
+
+        except Exception as e:
+            logger.warning("텍스트 분류 실패: %s", e)
+            # 실패 시 기본값으로 처리
+            return self._failed_category(text, e)
+
+    def _to_category_result(self, text: str, parsed: dict[str, Any]) -> CategoryResult:
+        """파싱된 분류 응답을 CategoryResult로 변환한다."""
+        return CategoryResult(
+            text=text[:200],  # 원본 텍스트 (축약)
+            category=parsed.get("primary_category", "Unknown"),
+            confidence=float(parsed.get("confidence", 50)),
+            reason=parsed.get("reason", ""),
+            secondary_categories=parsed.get("secondary_categories", []),
+        )
+
+    def _failed_category(self, text: str, error: Exception) -> CategoryResult:
+        """분류 실패 결과를 생성한다."""
+        return CategoryResult(
+            text=text[:200],
+            category="Unknown",
+            confidence=0,
+            reason=f"분류 실패: {error}",
+        )
 
     async def categorize_single(
         self,
@@ -526,6 +681,46 @@ class LLMAnalyzer:
             logger.warning("JSON 파싱 실패: %s", e)
             return {}
 
+    def _parse_batch_response(self, response: str, count: int) -> dict[int, dict[str, Any]]:
+        """배치 분류 응답에서 id별 항목을 추출한다.
+
+        Args:
+            response: LLM 응답
+            count: 배치에 포함된 텍스트 수
+
+        Returns:
+            1부터 count까지의 id를 키로 하는 항목 딕셔너리 (유효한 항목만)
+        """
+        json_match = re.search(r"```(?:json)?\s*([\s\S]*?)```", response)
+        if json_match:
+            json_str = json_match.group(1).strip()
+        else:
+            json_match = re.search(r"\[[\s\S]*\]", response)
+            json_str = json_match.group(0) if json_match else response
+
+        try:
+            data = json.loads(json_str)
+        except json.JSONDecodeError as e:
+            logger.warning("배치 JSON 파싱 실패: %s", e)
+            return {}
+
+        if isinstance(data, dict):
+            data = data.get("results", data.get("items", []))
+        if not isinstance(data, list):
+            return {}
+
+        items: dict[int, dict[str, Any]] = {}
+        for item in data:
+            if not isinstance(item, dict) or "primary_category" not in item:
+                continue
+            try:
+                item_id = int(item.get("id", 0))
+            except (TypeError, ValueError):
+                continue
+            if 1 <= item_id <= count and item_id not in items:
+                items[item_id] = item
+        return items
+
     def _parse_insights_response(self, response: str) -> list[Insight]:
         """마크다운 형식의 인사이트 응답을 파싱한다."""
         insights = []
@@ -1,18 +1,80 @@
 """LLM 응답 캐시 모듈.
 
 프롬프트 해시 기반으로 LLM 응답을 캐싱하여 중복 API 호출을 방지한다.
+
+두 가지 백엔드를 제공한다.
+
+- ``LLMCache``: 프로세스 내부 메모리 캐시 (OrderedDict 기반 LRU)
+- ``SQLiteLLMCache``: 데이터 디렉토리의 SQLite 파일에 저장하는 영속 캐시.
+  재시작 후에도 유지되고 여러 uvicorn 워커/CLI 프로세스가 같은 파일을 공유한다.
+
+캐시 키는 프롬프트와 모델뿐 아니라 시스템 프롬프트, temperature, max_tokens 등
+응답에 영향을 주는 호출 파라미터를 모두 포함한다.
+
+LLMClient는 이벤트 루프에서 ``aget``/``aset``을 사용한다. SQLite 캐시는 이를
+스레드에서 실행하므로 다른 프로세스의 쓰기 잠금을 기다리는 동안에도 루프가 멈추지 않는다.
 """
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
+import json
 import logging
+import sqlite3
+import threading
 import time
+from collections import OrderedDict
+from contextlib import contextmanager
 from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Protocol
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from reddit_insight.config import Settings
 
 logger = logging.getLogger(__name__)
 
 
+def make_cache_key(prompt: str, model: str, **params: Any) -> str:
+    """캐시 키를 생성한다.
+
+    None인 파라미터는 생략하므로 ``system=None``과 시스템 프롬프트 미지정은 같은 키가 된다.
+
+    Args:
+        prompt: 프롬프트 텍스트
+        model: 모델 이름
+        **params: 응답에 영향을 주는 호출 파라미터 (system, temperature, max_tokens 등)
+
+    Returns:
+        해시 기반 캐시 키
+    """
+    payload = {
+        "model": model,
+        "prompt": prompt,
+        "params": {name: value for name, value in params.items() if value is not None},
+    }
+    combined = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(combined.encode("utf-8")).hexdigest()
+
+
+class ResponseCache(Protocol):
+    """LLMClient가 사용하는 캐시 인터페이스.
+
+    비동기 메서드는 이벤트 루프를 막지 않아야 한다.
+    """
+
+    def get(self, prompt: str, model: str, **params: Any) -> str | None: ...
+
+    def set(self, prompt: str, model: str, response: str, **params: Any) -> None: ...
+
+    async def aget(self, prompt: str, model: str, **params: Any) -> str | None: ...
+
+    async def aset(self, prompt: str, model: str, response: str, **params: Any) -> None: ...
+
+
 @dataclass
 class CacheEntry:
     """캐시 엔트리."""
@@ -24,30 +86,32 @@ class CacheEntry:
 
 @dataclass
 class LLMCache:
-    """LLM 응답 캐시.
+    """LLM 응답 메모리 캐시.
 
-    프롬프트와 모델을 기반으로 응답을 캐싱한다.
-    TTL(Time To Live)이 지난 항목은 자동으로 만료된다.
+    프롬프트, 모델, 호출 파라미터를 기반으로 응답을 캐싱한다.
+    TTL(Time To Live)이 지난 항목은 자동으로 만료되고, 가득 차면
+    가장 오래 사용되지 않은 항목부터 O(1)로 제거한다(LRU).
     """
 
     ttl: int = 86400  # 기본 24시간
     max_size: int = 1000  # 최대 캐시 항목 수
-    _cache: dict[str, CacheEntry] = field(default_factory=dict)
+    # 오래 사용되지 않은 것부터 최근 사용 순
+    _cache: OrderedDict[str, CacheEntry] = field(default_factory=OrderedDict)
     _total_hits: int = 0
     _total_misses: int = 0
 
-    def _generate_key(self, prompt: str, model: str) -> str:
+    def _generate_key(self, prompt: str, model: str, **params: Any) -> str:
         """캐시 키를 생성한다.
 
         Args:
             prompt: 프롬프트 텍스트
             model: 모델 이름
+            **params: 호출 파라미터
 
         Returns:
             해시 기반 캐시 키
         """
-        combined = f"{model}:{prompt}"
-        return hashlib.sha256(combined.encode("utf-8")).hexdigest()
+        return make_cache_key(prompt, model, **params)
 
     def _is_expired(self, entry: CacheEntry) -> bool:
         """항목이 만료되었는지 확인한다.
@@ -61,12 +125,10 @@ class LLMCache:
         return (time.time() - entry.created_at) > self.ttl
 
     def _evict_if_needed(self) -> None:
-        """캐시가 가득 차면 오래된 항목을 제거한다."""
-        if len(self._cache) >= self.max_size:
-            # 가장 오래된 항목 제거 (LRU가 아닌 FIFO)
-            oldest_key = min(self._cache, key=lambda k: self._cache[k].created_at)
-            del self._cache[oldest_key]
-            logger.debug("Evicted cache entry: %s", oldest_key[:16])
+        """캐시가 가득 차면 가장 오래 사용되지 않은 항목을 제거한다."""
+        while len(self._cache) >= self.max_size and self._cache:
+            evicted_key, _ = self._cache.popitem(last=False)
+            logger.debug("Evicted cache entry: %s", evicted_key[:16])
 
     def _cleanup_expired(self) -> None:
         """만료된 캐시 항목을 정리한다."""
@@ -83,17 +145,18 @@ class LLMCache:
         if expired_keys:
             logger.debug("Cleaned up %d expired cache entries", len(expired_keys))
 
-    def get(self, prompt: str, model: str) -> str | None:
+    def get(self, prompt: str, model: str, **params: Any) -> str | None:
         """캐시에서 응답을 조회한다.
 
         Args:
             prompt: 프롬프트 텍스트
             model: 모델 이름
+            **params: 호출 파라미터
 
         Returns:
             캐시된 응답 또는 None
         """
-        key = self._generate_key(prompt, model)
+        key = self._generate_key(prompt, model, **params)
         entry = self._cache.get(key)
 
         if entry is None:
@@ -105,39 +168,51 @@ class LLMCache:
             self._total_misses += 1
             return None
 
+        self._cache.move_to_end(key)
         entry.hits += 1
         self._total_hits += 1
         logger.debug("Cache hit for key: %s", key[:16])
         return entry.value
 
-    def set(self, prompt: str, model: str, response: str) -> None:
+    def set(self, prompt: str, model: str, response: str, **params: Any) -> None:
         """응답을 캐시에 저장한다.
 
         Args:
             prompt: 프롬프트 텍스트
             model: 모델 이름
             response: LLM 응답
+            **params: 호출 파라미터
         """
-        self._evict_if_needed()
+        key = self._generate_key(prompt, model, **params)
+        if self._cache.pop(key, None) is None:
+            self._evict_if_needed()
 
-        key = self._generate_key(prompt, model)
         self._cache[key] = CacheEntry(
             value=response,
             created_at=time.time(),
         )
         logger.debug("Cached response for key: %s", key[:16])
 
-    def invalidate(self, prompt: str, model: str) -> bool:
+    async def aget(self, prompt: str, model: str, **params: Any) -> str | None:
+        """get()의 비동기 버전 (메모리 조회이므로 바로 실행한다)."""
+        return self.get(prompt, model, **params)
+
+    async def aset(self, prompt: str, model: str, response: str, **params: Any) -> None:
+        """set()의 비동기 버전 (메모리 저장이므로 바로 실행한다)."""
+        self.set(prompt, model, response, **params)
+
+    def invalidate(self, prompt: str, model: str, **params: Any) -> bool:
         """특정 캐시 항목을 무효화한다.
 
         Args:
             prompt: 프롬프트 텍스트
             model: 모델 이름
+            **params: 호출 파라미터
 
         Returns:
             삭제 성공 여부
         """
-        key = self._generate_key(prompt, model)
+        key = self._generate_key(prompt, model, **params)
         if key in self._cache:
             del self._cache[key]
             logger.debug("Invalidated cache entry: %s", key[:16])
@@ -169,3 +244,312 @@ class LLMCache:
             "total_misses": self._total_misses,
             "hit_rate_percent": round(hit_rate, 2),
         }
+
+
+# 조회 시각(accessed_at) 갱신은 메모리에 모았다가 한 번의 쓰기로 반영한다.
+# 이 개수나 시간(초)을 넘거나 set()이 쓰기 트랜잭션을 열 때 반영한다.
+_TOUCH_BATCH_SIZE = 256
+_TOUCH_FLUSH_INTERVAL = 30.0
+
+# 항목 수는 트리거로 별도 행에 유지한다 (SQLite의 COUNT(*)는 전체 스캔)
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_cache (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_llm_cache_accessed_at ON llm_cache (accessed_at);
+CREATE INDEX IF NOT EXISTS idx_llm_cache_created_at ON llm_cache (created_at);
+CREATE TABLE IF NOT EXISTS llm_cache_size (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    size INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO llm_cache_size (id, size)
+    VALUES (0, (SELECT COUNT(*) FROM llm_cache));
+CREATE TRIGGER IF NOT EXISTS llm_cache_after_insert AFTER INSERT ON llm_cache
+BEGIN
+    UPDATE llm_cache_size SET size = size + 1 WHERE id = 0;
+END;
+CREATE TRIGGER IF NOT EXISTS llm_cache_after_delete AFTER DELETE ON llm_cache
+BEGIN
+    UPDATE llm_cache_size SET size = size - 1 WHERE id = 0;
+END;
+"""
+
+
+class SQLiteLLMCache:
+    """SQLite 파일 기반 영속 LLM 응답 캐시.
+
+    ``LLMCache``와 같은 인터페이스를 제공한다. WAL 저널과 busy_timeout으로
+    여러 프로세스가 같은 파일을 동시에 읽고 쓸 수 있으며, 쓰기는
+    ``BEGIN IMMEDIATE`` 트랜잭션으로 직렬화된다.
+
+    LRU 순서는 accessed_at 인덱스로, TTL은 created_at 인덱스로 관리하므로
+    조회/저장/제거가 전체 테이블을 스캔하지 않는다. 조회는 읽기만 하고,
+    accessed_at/hits 갱신은 모아 두었다가 일정 개수/시간마다 또는 다음 저장 때
+    한 트랜잭션으로 반영한다. 만료된 항목은 저장 시 정리된다.
+
+    Example:
+        >>> cache = SQLiteLLMCache("./data/llm_cache.db", ttl=86400, max_size=10000)
+        >>> client = get_llm_client(provider="claude", cache=cache)
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        ttl: int = 86400,
+        max_size: int = 10000,
+        busy_timeout_ms: int = 5_000,
+    ) -> None:
+        """SQLiteLLMCache 초기화.
+
+        Args:
+            path: SQLite 파일 경로 (상위 디렉토리가 없으면 생성)
+            ttl: 항목 유효 시간 (초)
+            max_size: 최대 캐시 항목 수
+            busy_timeout_ms: 다른 프로세스의 쓰기 잠금 대기 시간 (밀리초)
+
+        Raises:
+            ValueError: max_size가 1 미만인 경우
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+
+        from reddit_insight.storage.sqlite_profile import SQLiteProfile
+
+        self.path = Path(path)
+        self.ttl = ttl
+        self.max_size = max_size
+        self._total_hits = 0
+        self._total_misses = 0
+        # 같은 프로세스의 여러 스레드가 연결 하나를 공유한다
+        self._lock = threading.Lock()
+        # key -> (마지막 조회 시각, 반영되지 않은 히트 수)
+        self._pending_touches: dict[str, tuple[float, int]] = {}
+        self._touched_at = time.time()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            self.path,
+            timeout=busy_timeout_ms / 1000,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        profile = SQLiteProfile(
+            name="llm_cache",
+            journal_mode="WAL",
+            synchronous="NORMAL",
+            busy_timeout_ms=busy_timeout_ms,
+        )
+        for statement in profile.pragmas():
+            self._conn.execute(statement)
+        # 여러 워커가 동시에 시작해도 스키마 생성은 한 번만 적용된다
+        self._conn.executescript(f"BEGIN IMMEDIATE;{_SCHEMA}COMMIT;")
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """쓰기 잠금을 먼저 잡는 트랜잭션."""
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield self._conn
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
+    def _write_touches(self, conn: sqlite3.Connection) -> None:
+        """모아 둔 조회 기록을 반영한다 (쓰기 트랜잭션 안에서 호출)."""
+        if self._pending_touches:
+            conn.executemany(
+                "UPDATE llm_cache SET accessed_at = MAX(accessed_at, ?), hits = hits + ? "
+                "WHERE key = ?",
+                [(at, hits, key) for key, (at, hits) in self._pending_touches.items()],
+            )
+            self._pending_touches.clear()
+        self._touched_at = time.time()
+
+    def _flush_touches(self) -> None:
+        """조회 기록을 반영한다. 쓰기 잠금을 얻지 못하면 다음 기회로 미룬다."""
+        try:
+            with self._transaction() as conn:
+                self._write_touches(conn)
+        except sqlite3.OperationalError as e:
+            logger.debug("Deferred cache access update: %s", e)
+
+    def _size(self) -> int:
+        row = self._conn.execute("SELECT size FROM llm_cache_size WHERE id = 0").fetchone()
+        return int(row[0]) if row else 0
+
+    def get(self, prompt: str, model: str, **params: Any) -> str | None:
+        """캐시에서 응답을 조회한다.
+
+        조회된 항목은 가장 최근 사용으로 표시된다. 표시는 모아서 반영하므로
+        대부분의 조회는 쓰기 잠금을 잡지 않는다.
+
+        Args:
+            prompt: 프롬프트 텍스트
+            model: 모델 이름
+            **params: 호출 파라미터
+
+        Returns:
+            캐시된 응답 또는 None
+        """
+        key = make_cache_key(prompt, model, **params)
+        now = time.time()
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created_at FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None:
+                self._total_misses += 1
+                return None
+
+            value, created_at = row
+            if (now - created_at) > self.ttl:
+                self._total_misses += 1
+                return None
+
+            _, hits = self._pending_touches.get(key, (now, 0))
+            self._pending_touches[key] = (now, hits + 1)
+            self._total_hits += 1
+            if (
+                len(self._pending_touches) >= _TOUCH_BATCH_SIZE
+                or now - self._touched_at >= _TOUCH_FLUSH_INTERVAL
+            ):
+                self._flush_touches()
+
+        logger.debug("Cache hit for key: %s", key[:16])
+        return str(value)
+
+    def set(self, prompt: str, model: str, response: str, **params: Any) -> None:
+        """응답을 캐시에 저장한다.
+
+        만료된 항목을 먼저 정리하고, 그래도 max_size를 넘으면
+        가장 오래 사용되지 않은 항목부터 제거한다.
+
+        Args:
+            prompt: 프롬프트 텍스트
+            model: 모델 이름
+            response: LLM 응답
+            **params: 호출 파라미터
+        """
+        key = make_cache_key(prompt, model, **params)
+        now = time.time()
+
+        with self._lock, self._transaction() as conn:
+            conn.execute(
+                "INSERT INTO llm_cache (key, value, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (key) DO UPDATE SET value = excluded.value, "
+                "created_at = excluded.created_at, accessed_at = excluded.accessed_at, "
+                "hits = 0",
+                (key, response, now, now),
+            )
+            self._pending_touches.pop(key, None)
+            # 제거 순서가 이 프로세스의 최근 조회를 반영하도록 먼저 기록한다
+            self._write_touches(conn)
+            # 각 항목은 한 번만 만료되므로 정리 비용은 저장 한 번당 상수로 분할 상환된다
+            conn.execute("DELETE FROM llm_cache WHERE created_at < ?", (now - self.ttl,))
+            overflow = self._size() - self.max_size
+            if overflow > 0:
+                conn.execute(
+                    "DELETE FROM llm_cache WHERE key IN ("
+                    "SELECT key FROM llm_cache ORDER BY accessed_at LIMIT ?)",
+                    (overflow,),
+                )
+                logger.debug("Evicted %d cache entries", overflow)
+
+        logger.debug("Cached response for key: %s", key[:16])
+
+    async def aget(self, prompt: str, model: str, **params: Any) -> str | None:
+        """get()을 스레드에서 실행한다."""
+        return await asyncio.to_thread(self.get, prompt, model, **params)
+
+    async def aset(self, prompt: str, model: str, response: str, **params: Any) -> None:
+        """set()을 스레드에서 실행한다."""
+        await asyncio.to_thread(self.set, prompt, model, response, **params)
+
+    def invalidate(self, prompt: str, model: str, **params: Any) -> bool:
+        """특정 캐시 항목을 무효화한다.
+
+        Args:
+            prompt: 프롬프트 텍스트
+            model: 모델 이름
+            **params: 호출 파라미터
+
+        Returns:
+            삭제 성공 여부
+        """
+        key = make_cache_key(prompt, model, **params)
+        with self._lock:
+            self._pending_touches.pop(key, None)
+            cursor = self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+        if cursor.rowcount > 0:
+            logger.debug("Invalidated cache entry: %s", key[:16])
+            return True
+        return False
+
+    def clear(self) -> None:
+        """캐시를 완전히 비운다."""
+        with self._lock:
+            self._pending_touches.clear()
+            cursor = self._conn.execute("DELETE FROM llm_cache")
+        logger.debug("Cleared %d cache entries", cursor.rowcount)
+
+    def get_stats(self) -> dict[str, int | float]:
+        """캐시 통계를 반환한다.
+
+        size는 모든 프로세스가 공유하는 값이고, 히트/미스는 이 프로세스의 값이다.
+
+        Returns:
+            통계 정보 딕셔너리
+        """
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM llm_cache WHERE created_at < ?", (time.time() - self.ttl,)
+            )
+            size = self._size()
+
+        total_requests = self._total_hits + self._total_misses
+        hit_rate = (self._total_hits / total_requests * 100) if total_requests > 0 else 0.0
+
+        return {
+            "size": size,
+            "max_size": self.max_size,
+            "ttl": self.ttl,
+            "total_hits": self._total_hits,
+            "total_misses": self._total_misses,
+            "hit_rate_percent": round(hit_rate, 2),
+        }
+
+    def close(self) -> None:
+        """모아 둔 조회 기록을 반영하고 데이터베이스 연결을 닫는다."""
+        with self._lock:
+            self._flush_touches()
+            self._conn.close()
+
+
+def create_llm_cache(settings: Settings) -> LLMCache | SQLiteLLMCache | None:
+    """설정에 따라 LLM 응답 캐시를 생성한다.
+
+    Args:
+        settings: 애플리케이션 설정 (llm_cache_backend, llm_cache_ttl 등)
+
+    Returns:
+        캐시 인스턴스 (llm_cache_backend가 "none"이면 None)
+    """
+    backend = settings.llm_cache_backend
+    if backend == "sqlite":
+        path = settings.llm_cache_path or Path(settings.data_dir) / "llm_cache.db"
+        return SQLiteLLMCache(
+            path,
+            ttl=settings.llm_cache_ttl,
+            max_size=settings.llm_cache_max_size,
+        )
+    if backend == "memory":
+        return LLMCache(ttl=settings.llm_cache_ttl, max_size=settings.llm_cache_max_size)
+    return None
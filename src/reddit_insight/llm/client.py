@@ -2,6 +2,11 @@
 
 Claude(Anthropic)와 OpenAI API 클라이언트를 제공한다.
 추상 베이스 클래스(LLMClient)를 통해 일관된 인터페이스를 보장한다.
+
+두 클라이언트 모두 SDK의 네이티브 비동기 클라이언트를 사용한다. SDK 클라이언트는
+LLMClient 인스턴스마다 한 번 생성되어 keep-alive 연결 풀을 재사용하며,
+요청이 스레드 풀 스레드를 점유하지 않는다. ``stream()``은 생성되는 토큰을
+도착하는 대로 전달한다.
 """
 
 from __future__ import annotations
@@ -12,7 +17,9 @@ from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any, Literal
 
 if TYPE_CHECKING:
-    from reddit_insight.llm.cache import LLMCache
+    from collections.abc import AsyncIterator
+
+    from reddit_insight.llm.cache import ResponseCache
     from reddit_insight.llm.rate_limiter import RateLimiter
 
 logger = logging.getLogger(__name__)
@@ -32,6 +39,36 @@ class LLMRateLimitError(LLMError):
         self.retry_after = retry_after
 
 
+class CompletionText(str):
+    """제공자가 보고한 토큰 사용량이 붙은 응답 텍스트.
+
+    _call_api 구현이 이 타입으로 반환하면 complete()가 rate limiter의
+    추정 토큰 수를 실제 사용량으로 보정한다. _stream_api 구현은 스트림 끝에
+    빈 CompletionText로 사용량을 전달할 수 있다.
+
+    Attributes:
+        usage_tokens: 실제 입력 + 출력 토큰 수 (알 수 없으면 None)
+    """
+
+    usage_tokens: int | None
+
+    def __new__(cls, text: str, usage_tokens: int | None = None) -> CompletionText:
+        completion = super().__new__(cls, text)
+        completion.usage_tokens = usage_tokens
+        return completion
+
+
+def _reported_tokens(usage: Any, *names: str) -> int | None:
+    """SDK usage 객체에서 지정한 토큰 수의 합을 읽는다."""
+    total = 0
+    for name in names:
+        count = getattr(usage, name, None)
+        if not isinstance(count, int):
+            return None
+        total += count
+    return total
+
+
 class LLMClient(ABC):
     """LLM API 클라이언트 추상 베이스 클래스.
 
@@ -43,7 +80,7 @@ class LLMClient(ABC):
         api_key: str,
         model: str,
         rate_limiter: RateLimiter | None = None,
-        cache: LLMCache | None = None,
+        cache: ResponseCache | None = None,
     ) -> None:
         """LLM 클라이언트를 초기화한다.
 
@@ -82,6 +119,50 @@ class LLMClient(ABC):
         """
         ...
 
+    async def _stream_api(
+        self,
+        prompt: str,
+        max_tokens: int = 1024,
+        temperature: float = 0.7,
+        **kwargs: Any,
+    ) -> AsyncIterator[str]:
+        """API 스트리밍 호출을 수행한다.
+
+        스트리밍을 지원하지 않는 클라이언트는 전체 응답을 한 조각으로 전달한다.
+        제공자가 사용량을 보고하면 usage_tokens가 설정된 CompletionText 조각을
+        전달한다 (텍스트가 비어 있을 수 있다).
+
+        Args:
+            prompt: 입력 프롬프트
+            max_tokens: 최대 토큰 수
+            temperature: 창의성 조절 (0-1)
+            **kwargs: 추가 파라미터
+
+        Yields:
+            생성된 텍스트 조각
+
+        Raises:
+            LLMError: API 호출 실패 시
+        """
+        yield await self._call_api(
+            prompt=prompt,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            **kwargs,
+        )
+
+    async def aclose(self) -> None:
+        """SDK 클라이언트의 연결 풀과 응답 캐시를 닫는다.
+
+        캐시에 close()가 있으면 (SQLiteLLMCache) 스레드에서 호출해
+        모아 둔 조회 기록을 반영하고 연결을 닫는다. 하위 클래스는 SDK 클라이언트를
+        닫은 뒤 super().aclose()를 호출한다.
+        """
+        close = getattr(self.cache, "close", None)
+        if close is not None:
+            self.cache = None
+            await asyncio.to_thread(close)
+
     async def complete(
         self,
         prompt: str,
@@ -108,32 +189,109 @@ class LLMClient(ABC):
             LLMError: API 호출 실패 시
             LLMRateLimitError: Rate limit 초과 시
         """
-        # 캐시 확인
+        # 캐시 확인 (응답에 영향을 주는 파라미터를 모두 키에 포함)
+        cache_params = {"max_tokens": max_tokens, "temperature": temperature, **kwargs}
         if use_cache and self.cache is not None:
-            cached = self.cache.get(prompt, self.model)
+            cached = await self.cache.aget(prompt, self.model, **cache_params)
             if cached is not None:
                 logger.debug("Cache hit for prompt (hash: %s)", hash(prompt) % 10000)
                 return cached
 
         # Rate limiting
+        estimated_tokens = 0
         if self.rate_limiter is not None:
             estimated_tokens = self.rate_limiter.estimate_tokens(prompt) + max_tokens
             await self.rate_limiter.acquire(estimated_tokens)
 
         # API 호출
-        result = await self._call_api(
+        completion = await self._call_api(
             prompt=prompt,
             max_tokens=max_tokens,
             temperature=temperature,
             **kwargs,
         )
 
+        # 추정 토큰 수를 실제 사용량으로 보정
+        usage_tokens = getattr(completion, "usage_tokens", None)
+        if self.rate_limiter is not None and usage_tokens is not None:
+            self.rate_limiter.reconcile(estimated_tokens, usage_tokens)
+        result = str(completion)
+
         # 캐시 저장
         if use_cache and self.cache is not None:
-            self.cache.set(prompt, self.model, result)
+            await self.cache.aset(prompt, self.model, result, **cache_params)
 
         return result
 
+    async def stream(
+        self,
+        prompt: str,
+        max_tokens: int = 1024,
+        temperature: float = 0.7,
+        use_cache: bool = True,
+        **kwargs: Any,
+    ) -> AsyncIterator[str]:
+        """프롬프트에 대한 완성을 토큰 단위로 스트리밍한다.
+
+        complete()와 같은 캐시 키와 rate limiting을 사용한다. 캐시 히트이면
+        캐시된 응답을 한 조각으로 전달하고, 스트림이 끝까지 전달된 경우에만
+        전체 응답을 캐시에 저장한다. 스트림이 끝나거나 중단되면 rate limiter의
+        추정 토큰 수를 보고된 사용량으로, 보고가 없으면 전달한 텍스트 길이로
+        보정한다.
+
+        Args:
+            prompt: 입력 프롬프트
+            max_tokens: 최대 토큰 수
+            temperature: 창의성 조절 (0-1)
+            use_cache: 캐시 사용 여부
+            **kwargs: 추가 파라미터
+
+        Yields:
+            생성된 텍스트 조각
+
+        Raises:
+            LLMError: API 호출 실패 시
+            LLMRateLimitError: Rate limit 초과 시
+        """
+        cache_params = {"max_tokens": max_tokens, "temperature": temperature, **kwargs}
+        if use_cache and self.cache is not None:
+            cached = await self.cache.aget(prompt, self.model, **cache_params)
+            if cached is not None:
+                yield cached
+                return
+
+        estimated_tokens = 0
+        if self.rate_limiter is not None:
+            estimated_tokens = self.rate_limiter.estimate_tokens(prompt) + max_tokens
+            await self.rate_limiter.acquire(estimated_tokens)
+
+        chunks: list[str] = []
+        usage_tokens: int | None = None
+        try:
+            async for chunk in self._stream_api(
+                prompt=prompt,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                **kwargs,
+            ):
+                reported = getattr(chunk, "usage_tokens", None)
+                if reported is not None:
+                    usage_tokens = reported
+                if not chunk:
+                    continue
+                chunks.append(chunk)
+                yield str(chunk)
+        finally:
+            # 선차감한 max_tokens 중 쓰지 않은 만큼 돌려준다
+            if self.rate_limiter is not None:
+                if usage_tokens is None:
+                    usage_tokens = self.rate_limiter.estimate_tokens(prompt)
+                    usage_tokens += self.rate_limiter.estimate_tokens("".join(chunks))
+                self.rate_limiter.reconcile(estimated_tokens, usage_tokens)
+
+        if use_cache and self.cache is not None:
+            await self.cache.aset(prompt, self.model, "".join(chunks), **cache_params)
+
     async def complete_with_retry(
         self,
         prompt: str,
@@ -218,7 +376,7 @@ class ClaudeClient(LLMClient):
         api_key: str,
         model: str = DEFAULT_MODEL,
         rate_limiter: RateLimiter | None = None,
-        cache: LLMCache | None = None,
+        cache: ResponseCache | None = None,
     ) -> None:
         """Claude 클라이언트를 초기화한다.
 
@@ -232,12 +390,15 @@ class ClaudeClient(LLMClient):
         self._client: Any = None
 
     def _get_client(self) -> Any:
-        """Anthropic 클라이언트 인스턴스를 반환한다 (lazy initialization)."""
+        """Anthropic 비동기 클라이언트 인스턴스를 반환한다 (lazy initialization).
+
+        인스턴스를 재사용하므로 요청 사이에 HTTP keep-alive 연결이 유지된다.
+        """
         if self._client is None:
             try:
                 import anthropic
 
-                self._client = anthropic.Anthropic(api_key=self.api_key)
+                self._client = anthropic.AsyncAnthropic(api_key=self.api_key)
             except ImportError as e:
                 raise LLMError(
                     "anthropic 패키지가 설치되지 않았습니다. "
@@ -245,6 +406,38 @@ class ClaudeClient(LLMClient):
                 ) from e
         return self._client
 
+    def _request_kwargs(
+        self,
+        prompt: str,
+        max_tokens: int,
+        temperature: float,
+        system: str | None,
+    ) -> dict[str, Any]:
+        """Messages API 요청 파라미터를 만든다."""
+        create_kwargs: dict[str, Any] = {
+            "model": self.model,
+            "max_tokens": max_tokens,
+            "messages": [{"role": "user", "content": prompt}],
+            "temperature": temperature,
+        }
+        if system:
+            create_kwargs["system"] = system
+        return create_kwargs
+
+    def _translate_error(self, error: Exception) -> LLMError:
+        """SDK 예외를 LLMError로 변환한다."""
+        import anthropic
+
+        if isinstance(error, anthropic.RateLimitError):
+            logger.warning("Claude rate limit exceeded: %s", str(error))
+            # Anthropic API에서 retry-after 헤더를 제공하면 사용
+            return LLMRateLimitError(str(error), retry_after=60.0)
+        if isinstance(error, anthropic.APIError):
+            logger.error("Claude API error: %s", str(error))
+            return LLMError(f"Claude API error: {error}")
+        logger.error("Unexpected error calling Claude API: %s", str(error))
+        return LLMError(f"Unexpected error: {error}")
+
     async def _call_api(
         self,
         prompt: str,
@@ -269,49 +462,77 @@ class ClaudeClient(LLMClient):
             LLMError: API 호출 실패 시
             LLMRateLimitError: Rate limit 초과 시
         """
+        client = self._get_client()
         try:
-            import anthropic
-        except ImportError as e:
-            raise LLMError(
-                "anthropic 패키지가 설치되지 않았습니다. "
-                "'pip install anthropic'을 실행하세요."
-            ) from e
+            message = await client.messages.create(
+                **self._request_kwargs(prompt, max_tokens, temperature, system)
+            )
+        except LLMError:
+            raise
+        except Exception as e:
+            raise self._translate_error(e) from e
+
+        logger.debug("Claude API call successful (model: %s)", self.model)
+        return CompletionText(
+            message.content[0].text,
+            usage_tokens=_reported_tokens(
+                getattr(message, "usage", None), "input_tokens", "output_tokens"
+            ),
+        )
+
+    async def _stream_api(
+        self,
+        prompt: str,
+        max_tokens: int = 1024,
+        temperature: float = 0.7,
+        system: str | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[str]:
+        """Claude API를 스트리밍으로 호출한다.
+
+        스트림 끝에 보고된 토큰 사용량을 빈 CompletionText로 전달한다.
 
+        Args:
+            prompt: 입력 프롬프트
+            max_tokens: 최대 토큰 수
+            temperature: 창의성 조절 (0-1)
+            system: 시스템 프롬프트 (선택)
+            **kwargs: 추가 파라미터
+
+        Yields:
+            생성된 텍스트 조각
+
+        Raises:
+            LLMError: API 호출 실패 시
+            LLMRateLimitError: Rate limit 초과 시
+        """
+        client = self._get_client()
         try:
-            client = self._get_client()
-
-            # 동기 클라이언트를 비동기로 실행
-            # Anthropic의 동기 API를 사용하고 asyncio.to_thread로 래핑
-            def _sync_call() -> str:
-                create_kwargs: dict[str, Any] = {
-                    "model": self.model,
-                    "max_tokens": max_tokens,
-                    "messages": [{"role": "user", "content": prompt}],
-                    "temperature": temperature,
-                }
-
-                if system:
-                    create_kwargs["system"] = system
-
-                message = client.messages.create(**create_kwargs)
-                return message.content[0].text  # type: ignore[return-value]
-
-            result = await asyncio.to_thread(_sync_call)
-            logger.debug("Claude API call successful (model: %s)", self.model)
-            return result
-
-        except anthropic.RateLimitError as e:
-            logger.warning("Claude rate limit exceeded: %s", str(e))
-            # Anthropic API에서 retry-after 헤더를 제공하면 사용
-            raise LLMRateLimitError(str(e), retry_after=60.0) from e
-        except anthropic.APIError as e:
-            logger.error("Claude API error: %s", str(e))
-            raise LLMError(f"Claude API error: {e}") from e
+            async with client.messages.stream(
+                **self._request_kwargs(prompt, max_tokens, temperature, system)
+            ) as stream:
+                async for text in stream.text_stream:
+                    yield text
+                message = await stream.get_final_message()
         except LLMError:
             raise
         except Exception as e:
-            logger.error("Unexpected error calling Claude API: %s", str(e))
-            raise LLMError(f"Unexpected error: {e}") from e
+            raise self._translate_error(e) from e
+
+        logger.debug("Claude API stream finished (model: %s)", self.model)
+        yield CompletionText(
+            "",
+            usage_tokens=_reported_tokens(
+                getattr(message, "usage", None), "input_tokens", "output_tokens"
+            ),
+        )
+
+    async def aclose(self) -> None:
+        """SDK 클라이언트의 연결 풀과 응답 캐시를 닫는다."""
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+        await super().aclose()
 
 
 class OpenAIClient(LLMClient):
@@ -328,7 +549,7 @@ class OpenAIClient(LLMClient):
         api_key: str,
         model: str = DEFAULT_MODEL,
         rate_limiter: RateLimiter | None = None,
-        cache: LLMCache | None = None,
+        cache: ResponseCache | None = None,
     ) -> None:
         """OpenAI 클라이언트를 초기화한다.
 
@@ -342,12 +563,15 @@ class OpenAIClient(LLMClient):
         self._client: Any = None
 
     def _get_client(self) -> Any:
-        """OpenAI 클라이언트 인스턴스를 반환한다 (lazy initialization)."""
+        """OpenAI 비동기 클라이언트 인스턴스를 반환한다 (lazy initialization).
+
+        인스턴스를 재사용하므로 요청 사이에 HTTP keep-alive 연결이 유지된다.
+        """
         if self._client is None:
             try:
                 import openai
 
-                self._client = openai.OpenAI(api_key=self.api_key)
+                self._client = openai.AsyncOpenAI(api_key=self.api_key)
             except ImportError as e:
                 raise LLMError(
                     "openai 패키지가 설치되지 않았습니다. "
@@ -355,6 +579,38 @@ class OpenAIClient(LLMClient):
                 ) from e
         return self._client
 
+    def _request_kwargs(
+        self,
+        prompt: str,
+        max_tokens: int,
+        temperature: float,
+        system: str | None,
+    ) -> dict[str, Any]:
+        """Chat Completions API 요청 파라미터를 만든다."""
+        messages: list[dict[str, str]] = []
+        if system:
+            messages.append({"role": "system", "content": system})
+        messages.append({"role": "user", "content": prompt})
+        return {
+            "model": self.model,
+            "messages": messages,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+        }
+
+    def _translate_error(self, error: Exception) -> LLMError:
+        """SDK 예외를 LLMError로 변환한다."""
+        import openai
+
+        if isinstance(error, openai.RateLimitError):
+            logger.warning("OpenAI rate limit exceeded: %s", str(error))
+            return LLMRateLimitError(str(error), retry_after=60.0)
+        if isinstance(error, openai.APIError):
+            logger.error("OpenAI API error: %s", str(error))
+            return LLMError(f"OpenAI API error: {error}")
+        logger.error("Unexpected error calling OpenAI API: %s", str(error))
+        return LLMError(f"Unexpected error: {error}")
+
     async def _call_api(
         self,
         prompt: str,
@@ -379,51 +635,84 @@ class OpenAIClient(LLMClient):
             LLMError: API 호출 실패 시
             LLMRateLimitError: Rate limit 초과 시
         """
+        client = self._get_client()
         try:
-            import openai
-        except ImportError as e:
-            raise LLMError(
-                "openai 패키지가 설치되지 않았습니다. "
-                "'pip install openai'를 실행하세요."
-            ) from e
+            response = await client.chat.completions.create(
+                **self._request_kwargs(prompt, max_tokens, temperature, system)
+            )
+        except LLMError:
+            raise
+        except Exception as e:
+            raise self._translate_error(e) from e
+
+        logger.debug("OpenAI API call successful (model: %s)", self.model)
+        content = response.choices[0].message.content
+        return CompletionText(
+            content if content else "",
+            usage_tokens=_reported_tokens(
+                getattr(response, "usage", None), "prompt_tokens", "completion_tokens"
+            ),
+        )
 
-        try:
-            client = self._get_client()
+    async def _stream_api(
+        self,
+        prompt: str,
+        max_tokens: int = 1024,
+        temperature: float = 0.7,
+        system: str | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[str]:
+        """OpenAI API를 스트리밍으로 호출한다.
 
-            # 동기 클라이언트를 비동기로 실행
-            def _sync_call() -> str:
-                messages: list[dict[str, str]] = []
+        스트림 끝에 보고된 토큰 사용량을 빈 CompletionText로 전달한다.
 
-                if system:
-                    messages.append({"role": "system", "content": system})
+        Args:
+            prompt: 입력 프롬프트
+            max_tokens: 최대 토큰 수
+            temperature: 창의성 조절 (0-1)
+            system: 시스템 프롬프트 (선택)
+            **kwargs: 추가 파라미터
 
-                messages.append({"role": "user", "content": prompt})
+        Yields:
+            생성된 텍스트 조각
 
-                response = client.chat.completions.create(
-                    model=self.model,
-                    messages=messages,  # type: ignore[arg-type]
-                    max_tokens=max_tokens,
-                    temperature=temperature,
+        Raises:
+            LLMError: API 호출 실패 시
+            LLMRateLimitError: Rate limit 초과 시
+        """
+        client = self._get_client()
+        usage_tokens: int | None = None
+        try:
+            stream = await client.chat.completions.create(
+                **self._request_kwargs(prompt, max_tokens, temperature, system),
+                stream=True,
+                stream_options={"include_usage": True},
+            )
+            async for chunk in stream:
+                reported = _reported_tokens(
+                    getattr(chunk, "usage", None), "prompt_tokens", "completion_tokens"
                 )
-
-                content = response.choices[0].message.content
-                return content if content else ""
-
-            result = await asyncio.to_thread(_sync_call)
-            logger.debug("OpenAI API call successful (model: %s)", self.model)
-            return result
-
-        except openai.RateLimitError as e:
-            logger.warning("OpenAI rate limit exceeded: %s", str(e))
-            raise LLMRateLimitError(str(e), retry_after=60.0) from e
-        except openai.APIError as e:
-            logger.error("OpenAI API error: %s", str(e))
-            raise LLMError(f"OpenAI API error: {e}") from e
+                if reported is not None:
+                    usage_tokens = reported
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    yield delta
         except LLMError:
             raise
         except Exception as e:
-            logger.error("Unexpected error calling OpenAI API: %s", str(e))
-            raise LLMError(f"Unexpected error: {e}") from e
+            raise self._translate_error(e) from e
+
+        logger.debug("OpenAI API stream finished (model: %s)", self.model)
+        yield CompletionText("", usage_tokens=usage_tokens)
+
+    async def aclose(self) -> None:
+        """SDK 클라이언트의 연결 풀과 응답 캐시를 닫는다."""
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+        await super().aclose()
 
 
 def get_llm_client(
@@ -431,7 +720,7 @@ def get_llm_client(
     api_key: str | None = None,
     model: str | None = None,
     rate_limiter: RateLimiter | None = None,
-    cache: LLMCache | None = None,
+    cache: ResponseCache | None = None,
 ) -> LLMClient:
     """설정에 따라 적절한 LLM 클라이언트를 반환한다.
 
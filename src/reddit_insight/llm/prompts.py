@@ -162,6 +162,40 @@ CATEGORIZE_CONTENT = PromptTemplate(
 )
 
 
+CATEGORIZE_BATCH = PromptTemplate(
+    template="""다음 {count}개의 텍스트를 각각 분석하고 적절한 카테고리로 분류해주세요.
+
+## 텍스트 목록
+{texts}
+
+## 사용 가능한 카테고리
+{categories}
+
+## 요구사항
+1. 각 텍스트마다 가장 적합한 카테고리 1개를 선택하세요
+2. 선택 이유를 간단히 설명하세요
+3. 해당 카테고리와의 관련성 점수(0-100)를 부여하세요
+4. 다른 관련 카테고리가 있다면 2순위, 3순위도 언급하세요
+5. 모든 텍스트에 대해 [번호]와 같은 id로 정확히 하나의 항목을 출력하세요
+
+## 출력 형식 (JSON 배열)
+[
+    {{
+        "id": 1,
+        "primary_category": "카테고리명",
+        "confidence": 85,
+        "reason": "선택 이유",
+        "secondary_categories": [
+            {{"category": "카테고리명", "confidence": 60}}
+        ]
+    }}
+]""",
+    version="1.0",
+    category=PromptCategory.CATEGORIZATION,
+    description="여러 텍스트를 한 번의 요청으로 카테고리 분류",
+)
+
+
 EXTRACT_INSIGHTS = PromptTemplate(
     template="""다음 분석 결과에서 비즈니스 인사이트를 추출해주세요.
 
@@ -279,6 +313,7 @@ TREND_INTERPRETATION = PromptTemplate(
 TEMPLATES: dict[str, PromptTemplate] = {
     "summarize_posts": SUMMARIZE_POSTS,
     "categorize_content": CATEGORIZE_CONTENT,
+    "categorize_batch": CATEGORIZE_BATCH,
     "extract_insights": EXTRACT_INSIGHTS,
     "sentiment_analysis": SENTIMENT_ANALYSIS,
     "trend_interpretation": TREND_INTERPRETATION,
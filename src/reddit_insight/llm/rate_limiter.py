@@ -1,13 +1,21 @@
 """LLM API Rate Limiter 모듈.
 
 API 호출 제한을 관리하여 rate limit 초과를 방지한다.
+
+요청 수(RPM)와 토큰 수(TPM) 각각에 토큰 버킷을 사용한다. 버킷은 분당 한도만큼
+채워져 있다가 초당 ``한도 / 60``씩 다시 채워진다. 여유가 있으면 ``acquire``는
+O(1)로 즉시 반환하고, 부족하면 FIFO 대기열에 들어가 타이머가 깨울 때까지 기다린다.
+대기 중에는 어떤 잠금도 잡지 않으므로 한 요청의 대기가 다른 호출자를 막지 않는다.
+
+실제 사용량은 추정치와 다르므로 응답을 받은 뒤 ``reconcile``로 차이를 보정한다.
 """
 
 from __future__ import annotations
 
 import asyncio
-import time
 import logging
+import time
+from collections import deque
 from dataclasses import dataclass, field
 
 logger = logging.getLogger(__name__)
@@ -17,15 +25,28 @@ logger = logging.getLogger(__name__)
 class RateLimiter:
     """API 호출 rate limiting을 관리한다.
 
-    RPM(Requests Per Minute)과 TPM(Tokens Per Minute) 제한을 적용한다.
-    슬라이딩 윈도우 방식으로 동작한다.
+    RPM(Requests Per Minute)과 TPM(Tokens Per Minute) 제한을 토큰 버킷으로 적용한다.
+    대기 중인 요청은 도착 순서대로(FIFO) 통과한다.
     """
 
     requests_per_minute: int = 60
     tokens_per_minute: int = 100000
-    _request_times: list[float] = field(default_factory=list)
-    _token_counts: list[tuple[float, int]] = field(default_factory=list)
-    _lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    # 버킷에 남은 요청/토큰 수 (토큰은 사후 보정으로 음수가 될 수 있다)
+    _available_requests: float = field(init=False, repr=False)
+    _available_tokens: float = field(init=False, repr=False)
+    _updated_at: float = field(init=False, repr=False)
+    # (깨울 Future, 요청 토큰 수), 도착 순
+    _waiters: deque[tuple[asyncio.Future[None], int]] = field(
+        default_factory=deque, init=False, repr=False
+    )
+    _wakeup: asyncio.TimerHandle | None = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.requests_per_minute < 1 or self.tokens_per_minute < 1:
+            raise ValueError("requests_per_minute and tokens_per_minute must be at least 1")
+        self._available_requests = float(self.requests_per_minute)
+        self._available_tokens = float(self.tokens_per_minute)
+        self._updated_at = time.monotonic()
 
     def estimate_tokens(self, text: str) -> int:
         """텍스트의 토큰 수를 추정한다.
@@ -43,109 +64,173 @@ class RateLimiter:
         # 보수적으로 평균 3글자 = 1토큰으로 계산
         return max(1, len(text) // 3)
 
-    def _cleanup_old_entries(self, current_time: float) -> None:
-        """1분 이전의 오래된 항목을 제거한다.
-
-        Args:
-            current_time: 현재 시간 (epoch seconds)
-        """
-        cutoff = current_time - 60.0
-
-        # 오래된 요청 시간 제거
-        self._request_times = [t for t in self._request_times if t > cutoff]
-
-        # 오래된 토큰 카운트 제거
-        self._token_counts = [(t, c) for t, c in self._token_counts if t > cutoff]
-
-    def _get_current_rpm(self) -> int:
-        """현재 분당 요청 수를 반환한다."""
-        return len(self._request_times)
-
-    def _get_current_tpm(self) -> int:
-        """현재 분당 토큰 수를 반환한다."""
-        return sum(count for _, count in self._token_counts)
+    def _refill(self) -> None:
+        """마지막 갱신 이후 경과 시간만큼 버킷을 채운다."""
+        now = time.monotonic()
+        elapsed = now - self._updated_at
+        if elapsed <= 0:
+            return
+        self._updated_at = now
+        self._available_requests = min(
+            float(self.requests_per_minute),
+            self._available_requests + elapsed * self.requests_per_minute / 60.0,
+        )
+        self._available_tokens = min(
+            float(self.tokens_per_minute),
+            self._available_tokens + elapsed * self.tokens_per_minute / 60.0,
+        )
+
+    def _can_take(self, tokens: int) -> bool:
+        return self._available_requests >= 1.0 and self._available_tokens >= tokens
+
+    def _take(self, tokens: int) -> None:
+        self._available_requests -= 1.0
+        self._available_tokens -= tokens
+
+    def _wait_time(self, tokens: int) -> float:
+        """요청 하나와 tokens개가 채워질 때까지 남은 시간 (초)."""
+        request_wait = (1.0 - self._available_requests) * 60.0 / self.requests_per_minute
+        token_wait = (tokens - self._available_tokens) * 60.0 / self.tokens_per_minute
+        return max(0.0, request_wait, token_wait)
 
     async def acquire(self, estimated_tokens: int = 0) -> None:
         """Rate limit 확인 후 필요시 대기한다.
 
+        대기 중인 요청이 없고 버킷에 여유가 있으면 즉시 반환한다. 그렇지 않으면
+        대기열 끝에 들어가 앞선 요청이 모두 통과한 뒤 차례가 되면 반환한다.
+
         Args:
-            estimated_tokens: 이번 요청의 추정 토큰 수
+            estimated_tokens: 이번 요청의 추정 토큰 수 (TPM 한도를 넘으면 한도로 제한)
 
         Note:
             이 메서드는 rate limit에 걸리면 대기한 후 반환한다.
             rate limit이 해소될 때까지 블로킹된다.
         """
-        async with self._lock:
-            while True:
-                current_time = time.time()
-                self._cleanup_old_entries(current_time)
-
-                current_rpm = self._get_current_rpm()
-                current_tpm = self._get_current_tpm()
-
-                rpm_ok = current_rpm < self.requests_per_minute
-                tpm_ok = (current_tpm + estimated_tokens) <= self.tokens_per_minute
-
-                if rpm_ok and tpm_ok:
-                    # Rate limit 내에 있음 - 현재 요청 기록
-                    self._request_times.append(current_time)
-                    if estimated_tokens > 0:
-                        self._token_counts.append((current_time, estimated_tokens))
-
-                    logger.debug(
-                        "Rate limit check passed: RPM=%d/%d, TPM=%d/%d",
-                        current_rpm + 1,
-                        self.requests_per_minute,
-                        current_tpm + estimated_tokens,
-                        self.tokens_per_minute,
-                    )
-                    return
-
-                # Rate limit 초과 - 대기 시간 계산
-                if not rpm_ok:
-                    oldest_request = min(self._request_times) if self._request_times else current_time
-                    wait_time = max(0.1, 60.0 - (current_time - oldest_request))
-                    logger.info(
-                        "RPM limit reached (%d/%d), waiting %.1fs",
-                        current_rpm,
-                        self.requests_per_minute,
-                        wait_time,
-                    )
-                elif not tpm_ok:
-                    oldest_token = min(t for t, _ in self._token_counts) if self._token_counts else current_time
-                    wait_time = max(0.1, 60.0 - (current_time - oldest_token))
-                    logger.info(
-                        "TPM limit reached (%d/%d), waiting %.1fs",
-                        current_tpm,
-                        self.tokens_per_minute,
-                        wait_time,
-                    )
-                else:
-                    wait_time = 1.0
-
-                # Lock을 해제하고 대기
-                await asyncio.sleep(wait_time)
+        tokens = min(max(0, estimated_tokens), self.tokens_per_minute)
+        self._refill()
+
+        if not self._waiters and self._can_take(tokens):
+            self._take(tokens)
+            return
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append((future, tokens))
+        # 대기열 맨 앞이 바뀔 때만 타이머를 다시 건다
+        if len(self._waiters) == 1:
+            logger.info(
+                "Rate limit reached (RPM %.0f/%d, TPM %.0f/%d), waiting %.1fs",
+                self.requests_per_minute - self._available_requests,
+                self.requests_per_minute,
+                self.tokens_per_minute - self._available_tokens,
+                self.tokens_per_minute,
+                self._wait_time(tokens),
+            )
+            self._schedule()
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            # 차례가 와서 이미 차감된 뒤 취소되었다면 돌려준다
+            if future.done() and not future.cancelled():
+                self._give_back(1.0, tokens)
+            self._drain()
+            raise
+
+    def reconcile(self, estimated_tokens: int, actual_tokens: int) -> None:
+        """추정 토큰 수를 제공자가 보고한 실제 사용량으로 보정한다.
+
+        실제 사용량이 더 많으면 차이만큼 버킷에서 더 차감하고(음수 가능),
+        더 적으면 돌려주어 대기 중인 요청이 더 일찍 통과하게 한다.
+
+        Args:
+            estimated_tokens: acquire()에 넘긴 추정 토큰 수
+            actual_tokens: 실제 입력 + 출력 토큰 수
+        """
+        charged = min(max(0, estimated_tokens), self.tokens_per_minute)
+        difference = actual_tokens - charged
+        if difference == 0:
+            return
+
+        self._refill()
+        if difference > 0:
+            self._available_tokens -= difference
+        else:
+            self._give_back(0.0, -difference)
+        logger.debug(
+            "Rate limiter reconciled: estimated=%d, actual=%d", estimated_tokens, actual_tokens
+        )
+
+    def _give_back(self, requests: float, tokens: int) -> None:
+        self._available_requests = min(
+            float(self.requests_per_minute), self._available_requests + requests
+        )
+        self._available_tokens = min(
+            float(self.tokens_per_minute), self._available_tokens + tokens
+        )
+        self._drain()
+
+    def _drain(self) -> None:
+        """대기열 앞에서부터 통과 가능한 요청을 깨운다."""
+        self._refill()
+        waiters = self._waiters
+        while waiters:
+            future, tokens = waiters[0]
+            if future.done():
+                # 대기 중 취소된 요청
+                waiters.popleft()
+                continue
+            if not self._can_take(tokens):
+                break
+            waiters.popleft()
+            self._take(tokens)
+            future.set_result(None)
+        self._schedule()
+
+    def _on_wakeup(self) -> None:
+        self._wakeup = None
+        self._drain()
+
+    def _schedule(self) -> None:
+        """대기열 맨 앞 요청이 통과 가능해지는 시각에 타이머를 건다."""
+        if self._wakeup is not None:
+            self._wakeup.cancel()
+            self._wakeup = None
+        while self._waiters and self._waiters[0][0].done():
+            self._waiters.popleft()
+        if not self._waiters:
+            return
+        future, tokens = self._waiters[0]
+        self._wakeup = future.get_loop().call_later(self._wait_time(tokens), self._on_wakeup)
 
     def get_stats(self) -> dict[str, int | float]:
         """현재 rate limiter 통계를 반환한다.
 
+        current_rpm/current_tpm은 최근 1분 동안 사용되어 아직 채워지지 않은 양이다.
+
         Returns:
             통계 정보 딕셔너리
         """
-        current_time = time.time()
-        self._cleanup_old_entries(current_time)
+        self._refill()
+        used_requests = round(self.requests_per_minute - self._available_requests)
+        used_tokens = round(self.tokens_per_minute - self._available_tokens)
 
         return {
-            "current_rpm": self._get_current_rpm(),
+            "current_rpm": used_requests,
             "rpm_limit": self.requests_per_minute,
-            "current_tpm": self._get_current_tpm(),
+            "current_tpm": used_tokens,
             "tpm_limit": self.tokens_per_minute,
-            "rpm_remaining": max(0, self.requests_per_minute - self._get_current_rpm()),
-            "tpm_remaining": max(0, self.tokens_per_minute - self._get_current_tpm()),
+            "rpm_remaining": max(0, int(self._available_requests)),
+            "tpm_remaining": max(0, int(self._available_tokens)),
+            "waiting": sum(1 for future, _ in self._waiters if not future.done()),
         }
 
     def reset(self) -> None:
-        """Rate limiter 상태를 초기화한다."""
-        self._request_times.clear()
-        self._token_counts.clear()
+        """Rate limiter 상태를 초기화한다.
+
+        버킷을 가득 채우므로 대기 중인 요청은 순서대로 통과한다.
+        """
+        self._available_requests = float(self.requests_per_minute)
+        self._available_tokens = float(self.tokens_per_minute)
+        self._updated_at = time.monotonic()
+        self._drain()
         logger.debug("Rate limiter reset")
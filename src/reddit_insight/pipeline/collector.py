@@ -6,15 +6,25 @@ Collector 클래스는 UnifiedDataSource와 DataPipeline을 통합하여
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from typing import TYPE_CHECKING
 
 from reddit_insight.data_source import DataSourceStrategy, UnifiedDataSource
-from reddit_insight.pipeline.data_pipeline import DataPipeline, ProcessingResult
+from reddit_insight.pipeline.data_pipeline import (
+    DEFAULT_COMMENT_BATCH_SIZE,
+    DEFAULT_COMMENT_CONCURRENCY,
+    DataPipeline,
+    ProcessingResult,
+)
 from reddit_insight.storage.database import Database
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 logger = logging.getLogger(__name__)
 
 
@@ -31,6 +41,9 @@ class CollectorConfig:
         include_comments: 댓글 수집 여부
         comment_limit: 게시물당 수집할 댓글 수
         time_filter: top 정렬 시 기간 필터
+        comment_concurrency: 동시에 실행할 댓글 fetch 수
+        comment_batch_size: 한 번에 저장할 댓글 수 (여러 게시물에 걸쳐 배치)
+        incremental: new 정렬 시 워터마크 이후 게시물만 수집
     """
 
     subreddit: str
@@ -39,6 +52,9 @@ class CollectorConfig:
     include_comments: bool = False
     comment_limit: int = 50
     time_filter: str = "week"
+    comment_concurrency: int = DEFAULT_COMMENT_CONCURRENCY
+    comment_batch_size: int = DEFAULT_COMMENT_BATCH_SIZE
+    incremental: bool = True
 
 
 @dataclass
@@ -88,7 +104,11 @@ class Collector:
     """데이터 수집기.
 
     UnifiedDataSource로 데이터를 수집하고 DataPipeline으로 저장한다.
-    여러 서브레딧을 순차적으로 수집할 수 있다.
+    여러 서브레딧을 순차적으로 또는 제한된 동시성으로 수집할 수 있다.
+
+    동시 수집 시 모든 작업은 하나의 UnifiedDataSource를 공유하므로
+    스크래핑 RateLimiter와 PRAW 호출 할당량이 전역으로 적용된다.
+    네트워크 요청은 겹쳐서 실행되고, 데이터베이스 쓰기는 DataPipeline이 직렬화한다.
 
     Example:
         >>> collector = Collector()
@@ -106,6 +126,7 @@ class Collector:
         ...     results = await collector.collect_from_list(
         ...         ["python", "programming"],
         ...         limit=50,
+        ...         max_concurrency=4,
         ...     )
     """
 
@@ -114,6 +135,7 @@ class Collector:
         database: Database | None = None,
         data_source: UnifiedDataSource | None = None,
         strategy: DataSourceStrategy = DataSourceStrategy.API_FIRST,
+        max_concurrency: int = 1,
     ) -> None:
         """Collector 초기화.
 
@@ -121,14 +143,24 @@ class Collector:
             database: Database 인스턴스. None이면 새로 생성
             data_source: UnifiedDataSource 인스턴스. None이면 새로 생성
             strategy: 데이터 소스 전략 (기본: API_FIRST)
+            max_concurrency: 여러 서브레딧 수집 시 기본 동시 작업 수 (기본: 1, 순차)
         """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be >= 1, got {max_concurrency}")
+
         self._db = database
         self._data_source = data_source
         self._strategy = strategy
+        self._max_concurrency = max_concurrency
         self._pipeline: DataPipeline | None = None
         self._owns_db = database is None
         self._owns_data_source = data_source is None
 
+    @property
+    def max_concurrency(self) -> int:
+        """기본 동시 작업 수."""
+        return self._max_concurrency
+
     async def connect(self) -> None:
         """리소스 연결."""
         # 데이터베이스 연결
@@ -216,6 +248,10 @@ class Collector:
                 posts = await self._data_source.get_hot_posts(
                     config.subreddit, limit=config.limit
                 )
+            elif config.sort == "new" and config.incremental:
+                posts = await self._pipeline.collect_new_posts(
+                    self._data_source, config.subreddit, limit=config.limit
+                )
             elif config.sort == "new":
                 posts = await self._data_source.get_new_posts(
                     config.subreddit, limit=config.limit
@@ -240,25 +276,18 @@ class Collector:
             result.posts_result = await self._pipeline.process_posts(
                 posts, config.subreddit
             )
+            if config.sort == "new":
+                await self._pipeline.advance_watermark(config.subreddit, posts)
 
             # 댓글 수집 (옵션)
             if config.include_comments and posts:
-                result.comments_result = ProcessingResult()
-
-                for post in posts:
-                    try:
-                        comments = await self._data_source.get_post_comments(
-                            post.id, limit=config.comment_limit
-                        )
-                        comment_result = await self._pipeline.process_comments(
-                            comments, post.id
-                        )
-                        result.comments_result = (
-                            result.comments_result + comment_result
-                        )
-                    except Exception as e:
-                        logger.warning(f"post/{post.id} 댓글 수집 실패: {e}")
-                        result.comments_result.errors += 1
+                result.comments_result = await self._pipeline.collect_comments(
+                    self._data_source,
+                    [post.id for post in posts],
+                    limit=config.comment_limit,
+                    concurrency=config.comment_concurrency,
+                    batch_size=config.comment_batch_size,
+                )
 
                 logger.info(
                     f"r/{config.subreddit} 댓글 수집 완료: "
@@ -282,32 +311,60 @@ class Collector:
         return result
 
     async def collect_multiple(
-        self, configs: list[CollectorConfig]
+        self,
+        configs: list[CollectorConfig],
+        max_concurrency: int | None = None,
+        on_result: Callable[[CollectionResult], None] | None = None,
     ) -> list[CollectionResult]:
-        """여러 서브레딧 순차 수집.
+        """여러 서브레딧 수집.
+
+        최대 max_concurrency개의 서브레딧을 동시에 수집한다.
+        한 서브레딧의 실패는 해당 CollectionResult.error로만 기록되고
+        다른 서브레딧 수집에는 영향을 주지 않는다.
 
         Args:
             configs: 수집 설정 목록
+            max_concurrency: 동시 작업 수. None이면 Collector 기본값 사용
+            on_result: 서브레딧 하나가 끝날 때마다 호출되는 콜백 (완료 순서)
 
         Returns:
-            list[CollectionResult]: 수집 결과 목록
+            list[CollectionResult]: configs와 같은 순서의 수집 결과 목록
         """
-        results: list[CollectionResult] = []
+        self._ensure_connected()
+
+        workers = max_concurrency if max_concurrency is not None else self._max_concurrency
+        if workers < 1:
+            raise ValueError(f"max_concurrency must be >= 1, got {workers}")
+
+        semaphore = asyncio.Semaphore(workers)
+        start_time = time.monotonic()
 
-        for config in configs:
-            result = await self.collect_subreddit(config)
-            results.append(result)
+        async def run(config: CollectorConfig) -> CollectionResult:
+            async with semaphore:
+                try:
+                    result = await self.collect_subreddit(config)
+                except Exception as e:
+                    # collect_subreddit은 수집 오류를 결과에 담지만,
+                    # 예기치 않은 예외도 다른 작업으로 전파되지 않게 격리한다
+                    logger.error(f"r/{config.subreddit} 수집 작업 실패: {e}")
+                    result = CollectionResult(subreddit=config.subreddit, error=str(e))
+            if on_result is not None:
+                on_result(result)
+            return result
+
+        results = list(await asyncio.gather(*(run(config) for config in configs)))
 
         # 통계 로깅
         total_posts = sum(r.posts_result.new for r in results)
         total_time = sum(r.duration_seconds for r in results)
+        wall_time = time.monotonic() - start_time
         success_count = sum(1 for r in results if r.success)
 
         logger.info(
             f"전체 수집 완료: "
             f"{success_count}/{len(configs)} 성공, "
             f"새 게시물 {total_posts}개, "
-            f"총 {total_time:.2f}초"
+            f"총 {total_time:.2f}초 (경과 {wall_time:.2f}초, 동시 {workers})"
         )
 
         return results
@@ -320,6 +377,7 @@ class Collector:
         include_comments: bool = False,
         comment_limit: int = 50,
         time_filter: str = "week",
+        max_concurrency: int | None = None,
     ) -> list[CollectionResult]:
         """서브레딧 목록으로 간편 수집.
 
@@ -330,6 +388,7 @@ class Collector:
             include_comments: 댓글 수집 여부
             comment_limit: 게시물당 수집할 댓글 수
             time_filter: top 정렬 시 기간 필터
+            max_concurrency: 동시 작업 수. None이면 Collector 기본값 사용
 
         Returns:
             list[CollectionResult]: 수집 결과 목록
@@ -346,4 +405,4 @@ class Collector:
             for subreddit in subreddits
         ]
 
-        return await self.collect_multiple(configs)
+        return await self.collect_multiple(configs, max_concurrency=max_concurrency)
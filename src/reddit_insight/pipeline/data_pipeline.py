@@ -6,6 +6,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
@@ -14,17 +15,26 @@ from reddit_insight.data_source import DataSourceStrategy, UnifiedDataSource
 from reddit_insight.pipeline.preprocessor import TextPreprocessor
 from reddit_insight.storage.models import SubredditModel
 from reddit_insight.storage.repository import (
+    DEFAULT_CHUNK_SIZE,
     CommentRepository,
     PostRepository,
     SubredditRepository,
+    WatermarkRepository,
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from datetime import datetime
+
     from reddit_insight.reddit.models import Comment, Post, SubredditInfo
     from reddit_insight.storage.database import Database
 
 logger = logging.getLogger(__name__)
 
+# 댓글 수집 단계 기본값: 동시 fetch 수와 writer가 한 번에 저장할 댓글 수
+DEFAULT_COMMENT_CONCURRENCY = 4
+DEFAULT_COMMENT_BATCH_SIZE = 500
+
 
 @dataclass
 class ProcessingResult:
@@ -98,6 +108,8 @@ class DataPipeline:
     """데이터 파이프라인.
 
     Reddit 데이터 수집 -> 전처리 -> 저장의 전체 워크플로우를 관리한다.
+    SQLite는 동시에 하나의 writer만 허용하므로, 같은 파이프라인을 공유하는
+    여러 작업의 저장 단계는 내부 락으로 직렬화된다.
 
     Example:
         >>> async with Database() as db:
@@ -111,14 +123,21 @@ class DataPipeline:
         ...     print(f"새 게시물: {result.posts.new}")
     """
 
-    def __init__(self, database: Database) -> None:
+    def __init__(
+        self,
+        database: Database,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
         """DataPipeline 초기화.
 
         Args:
             database: Database 인스턴스 (연결 상태여야 함)
+            chunk_size: 중복 조회/upsert 한 번에 처리할 최대 행 수
         """
         self._db = database
         self._preprocessor = TextPreprocessor()
+        self._chunk_size = chunk_size
+        self._write_lock = asyncio.Lock()
 
     @property
     def preprocessor(self) -> TextPreprocessor:
@@ -161,7 +180,7 @@ class DataPipeline:
             return result
 
         try:
-            async with self._db.session() as session:
+            async with self._write_lock, self._db.session() as session:
                 # 서브레딧 확보
                 subreddit_repo = SubredditRepository(session)
                 subreddit = await subreddit_repo.get_by_name(subreddit_name)
@@ -186,23 +205,25 @@ class DataPipeline:
                     )
                     subreddit = await subreddit_repo.get_or_create(default_info)
 
-                # 기존 게시물 ID 조회 (중복 체크용)
+                # 기존 게시물 ID 조회 (청크 단위 IN 쿼리로 중복 체크)
                 post_repo = PostRepository(session)
-                existing_ids: set[str] = set()
-                for post in valid_posts:
-                    existing = await post_repo.get_by_reddit_id(post.id)
-                    if existing is not None:
-                        existing_ids.add(post.id)
+                existing_ids = await post_repo.get_existing_reddit_ids(
+                    (p.id for p in valid_posts), chunk_size=self._chunk_size
+                )
 
-                # 새 게시물과 기존 게시물 분리
-                new_posts = [p for p in valid_posts if p.id not in existing_ids]
-                duplicate_posts = [p for p in valid_posts if p.id in existing_ids]
+                # 배치 내 반복 ID는 첫 등장만 신규로 집계한다
+                new_ids = {p.id for p in valid_posts} - existing_ids
 
                 # bulk 저장
-                saved_models = await post_repo.save_many(valid_posts, subreddit.id)
+                await post_repo.save_many(
+                    valid_posts,
+                    subreddit.id,
+                    chunk_size=self._chunk_size,
+                    return_models=False,
+                )
 
-                result.new = len(new_posts)
-                result.duplicates = len(duplicate_posts)
+                result.new = len(new_ids)
+                result.duplicates = len(valid_posts) - len(new_ids)
 
                 await session.commit()
 
@@ -235,76 +256,214 @@ class DataPipeline:
         Returns:
             ProcessingResult: 처리 결과 통계
         """
-        result = ProcessingResult(total=len(comments))
+        return await self.process_comment_batch({post_reddit_id: comments})
 
-        if not comments:
-            return result
+    async def process_comment_batch(
+        self,
+        comments_by_post: dict[str, list[Comment]],
+    ) -> ProcessingResult:
+        """여러 게시물의 댓글을 하나의 세션에서 처리 및 저장.
+
+        게시물 ID 조회와 댓글 중복 체크를 배치 전체에 대해 한 번씩 수행하고
+        한 번의 커밋으로 저장한다.
+
+        Args:
+            comments_by_post: 게시물 Reddit ID -> Comment 목록
+
+        Returns:
+            ProcessingResult: 배치 전체의 처리 결과 통계
+        """
+        result = ProcessingResult(
+            total=sum(len(comments) for comments in comments_by_post.values())
+        )
 
         # 삭제된 댓글 필터링
-        valid_comments: list[Comment] = []
-        for comment in comments:
-            if self._preprocessor.is_deleted_content(comment.body):
-                result.filtered += 1
-                continue
-            # 작성자 정규화 후 삭제 여부 체크
-            if self._preprocessor.normalize_author(comment.author) is None:
-                # 삭제된 작성자의 댓글은 본문이 있으면 유지
-                if not comment.body or comment.body.strip() == "":
-                    result.filtered += 1
-                    continue
-            valid_comments.append(comment)
+        valid_by_post: dict[str, list[Comment]] = {}
+        for post_reddit_id, comments in comments_by_post.items():
+            valid_comments = self._filter_comments(comments, result)
+            if valid_comments:
+                valid_by_post[post_reddit_id] = valid_comments
 
-        if not valid_comments:
+        if not valid_by_post:
             return result
 
+        valid_count = sum(len(comments) for comments in valid_by_post.values())
+
         try:
-            async with self._db.session() as session:
+            async with self._write_lock, self._db.session() as session:
                 # 게시물 조회
                 post_repo = PostRepository(session)
-                post = await post_repo.get_by_reddit_id(post_reddit_id)
+                post_ids = await post_repo.get_ids_by_reddit_ids(
+                    valid_by_post.keys(), chunk_size=self._chunk_size
+                )
 
-                if post is None:
+                for post_reddit_id in valid_by_post.keys() - post_ids.keys():
                     logger.warning(
                         f"게시물을 찾을 수 없음: {post_reddit_id}, 댓글 저장 건너뜀"
                     )
-                    result.errors = len(valid_comments)
+                    result.errors += len(valid_by_post.pop(post_reddit_id))
+
+                if not valid_by_post:
                     return result
 
-                # 기존 댓글 ID 조회 (중복 체크용)
+                # 기존 댓글 ID 조회 (청크 단위 IN 쿼리로 중복 체크)
                 comment_repo = CommentRepository(session)
-                existing_ids: set[str] = set()
-                for comment in valid_comments:
-                    existing = await comment_repo.get_by_reddit_id(comment.id)
-                    if existing is not None:
-                        existing_ids.add(comment.id)
-
-                # 새 댓글과 기존 댓글 분리
-                new_comments = [c for c in valid_comments if c.id not in existing_ids]
-                duplicate_comments = [
-                    c for c in valid_comments if c.id in existing_ids
-                ]
+                existing_ids = await comment_repo.get_existing_reddit_ids(
+                    (c.id for comments in valid_by_post.values() for c in comments),
+                    chunk_size=self._chunk_size,
+                )
 
-                # bulk 저장
-                saved_models = await comment_repo.save_many(valid_comments, post.id)
+                new_ids: set[str] = set()
+                stored = 0
+                for post_reddit_id, valid_comments in valid_by_post.items():
+                    # 배치 내 반복 ID는 첫 등장만 신규로 집계한다
+                    new_ids.update(c.id for c in valid_comments)
+
+                    # bulk 저장
+                    await comment_repo.save_many(
+                        valid_comments,
+                        post_ids[post_reddit_id],
+                        chunk_size=self._chunk_size,
+                        return_models=False,
+                    )
+                    stored += len(valid_comments)
 
-                result.new = len(new_comments)
-                result.duplicates = len(duplicate_comments)
+                new_ids -= existing_ids
+                result.new = len(new_ids)
+                result.duplicates = stored - len(new_ids)
 
                 await session.commit()
 
                 logger.info(
-                    f"post/{post_reddit_id} 댓글 처리 완료: "
+                    f"{len(valid_by_post)}개 게시물 댓글 처리 완료: "
                     f"total={result.total}, new={result.new}, "
                     f"duplicates={result.duplicates}, filtered={result.filtered}"
                 )
 
         except Exception as e:
-            result.errors = len(valid_comments)
+            result.errors = valid_count
             logger.error(f"댓글 처리 중 오류: {e}")
             raise
 
         return result
 
+    def _filter_comments(
+        self,
+        comments: list[Comment],
+        result: ProcessingResult,
+    ) -> list[Comment]:
+        """삭제된 댓글을 걸러내고 filtered 카운트를 갱신.
+
+        Args:
+            comments: Comment Pydantic 모델 목록
+            result: filtered 카운트를 누적할 처리 결과
+
+        Returns:
+            저장 대상 댓글 목록
+        """
+        valid_comments: list[Comment] = []
+        for comment in comments:
+            if self._preprocessor.is_deleted_content(comment.body):
+                result.filtered += 1
+                continue
+            # 작성자 정규화 후 삭제 여부 체크
+            if self._preprocessor.normalize_author(comment.author) is None:
+                # 삭제된 작성자의 댓글은 본문이 있으면 유지
+                if not comment.body or comment.body.strip() == "":
+                    result.filtered += 1
+                    continue
+            valid_comments.append(comment)
+        return valid_comments
+
+    async def collect_comments(
+        self,
+        data_source: UnifiedDataSource,
+        post_ids: Sequence[str],
+        limit: int | None = None,
+        concurrency: int = DEFAULT_COMMENT_CONCURRENCY,
+        batch_size: int = DEFAULT_COMMENT_BATCH_SIZE,
+    ) -> ProcessingResult:
+        """여러 게시물의 댓글을 파이프라인 방식으로 수집 및 저장.
+
+        댓글 fetch는 최대 concurrency개가 동시에 실행되며 데이터 소스의
+        공유 rate limiter를 따른다. 단일 writer 작업이 여러 게시물의 댓글을
+        batch_size개 단위로 모아 process_comment_batch로 저장한다.
+
+        Args:
+            data_source: 댓글을 가져올 데이터 소스
+            post_ids: 게시물 Reddit ID 목록
+            limit: 게시물당 최대 댓글 수
+            concurrency: 동시에 실행할 댓글 fetch 수
+            batch_size: writer가 한 번에 저장할 댓글 수
+
+        Returns:
+            ProcessingResult: 전체 댓글 처리 결과 (fetch/저장 실패는 게시물당 errors 1)
+        """
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be >= 1, got {concurrency}")
+
+        result = ProcessingResult()
+        if not post_ids:
+            return result
+
+        # 작은 큐로 writer가 밀릴 때 fetch 쪽에 backpressure를 건다
+        queue: asyncio.Queue[tuple[str, list[Comment]] | None] = asyncio.Queue(
+            maxsize=concurrency * 2
+        )
+        semaphore = asyncio.Semaphore(concurrency)
+        fetch_errors = 0
+
+        async def fetch(post_id: str) -> None:
+            nonlocal fetch_errors
+            async with semaphore:
+                try:
+                    comments = await data_source.get_post_comments(post_id, limit=limit)
+                except Exception as e:
+                    logger.warning(f"post/{post_id} 댓글 수집 실패: {e}")
+                    fetch_errors += 1
+                    return
+            await queue.put((post_id, comments))
+
+        async def write() -> ProcessingResult:
+            written = ProcessingResult()
+            pending: dict[str, list[Comment]] = {}
+            pending_count = 0
+            done_posts = 0
+
+            async def flush() -> None:
+                nonlocal written, pending, pending_count
+                try:
+                    written = written + await self.process_comment_batch(pending)
+                except Exception as e:
+                    logger.warning(f"댓글 배치 저장 실패 ({len(pending)}개 게시물): {e}")
+                    written.errors += len(pending)
+                pending = {}
+                pending_count = 0
+
+            while (item := await queue.get()) is not None:
+                post_id, comments = item
+                pending.setdefault(post_id, []).extend(comments)
+                pending_count += len(comments)
+                done_posts += 1
+                if pending_count >= batch_size:
+                    await flush()
+                    logger.debug(f"댓글 수집 진행: {done_posts}/{len(post_ids)} 게시물")
+
+            if pending:
+                await flush()
+            return written
+
+        writer = asyncio.create_task(write())
+        try:
+            await asyncio.gather(*(fetch(post_id) for post_id in post_ids))
+        finally:
+            await queue.put(None)
+            written = await writer
+
+        result = written
+        result.errors += fetch_errors
+        return result
+
     async def ensure_subreddit(
         self,
         info: SubredditInfo,
@@ -317,12 +476,73 @@ class DataPipeline:
         Returns:
             SubredditModel: 저장된 서브레딧 모델
         """
-        async with self._db.session() as session:
+        async with self._write_lock, self._db.session() as session:
             repo = SubredditRepository(session)
             model = await repo.get_or_create(info)
             await session.commit()
             return model
 
+    async def get_watermark(self, subreddit: str) -> datetime | None:
+        """서브레딧의 증분 수집 워터마크 조회.
+
+        Args:
+            subreddit: 서브레딧 이름
+
+        Returns:
+            지금까지 new 수집에서 확인한 가장 최신 게시물 작성 시각 (없으면 None)
+        """
+        async with self._db.session() as session:
+            return await WatermarkRepository(session).get_newest_utc(subreddit)
+
+    async def advance_watermark(self, subreddit: str, posts: Sequence[Post]) -> None:
+        """저장한 게시물로 워터마크를 전진.
+
+        Args:
+            subreddit: 서브레딧 이름
+            posts: new 수집으로 저장한 게시물
+        """
+        if not posts:
+            return
+        async with self._write_lock, self._db.session() as session:
+            await WatermarkRepository(session).advance(subreddit, posts)
+            await session.commit()
+
+    async def collect_new_posts(
+        self,
+        data_source: UnifiedDataSource,
+        subreddit: str,
+        limit: int = 100,
+    ) -> list[Post]:
+        """워터마크 이후의 new 게시물만 수집.
+
+        저장된 워터마크가 있으면 new 목록을 페이지 단위로 읽다가 워터마크에
+        도달하는 즉시 멈추므로, 정상 상태의 수집 비용은 limit가 아니라 새 게시물 수에 비례한다.
+        워터마크 시각과 같은 게시물은 다시 받아 중복으로 처리된다.
+
+        수집한 게시물을 저장한 뒤 advance_watermark를 호출해야 워터마크가 전진한다.
+
+        Args:
+            data_source: 데이터 소스
+            subreddit: 서브레딧 이름
+            limit: 최대 수집 게시물 수
+
+        Returns:
+            워터마크 이후(포함) 게시물 목록
+        """
+        since = await self.get_watermark(subreddit)
+        posts = await data_source.get_new_posts(subreddit, limit=limit, since=since)
+
+        if since is not None:
+            logger.info(
+                f"r/{subreddit} 증분 수집: 워터마크 {since.isoformat()} 이후 {len(posts)}개"
+            )
+            if len(posts) >= limit:
+                logger.warning(
+                    f"r/{subreddit} 워터마크에 도달하기 전에 limit({limit})에 도달했습니다. "
+                    f"일부 게시물이 누락될 수 있습니다."
+                )
+        return posts
+
     async def collect_and_store(
         self,
         subreddit: str,
@@ -331,6 +551,7 @@ class DataPipeline:
         include_comments: bool = False,
         time_filter: str = "week",
         strategy: DataSourceStrategy = DataSourceStrategy.API_FIRST,
+        incremental: bool = True,
     ) -> CollectionResult:
         """데이터 수집 및 저장 워크플로우.
 
@@ -343,6 +564,7 @@ class DataPipeline:
             include_comments: 댓글 수집 여부
             time_filter: top 정렬 시 기간 필터 (hour, day, week, month, year, all)
             strategy: 데이터 소스 전략
+            incremental: new 정렬 시 워터마크 이후 게시물만 수집 (기본: True)
 
         Returns:
             CollectionResult: 수집 및 저장 결과
@@ -374,6 +596,8 @@ class DataPipeline:
             try:
                 if sort == "hot":
                     posts = await data_source.get_hot_posts(subreddit, limit=limit)
+                elif sort == "new" and incremental:
+                    posts = await self.collect_new_posts(data_source, subreddit, limit)
                 elif sort == "new":
                     posts = await data_source.get_new_posts(subreddit, limit=limit)
                 elif sort == "top":
@@ -391,19 +615,14 @@ class DataPipeline:
 
             # 3. 게시물 처리 및 저장
             result.posts = await self.process_posts(posts, subreddit)
+            if sort == "new":
+                await self.advance_watermark(subreddit, posts)
 
             # 4. 댓글 수집 (옵션)
             if include_comments and posts:
-                result.comments = ProcessingResult()
-
-                for post in posts:
-                    try:
-                        comments = await data_source.get_post_comments(post.id)
-                        comment_result = await self.process_comments(comments, post.id)
-                        result.comments = result.comments + comment_result
-                    except Exception as e:
-                        logger.warning(f"post/{post.id} 댓글 수집 실패: {e}")
-                        result.comments.errors += 1
+                result.comments = await self.collect_comments(
+                    data_source, [post.id for post in posts]
+                )
 
                 logger.info(
                     f"r/{subreddit} 댓글 수집 완료: "
@@ -35,6 +35,7 @@ class ScheduleConfig:
         include_comments: 댓글 수집 여부
         comment_limit: 게시물당 수집할 댓글 수
         time_filter: top 정렬 시 기간 필터
+        max_concurrency: 동시에 수집할 서브레딧 수
     """
 
     subreddits: list[str]
@@ -44,6 +45,7 @@ class ScheduleConfig:
     include_comments: bool = False
     comment_limit: int = 50
     time_filter: str = "week"
+    max_concurrency: int = 4
 
     def to_collector_configs(self) -> list[CollectorConfig]:
         """CollectorConfig 목록으로 변환."""
@@ -229,7 +231,9 @@ class SimpleScheduler:
 
         try:
             configs = self._config.to_collector_configs()
-            results = await self._collector.collect_multiple(configs)
+            results = await self._collector.collect_multiple(
+                configs, max_concurrency=self._config.max_concurrency
+            )
 
             run.results = results
             run.completed_at = datetime.now(UTC)
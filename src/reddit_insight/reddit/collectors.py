@@ -12,6 +12,8 @@ from typing import TYPE_CHECKING
 from reddit_insight.reddit.models import Comment, Post
 
 if TYPE_CHECKING:
+    from datetime import datetime
+
     from praw.models.comment_forest import CommentForest
 
     from reddit_insight.reddit.client import RedditClient
@@ -59,21 +61,39 @@ class PostCollector:
         sub = self._client.get_subreddit(subreddit)
         return [self._convert_submission(s) for s in sub.hot(limit=limit)]
 
-    def get_new(self, subreddit: str, limit: int = 100) -> list[Post]:
+    def get_new(
+        self,
+        subreddit: str,
+        limit: int = 100,
+        since: datetime | None = None,
+    ) -> list[Post]:
         """최신 게시물 수집.
 
-        작성 시간 순으로 정렬된 게시물을 가져온다.
+        작성 시간 순으로 정렬된 게시물을 가져온다. since가 주어지면
+        그보다 오래된 게시물을 만나는 즉시 중단하므로, 다음 페이지를 요청하지 않는다.
 
         Args:
             subreddit: 서브레딧 이름
             limit: 최대 수집 개수 (기본: 100)
+            since: 워터마크 시각. 이 시각 이후(포함) 게시물만 수집
 
         Returns:
             list[Post]: 수집된 게시물 목록
         """
         logger.debug("r/%s에서 new 게시물 %d개 수집", subreddit, limit)
         sub = self._client.get_subreddit(subreddit)
-        return [self._convert_submission(s) for s in sub.new(limit=limit)]
+        if since is None:
+            return [self._convert_submission(s) for s in sub.new(limit=limit)]
+
+        # ListingGenerator는 페이지를 지연 요청하므로 break 시 추가 요청이 없다
+        posts: list[Post] = []
+        for submission in sub.new(limit=limit):
+            post = self._convert_submission(submission)
+            if post.created_utc < since:
+                break
+            posts.append(post)
+        logger.debug("r/%s 워터마크 이후 게시물 %d개", subreddit, len(posts))
+        return posts
 
     def get_top(
         self,
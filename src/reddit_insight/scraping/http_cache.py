@@ -0,0 +1,289 @@
+"""조건부 요청을 위한 디스크 HTTP 응답 캐시.
+
+URL과 쿼리 파라미터를 키로 응답 본문과 ETag/Last-Modified 검증자를 디스크에 저장한다.
+ScrapingClient는 저장된 검증자로 조건부 요청(If-None-Match, If-Modified-Since)을 보내고,
+서버가 304 Not Modified를 반환하면 디스크의 본문으로 응답을 재구성한다.
+
+캐시는 전체 크기 상한을 가지며 가장 오래 사용되지 않은 항목부터 제거한다(LRU).
+디스크 I/O가 이벤트 루프를 막지 않도록 ScrapingClient는 get/store를 스레드에서 호출하며,
+인덱스는 잠금으로 보호한다.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# 응답 재구성 시 보존할 헤더 (content-encoding 등은 이미 디코딩된 본문과 맞지 않으므로 제외)
+_PRESERVED_HEADERS: tuple[str, ...] = ("content-type", "etag", "last-modified")
+
+
+@dataclass
+class CacheStats:
+    """HTTP 캐시 통계.
+
+    Attributes:
+        hits: 304 응답을 디스크 본문으로 처리한 횟수
+        misses: 전체 응답을 받은 횟수
+        stores: 캐시에 저장한 응답 수
+        evictions: 크기 상한으로 제거된 항목 수
+        bytes_saved: 304로 전송을 생략한 본문 바이트 수
+    """
+
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+    bytes_saved: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """조건부 요청 적중률 (0.0 ~ 1.0)."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+@dataclass
+class CachedResponse:
+    """캐시된 응답.
+
+    Attributes:
+        url: 요청 URL (파라미터 포함)
+        headers: 보존된 응답 헤더
+        content: 응답 본문
+    """
+
+    url: str
+    headers: dict[str, str]
+    content: bytes
+
+    @property
+    def etag(self) -> str | None:
+        """ETag 검증자."""
+        return self.headers.get("etag")
+
+    @property
+    def last_modified(self) -> str | None:
+        """Last-Modified 검증자."""
+        return self.headers.get("last-modified")
+
+    def conditional_headers(self) -> dict[str, str]:
+        """조건부 요청 헤더 생성."""
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_response(self, request: httpx.Request | None = None) -> httpx.Response:
+        """캐시된 본문으로 200 응답을 재구성."""
+        return httpx.Response(
+            status_code=200,
+            headers=self.headers,
+            content=self.content,
+            request=request,
+        )
+
+
+class HTTPResponseCache:
+    """크기 제한 LRU 디스크 응답 캐시.
+
+    항목마다 ``<key>.json``(메타데이터)과 ``<key>.body``(본문) 파일을 만든다.
+    최근 사용 순서는 파일 수정 시각으로 디스크에 남기므로 재시작 후에도 유지된다.
+
+    Example:
+        >>> cache = HTTPResponseCache("./data/http_cache", max_bytes=64 * 1024 * 1024)
+        >>> async with ScrapingClient(cache=cache) as client:
+        ...     await client.get_json("https://old.reddit.com/r/python/new.json")
+        >>> cache.stats.hit_rate
+    """
+
+    def __init__(
+        self,
+        cache_dir: str | Path,
+        max_bytes: int = 256 * 1024 * 1024,
+    ) -> None:
+        """HTTPResponseCache 초기화.
+
+        Args:
+            cache_dir: 캐시 디렉토리 (없으면 생성)
+            max_bytes: 본문 전체 크기 상한 (기본: 256 MiB)
+
+        Raises:
+            ValueError: max_bytes가 1 미만인 경우
+        """
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # key -> 본문 크기, 오래된 것부터 최근 사용 순
+        self._index: OrderedDict[str, int] = OrderedDict()
+        self._total_bytes = 0
+        # get/store는 asyncio.to_thread로 여러 스레드에서 동시에 호출될 수 있다
+        self._lock = threading.RLock()
+        self._load_index()
+
+    @staticmethod
+    def make_key(url: str, params: dict[str, Any] | None = None) -> str:
+        """URL과 쿼리 파라미터로 캐시 키 생성.
+
+        파라미터 순서와 무관하게 같은 키를 만든다.
+        """
+        canonical = str(httpx.URL(url, params=sorted((params or {}).items())))
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    @property
+    def total_bytes(self) -> int:
+        """캐시된 본문 전체 크기."""
+        return self._total_bytes
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._index
+
+    def get(self, key: str) -> CachedResponse | None:
+        """캐시 항목 조회.
+
+        조회된 항목은 가장 최근 사용으로 표시된다.
+
+        Args:
+            key: make_key로 만든 캐시 키
+
+        Returns:
+            캐시된 응답 (없거나 손상된 경우 None)
+        """
+        with self._lock:
+            if key not in self._index:
+                return None
+
+            meta_path, body_path = self._paths(key)
+            try:
+                meta = json.loads(meta_path.read_text(encoding="utf-8"))
+                content = body_path.read_bytes()
+            except (OSError, ValueError) as e:
+                logger.warning(f"손상된 HTTP 캐시 항목 제거: {key} ({e})")
+                self._remove(key)
+                return None
+
+            self._touch(key)
+        return CachedResponse(url=meta["url"], headers=meta["headers"], content=content)
+
+    def store(self, key: str, response: httpx.Response) -> bool:
+        """응답 저장.
+
+        ETag 또는 Last-Modified 검증자가 있는 200 응답만 저장한다.
+
+        Args:
+            key: make_key로 만든 캐시 키
+            response: 저장할 응답
+
+        Returns:
+            저장 여부
+        """
+        if response.status_code != 200:
+            return False
+        headers = {
+            name: response.headers[name]
+            for name in _PRESERVED_HEADERS
+            if name in response.headers
+        }
+        if "etag" not in headers and "last-modified" not in headers:
+            return False
+
+        content = response.content
+        if len(content) > self.max_bytes:
+            return False
+
+        with self._lock:
+            if key in self._index:
+                self._remove(key)
+
+            meta_path, body_path = self._paths(key)
+            try:
+                body_path.write_bytes(content)
+                meta_path.write_text(
+                    json.dumps({"url": str(response.url), "headers": headers}),
+                    encoding="utf-8",
+                )
+            except OSError as e:
+                logger.warning(f"HTTP 캐시 저장 실패: {e}")
+                self._remove(key)
+                return False
+
+            self._index[key] = len(content)
+            self._total_bytes += len(content)
+            self.stats.stores += 1
+            self._evict()
+            return True
+
+    def record_hit(self, cached: CachedResponse) -> None:
+        """304 응답을 캐시로 처리했음을 기록."""
+        self.stats.hits += 1
+        self.stats.bytes_saved += len(cached.content)
+
+    def record_miss(self) -> None:
+        """전체 응답을 받았음을 기록."""
+        self.stats.misses += 1
+
+    def clear(self) -> None:
+        """모든 캐시 항목 삭제."""
+        with self._lock:
+            for key in list(self._index):
+                self._remove(key)
+
+    def _paths(self, key: str) -> tuple[Path, Path]:
+        return self.cache_dir / f"{key}.json", self.cache_dir / f"{key}.body"
+
+    def _load_index(self) -> None:
+        """디스크의 기존 항목으로 LRU 인덱스를 복원."""
+        entries: list[tuple[float, str, int]] = []
+        for body_path in self.cache_dir.glob("*.body"):
+            key = body_path.stem
+            if not (self.cache_dir / f"{key}.json").exists():
+                continue
+            stat = body_path.stat()
+            entries.append((stat.st_mtime, key, stat.st_size))
+
+        for _, key, size in sorted(entries):
+            self._index[key] = size
+            self._total_bytes += size
+        self._evict()
+
+    def _touch(self, key: str) -> None:
+        """항목을 가장 최근 사용으로 표시."""
+        self._index.move_to_end(key)
+        _, body_path = self._paths(key)
+        with contextlib.suppress(OSError):
+            os.utime(body_path)
+
+    def _remove(self, key: str) -> None:
+        size = self._index.pop(key, 0)
+        self._total_bytes -= size
+        for path in self._paths(key):
+            path.unlink(missing_ok=True)
+
+    def _evict(self) -> None:
+        """크기 상한을 넘으면 오래된 항목부터 제거."""
+        while self._total_bytes > self.max_bytes and self._index:
+            key = next(iter(self._index))
+            self._remove(key)
+            self.stats.evictions += 1
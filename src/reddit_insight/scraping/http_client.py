@@ -9,12 +9,16 @@ from __future__ import annotations
 import asyncio
 import logging
 import random
-from typing import Any, Self
+from typing import TYPE_CHECKING, Any, Self
 
 import httpx
 
+from reddit_insight.scraping.http_cache import HTTPResponseCache
 from reddit_insight.scraping.rate_limiter import RateLimiter
 
+if TYPE_CHECKING:
+    from reddit_insight.scraping.http_cache import CachedResponse
+
 logger = logging.getLogger(__name__)
 
 
@@ -56,11 +60,13 @@ class ScrapingClient:
     - User-Agent 로테이션
     - Rate limiting
     - 재시도 로직 (exponential backoff)
+    - 조건부 요청 캐시 (선택, ETag/Last-Modified)
 
     Attributes:
         rate_limiter: 요청 속도 제어기
         max_retries: 최대 재시도 횟수
         base_delay: 재시도 시 기본 대기 시간
+        cache: 디스크 응답 캐시 (None이면 캐시 미사용)
 
     Example:
         >>> async with ScrapingClient() as client:
@@ -74,6 +80,7 @@ class ScrapingClient:
         max_retries: int = 3,
         base_delay: float = 1.0,
         timeout: float = 30.0,
+        cache: HTTPResponseCache | None = None,
     ) -> None:
         """ScrapingClient 초기화.
 
@@ -82,11 +89,13 @@ class ScrapingClient:
             max_retries: 최대 재시도 횟수 (기본: 3)
             base_delay: 재시도 시 기본 대기 시간 초 (기본: 1.0)
             timeout: 요청 타임아웃 초 (기본: 30.0)
+            cache: 조건부 요청용 디스크 응답 캐시 (선택)
         """
         self.rate_limiter = rate_limiter or RateLimiter()
         self.max_retries = max_retries
         self.base_delay = base_delay
         self.timeout = timeout
+        self.cache = cache
 
         # User-Agent 로테이션 상태
         self._user_agents: list[str] = USER_AGENTS.copy()
@@ -143,7 +152,9 @@ class ScrapingClient:
     ) -> httpx.Response:
         """GET 요청 수행.
 
-        Rate limiting과 재시도 로직이 적용됩니다.
+        Rate limiting과 재시도 로직이 적용됩니다. 캐시가 설정된 경우
+        저장된 검증자로 조건부 요청을 보내고, 304 응답은 디스크의 본문으로
+        재구성한 200 응답으로 반환합니다.
 
         Args:
             url: 요청 URL
@@ -158,6 +169,12 @@ class ScrapingClient:
         client = await self._get_client()
         last_error: Exception | None = None
 
+        cache_key: str | None = None
+        cached = None
+        if self.cache is not None:
+            cache_key = HTTPResponseCache.make_key(url, params)
+            cached = await asyncio.to_thread(self.cache.get, cache_key)
+
         for attempt in range(self.max_retries):
             try:
                 # Rate limiting 대기
@@ -165,6 +182,8 @@ class ScrapingClient:
 
                 # 요청 실행
                 headers = self._get_headers()
+                if cached is not None:
+                    headers.update(cached.conditional_headers())
                 response = await client.get(url, params=params, headers=headers)
 
                 # 429 (Too Many Requests) 처리
@@ -185,6 +204,9 @@ class ScrapingClient:
                     await asyncio.sleep(delay)
                     continue
 
+                if self.cache is not None and cache_key is not None:
+                    return await self._apply_cache(cache_key, cached, response)
+
                 # 성공 또는 클라이언트 오류 (재시도 불필요)
                 return response
 
@@ -204,6 +226,33 @@ class ScrapingClient:
         error_msg = f"Failed after {self.max_retries} attempts: {last_error}"
         raise ScrapingError(error_msg)
 
+    async def _apply_cache(
+        self,
+        cache_key: str,
+        cached: CachedResponse | None,
+        response: httpx.Response,
+    ) -> httpx.Response:
+        """응답을 캐시에 반영하고 호출자에게 돌려줄 응답을 결정.
+
+        Args:
+            cache_key: 요청의 캐시 키
+            cached: 조건부 요청에 사용한 캐시 항목
+            response: 서버 응답
+
+        Returns:
+            304이면 캐시 본문으로 재구성한 응답, 그 외에는 서버 응답
+        """
+        assert self.cache is not None
+
+        if response.status_code == 304 and cached is not None:
+            self.cache.record_hit(cached)
+            logger.debug(f"HTTP 캐시 적중 (304): {response.url}")
+            return cached.to_response(request=response.request)
+
+        self.cache.record_miss()
+        await asyncio.to_thread(self.cache.store, cache_key, response)
+        return response
+
     async def get_json(self, url: str) -> dict[str, Any]:
         """JSON 응답을 요청하고 파싱.
 
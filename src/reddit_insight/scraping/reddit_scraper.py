@@ -13,7 +13,7 @@ URL 패턴:
 from __future__ import annotations
 
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from urllib.parse import urlencode
 
 from reddit_insight.reddit.models import Comment, Post, SubredditInfo
@@ -24,6 +24,11 @@ from reddit_insight.scraping.parser import (
     extract_posts_from_response,
 )
 
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from reddit_insight.scraping.http_cache import HTTPResponseCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -47,13 +52,18 @@ class RedditScraper:
     BASE_URL = "https://old.reddit.com"
     MAX_PER_REQUEST = 100  # Reddit API 한 요청당 최대 개수
 
-    def __init__(self, client: ScrapingClient | None = None) -> None:
+    def __init__(
+        self,
+        client: ScrapingClient | None = None,
+        cache: HTTPResponseCache | None = None,
+    ) -> None:
         """RedditScraper 초기화.
 
         Args:
             client: HTTP 클라이언트 (없으면 새로 생성)
+            cache: 새로 생성하는 클라이언트에 사용할 응답 캐시 (선택)
         """
-        self._client = client or ScrapingClient()
+        self._client = client or ScrapingClient(cache=cache)
         self._parser = RedditJSONParser()
         self._owns_client = client is None  # 클라이언트 소유 여부 (cleanup용)
 
@@ -96,14 +106,19 @@ class RedditScraper:
             return f"{base}?{urlencode(params)}"
         return base
 
-    async def _fetch_posts(self, url: str, limit: int) -> list[Post]:
+    async def _fetch_posts(
+        self, url: str, limit: int, since: datetime | None = None
+    ) -> list[Post]:
         """URL에서 게시물 수집.
 
         limit가 100을 초과하면 여러 요청으로 페이지네이션 처리합니다.
+        since가 주어지면 작성 시간 역순 목록(new)으로 간주하여, 그보다 오래된
+        게시물이 나온 페이지에서 수집을 멈춥니다.
 
         Args:
             url: 요청 URL (기본 파라미터 제외)
             limit: 수집할 게시물 수
+            since: 워터마크 시각. 이 시각 이후(포함) 게시물만 수집
 
         Returns:
             Post 모델 리스트
@@ -137,7 +152,18 @@ class RedditScraper:
 
             # 게시물 추출
             new_posts = extract_posts_from_response(response)
-            posts.extend(new_posts)
+
+            # 워터마크 도달 확인
+            if since is not None:
+                fresh = [p for p in new_posts if p.created_utc >= since]
+                posts.extend(fresh)
+                if len(fresh) < len(new_posts):
+                    logger.debug(f"Reached watermark {since.isoformat()}")
+                    break
+                if not new_posts:
+                    break
+            else:
+                posts.extend(new_posts)
 
             # 다음 페이지 토큰 확인
             after = self._parser.get_after_token(response)
@@ -165,18 +191,25 @@ class RedditScraper:
         url = self._build_subreddit_url(subreddit, "hot")
         return await self._fetch_posts(url, limit)
 
-    async def get_new(self, subreddit: str, limit: int = 100) -> list[Post]:
+    async def get_new(
+        self,
+        subreddit: str,
+        limit: int = 100,
+        since: datetime | None = None,
+    ) -> list[Post]:
         """New 게시물 수집.
 
         Args:
             subreddit: 서브레딧 이름
             limit: 수집할 게시물 수 (기본: 100)
+            since: 워터마크 시각. 이 시각 이후(포함) 게시물만 수집하고
+                워터마크에 도달하면 페이지 요청을 멈춤
 
         Returns:
             Post 모델 리스트
         """
         url = self._build_subreddit_url(subreddit, "new")
-        return await self._fetch_posts(url, limit)
+        return await self._fetch_posts(url, limit, since=since)
 
     async def get_top(
         self,
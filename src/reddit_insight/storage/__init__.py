@@ -5,19 +5,39 @@ Reddit 데이터를 영구 저장하고 조회하기 위한 인터페이스.
 """
 
 from reddit_insight.storage.database import Database
-from reddit_insight.storage.models import CommentModel, PostModel, SubredditModel
+from reddit_insight.storage.models import (
+    CollectionWatermarkModel,
+    CommentModel,
+    PostModel,
+    SubredditModel,
+)
 from reddit_insight.storage.repository import (
     CommentRepository,
     PostRepository,
     SubredditRepository,
+    WatermarkRepository,
+)
+from reddit_insight.storage.sqlite_profile import (
+    DEFAULT_PROFILE,
+    PRODUCTION_PROFILE,
+    SQLiteProfile,
+    apply_sqlite_profile,
+    get_profile,
 )
 
 __all__ = [
+    "DEFAULT_PROFILE",
+    "PRODUCTION_PROFILE",
+    "CollectionWatermarkModel",
     "CommentModel",
     "CommentRepository",
     "Database",
     "PostModel",
     "PostRepository",
+    "SQLiteProfile",
     "SubredditModel",
     "SubredditRepository",
+    "WatermarkRepository",
+    "apply_sqlite_profile",
+    "get_profile",
 ]
@@ -267,3 +267,29 @@ class CommentModel(Base, TimestampMixin):
             parent_id=self.parent_reddit_id or "",
             post_id=self.post.reddit_id if self.post else "",
         )
+
+
+class CollectionWatermarkModel(Base, TimestampMixin):
+    """수집 워터마크 ORM 모델.
+
+    서브레딧별로 new 정렬 수집에서 확인한 가장 최신 게시물을 저장한다.
+    증분 수집은 이 시점까지 도달하면 페이지 요청을 멈춘다.
+    """
+
+    __tablename__ = "collection_watermarks"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    subreddit: Mapped[str] = mapped_column(String(64), unique=True, nullable=False, index=True)
+    newest_post_utc: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    newest_post_id: Mapped[str] = mapped_column(String(16), nullable=False)
+
+    def __repr__(self) -> str:
+        return (
+            f"<CollectionWatermarkModel(subreddit={self.subreddit!r}, "
+            f"newest_post_id={self.newest_post_id!r})>"
+        )
+
+    @property
+    def newest_post_fullname(self) -> str:
+        """가장 최신 게시물의 Reddit fullname (t3_ 접두사)."""
+        return f"t3_{self.newest_post_id}"
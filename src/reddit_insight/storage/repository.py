@@ -7,19 +7,58 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime, timedelta
-from typing import TYPE_CHECKING, Generic, TypeVar
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
 from sqlalchemy import select
 from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from reddit_insight.storage.models import CommentModel, PostModel, SubredditModel
+from reddit_insight.storage.models import (
+    CollectionWatermarkModel,
+    CommentModel,
+    PostModel,
+    SubredditModel,
+)
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterable, Iterator
+
+    from sqlalchemy import Row
+
     from reddit_insight.reddit.models import Comment, Post, SubredditInfo
 
 
-ModelT = TypeVar("ModelT", bound=SubredditModel | PostModel | CommentModel)
+ModelT = TypeVar(
+    "ModelT",
+    bound=SubredditModel | PostModel | CommentModel | CollectionWatermarkModel,
+)
+T = TypeVar("T")
+
+# bulk 연산 1회당 최대 행 수 (IN 절 ID 수, upsert executemany 배치 크기).
+# SQLite 바인드 파라미터 한도(SQLITE_MAX_VARIABLE_NUMBER) 안에 머물면서
+# 왕복 횟수를 ceil(n / 500)으로 줄인다.
+DEFAULT_CHUNK_SIZE = 500
+
+# 스트리밍 조회 시 한 번에 가져오는 행 수 (yield_per)
+DEFAULT_STREAM_CHUNK_SIZE = 1_000
+
+
+def chunked(items: Iterable[T], size: int) -> Iterator[list[T]]:
+    """시퀀스를 최대 size 크기의 리스트로 나눈다.
+
+    Args:
+        items: 나눌 항목들
+        size: 청크 크기 (1 이상)
+
+    Yields:
+        최대 size개 항목을 담은 리스트
+    """
+    if size < 1:
+        raise ValueError(f"chunk size must be >= 1, got {size}")
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
 
 
 class BaseRepository(Generic[ModelT]):
@@ -158,6 +197,53 @@ class PostRepository(BaseRepository[PostModel]):
         result = await self._session.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def get_existing_reddit_ids(
+        self,
+        reddit_ids: Iterable[str],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> set[str]:
+        """이미 저장된 Reddit ID 집합 조회.
+
+        ID 목록을 청크 단위 IN 쿼리로 조회하여 게시물 수와 무관하게
+        ceil(n / chunk_size)번의 왕복만 발생한다.
+
+        Args:
+            reddit_ids: 확인할 Reddit 게시물 ID들
+            chunk_size: IN 절 하나에 담을 최대 ID 수
+
+        Returns:
+            데이터베이스에 존재하는 Reddit ID 집합
+        """
+        existing: set[str] = set()
+        for chunk in chunked(dict.fromkeys(reddit_ids), chunk_size):
+            stmt = select(PostModel.reddit_id).where(PostModel.reddit_id.in_(chunk))
+            result = await self._session.execute(stmt)
+            existing.update(result.scalars().all())
+        return existing
+
+    async def get_ids_by_reddit_ids(
+        self,
+        reddit_ids: Iterable[str],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> dict[str, int]:
+        """Reddit ID -> 내부 게시물 ID 매핑 조회.
+
+        Args:
+            reddit_ids: 조회할 Reddit 게시물 ID들
+            chunk_size: IN 절 하나에 담을 최대 ID 수
+
+        Returns:
+            존재하는 게시물의 Reddit ID -> PostModel.id 딕셔너리
+        """
+        ids: dict[str, int] = {}
+        for chunk in chunked(dict.fromkeys(reddit_ids), chunk_size):
+            stmt = select(PostModel.reddit_id, PostModel.id).where(
+                PostModel.reddit_id.in_(chunk)
+            )
+            result = await self._session.execute(stmt)
+            ids.update((reddit_id, post_id) for reddit_id, post_id in result)
+        return ids
+
     async def save(self, post: Post, subreddit_id: int) -> PostModel:
         """단일 게시물 저장.
 
@@ -190,18 +276,23 @@ class PostRepository(BaseRepository[PostModel]):
         self,
         posts: list[Post],
         subreddit_id: int,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        return_models: bool = True,
     ) -> list[PostModel]:
         """여러 게시물 bulk 저장.
 
         SQLite의 ON CONFLICT DO UPDATE를 사용하여 upsert 수행.
-        중복 게시물은 업데이트된다.
+        중복 게시물은 업데이트된다. 바인드 파라미터 한도를 넘지 않도록
+        chunk_size 행 단위로 나누어 실행한다.
 
         Args:
             posts: Post Pydantic 모델 목록
             subreddit_id: 연결할 서브레딧 ID
+            chunk_size: INSERT 문 하나에 담을 최대 행 수
+            return_models: False이면 저장 후 재조회를 생략하고 빈 목록 반환
 
         Returns:
-            저장된 PostModel 목록
+            저장된 PostModel 목록 (return_models=False이면 빈 목록)
         """
         if not posts:
             return []
@@ -228,7 +319,8 @@ class PostRepository(BaseRepository[PostModel]):
         ]
 
         # SQLite INSERT ... ON CONFLICT DO UPDATE
-        stmt = sqlite_insert(PostModel).values(values)
+        # 문장을 한 번만 컴파일하고 청크별 executemany로 실행한다
+        stmt = sqlite_insert(PostModel)
         stmt = stmt.on_conflict_do_update(
             index_elements=["reddit_id"],
             set_={
@@ -238,14 +330,96 @@ class PostRepository(BaseRepository[PostModel]):
                 "updated_at": stmt.excluded.updated_at,
             },
         )
-        await self._session.execute(stmt)
+        for chunk in chunked(values, chunk_size):
+            await self._session.execute(stmt, chunk)
         await self._session.flush()
 
+        if not return_models:
+            return []
+
         # 저장된 레코드 조회하여 반환
-        reddit_ids = [post.id for post in posts]
-        select_stmt = select(PostModel).where(PostModel.reddit_id.in_(reddit_ids))
-        result = await self._session.execute(select_stmt)
-        return list(result.scalars().all())
+        models: list[PostModel] = []
+        for id_chunk in chunked(dict.fromkeys(post.id for post in posts), chunk_size):
+            select_stmt = select(PostModel).where(PostModel.reddit_id.in_(id_chunk))
+            result = await self._session.execute(select_stmt)
+            models.extend(result.scalars().all())
+        return models
+
+    # 분석에 필요한 컬럼만 조회 (ORM 객체/identity map 생성 없음)
+    _STREAM_COLUMNS = (
+        PostModel.reddit_id,
+        PostModel.title,
+        PostModel.selftext,
+        PostModel.author,
+        PostModel.score,
+        PostModel.num_comments,
+        PostModel.reddit_created_utc,
+        PostModel.url,
+        PostModel.permalink,
+        PostModel.is_self,
+    )
+
+    async def stream_by_subreddit(
+        self,
+        subreddit_id: int,
+        subreddit_name: str = "",
+        limit: int | None = None,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+    ) -> AsyncIterator[list[Post]]:
+        """서브레딧 게시물을 청크 단위로 스트리밍.
+
+        서버 측 커서(yield_per)로 chunk_size 행씩 가져와 Pydantic Post로 변환한다.
+        필요한 컬럼만 조회하고 ORM 객체를 만들지 않으므로, 코퍼스 크기와 무관하게
+        한 번에 메모리에 올라가는 행은 한 청크뿐이다.
+
+        Args:
+            subreddit_id: 서브레딧 ID
+            subreddit_name: Post.subreddit에 채울 서브레딧 이름
+            limit: 최대 조회 개수 (None이면 전체)
+            chunk_size: 청크당 게시물 수
+
+        Yields:
+            최대 chunk_size개 Post 목록 (최신순 정렬)
+
+        Example:
+            >>> async for chunk in repo.stream_by_subreddit(sub.id, sub.name):
+            ...     counter.update(word for post in chunk for word in post.title.split())
+        """
+        if chunk_size < 1:
+            raise ValueError(f"chunk size must be >= 1, got {chunk_size}")
+
+        from reddit_insight.reddit.models import Post
+
+        stmt = (
+            select(*self._STREAM_COLUMNS)
+            .where(PostModel.subreddit_id == subreddit_id)
+            .order_by(PostModel.reddit_created_utc.desc())
+            .execution_options(yield_per=chunk_size)
+        )
+        if limit is not None:
+            stmt = stmt.limit(limit)
+
+        def to_post(row: Row[*tuple[Any, ...]]) -> Post:
+            return Post(
+                id=row.reddit_id,
+                title=row.title,
+                selftext=row.selftext or "",
+                author=row.author,
+                subreddit=subreddit_name,
+                score=row.score,
+                num_comments=row.num_comments,
+                created_utc=row.reddit_created_utc,
+                url=row.url,
+                permalink=row.permalink,
+                is_self=row.is_self,
+            )
+
+        result = await self._session.stream(stmt)
+        try:
+            async for partition in result.partitions():
+                yield [to_post(row) for row in partition]
+        finally:
+            await result.close()
 
     async def get_by_subreddit(
         self,
@@ -314,6 +488,27 @@ class CommentRepository(BaseRepository[CommentModel]):
         result = await self._session.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def get_existing_reddit_ids(
+        self,
+        reddit_ids: Iterable[str],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> set[str]:
+        """이미 저장된 Reddit ID 집합 조회.
+
+        Args:
+            reddit_ids: 확인할 Reddit 댓글 ID들
+            chunk_size: IN 절 하나에 담을 최대 ID 수
+
+        Returns:
+            데이터베이스에 존재하는 Reddit ID 집합
+        """
+        existing: set[str] = set()
+        for chunk in chunked(dict.fromkeys(reddit_ids), chunk_size):
+            stmt = select(CommentModel.reddit_id).where(CommentModel.reddit_id.in_(chunk))
+            result = await self._session.execute(stmt)
+            existing.update(result.scalars().all())
+        return existing
+
     async def save(self, comment: Comment, post_id: int) -> CommentModel:
         """단일 댓글 저장.
 
@@ -345,17 +540,22 @@ class CommentRepository(BaseRepository[CommentModel]):
         self,
         comments: list[Comment],
         post_id: int,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        return_models: bool = True,
     ) -> list[CommentModel]:
         """여러 댓글 bulk 저장.
 
         SQLite의 ON CONFLICT DO UPDATE를 사용하여 upsert 수행.
+        chunk_size 행 단위로 나누어 실행한다.
 
         Args:
             comments: Comment Pydantic 모델 목록
             post_id: 연결할 게시물 ID
+            chunk_size: INSERT 문 하나에 담을 최대 행 수
+            return_models: False이면 저장 후 재조회를 생략하고 빈 목록 반환
 
         Returns:
-            저장된 CommentModel 목록
+            저장된 CommentModel 목록 (return_models=False이면 빈 목록)
         """
         if not comments:
             return []
@@ -378,7 +578,8 @@ class CommentRepository(BaseRepository[CommentModel]):
         ]
 
         # SQLite INSERT ... ON CONFLICT DO UPDATE
-        stmt = sqlite_insert(CommentModel).values(values)
+        # 문장을 한 번만 컴파일하고 청크별 executemany로 실행한다
+        stmt = sqlite_insert(CommentModel)
         stmt = stmt.on_conflict_do_update(
             index_elements=["reddit_id"],
             set_={
@@ -387,16 +588,20 @@ class CommentRepository(BaseRepository[CommentModel]):
                 "updated_at": stmt.excluded.updated_at,
             },
         )
-        await self._session.execute(stmt)
+        for chunk in chunked(values, chunk_size):
+            await self._session.execute(stmt, chunk)
         await self._session.flush()
 
+        if not return_models:
+            return []
+
         # 저장된 레코드 조회하여 반환
-        reddit_ids = [comment.id for comment in comments]
-        select_stmt = select(CommentModel).where(
-            CommentModel.reddit_id.in_(reddit_ids)
-        )
-        result = await self._session.execute(select_stmt)
-        return list(result.scalars().all())
+        models: list[CommentModel] = []
+        for id_chunk in chunked(dict.fromkeys(c.id for c in comments), chunk_size):
+            select_stmt = select(CommentModel).where(CommentModel.reddit_id.in_(id_chunk))
+            result = await self._session.execute(select_stmt)
+            models.extend(result.scalars().all())
+        return models
 
     async def get_by_post(self, post_id: int) -> list[CommentModel]:
         """게시물의 모든 댓글 조회.
@@ -414,3 +619,78 @@ class CommentRepository(BaseRepository[CommentModel]):
         )
         result = await self._session.execute(stmt)
         return list(result.scalars().all())
+
+
+class WatermarkRepository(BaseRepository[CollectionWatermarkModel]):
+    """수집 워터마크 Repository.
+
+    서브레딧별 증분 수집 기준점을 조회하고 전진시킨다.
+    """
+
+    async def get(self, subreddit: str) -> CollectionWatermarkModel | None:
+        """서브레딧 워터마크 조회.
+
+        Args:
+            subreddit: 서브레딧 이름 (대소문자 무관)
+
+        Returns:
+            CollectionWatermarkModel 또는 None (아직 수집 이력이 없는 경우)
+        """
+        stmt = select(CollectionWatermarkModel).where(
+            CollectionWatermarkModel.subreddit == subreddit.lower()
+        )
+        result = await self._session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def get_newest_utc(self, subreddit: str) -> datetime | None:
+        """워터마크 시각 조회 (UTC, timezone-aware).
+
+        Args:
+            subreddit: 서브레딧 이름
+
+        Returns:
+            가장 최신 게시물 작성 시각 또는 None
+        """
+        watermark = await self.get(subreddit)
+        if watermark is None:
+            return None
+        newest = watermark.newest_post_utc
+        # SQLite는 타임존을 저장하지 않으므로 UTC로 복원한다
+        return newest if newest.tzinfo is not None else newest.replace(tzinfo=UTC)
+
+    async def advance(
+        self, subreddit: str, posts: Iterable[Post]
+    ) -> CollectionWatermarkModel | None:
+        """수집된 게시물로 워터마크를 전진.
+
+        워터마크는 앞으로만 이동한다. 더 오래된 게시물로는 갱신하지 않는다.
+
+        Args:
+            subreddit: 서브레딧 이름
+            posts: 이번 수집에서 저장한 게시물
+
+        Returns:
+            갱신된(또는 기존) 워터마크. 게시물도 기존 워터마크도 없으면 None
+        """
+        newest = max(posts, key=lambda p: p.created_utc, default=None)
+        watermark = await self.get(subreddit)
+        if newest is None:
+            return watermark
+
+        if watermark is None:
+            watermark = CollectionWatermarkModel(
+                subreddit=subreddit.lower(),
+                newest_post_utc=newest.created_utc,
+                newest_post_id=newest.id,
+            )
+            self._session.add(watermark)
+        else:
+            current = watermark.newest_post_utc
+            if current.tzinfo is None:
+                current = current.replace(tzinfo=UTC)
+            if newest.created_utc > current:
+                watermark.newest_post_utc = newest.created_utc
+                watermark.newest_post_id = newest.id
+
+        await self._session.flush()
+        return watermark
@@ -0,0 +1,143 @@
+"""SQLite 연결 프로파일.
+
+SQLite 연결마다 적용할 PRAGMA 묶음을 정의하고 SQLAlchemy connect 이벤트로 적용한다.
+동기 엔진(dashboard)과 비동기 엔진(storage) 모두에서 같은 프로파일을 사용한다.
+
+production 프로파일은 WAL 저널을 사용하므로 수집 작업이 쓰는 동안에도
+대시보드 읽기가 차단되지 않는다.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Literal
+
+from sqlalchemy import event
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Engine
+
+ProfileName = Literal["default", "production"]
+
+
+@dataclass(frozen=True)
+class SQLiteProfile:
+    """SQLite PRAGMA 설정 묶음.
+
+    None인 항목은 SQLite 기본값을 그대로 둔다.
+
+    Attributes:
+        name: 프로파일 이름
+        journal_mode: 저널 모드 (WAL, DELETE 등)
+        synchronous: 동기화 수준 (FULL, NORMAL, OFF)
+        busy_timeout_ms: 잠금 대기 시간 (밀리초)
+        cache_size_kib: 연결당 페이지 캐시 크기 (KiB)
+        mmap_size_bytes: 메모리 맵 I/O 크기 (바이트)
+        temp_store: 임시 테이블 저장 위치 (MEMORY, FILE)
+    """
+
+    name: str
+    journal_mode: str | None = None
+    synchronous: str | None = None
+    busy_timeout_ms: int | None = None
+    cache_size_kib: int | None = None
+    mmap_size_bytes: int | None = None
+    temp_store: str | None = None
+
+    def pragmas(self, read_only: bool = False) -> list[str]:
+        """연결 시 실행할 PRAGMA 문 목록.
+
+        Args:
+            read_only: True이면 query_only를 켜서 쓰기를 거부하는 연결로 만든다
+
+        Returns:
+            PRAGMA SQL 문 목록
+        """
+        statements: list[str] = []
+        # journal_mode는 데이터베이스 파일에 기록되므로 쓰기 연결에서만 바꾼다
+        if self.journal_mode is not None and not read_only:
+            statements.append(f"PRAGMA journal_mode={self.journal_mode}")
+        if self.synchronous is not None:
+            statements.append(f"PRAGMA synchronous={self.synchronous}")
+        if self.busy_timeout_ms is not None:
+            statements.append(f"PRAGMA busy_timeout={self.busy_timeout_ms}")
+        if self.cache_size_kib is not None:
+            # 음수 값은 페이지 수가 아닌 KiB 단위를 의미한다
+            statements.append(f"PRAGMA cache_size=-{self.cache_size_kib}")
+        if self.mmap_size_bytes is not None:
+            statements.append(f"PRAGMA mmap_size={self.mmap_size_bytes}")
+        if self.temp_store is not None:
+            statements.append(f"PRAGMA temp_store={self.temp_store}")
+        if read_only:
+            statements.append("PRAGMA query_only=ON")
+        return statements
+
+
+DEFAULT_PROFILE = SQLiteProfile(name="default")
+
+PRODUCTION_PROFILE = SQLiteProfile(
+    name="production",
+    journal_mode="WAL",
+    synchronous="NORMAL",
+    busy_timeout_ms=5_000,
+    cache_size_kib=64 * 1024,
+    mmap_size_bytes=256 * 1024 * 1024,
+    temp_store="MEMORY",
+)
+
+PROFILES: dict[str, SQLiteProfile] = {
+    DEFAULT_PROFILE.name: DEFAULT_PROFILE,
+    PRODUCTION_PROFILE.name: PRODUCTION_PROFILE,
+}
+
+
+def get_profile(name: str) -> SQLiteProfile:
+    """이름으로 프로파일 조회.
+
+    Args:
+        name: 프로파일 이름 (default, production)
+
+    Returns:
+        SQLiteProfile 인스턴스
+
+    Raises:
+        ValueError: 알 수 없는 프로파일 이름
+    """
+    try:
+        return PROFILES[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown SQLite profile: {name!r} (choose from {sorted(PROFILES)})"
+        ) from None
+
+
+def apply_sqlite_profile(
+    engine: Engine,
+    profile: SQLiteProfile,
+    read_only: bool = False,
+) -> None:
+    """엔진의 모든 새 연결에 프로파일 PRAGMA를 적용하도록 등록.
+
+    SQLite가 아닌 엔진에는 아무것도 하지 않는다. 비동기 엔진은
+    ``async_engine.sync_engine``을 넘긴다.
+
+    Args:
+        engine: SQLAlchemy 동기 Engine
+        profile: 적용할 프로파일
+        read_only: True이면 query_only 연결로 만든다
+    """
+    if engine.dialect.name != "sqlite":
+        return
+
+    statements = profile.pragmas(read_only=read_only)
+    if not statements:
+        return
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for statement in statements:
+                cursor.execute(statement)
+        finally:
+            cursor.close()
@@ -7,14 +7,17 @@ automatic method selection, and integration with RisingKeywordDetector.
 
 from datetime import UTC, datetime, timedelta
 
+import numpy as np
 import pytest
 
 from reddit_insight.analysis.ml.anomaly_detector import (
     AnomalyDetector,
     AnomalyDetectorConfig,
+    _rolling_percentiles,
+    _zscore_matrix,
     detect_anomalies_simple,
 )
-from reddit_insight.analysis.ml.models import AnomalyPoint, AnomalyResult
+from reddit_insight.analysis.ml.models import AnomalyMatrixResult, AnomalyPoint, AnomalyResult
 from reddit_insight.analysis.time_series import TimeGranularity, TimePoint, TimeSeries
 
 
@@ -446,3 +449,169 @@ class TestAnalyzeMethod:
         assert result.metadata.data_size == 20
         assert result.metadata.processing_time_ms >= 0
         assert result.metadata.analyzer_name == "AnomalyDetector"
+
+
+def _naive_rolling_zscore(values: np.ndarray, window: int) -> tuple[np.ndarray, np.ndarray]:
+    """Reference per-point rolling z-score (O(n x w))."""
+    half = window // 2
+    scores = np.zeros(len(values))
+    means = np.zeros(len(values))
+    for i in range(len(values)):
+        chunk = values[max(0, i - half) : min(len(values), i + half + 1)]
+        means[i] = chunk.mean()
+        std = chunk.std()
+        scores[i] = abs(values[i] - means[i]) / std if std > 0 else 0.0
+    return scores, means
+
+
+def _naive_rolling_quartiles(values: np.ndarray, window: int) -> tuple[np.ndarray, np.ndarray]:
+    """Reference per-point rolling Q1/Q3."""
+    half = window // 2
+    q1 = np.zeros(len(values))
+    q3 = np.zeros(len(values))
+    for i in range(len(values)):
+        chunk = values[max(0, i - half) : min(len(values), i + half + 1)]
+        q1[i], q3[i] = np.percentile(chunk, [25, 75])
+    return q1, q3
+
+
+class TestRollingStatistics:
+    """Tests for the vectorized rolling statistics."""
+
+    @pytest.mark.parametrize("window", [3, 4, 7, 15])
+    def test_rolling_zscore_matches_naive(self, window: int) -> None:
+        """Cumulative-sum rolling z-score matches the per-window computation."""
+        rng = np.random.default_rng(0)
+        values = rng.normal(1000.0, 5.0, size=60)
+        values[[10, 30]] += 80.0
+        scores, flags, expected, _ = _zscore_matrix(values[None, :], 2.0, window)
+
+        ref_scores, ref_means = _naive_rolling_zscore(values, window)
+        np.testing.assert_allclose(scores[0], ref_scores, rtol=1e-6, atol=1e-9)
+        np.testing.assert_allclose(expected[0], ref_means, rtol=1e-12)
+        assert flags[0].tolist() == (ref_scores > 2.0).tolist()
+
+    def test_rolling_zscore_constant_windows(self) -> None:
+        """Constant windows get an exact zero score despite float cancellation."""
+        values = np.array([[1e9 + 0.1] * 10 + [5.0] + [1e9 + 0.1] * 10])
+        scores, flags, expected, _ = _zscore_matrix(values, 3.0, 3)
+
+        assert scores[0, :9].tolist() == [0.0] * 9
+        assert scores[0, 12:].tolist() == [0.0] * 9
+        assert expected[0, 0] == values[0, 0]
+        assert not flags[0, 0]
+
+    @pytest.mark.parametrize("window", [3, 5, 8])
+    def test_rolling_iqr_matches_naive(self, window: int) -> None:
+        """Sliding-window quartiles match the per-window computation."""
+        rng = np.random.default_rng(1)
+        values = rng.normal(50.0, 3.0, size=40)
+        values[20] = 200.0
+        q1, q3, _ = _rolling_percentiles(values[None, :], window, (25, 75, 50))
+
+        ref_q1, ref_q3 = _naive_rolling_quartiles(values, window)
+        np.testing.assert_allclose(q1[0], ref_q1)
+        np.testing.assert_allclose(q3[0], ref_q3)
+
+    def test_rolling_iqr_window_flags_spike(self) -> None:
+        """IQR honours window_size and flags a local spike."""
+        values = [float(i) for i in range(40)]
+        values[20] = 60.0
+        now = datetime.now(UTC)
+        series = TimeSeries(
+            keyword="trend",
+            granularity=TimeGranularity.HOUR,
+            points=[
+                TimePoint(timestamp=now + timedelta(hours=i), value=v)
+                for i, v in enumerate(values)
+            ],
+        )
+        detector = AnomalyDetector(AnomalyDetectorConfig(method="iqr", window_size=7))
+        result = detector.detect(series)
+
+        flagged = [i for i, ap in enumerate(result.anomalies) if ap.is_anomaly]
+        assert flagged == [20]
+
+
+class TestDetectMany:
+    """Tests for multi-series detection."""
+
+    @pytest.mark.parametrize(
+        ("method", "window"),
+        [("zscore", 0), ("zscore", 5), ("iqr", 0), ("iqr", 5)],
+    )
+    def test_detect_many_matches_detect(self, method: str, window: int) -> None:
+        """Each matrix row gives the same result as single-series detect."""
+        rng = np.random.default_rng(2)
+        matrix = rng.poisson(100, size=(8, 30)).astype(float)
+        matrix[3, 12] = 600.0
+        matrix[5] = 42.0
+        config = AnomalyDetectorConfig(method=method, threshold=1.8, window_size=window)
+        detector = AnomalyDetector(config)
+
+        result = detector.detect_many(matrix)
+
+        assert isinstance(result, AnomalyMatrixResult)
+        assert result.method == method
+        now = datetime.now(UTC)
+        for row in range(matrix.shape[0]):
+            series = TimeSeries(
+                keyword=f"k{row}",
+                granularity=TimeGranularity.DAY,
+                points=[
+                    TimePoint(timestamp=now + timedelta(days=i), value=float(v))
+                    for i, v in enumerate(matrix[row])
+                ],
+            )
+            single = detector.detect(series)
+            assert result.is_anomaly[row].tolist() == [a.is_anomaly for a in single.anomalies]
+            np.testing.assert_allclose(
+                result.scores[row], [a.anomaly_score for a in single.anomalies]
+            )
+        assert 3 in result.anomalous_rows()
+        assert result.anomaly_counts[5] == 0
+
+    def test_detect_many_insufficient_data(self) -> None:
+        """Too few time buckets yields an empty result."""
+        detector = AnomalyDetector(AnomalyDetectorConfig(min_data_points=10))
+        result = detector.detect_many(np.ones((3, 5)))
+
+        assert result.method == "insufficient_data"
+        assert not result.is_anomaly.any()
+
+    def test_detect_many_auto_and_isolation_forest(self) -> None:
+        """Auto selection uses the series length; isolation forest runs per row."""
+        pytest.importorskip("sklearn")
+        rng = np.random.default_rng(4)
+        matrix = rng.normal(10.0, 1.0, size=(3, 120))
+        matrix[1, 60] = 40.0
+        result = AnomalyDetector(AnomalyDetectorConfig(method="auto")).detect_many(matrix)
+
+        assert result.method == "isolation_forest"
+        assert result.is_anomaly[1, 60]
+
+    @pytest.mark.parametrize("method", ["auto", "zscore", "iqr"])
+    def test_detect_many_zero_rows(self, method: str) -> None:
+        """A matrix without series yields empty results instead of failing."""
+        result = AnomalyDetector(AnomalyDetectorConfig(method=method)).detect_many(
+            np.empty((0, 40))
+        )
+
+        assert result.method == ("iqr" if method == "auto" else method)
+        assert result.is_anomaly.shape == (0, 40)
+        assert result.anomalous_rows() == []
+
+    def test_detect_many_rejects_1d(self) -> None:
+        """A 1-D input is rejected."""
+        with pytest.raises(ValueError, match="2-D"):
+            AnomalyDetector().detect_many(np.ones(20))
+
+    def test_to_dict(self) -> None:
+        """Matrix result serializes to plain lists."""
+        result = AnomalyDetector(AnomalyDetectorConfig(method="zscore")).detect_many(
+            np.ones((2, 12))
+        )
+        data = result.to_dict()
+
+        assert data["anomaly_counts"] == [0, 0]
+        assert len(data["scores"]) == 2
@@ -4,6 +4,9 @@ Tests for topic modeling and text clustering.
 Tests TopicModeler (LDA/NMF) and TextClusterer (K-means/Agglomerative).
 """
 
+import random
+
+import numpy as np
 import pytest
 
 from reddit_insight.analysis.ml.models import (
@@ -189,6 +192,70 @@ class TestTopicResultStructure:
         assert abs(sum(p for _, p in topics) - 1.0) < 0.01
 
 
+class TestTopicCoherence:
+    """Tests for sparse co-occurrence coherence."""
+
+    @staticmethod
+    def _pair_counts(modeler: TopicModeler, topic: Topic) -> list[tuple[int, int, int]]:
+        """Dense reference counts (both, first, second) per keyword pair."""
+        occurrence = (modeler._tfidf_matrix > 0).toarray()
+        index = {name: i for i, name in enumerate(modeler._feature_names)}
+        cols = [index[kw] for kw in topic.keywords if kw in index]
+        return [
+            (
+                int(np.sum(occurrence[:, a] & occurrence[:, b])),
+                int(np.sum(occurrence[:, a])),
+                int(np.sum(occurrence[:, b])),
+            )
+            for i, a in enumerate(cols)
+            for b in cols[i + 1 :]
+        ]
+
+    def test_umass_matches_dense_reference(self, sample_texts: list[str]) -> None:
+        """Sparse UMass equals the pairwise dense computation."""
+        modeler = TopicModeler(TopicModelerConfig(n_topics=2, min_df=1))
+        result = modeler.fit_transform(sample_texts)
+
+        expected = []
+        for topic in result.topics:
+            pairs = self._pair_counts(modeler, topic)
+            scores = [np.log((both + 1) / first) for both, first, _ in pairs if first > 0]
+            expected.append(np.mean(scores))
+            assert topic.coherence == pytest.approx(expected[-1])
+        assert result.coherence_score == pytest.approx(np.mean(expected))
+        assert result.parameters["coherence_measure"] == "umass"
+
+    def test_npmi_matches_dense_reference(self, sample_texts: list[str]) -> None:
+        """NPMI equals the pairwise definition and stays in [-1, 1]."""
+        config = TopicModelerConfig(n_topics=2, min_df=1, coherence_measure="npmi")
+        modeler = TopicModeler(config)
+        result = modeler.fit_transform(sample_texts)
+        n = len(sample_texts)
+
+        for topic in result.topics:
+            scores = []
+            for both, first, second in self._pair_counts(modeler, topic):
+                if both == 0:
+                    scores.append(-1.0)
+                elif both == n:
+                    scores.append(1.0)
+                else:
+                    p_both = both / n
+                    pmi = np.log(p_both / ((first / n) * (second / n)))
+                    scores.append(pmi / -np.log(p_both))
+            assert topic.coherence == pytest.approx(np.mean(scores))
+            assert -1.0 <= topic.coherence <= 1.0
+
+    def test_document_distribution_rows_sum_to_one(self, sample_texts: list[str]) -> None:
+        """Vectorized normalization yields probability rows."""
+        result = TopicModeler(TopicModelerConfig(n_topics=2, min_df=1)).fit_transform(
+            sample_texts
+        )
+
+        for row in result.document_topic_distribution:
+            assert sum(row) == pytest.approx(1.0)
+
+
 # TextClusterer Tests
 class TestTextClustererKMeans:
     """Tests for K-means clustering."""
@@ -321,6 +388,89 @@ class TestClusterResultStructure:
         assert 0 <= cluster_id < 2
 
 
+class TestScalableClustering:
+    """Tests for the sparse MiniBatchKMeans path used on large corpora."""
+
+    @pytest.fixture
+    def corpus(self, sample_texts: list[str]) -> list[str]:
+        """Repeat the sample texts with suffixes so the corpus is larger."""
+        return [f"{text} {i % 7}" for i in range(12) for text in sample_texts]
+
+    @pytest.mark.parametrize("svd_components", [5, None])
+    def test_scalable_path_clusters(
+        self, corpus: list[str], svd_components: int | None
+    ) -> None:
+        """Large corpora use MiniBatchKMeans with or without SVD reduction."""
+        config = TextClustererConfig(
+            max_clusters=5, large_corpus_threshold=50, svd_components=svd_components
+        )
+        clusterer = TextClusterer(config)
+        result = clusterer.cluster(corpus)
+
+        assert result.parameters["scalable"] is True
+        assert result.parameters["svd_components"] == svd_components
+        assert 2 <= result.n_clusters <= 5
+        assert len(result.labels) == len(corpus)
+        assert result.inertia is not None
+        assert -1.0 <= result.silhouette_score <= 1.0
+        assert 0 <= clusterer.assign_cluster("task management software") < result.n_clusters
+
+    @pytest.mark.parametrize("seed", [3, 8])
+    def test_scalable_path_recovers_planted_k(self, seed: int) -> None:
+        """Automatic k on the scalable path finds the planted topic count."""
+        rng = random.Random(seed)
+        topics = [
+            "deploy docker kubernetes container cluster helm",
+            "login auth token password session oauth",
+            "slow memory leak crash freeze performance",
+            "pricing plan subscription billing refund invoice",
+        ]
+        topic_words = [topic.split() for topic in topics]
+        common = [
+            "need", "help", "with", "this", "issue", "today",
+            "anyone", "know", "how", "to", "fix", "it",
+        ]
+        corpus = [
+            " ".join(
+                rng.choice(topic_words[i % 4]) if rng.random() < 0.6 else rng.choice(common)
+                for _ in range(12)
+            )
+            for i in range(3000)
+        ]
+
+        config = TextClustererConfig(max_clusters=8, large_corpus_threshold=1)
+        result = TextClusterer(config).cluster(corpus)
+
+        assert result.parameters["scalable"] is True
+        assert result.n_clusters == 4
+
+    def test_scalable_path_fixed_k(self, corpus: list[str]) -> None:
+        """An explicit n_clusters skips the k search."""
+        config = TextClustererConfig(n_clusters=3, large_corpus_threshold=50)
+        result = TextClusterer(config).cluster(corpus)
+
+        assert result.n_clusters == 3
+        assert sum(cluster.size for cluster in result.clusters) == len(corpus)
+
+    def test_small_corpus_keeps_exact_path(self, sample_texts: list[str]) -> None:
+        """Corpora below the threshold keep full KMeans and silhouette."""
+        result = TextClusterer(TextClustererConfig(n_clusters=2)).cluster(sample_texts)
+
+        assert result.parameters["scalable"] is False
+
+    def test_cluster_means_match_dense(self, corpus: list[str]) -> None:
+        """Sparse cluster means equal dense per-cluster means."""
+        clusterer = TextClusterer(TextClustererConfig(n_clusters=3))
+        result = clusterer.cluster(corpus)
+        dense = clusterer._tfidf_matrix.toarray()
+        labels = np.array(result.labels)
+
+        centroids = clusterer._get_cluster_centroids(clusterer._tfidf_matrix, labels)
+
+        for cluster_id, centroid in centroids.items():
+            np.testing.assert_allclose(centroid, dense[labels == cluster_id].mean(axis=0))
+
+
 # Empty Input Handling Tests
 class TestEmptyInputHandling:
     """Tests for handling empty or invalid inputs."""
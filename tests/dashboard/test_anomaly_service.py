@@ -280,6 +280,42 @@ class TestAnomalyService:
         assert "python" in keywords
         assert "javascript" in keywords
 
+    def test_detect_anomalies_many_matches_single(
+        self, anomaly_service: AnomalyService, mock_trend_service
+    ):
+        """detect_anomalies_many()가 키워드별 단건 탐지와 같은 결과를 반환한다."""
+        # When
+        views = anomaly_service.detect_anomalies_many(
+            ["python", "rust", "python"], days=15, method="zscore"
+        )
+        single = anomaly_service.detect_anomalies("python", days=15, method="zscore")
+
+        # Then
+        assert list(views) == ["python", "rust"]
+        for view in views.values():
+            assert view.is_anomaly == single.is_anomaly
+            assert view.anomaly_count == single.anomaly_count
+            assert [p.date for p in view.anomaly_points] == [
+                p.date for p in single.anomaly_points
+            ]
+            assert view.method == "zscore"
+
+    def test_detect_anomalies_many_insufficient_data(self, mock_trend_service):
+        """데이터가 부족한 키워드는 빈 결과를 반환한다."""
+        # Given
+        today = date.today()
+        mock_trend_service.get_keyword_timeline.return_value = [
+            TimelinePoint(date=today - timedelta(days=i), count=100) for i in range(5)
+        ]
+        service = AnomalyService(trend_service=mock_trend_service)
+
+        # When
+        views = service.detect_anomalies_many(["python"])
+
+        # Then
+        assert views["python"].anomaly_count == 0
+        assert views["python"].total_points == 5
+
 
 # =============================================================================
 # SINGLETON TESTS
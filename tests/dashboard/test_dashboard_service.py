@@ -0,0 +1,106 @@
+"""DashboardService 단위 테스트."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+from reddit_insight.dashboard.data_store import AnalysisData
+from reddit_insight.dashboard.services_module import DashboardService
+from reddit_insight.reddit.models import Post, SubredditInfo
+from reddit_insight.storage.database import Database
+from reddit_insight.storage.repository import PostRepository, SubredditRepository
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+CREATED = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+async def _seed(database_url: str, count: int) -> None:
+    async with Database(database_url) as db, db.session() as session:
+        subreddit = await SubredditRepository(session).get_or_create(
+            SubredditInfo(name="python", display_name="Python", created_utc=CREATED)
+        )
+        posts = [
+            Post(
+                id=f"post{i}",
+                title=f"Post {i}",
+                selftext="body",
+                author="tester",
+                subreddit="python",
+                score=i,
+                num_comments=i,
+                created_utc=CREATED,
+                url=f"https://reddit.com/r/python/comments/post{i}/",
+                permalink=f"/r/python/comments/post{i}/",
+                is_self=True,
+            )
+            for i in range(count)
+        ]
+        await PostRepository(session).save_many(posts, subreddit.id)
+        await session.commit()
+
+
+class TestGetAnalysisBySubreddit:
+    """get_analysis_by_subreddit 테스트."""
+
+    @pytest.fixture
+    def database_url(self, tmp_path: Path) -> str:
+        return f"sqlite+aiosqlite:///{tmp_path / 'posts.db'}"
+
+    @pytest.fixture(autouse=True)
+    def analysis(self):
+        data = AnalysisData(subreddit="python", analyzed_at=CREATED.isoformat(), post_count=3)
+        with patch("reddit_insight.dashboard.services_module.get_current_data", return_value=data):
+            yield data
+
+    @pytest.mark.asyncio
+    async def test_returns_analysis_with_posts(self, database_url: str) -> None:
+        """분석 필드와 최신 게시물을 함께 반환한다."""
+        await _seed(database_url, 3)
+        service = DashboardService(database_url=database_url)
+
+        result = await service.get_analysis_by_subreddit("Python", post_limit=2)
+        await service.aclose()
+
+        assert result is not None
+        assert result["post_count"] == 3
+        assert len(result["raw_data"]["posts"]) == 2
+        assert {"title", "body", "score", "num_comments"} <= result["raw_data"]["posts"][0].keys()
+
+    @pytest.mark.asyncio
+    async def test_reuses_connection_without_ddl(self, database_url: str) -> None:
+        """조회마다 엔진을 만들거나 테이블 생성을 실행하지 않는다."""
+        await _seed(database_url, 1)
+        service = DashboardService(database_url=database_url)
+
+        with patch.object(Database, "create_tables") as create_tables:
+            await service.get_analysis_by_subreddit("python")
+            engine = service._database.engine
+            await service.get_analysis_by_subreddit("python")
+
+        assert service._database.engine is engine
+        create_tables.assert_not_called()
+        await service.aclose()
+
+    @pytest.mark.asyncio
+    async def test_missing_tables_yield_no_posts(self, database_url: str) -> None:
+        """수집 데이터베이스가 비어 있으면 게시물 없이 분석 결과를 반환한다."""
+        service = DashboardService(database_url=database_url)
+
+        result = await service.get_analysis_by_subreddit("python")
+        await service.aclose()
+
+        assert result is not None
+        assert result["raw_data"]["posts"] == []
+
+    @pytest.mark.asyncio
+    async def test_other_subreddit_returns_none(self, database_url: str) -> None:
+        """다른 서브레딧의 분석 결과는 반환하지 않는다."""
+        service = DashboardService(database_url=database_url)
+
+        assert await service.get_analysis_by_subreddit("rust") is None
@@ -5,8 +5,12 @@ Mock을 사용하여 실제 API 호출 없이 LLMService를 테스트한다.
 
 from __future__ import annotations
 
+import asyncio
+import sqlite3
+
 import pytest
 from dataclasses import asdict
+from typing import TYPE_CHECKING, Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from reddit_insight.dashboard.services.llm_service import (
@@ -15,18 +19,25 @@ from reddit_insight.dashboard.services.llm_service import (
     LLMCategoryView,
     LLMSentimentView,
     LLMInsightView,
+    close_llm_service,
     get_llm_service,
     reset_llm_service,
 )
 from reddit_insight.dashboard.services.cache_service import CacheService
+from reddit_insight.llm.cache import SQLiteLLMCache, make_cache_key
 from reddit_insight.llm import (
+    ClaudeClient,
     LLMAnalyzer,
+    LLMError,
     CategoryResult,
     DeepSentimentResult,
     SentimentAspect,
     Insight,
 )
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
 
 @pytest.fixture
 def mock_analyzer() -> MagicMock:
@@ -146,6 +157,57 @@ class TestGetSummary:
         assert mock_analyzer.summarize_posts.call_count == 2
 
 
+async def _stream(*chunks: str) -> Any:
+    for chunk in chunks:
+        yield chunk
+
+
+class TestStreamSummary:
+    """stream_summary 메서드 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_stream_forwards_chunks_and_caches(
+        self, service: LLMService, mock_analyzer: MagicMock
+    ) -> None:
+        """조각을 그대로 전달하고 완료 후 get_summary 캐시에 저장한다."""
+        mock_analyzer.stream_summary = MagicMock(return_value=_stream("### 주요", " 주제"))
+        posts = [{"title": "Post 1"}, {"title": "Post 2"}]
+
+        chunks = [chunk async for chunk in service.stream_summary("python", posts)]
+        result = await service.get_summary("python", posts)
+
+        assert chunks == ["### 주요", " 주제"]
+        assert result.cached is True
+        assert result.summary == "### 주요 주제"
+        assert result.post_count == 2
+        mock_analyzer.summarize_posts.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_stream_uses_cache(
+        self, service: LLMService, mock_analyzer: MagicMock
+    ) -> None:
+        """캐시된 요약은 한 조각으로 전달한다."""
+        mock_analyzer.summarize_posts.return_value = "Summary"
+        mock_analyzer.stream_summary = MagicMock()
+        posts = [{"title": "Post 1"}]
+        await service.get_summary("python", posts)
+
+        chunks = [chunk async for chunk in service.stream_summary("python", posts)]
+
+        assert chunks == ["Summary"]
+        mock_analyzer.stream_summary.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_stream_unconfigured(self, unconfigured_service: LLMService) -> None:
+        """설정되지 않은 서비스는 경고 메시지를 전달한다."""
+        chunks = [
+            chunk
+            async for chunk in unconfigured_service.stream_summary("python", [{"title": "P"}])
+        ]
+
+        assert "설정되지 않았습니다" in "".join(chunks)
+
+
 class TestGetAICategorization:
     """get_ai_categorization 메서드 테스트."""
 
@@ -394,7 +456,7 @@ class TestSingletonFactory:
                 service = get_llm_service()
 
                 assert service.is_configured is True
-                mock_client.assert_called_with(provider="claude")
+                mock_client.assert_called_with(provider="claude", cache=None)
 
         reset_llm_service()
 
@@ -415,6 +477,66 @@ class TestSingletonFactory:
 
         reset_llm_service()
 
+    def test_reset_closes_client(self) -> None:
+        """리셋하면 기존 서비스의 LLM 클라이언트 연결을 닫는다."""
+        reset_llm_service()
+
+        with (
+            patch("reddit_insight.config.get_settings") as mock_settings,
+            patch("reddit_insight.llm.get_llm_client") as mock_client,
+        ):
+            mock_settings.return_value.anthropic_api_key = "test-key"
+            mock_client.return_value = MagicMock(aclose=AsyncMock())
+
+            get_llm_service()
+            reset_llm_service()
+
+            mock_client.return_value.aclose.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_close_llm_service(self) -> None:
+        """애플리케이션 종료 시 클라이언트 연결을 닫고 싱글톤을 비운다."""
+        reset_llm_service()
+
+        with (
+            patch("reddit_insight.config.get_settings") as mock_settings,
+            patch("reddit_insight.llm.get_llm_client") as mock_client,
+        ):
+            mock_settings.return_value.anthropic_api_key = "test-key"
+            mock_client.return_value = MagicMock(aclose=AsyncMock())
+
+            service = get_llm_service()
+            await close_llm_service()
+
+            mock_client.return_value.aclose.assert_awaited_once()
+            assert get_llm_service() is not service
+
+        reset_llm_service()
+
+    @pytest.mark.asyncio
+    async def test_close_llm_service_flushes_response_cache(self, tmp_path: Path) -> None:
+        """종료 시 SQLite 응답 캐시에 모아 둔 조회 기록을 반영하고 닫는다."""
+        reset_llm_service()
+        cache = SQLiteLLMCache(tmp_path / "llm_cache.db")
+        cache.set("prompt", "model", "response")
+        assert cache.get("prompt", "model") == "response"
+        client = ClaudeClient(api_key="test-key", model="model", cache=cache)
+
+        with (
+            patch("reddit_insight.config.get_settings") as mock_settings,
+            patch("reddit_insight.llm.get_llm_client", return_value=client),
+        ):
+            mock_settings.return_value.anthropic_api_key = "test-key"
+            get_llm_service()
+            await close_llm_service()
+
+        reader = sqlite3.connect(tmp_path / "llm_cache.db")
+        key = make_cache_key("prompt", "model")
+        hits = reader.execute("SELECT hits FROM llm_cache WHERE key = ?", (key,)).fetchone()[0]
+        reader.close()
+        assert hits == 1
+        assert client.cache is None
+
 
 class TestViewDataClasses:
     """뷰 모델 데이터클래스 테스트."""
@@ -472,3 +594,263 @@ class TestViewDataClasses:
 
         assert view.title == "Price Sensitivity"
         assert view.priority == "high"
+
+
+class TestSingleFlight:
+    """동일 요청 병합(single-flight) 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_summaries_share_one_call(
+        self, service: LLMService, mock_analyzer: MagicMock
+    ) -> None:
+        """같은 서브레딧 요약 동시 요청은 LLM을 한 번만 호출한다."""
+        release = asyncio.Event()
+
+        async def slow_summary(posts: list[dict[str, Any]]) -> str:
+            await release.wait()
+            return "Summary"
+
+        mock_analyzer.summarize_posts.side_effect = slow_summary
+        posts = [{"title": "Post 1"}]
+
+        pending = [
+            asyncio.create_task(service.get_summary("python", posts)) for _ in range(10)
+        ]
+        await asyncio.sleep(0)
+        assert service.get_status()["coalescing"]["in_flight"] == 1
+        release.set()
+        results = await asyncio.gather(*pending)
+
+        assert mock_analyzer.summarize_posts.call_count == 1
+        assert all(r.summary == "Summary" for r in results)
+        assert service.coalescing.executed == 1
+        assert service.coalescing.coalesced == 9
+        status = service.get_status()["coalescing"]
+        assert status["coalesce_rate"] == 0.9
+        assert status["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_different_keys_are_not_coalesced(
+        self, service: LLMService, mock_analyzer: MagicMock
+    ) -> None:
+        """다른 서브레딧 요청은 각각 실행된다."""
+        mock_analyzer.summarize_posts.return_value = "Summary"
+        posts = [{"title": "Post 1"}]
+
+        await asyncio.gather(
+            service.get_summary("python", posts),
+            service.get_summary("rust", posts),
+        )
+
+        assert mock_analyzer.summarize_posts.call_count == 2
+        assert service.coalescing.coalesced == 0
+
+    @pytest.mark.asyncio
+    async def test_failure_is_shared_and_not_cached(
+        self, service: LLMService, mock_analyzer: MagicMock
+    ) -> None:
+        """실패는 기다리던 모든 요청에 전달되고 다음 요청은 새로 실행한다."""
+        release = asyncio.Event()
+
+        async def failing_summary(posts: list[dict[str, Any]]) -> str:
+            await release.wait()
+            raise LLMError("boom")
+
+        mock_analyzer.summarize_posts.side_effect = failing_summary
+        posts = [{"title": "Post 1"}]
+
+        pending = [
+            asyncio.create_task(service.get_summary("python", posts)) for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*pending, return_exceptions=True)
+
+        assert all(isinstance(r, LLMError) for r in results)
+        assert mock_analyzer.summarize_posts.call_count == 1
+
+        mock_analyzer.summarize_posts.side_effect = None
+        mock_analyzer.summarize_posts.return_value = "Recovered"
+        result = await service.get_summary("python", posts)
+
+        assert result.summary == "Recovered"
+        assert mock_analyzer.summarize_posts.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_cancel_others(
+        self, service: LLMService, mock_analyzer: MagicMock
+    ) -> None:
+        """기다리던 요청 하나가 취소되어도 다른 요청은 결과를 받는다."""
+        release = asyncio.Event()
+
+        async def slow_summary(posts: list[dict[str, Any]]) -> str:
+            await release.wait()
+            return "Summary"
+
+        mock_analyzer.summarize_posts.side_effect = slow_summary
+        posts = [{"title": "Post 1"}]
+
+        first = asyncio.create_task(service.get_summary("python", posts))
+        second = asyncio.create_task(service.get_summary("python", posts))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        result = await second
+
+        assert result.summary == "Summary"
+        assert first.cancelled()
+        assert mock_analyzer.summarize_posts.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_streams_share_one_call(
+        self, service: LLMService, mock_analyzer: MagicMock
+    ) -> None:
+        """같은 서브레딧 스트림 동시 요청은 LLM 스트림 하나를 나눠 받는다."""
+        release = asyncio.Event()
+
+        async def slow_stream(posts: list[dict[str, Any]]) -> Any:
+            yield "### 주요"
+            await release.wait()
+            yield " 주제"
+
+        mock_analyzer.stream_summary = MagicMock(side_effect=slow_stream)
+        posts = [{"title": "Post 1"}]
+
+        async def collect() -> list[str]:
+            return [chunk async for chunk in service.stream_summary("python", posts)]
+
+        first = asyncio.create_task(collect())
+        await asyncio.sleep(0.01)
+        # 첫 조각이 나간 뒤 합류해도 처음부터 받는다
+        late = asyncio.create_task(collect())
+        joined = asyncio.create_task(service.get_summary("python", posts))
+        await asyncio.sleep(0.01)
+        release.set()
+
+        assert await first == ["### 주요", " 주제"]
+        assert await late == ["### 주요", " 주제"]
+        assert (await joined).summary == "### 주요 주제"
+        assert mock_analyzer.stream_summary.call_count == 1
+        mock_analyzer.summarize_posts.assert_not_called()
+        assert service.coalescing.executed == 1
+        assert service.coalescing.coalesced == 2
+
+    @pytest.mark.asyncio
+    async def test_stream_joins_in_flight_summary(
+        self, service: LLMService, mock_analyzer: MagicMock
+    ) -> None:
+        """진행 중인 get_summary에 합류한 스트림은 결과를 한 조각으로 받는다."""
+        release = asyncio.Event()
+
+        async def slow_summary(posts: list[dict[str, Any]]) -> str:
+            await release.wait()
+            return "Summary"
+
+        mock_analyzer.summarize_posts.side_effect = slow_summary
+        mock_analyzer.stream_summary = MagicMock()
+        posts = [{"title": "Post 1"}]
+
+        pending = asyncio.create_task(service.get_summary("python", posts))
+        await asyncio.sleep(0)
+        stream = service.stream_summary("python", posts)
+        first_chunk = asyncio.create_task(anext(stream))
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await first_chunk == "Summary"
+        assert [chunk async for chunk in stream] == []
+        assert (await pending).summary == "Summary"
+        mock_analyzer.stream_summary.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_disconnected_stream_does_not_stop_others(
+        self, service: LLMService, mock_analyzer: MagicMock
+    ) -> None:
+        """구독자 하나가 끊겨도 생성은 계속되고 결과가 캐시된다."""
+        release = asyncio.Event()
+
+        async def slow_stream(posts: list[dict[str, Any]]) -> Any:
+            yield "A"
+            await release.wait()
+            yield "B"
+
+        mock_analyzer.stream_summary = MagicMock(side_effect=slow_stream)
+        posts = [{"title": "Post 1"}]
+
+        dropped = service.stream_summary("python", posts)
+        assert await anext(dropped) == "A"
+        await dropped.aclose()
+        remaining = service.stream_summary("python", posts)
+        assert await anext(remaining) == "A"
+        release.set()
+
+        assert [chunk async for chunk in remaining] == ["B"]
+        assert (await service.get_summary("python", posts)).cached is True
+        assert mock_analyzer.stream_summary.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_stream_failure_reaches_every_subscriber(
+        self, service: LLMService, mock_analyzer: MagicMock
+    ) -> None:
+        """스트림 생성 실패는 모든 구독자에게 전달된다."""
+
+        async def failing_stream(posts: list[dict[str, Any]]) -> Any:
+            yield "A"
+            await asyncio.sleep(0.01)
+            raise LLMError("boom")
+
+        mock_analyzer.stream_summary = MagicMock(side_effect=failing_stream)
+        posts = [{"title": "Post 1"}]
+
+        async def collect() -> list[str]:
+            return [chunk async for chunk in service.stream_summary("python", posts)]
+
+        results = await asyncio.gather(collect(), collect(), return_exceptions=True)
+
+        assert all(isinstance(r, LLMError) for r in results)
+        assert mock_analyzer.stream_summary.call_count == 1
+        assert service.get_status()["coalescing"]["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_insights_sentiment_and_trends_are_coalesced(
+        self, service: LLMService, mock_analyzer: MagicMock
+    ) -> None:
+        """인사이트, 심층 감성, 트렌드 해석도 동시 요청을 병합한다."""
+
+        def delayed(value: Any) -> Any:
+            async def respond(*args: Any, **kwargs: Any) -> Any:
+                await asyncio.sleep(0.01)
+                return value
+
+            return respond
+
+        mock_analyzer.generate_insights.side_effect = delayed(
+            [
+                Insight(
+                    title="T",
+                    finding="F",
+                    meaning="M",
+                    recommendation="R",
+                    priority="high",
+                )
+            ]
+        )
+        mock_analyzer.analyze_sentiment_deep.side_effect = delayed(
+            DeepSentimentResult(overall_sentiment="positive", sentiment_score=0.8)
+        )
+        mock_analyzer.interpret_trends.side_effect = delayed("Trend")
+
+        trend_args = ({"python": 1.5}, ["ai"], ["php"])
+        await asyncio.gather(
+            *(service.get_insights({"trends": {}}, "python") for _ in range(3)),
+            *(service.get_deep_sentiment("Great app") for _ in range(3)),
+            *(service.interpret_trends(*trend_args) for _ in range(3)),
+            service.interpret_trends({"python": 1.5}, ["ai"], ["rust"]),
+        )
+
+        assert mock_analyzer.generate_insights.call_count == 1
+        assert mock_analyzer.analyze_sentiment_deep.call_count == 1
+        assert mock_analyzer.interpret_trends.call_count == 2
+        assert service.coalescing.executed == 4
+        assert service.coalescing.coalesced == 6
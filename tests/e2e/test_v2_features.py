@@ -10,12 +10,15 @@ v2.0에서 추가된 주요 기능에 대한 통합 테스트:
 from __future__ import annotations
 
 import os
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
 # 테스트에서 rate limiting 비활성화
 os.environ["RATE_LIMIT_PER_MINUTE"] = "10000"
 
@@ -98,6 +101,114 @@ class TestLLMIntegration:
 
             assert response.status_code == 200
 
+    def test_llm_summary_stream_endpoint(self, e2e_client: TestClient, tmp_path: Path) -> None:
+        """요약 스트리밍 엔드포인트가 저장된 게시물의 요약을 SSE로 전달한다."""
+        import asyncio
+        import json
+        from datetime import UTC, datetime
+
+        from reddit_insight.dashboard.data_store import (
+            AnalysisData,
+            clear_cache,
+            save_to_database,
+        )
+        from reddit_insight.dashboard.services.llm_service import get_llm_service
+        from reddit_insight.dashboard.services_module import (
+            DashboardService,
+            get_dashboard_service,
+        )
+        from reddit_insight.reddit.models import Post, SubredditInfo
+        from reddit_insight.storage.database import Database
+        from reddit_insight.storage.repository import PostRepository, SubredditRepository
+
+        database_url = f"sqlite+aiosqlite:///{tmp_path / 'posts.db'}"
+        created = datetime(2024, 1, 1, tzinfo=UTC)
+
+        async def seed() -> None:
+            async with Database(database_url) as db, db.session() as session:
+                subreddit = await SubredditRepository(session).get_or_create(
+                    SubredditInfo(
+                        name="e2e_stream",
+                        display_name="e2e_stream",
+                        title="E2E",
+                        subscribers=1,
+                        created_utc=created,
+                    )
+                )
+                posts = [
+                    Post(
+                        id=f"e2e{i}",
+                        title=f"Post {i}",
+                        selftext="body",
+                        author="tester",
+                        subreddit="e2e_stream",
+                        score=i,
+                        num_comments=0,
+                        created_utc=created,
+                        url=f"https://reddit.com/r/e2e_stream/comments/e2e{i}/",
+                        permalink=f"/r/e2e_stream/comments/e2e{i}/",
+                        is_self=True,
+                    )
+                    for i in range(2)
+                ]
+                await PostRepository(session).save_many(posts, subreddit.id)
+                await session.commit()
+
+        asyncio.run(seed())
+        save_to_database(
+            AnalysisData(subreddit="e2e_stream", analyzed_at=created.isoformat(), post_count=2)
+        )
+        clear_cache()
+
+        received: list[list[dict[str, Any]]] = []
+
+        async def chunks(subreddit: str, posts: list[dict[str, Any]]) -> Any:
+            received.append(posts)
+            for chunk in ("### 주요", " 주제"):
+                yield chunk
+
+        mock_service = MagicMock()
+        mock_service.stream_summary = chunks
+
+        app = e2e_client.app
+        app.dependency_overrides[get_llm_service] = lambda: mock_service
+        app.dependency_overrides[get_dashboard_service] = lambda: DashboardService(
+            database_url=database_url
+        )
+        try:
+            response = e2e_client.get("/dashboard/llm/summary/stream?subreddit=e2e_stream")
+        finally:
+            app.dependency_overrides.clear()
+            clear_cache()
+
+        assert sorted(post["title"] for post in received[0]) == ["Post 0", "Post 1"]
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = [
+            json.loads(line[len("data: ") :])
+            for line in response.text.splitlines()
+            if line.startswith("data: ")
+        ]
+        assert events == [
+            {"type": "chunk", "text": "### 주요"},
+            {"type": "chunk", "text": " 주제"},
+            {"type": "done", "post_count": 2},
+        ]
+
+    def test_llm_summary_stream_without_analysis(self, e2e_client: TestClient) -> None:
+        """분석 데이터가 없는 서브레딧은 오류 이벤트를 보낸다."""
+        import json
+
+        response = e2e_client.get("/dashboard/llm/summary/stream?subreddit=no_such_e2e_sub")
+
+        assert response.status_code == 200
+        events = [
+            json.loads(line[len("data: ") :])
+            for line in response.text.splitlines()
+            if line.startswith("data: ")
+        ]
+        assert [event["type"] for event in events] == ["error"]
+
 
 # =============================================================================
 # COMPARISON INTEGRATION TESTS (Phase 28)
@@ -5,9 +5,15 @@ Mock을 사용하여 실제 API 호출 없이 LLMAnalyzer의 각 기능을 테
 
 from __future__ import annotations
 
-import pytest
+import asyncio
+import json
+import re
+import time
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import pytest
+
 from reddit_insight.llm import (
     LLMAnalyzer,
     CategoryResult,
@@ -15,6 +21,8 @@ from reddit_insight.llm import (
     Insight,
     LLMClient,
     ClaudeClient,
+    LLMError,
+    RateLimiter,
 )
 
 
@@ -77,6 +85,29 @@ class TestSummarizePosts:
         assert result == expected_summary
         mock_client.complete_with_retry.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_stream_summary_uses_same_prompt(
+        self, analyzer: LLMAnalyzer, mock_client: MagicMock
+    ) -> None:
+        """스트리밍 요약은 summarize_posts와 같은 프롬프트와 파라미터를 사용한다."""
+        posts = [{"title": "Test Post 1", "body": "Content 1", "score": 100}]
+
+        async def fake_stream(**kwargs: Any) -> Any:
+            for chunk in ("### 주요", " 주제"):
+                yield chunk
+
+        mock_client.stream = MagicMock(side_effect=fake_stream)
+        mock_client.complete_with_retry.return_value = "Summary"
+
+        chunks = [chunk async for chunk in analyzer.stream_summary(posts)]
+        await analyzer.summarize_posts(posts)
+
+        assert chunks == ["### 주요", " 주제"]
+        stream_kwargs = mock_client.stream.call_args.kwargs
+        complete_kwargs = mock_client.complete_with_retry.call_args.kwargs
+        for name in ("prompt", "temperature", "max_tokens"):
+            assert stream_kwargs[name] == complete_kwargs[name]
+
     @pytest.mark.asyncio
     async def test_summarize_posts_respects_max_posts(
         self, analyzer: LLMAnalyzer, mock_client: MagicMock
@@ -214,6 +245,133 @@ class TestCategorizeContent:
         assert result.category == "Discussion"
 
 
+class SlowClient(LLMClient):
+    """일정 지연 후 배치/단일 분류 응답을 돌려주는 테스트용 클라이언트."""
+
+    def __init__(self, latency: float, rate_limiter: RateLimiter | None = None) -> None:
+        super().__init__(api_key="test", model="test", rate_limiter=rate_limiter)
+        self.latency = latency
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def _call_api(self, prompt: str, **kwargs: Any) -> str:
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self.in_flight -= 1
+        ids = [int(i) for i in re.findall(r"^\[(\d+)\]", prompt, re.M)]
+        if not ids:
+            return '{"primary_category": "Question", "confidence": 70}'
+        return json.dumps(
+            [{"id": i, "primary_category": "Question", "confidence": 70} for i in ids]
+        )
+
+
+class TestBatchedCategorization:
+    """배치/동시 categorize_content 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_batch_packs_texts_into_one_prompt(
+        self, analyzer: LLMAnalyzer, mock_client: MagicMock
+    ) -> None:
+        """batch_size개 텍스트가 하나의 프롬프트로 묶이고 순서대로 매핑된다."""
+        mock_client.complete_with_retry.side_effect = [
+            '[{"id": 2, "primary_category": "Question", "confidence": 70},'
+            ' {"id": 1, "primary_category": "Bug Report", "confidence": 90}]',
+            '{"primary_category": "Review", "confidence": 60}',
+        ]
+
+        result = await analyzer.categorize_content(
+            ["App crashes", "How to export?"], batch_size=2
+        )
+        result += await analyzer.categorize_content(["Nice app"], batch_size=2)
+
+        assert [r.category for r in result] == ["Bug Report", "Question", "Review"]
+        first_prompt = mock_client.complete_with_retry.call_args_list[0].kwargs["prompt"]
+        assert "[1] App crashes" in first_prompt
+        assert "[2] How to export?" in first_prompt
+
+    @pytest.mark.asyncio
+    async def test_missing_items_are_split_and_retried(
+        self, analyzer: LLMAnalyzer, mock_client: MagicMock
+    ) -> None:
+        """파싱되지 않은 항목만 분할하여 다시 요청한다."""
+        mock_client.complete_with_retry.side_effect = [
+            '```json\n[{"id": 1, "primary_category": "Bug Report", "confidence": 90}]\n```',
+            '{"primary_category": "Question", "confidence": 75}',
+            '{"primary_category": "Review", "confidence": 65}',
+        ]
+
+        result = await analyzer.categorize_content(["a", "b", "c"], batch_size=3)
+
+        assert [r.category for r in result] == ["Bug Report", "Question", "Review"]
+        assert mock_client.complete_with_retry.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_batch_api_error_marks_items_failed(
+        self, analyzer: LLMAnalyzer, mock_client: MagicMock
+    ) -> None:
+        """배치 요청 자체가 실패하면 해당 항목을 실패로 처리한다."""
+        mock_client.complete_with_retry.side_effect = LLMError("boom")
+
+        result = await analyzer.categorize_content(["a", "b"], batch_size=2)
+
+        assert [r.category for r in result] == ["Unknown", "Unknown"]
+        assert all(r.confidence == 0 for r in result)
+        assert mock_client.complete_with_retry.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_invalid_batch_parameters(self, analyzer: LLMAnalyzer) -> None:
+        """batch_size와 max_concurrency는 1 이상이어야 한다."""
+        with pytest.raises(ValueError, match="batch_size"):
+            await analyzer.categorize_content(["a"], batch_size=0)
+        with pytest.raises(ValueError, match="max_concurrency"):
+            await analyzer.categorize_content(["a"], max_concurrency=0)
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self) -> None:
+        """동시 요청 수가 max_concurrency를 넘지 않는다."""
+        client = SlowClient(latency=0.01)
+        analyzer = LLMAnalyzer(client=client)
+
+        result = await analyzer.categorize_content(
+            [f"text {i}" for i in range(40)], batch_size=5, max_concurrency=3
+        )
+
+        assert len(result) == 40
+        assert all(r.category == "Question" for r in result)
+        assert client.calls == 8
+        assert client.max_in_flight == 3
+
+    @pytest.mark.asyncio
+    async def test_batched_concurrent_wall_clock(self) -> None:
+        """배치+동시 요청이 직렬 요청보다 한 자릿수 이상 빠르다."""
+        texts = [f"post number {i}" for i in range(100)]
+        limiter = RateLimiter(requests_per_minute=10_000, tokens_per_minute=10_000_000)
+
+        serial_client = SlowClient(latency=0.02, rate_limiter=limiter)
+        start = time.perf_counter()
+        await LLMAnalyzer(client=serial_client).categorize_content(texts)
+        serial_elapsed = time.perf_counter() - start
+
+        limiter.reset()
+        batched_client = SlowClient(latency=0.02, rate_limiter=limiter)
+        start = time.perf_counter()
+        result = await LLMAnalyzer(client=batched_client).categorize_content(
+            texts, batch_size=20, max_concurrency=4
+        )
+        batched_elapsed = time.perf_counter() - start
+
+        assert len(result) == 100
+        assert serial_client.calls == 100
+        assert batched_client.calls == 5
+        assert batched_elapsed * 10 < serial_elapsed
+
+
 class TestAnalyzeSentimentDeep:
     """analyze_sentiment_deep 메서드 테스트."""
 
@@ -2,11 +2,26 @@
 
 from __future__ import annotations
 
+import multiprocessing
+import sqlite3
+import threading
 import time
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from reddit_insight.llm.cache import LLMCache, CacheEntry
+from reddit_insight.llm.cache import (
+    CacheEntry,
+    LLMCache,
+    SQLiteLLMCache,
+    create_llm_cache,
+    make_cache_key,
+)
+from reddit_insight.llm.client import ClaudeClient
+
+if TYPE_CHECKING:
+    from pathlib import Path
 
 
 class TestCacheEntry:
@@ -188,3 +203,254 @@ class TestLLMCacheEdgeCases:
         assert key1 != key2
         assert key1 != key3
         assert key2 != key3
+
+    def test_key_covers_call_parameters(self) -> None:
+        """시스템 프롬프트, temperature, max_tokens가 다르면 다른 키가 생성된다."""
+        base = make_cache_key("prompt", "model", temperature=0.3, max_tokens=100)
+        assert base == make_cache_key("prompt", "model", max_tokens=100, temperature=0.3)
+        assert base != make_cache_key("prompt", "model", temperature=0.7, max_tokens=100)
+        assert base != make_cache_key("prompt", "model", temperature=0.3, max_tokens=200)
+        assert base != make_cache_key(
+            "prompt", "model", temperature=0.3, max_tokens=100, system="be brief"
+        )
+        assert base == make_cache_key(
+            "prompt", "model", temperature=0.3, max_tokens=100, system=None
+        )
+
+    def test_lru_keeps_recently_used(self) -> None:
+        """최근 조회된 항목은 제거되지 않는다(LRU)."""
+        cache = LLMCache(ttl=3600, max_size=2)
+        cache.set("prompt1", "model", "response1")
+        cache.set("prompt2", "model", "response2")
+        cache.get("prompt1", "model")
+
+        cache.set("prompt3", "model", "response3")
+
+        assert cache.get("prompt1", "model") == "response1"
+        assert cache.get("prompt2", "model") is None
+        assert cache.get("prompt3", "model") == "response3"
+
+    def test_overwrite_does_not_evict(self) -> None:
+        """기존 키를 덮어쓰면 다른 항목을 제거하지 않는다."""
+        cache = LLMCache(ttl=3600, max_size=2)
+        cache.set("prompt1", "model", "response1")
+        cache.set("prompt2", "model", "response2")
+        cache.set("prompt2", "model", "updated")
+
+        assert cache.get("prompt1", "model") == "response1"
+        assert cache.get("prompt2", "model") == "updated"
+
+
+def _write_entries(path: str, worker: int, count: int) -> None:
+    """다른 프로세스에서 SQLite 캐시에 항목을 쓴다."""
+    cache = SQLiteLLMCache(path, ttl=3600, max_size=10_000)
+    for i in range(count):
+        cache.set(f"prompt-{worker}-{i}", "model", f"response-{worker}-{i}")
+    cache.close()
+
+
+class TestSQLiteLLMCache:
+    """SQLiteLLMCache 클래스 테스트."""
+
+    @pytest.fixture
+    def cache_path(self, tmp_path: Path) -> Path:
+        """테스트용 캐시 파일 경로."""
+        return tmp_path / "llm_cache.db"
+
+    def test_set_and_get(self, cache_path: Path) -> None:
+        """저장한 응답을 파라미터까지 일치할 때만 조회한다."""
+        cache = SQLiteLLMCache(cache_path)
+        cache.set("prompt", "model", "response", temperature=0.3)
+
+        assert cache.get("prompt", "model", temperature=0.3) == "response"
+        assert cache.get("prompt", "model", temperature=0.7) is None
+        assert cache.get("prompt", "other", temperature=0.3) is None
+
+    def test_persists_across_instances(self, cache_path: Path) -> None:
+        """재시작(새 인스턴스) 후에도 응답이 유지된다."""
+        first = SQLiteLLMCache(cache_path)
+        first.set("한국어 프롬프트", "model", "한국어 응답")
+        first.close()
+
+        second = SQLiteLLMCache(cache_path)
+        assert second.get("한국어 프롬프트", "model") == "한국어 응답"
+        assert second.get_stats()["size"] == 1
+
+    def test_expiration(self, cache_path: Path) -> None:
+        """TTL이 지나면 캐시가 만료되고 정리된다."""
+        cache = SQLiteLLMCache(cache_path, ttl=0)
+        cache.set("prompt", "model", "response")
+        time.sleep(0.01)
+
+        assert cache.get("prompt", "model") is None
+        assert cache.get_stats()["size"] == 0
+
+    def test_lru_eviction(self, cache_path: Path) -> None:
+        """가득 차면 가장 오래 사용되지 않은 항목을 제거한다."""
+        cache = SQLiteLLMCache(cache_path, ttl=3600, max_size=2)
+        cache.set("prompt1", "model", "response1")
+        cache.set("prompt2", "model", "response2")
+        cache.get("prompt1", "model")
+
+        cache.set("prompt3", "model", "response3")
+
+        assert cache.get("prompt2", "model") is None
+        assert cache.get("prompt1", "model") == "response1"
+        assert cache.get("prompt3", "model") == "response3"
+        assert cache.get_stats()["size"] == 2
+
+    def test_overwrite_keeps_size(self, cache_path: Path) -> None:
+        """같은 키를 다시 저장하면 항목 수가 늘지 않는다."""
+        cache = SQLiteLLMCache(cache_path)
+        cache.set("prompt", "model", "response1")
+        cache.set("prompt", "model", "response2")
+
+        assert cache.get("prompt", "model") == "response2"
+        assert cache.get_stats()["size"] == 1
+
+    def test_invalidate_and_clear(self, cache_path: Path) -> None:
+        """항목 무효화와 전체 삭제."""
+        cache = SQLiteLLMCache(cache_path)
+        cache.set("prompt1", "model", "response1")
+        cache.set("prompt2", "model", "response2")
+
+        assert cache.invalidate("prompt1", "model") is True
+        assert cache.invalidate("prompt1", "model") is False
+        cache.clear()
+
+        assert cache.get("prompt2", "model") is None
+        assert cache.get_stats()["size"] == 0
+
+    def test_get_stats(self, cache_path: Path) -> None:
+        """통계를 조회할 수 있다."""
+        cache = SQLiteLLMCache(cache_path, ttl=3600, max_size=100)
+        cache.set("prompt", "model", "response")
+        cache.get("prompt", "model")
+        cache.get("nonexistent", "model")
+
+        stats = cache.get_stats()
+
+        assert stats["size"] == 1
+        assert stats["max_size"] == 100
+        assert stats["total_hits"] == 1
+        assert stats["total_misses"] == 1
+        assert stats["hit_rate_percent"] == 50.0
+
+    def test_invalid_max_size(self, cache_path: Path) -> None:
+        """max_size는 1 이상이어야 한다."""
+        with pytest.raises(ValueError, match="max_size"):
+            SQLiteLLMCache(cache_path, max_size=0)
+
+    def test_hits_do_not_write_until_flush(self, cache_path: Path) -> None:
+        """조회는 쓰기 잠금 없이 처리되고 조회 기록은 모아서 반영된다."""
+        cache = SQLiteLLMCache(cache_path)
+        cache.set("prompt", "model", "response")
+        key = make_cache_key("prompt", "model")
+
+        # 다른 연결이 쓰기 잠금을 쥐고 있어도 조회는 막히지 않는다
+        writer = sqlite3.connect(cache_path, isolation_level=None)
+        writer.execute("BEGIN IMMEDIATE")
+        try:
+            for _ in range(3):
+                assert cache.get("prompt", "model") == "response"
+        finally:
+            writer.execute("ROLLBACK")
+            writer.close()
+
+        hits_sql = "SELECT hits FROM llm_cache WHERE key = ?"
+        assert cache._conn.execute(hits_sql, (key,)).fetchone()[0] == 0
+        cache.close()
+
+        reader = sqlite3.connect(cache_path)
+        assert reader.execute(hits_sql, (key,)).fetchone()[0] == 3
+        reader.close()
+
+    @pytest.mark.asyncio
+    async def test_async_access_runs_off_event_loop(self, cache_path: Path) -> None:
+        """aget/aset은 이벤트 루프 스레드 밖에서 SQLite에 접근한다."""
+        threads: list[threading.Thread] = []
+
+        class RecordingCache(SQLiteLLMCache):
+            def get(self, prompt: str, model: str, **params: object) -> str | None:
+                threads.append(threading.current_thread())
+                return super().get(prompt, model, **params)
+
+            def set(self, prompt: str, model: str, response: str, **params: object) -> None:
+                threads.append(threading.current_thread())
+                super().set(prompt, model, response, **params)
+
+        cache = RecordingCache(cache_path)
+        await cache.aset("prompt", "model", "response")
+
+        assert await cache.aget("prompt", "model") == "response"
+        assert len(threads) == 2
+        assert threading.current_thread() not in threads
+
+    def test_concurrent_processes(self, cache_path: Path) -> None:
+        """여러 프로세스가 같은 파일에 동시에 써도 항목이 유실되지 않는다."""
+        SQLiteLLMCache(cache_path).close()
+        context = multiprocessing.get_context("spawn")
+        workers = [
+            context.Process(target=_write_entries, args=(str(cache_path), worker, 50))
+            for worker in range(3)
+        ]
+        for process in workers:
+            process.start()
+        for process in workers:
+            process.join(timeout=60)
+            assert process.exitcode == 0
+
+        cache = SQLiteLLMCache(cache_path)
+        assert cache.get_stats()["size"] == 150
+        assert cache.get("prompt-2-49", "model") == "response-2-49"
+
+    @pytest.mark.asyncio
+    async def test_rerun_costs_no_api_calls(self, cache_path: Path) -> None:
+        """같은 분석을 다시 실행하면 새 프로세스에서도 API를 호출하지 않는다."""
+
+        async def run() -> int:
+            client = ClaudeClient(
+                api_key="test-key",
+                model="claude-3-haiku-20240307",
+                cache=SQLiteLLMCache(cache_path),
+            )
+            client._call_api = AsyncMock(return_value="response")  # type: ignore[method-assign]
+            for prompt in ("summarize", "categorize"):
+                await client.complete(prompt, system="analyst", temperature=0.3)
+            return client._call_api.await_count
+
+        assert await run() == 2
+        assert await run() == 0
+
+
+class TestCreateLLMCache:
+    """create_llm_cache 팩토리 테스트."""
+
+    def _settings(self, backend: str, tmp_path: Path) -> MagicMock:
+        settings = MagicMock()
+        settings.llm_cache_backend = backend
+        settings.llm_cache_path = None
+        settings.data_dir = tmp_path
+        settings.llm_cache_ttl = 60
+        settings.llm_cache_max_size = 10
+        return settings
+
+    def test_sqlite_backend(self, tmp_path: Path) -> None:
+        """sqlite 백엔드는 data_dir 아래에 캐시 파일을 만든다."""
+        cache = create_llm_cache(self._settings("sqlite", tmp_path))
+
+        assert isinstance(cache, SQLiteLLMCache)
+        assert cache.path == tmp_path / "llm_cache.db"
+        assert cache.ttl == 60
+        assert cache.max_size == 10
+
+    def test_memory_backend(self, tmp_path: Path) -> None:
+        """memory 백엔드는 프로세스 내부 캐시를 만든다."""
+        cache = create_llm_cache(self._settings("memory", tmp_path))
+
+        assert isinstance(cache, LLMCache)
+        assert cache.max_size == 10
+
+    def test_disabled(self, tmp_path: Path) -> None:
+        """none이면 캐시를 사용하지 않는다."""
+        assert create_llm_cache(self._settings("none", tmp_path)) is None
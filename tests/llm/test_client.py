@@ -5,6 +5,10 @@ Mock을 사용하여 실제 API 호출 없이 테스트한다.
 
 from __future__ import annotations
 
+import asyncio
+import time
+from typing import Any
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -66,7 +70,13 @@ class TestClaudeClient:
     async def test_complete_with_cache_hit(self, client: ClaudeClient) -> None:
         """캐시 히트 시 API를 호출하지 않는다."""
         cache = LLMCache(ttl=3600)
-        cache.set("Test prompt", "claude-3-haiku-20240307", "Cached response")
+        cache.set(
+            "Test prompt",
+            "claude-3-haiku-20240307",
+            "Cached response",
+            max_tokens=1024,
+            temperature=0.7,
+        )
 
         client_with_cache = ClaudeClient(
             api_key="test-key",
@@ -165,6 +175,298 @@ class TestClaudeClient:
         assert client.model == ClaudeClient.DEFAULT_MODEL
 
 
+class _FakeTextStream:
+    """Anthropic messages.stream() 컨텍스트 매니저 대역."""
+
+    def __init__(self, chunks: list[str], usage: Any = None) -> None:
+        self._chunks = chunks
+        self._usage = usage
+
+    async def __aenter__(self) -> _FakeTextStream:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        return None
+
+    @property
+    async def text_stream(self) -> Any:
+        for chunk in self._chunks:
+            yield chunk
+
+    async def get_final_message(self) -> Any:
+        return MagicMock(usage=self._usage)
+
+
+async def _collect(stream: Any) -> list[str]:
+    return [chunk async for chunk in stream]
+
+
+@pytest.fixture
+def frozen_clock() -> Any:
+    """rate limiter 버킷이 테스트 도중 다시 채워지지 않도록 시계를 고정한다."""
+    with patch("reddit_insight.llm.rate_limiter.time.monotonic", return_value=1000.0):
+        yield
+
+
+class TestNativeAsyncClients:
+    """네이티브 비동기 SDK 클라이언트와 스트리밍 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_claude_call_awaits_async_sdk(self) -> None:
+        """Claude 호출은 스레드 없이 비동기 SDK를 await한다."""
+        client = ClaudeClient(api_key="test-key")
+        sdk = MagicMock()
+        message = MagicMock()
+        message.content = [MagicMock(text="Async response")]
+        sdk.messages.create = AsyncMock(return_value=message)
+        client._client = sdk
+
+        with patch("reddit_insight.llm.client.asyncio.to_thread") as mock_thread:
+            result = await client.complete("Test prompt", system="be brief")
+
+        assert result == "Async response"
+        mock_thread.assert_not_called()
+        kwargs = sdk.messages.create.call_args.kwargs
+        assert kwargs["system"] == "be brief"
+        assert kwargs["messages"] == [{"role": "user", "content": "Test prompt"}]
+
+    @pytest.mark.asyncio
+    async def test_reported_usage_reconciles_rate_limiter(self) -> None:
+        """제공자가 보고한 실제 토큰 사용량으로 rate limiter를 보정한다."""
+        rate_limiter = RateLimiter(requests_per_minute=60, tokens_per_minute=100_000)
+        client = ClaudeClient(api_key="test-key", rate_limiter=rate_limiter)
+        sdk = MagicMock()
+        message = MagicMock()
+        message.content = [MagicMock(text="ok")]
+        message.usage.input_tokens = 30
+        message.usage.output_tokens = 20
+        sdk.messages.create = AsyncMock(return_value=message)
+        client._client = sdk
+
+        result = await client.complete("Test prompt", max_tokens=4096)
+
+        assert type(result) is str
+        assert rate_limiter.get_stats()["current_tpm"] == 50
+
+    @pytest.mark.asyncio
+    async def test_openai_reported_usage_reconciles_rate_limiter(self) -> None:
+        """OpenAI 응답의 prompt/completion 토큰으로 보정한다."""
+        rate_limiter = RateLimiter(requests_per_minute=60, tokens_per_minute=100_000)
+        client = OpenAIClient(api_key="test-key", rate_limiter=rate_limiter)
+        sdk = MagicMock()
+        response = MagicMock()
+        response.choices = [MagicMock(message=MagicMock(content="ok"))]
+        response.usage.prompt_tokens = 12
+        response.usage.completion_tokens = 8
+        sdk.chat.completions.create = AsyncMock(return_value=response)
+        client._client = sdk
+
+        await client.complete("Test prompt", max_tokens=4096)
+
+        assert rate_limiter.get_stats()["current_tpm"] == 20
+
+    def test_sdk_client_is_reused(self) -> None:
+        """SDK 클라이언트는 한 번만 생성되어 연결 풀을 재사용한다."""
+        client = ClaudeClient(api_key="test-key")
+
+        first = client._get_client()
+
+        assert client._get_client() is first
+        assert type(first).__name__ == "AsyncAnthropic"
+
+    @pytest.mark.asyncio
+    async def test_concurrency_not_bound_by_thread_pool(self) -> None:
+        """동시 요청 수가 기본 스레드 풀 크기에 묶이지 않는다."""
+        client = OpenAIClient(api_key="test-key")
+        response = MagicMock()
+        response.choices = [MagicMock()]
+        response.choices[0].message.content = "ok"
+
+        async def slow_create(**kwargs: Any) -> Any:
+            await asyncio.sleep(0.05)
+            return response
+
+        sdk = MagicMock()
+        sdk.chat.completions.create = slow_create
+        client._client = sdk
+
+        start = time.perf_counter()
+        results = await asyncio.gather(
+            *(client.complete(f"prompt {i}", use_cache=False) for i in range(64))
+        )
+        elapsed = time.perf_counter() - start
+
+        assert results == ["ok"] * 64
+        # to_thread 기반이면 최소 64 * 0.05 / 32 = 0.1초 이상 걸린다
+        assert elapsed < 0.5
+
+    @pytest.mark.asyncio
+    async def test_claude_stream(self) -> None:
+        """Claude 스트리밍은 텍스트 조각을 순서대로 전달하고 전체 응답을 캐시한다."""
+        cache = LLMCache()
+        client = ClaudeClient(api_key="test-key", cache=cache)
+        sdk = MagicMock()
+        sdk.messages.stream = MagicMock(return_value=_FakeTextStream(["Hel", "lo", "!"]))
+        client._client = sdk
+
+        chunks = await _collect(client.stream("Test prompt", max_tokens=64))
+
+        assert chunks == ["Hel", "lo", "!"]
+        assert await client.complete("Test prompt", max_tokens=64) == "Hello!"
+        sdk.messages.stream.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_openai_stream(self) -> None:
+        """OpenAI 스트리밍은 빈 delta를 건너뛴다."""
+        client = OpenAIClient(api_key="test-key")
+
+        def chunk(content: str | None) -> MagicMock:
+            item = MagicMock()
+            item.choices = [MagicMock()]
+            item.choices[0].delta.content = content
+            return item
+
+        async def events() -> Any:
+            for content in ("A", None, "B"):
+                yield chunk(content)
+
+        sdk = MagicMock()
+        sdk.chat.completions.create = AsyncMock(return_value=events())
+        client._client = sdk
+
+        chunks = await _collect(client.stream("Test prompt"))
+
+        assert chunks == ["A", "B"]
+        kwargs = sdk.chat.completions.create.call_args.kwargs
+        assert kwargs["stream"] is True
+        assert kwargs["stream_options"] == {"include_usage": True}
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("frozen_clock")
+    async def test_claude_stream_reconciles_final_usage(self) -> None:
+        """Claude 스트림이 끝나면 최종 메시지의 사용량으로 rate limiter를 보정한다."""
+        rate_limiter = RateLimiter(requests_per_minute=60, tokens_per_minute=100_000)
+        client = ClaudeClient(api_key="test-key", rate_limiter=rate_limiter)
+        usage = MagicMock(input_tokens=30, output_tokens=20)
+        sdk = MagicMock()
+        sdk.messages.stream = MagicMock(return_value=_FakeTextStream(["Hel", "lo"], usage))
+        client._client = sdk
+
+        chunks = await _collect(client.stream("Test prompt", max_tokens=4096))
+
+        assert chunks == ["Hel", "lo"]
+        assert rate_limiter.get_stats()["current_tpm"] == 50
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("frozen_clock")
+    async def test_openai_stream_reconciles_usage_chunk(self) -> None:
+        """OpenAI 스트림의 마지막 usage 청크로 rate limiter를 보정한다."""
+        rate_limiter = RateLimiter(requests_per_minute=60, tokens_per_minute=100_000)
+        client = OpenAIClient(api_key="test-key", rate_limiter=rate_limiter)
+        text_chunk = MagicMock(usage=None)
+        text_chunk.choices = [MagicMock()]
+        text_chunk.choices[0].delta.content = "ok"
+        usage_chunk = MagicMock(choices=[])
+        usage_chunk.usage.prompt_tokens = 12
+        usage_chunk.usage.completion_tokens = 8
+
+        async def events() -> Any:
+            yield text_chunk
+            yield usage_chunk
+
+        sdk = MagicMock()
+        sdk.chat.completions.create = AsyncMock(return_value=events())
+        client._client = sdk
+
+        chunks = await _collect(client.stream("Test prompt", max_tokens=4096))
+
+        assert chunks == ["ok"]
+        assert rate_limiter.get_stats()["current_tpm"] == 20
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("frozen_clock")
+    async def test_stream_without_usage_refunds_unused_max_tokens(self) -> None:
+        """사용량 보고가 없으면 전달한 텍스트 길이로 추정해 남은 max_tokens를 돌려준다."""
+        rate_limiter = RateLimiter(requests_per_minute=60, tokens_per_minute=100_000)
+
+        class PlainClient(LLMClient):
+            async def _call_api(self, prompt: str, **kwargs: Any) -> str:
+                return "x" * 30
+
+        client = PlainClient(api_key="k", model="m", rate_limiter=rate_limiter)
+
+        chunks = await _collect(client.stream("y" * 30, max_tokens=4096))
+
+        assert chunks == ["x" * 30]
+        assert rate_limiter.get_stats()["current_tpm"] == 20
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("frozen_clock")
+    async def test_abandoned_stream_is_reconciled(self) -> None:
+        """소비자가 스트림을 중간에 닫아도 받은 만큼만 차감한다."""
+        rate_limiter = RateLimiter(requests_per_minute=60, tokens_per_minute=100_000)
+        client = ClaudeClient(api_key="test-key", rate_limiter=rate_limiter)
+        sdk = MagicMock()
+        sdk.messages.stream = MagicMock(return_value=_FakeTextStream(["a" * 30, "b" * 30]))
+        client._client = sdk
+
+        stream = client.stream("y" * 30, max_tokens=4096)
+        assert await anext(stream) == "a" * 30
+        await stream.aclose()
+
+        assert rate_limiter.get_stats()["current_tpm"] == 20
+
+    @pytest.mark.asyncio
+    async def test_stream_cache_hit_skips_api(self) -> None:
+        """캐시 히트이면 API 없이 캐시된 응답을 한 조각으로 전달한다."""
+        cache = LLMCache()
+        cache.set("Test prompt", "gpt-4o-mini", "Cached", max_tokens=1024, temperature=0.7)
+        client = OpenAIClient(api_key="test-key", cache=cache)
+        client._client = MagicMock()
+
+        chunks = await _collect(client.stream("Test prompt"))
+
+        assert chunks == ["Cached"]
+        client._client.chat.completions.create.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_stream_error_is_translated(self) -> None:
+        """스트리밍 중 SDK 예외는 LLMError로 변환된다."""
+        client = ClaudeClient(api_key="test-key")
+        sdk = MagicMock()
+        sdk.messages.stream = MagicMock(side_effect=RuntimeError("boom"))
+        client._client = sdk
+
+        with pytest.raises(LLMError, match="boom"):
+            await _collect(client.stream("Test prompt"))
+
+    @pytest.mark.asyncio
+    async def test_default_stream_uses_call_api(self) -> None:
+        """스트리밍을 구현하지 않은 클라이언트는 전체 응답을 한 조각으로 전달한다."""
+
+        class PlainClient(LLMClient):
+            async def _call_api(self, prompt: str, **kwargs: Any) -> str:
+                return f"echo {prompt}"
+
+        chunks = await _collect(PlainClient(api_key="k", model="m").stream("hi"))
+
+        assert chunks == ["echo hi"]
+
+    @pytest.mark.asyncio
+    async def test_aclose_releases_sdk_client(self) -> None:
+        """aclose는 SDK 클라이언트를 닫고 다음 호출 때 새로 만든다."""
+        client = ClaudeClient(api_key="test-key")
+        sdk = MagicMock()
+        sdk.close = AsyncMock()
+        client._client = sdk
+
+        await client.aclose()
+        await client.aclose()
+
+        sdk.close.assert_awaited_once()
+        assert client._client is None
+
+
 class TestOpenAIClient:
     """OpenAIClient 테스트."""
 
@@ -182,18 +484,12 @@ class TestOpenAIClient:
             mock_choice = MagicMock()
             mock_choice.message.content = "Test response"
             mock_response.choices = [mock_choice]
-            mock_client.chat.completions.create.return_value = mock_response
+            mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
             mock_get.return_value = mock_client
 
-            with patch("reddit_insight.llm.client.asyncio.to_thread") as mock_thread:
-                async def run_sync(func):
-                    return func()
-
-                mock_thread.side_effect = run_sync
-
-                result = await client.complete("Test prompt")
+            result = await client.complete("Test prompt")
 
-                assert result == "Test response"
+            assert result == "Test response"
 
     def test_model_attribute(self, client: OpenAIClient) -> None:
         """모델 속성이 올바르게 설정된다."""
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import time
+from unittest.mock import patch
 
 import pytest
 
@@ -104,35 +105,30 @@ class TestRateLimiter:
         assert stats["current_rpm"] == 0
         assert stats["current_tpm"] == 0
 
-    def test_reset(self, rate_limiter: RateLimiter) -> None:
+    @pytest.mark.asyncio
+    async def test_reset(self, rate_limiter: RateLimiter) -> None:
         """rate limiter를 초기화할 수 있다."""
-        # 요청 기록 추가
-        rate_limiter._request_times.append(time.time())
-        rate_limiter._token_counts.append((time.time(), 100))
-
-        assert len(rate_limiter._request_times) == 1
-        assert len(rate_limiter._token_counts) == 1
+        await rate_limiter.acquire(estimated_tokens=100)
+        assert rate_limiter.get_stats()["current_rpm"] == 1
 
-        # 리셋
         rate_limiter.reset()
 
-        assert len(rate_limiter._request_times) == 0
-        assert len(rate_limiter._token_counts) == 0
+        stats = rate_limiter.get_stats()
+        assert stats["current_rpm"] == 0
+        assert stats["current_tpm"] == 0
 
     @pytest.mark.asyncio
-    async def test_cleanup_old_entries(self, rate_limiter: RateLimiter) -> None:
-        """오래된 항목이 정리된다."""
-        # 오래된 항목 추가 (2분 전)
-        old_time = time.time() - 120
-        rate_limiter._request_times.append(old_time)
-        rate_limiter._token_counts.append((old_time, 100))
-
-        # 새 요청 시 정리됨
-        await rate_limiter.acquire()
+    async def test_bucket_refills_over_time(self, rate_limiter: RateLimiter) -> None:
+        """1분이 지나면 버킷이 다시 가득 찬다."""
+        await rate_limiter.acquire(estimated_tokens=100)
+
+        later = time.monotonic() + 60.0
+        with patch("reddit_insight.llm.rate_limiter.time.monotonic", return_value=later):
+            stats = rate_limiter.get_stats()
 
-        # 오래된 항목은 제거되고 새 항목만 있음
-        assert len(rate_limiter._request_times) == 1
-        assert all(t > (time.time() - 60) for t in rate_limiter._request_times)
+        assert stats["current_rpm"] == 0
+        assert stats["current_tpm"] == 0
+        assert stats["rpm_remaining"] == 60
 
     @pytest.mark.asyncio
     async def test_concurrent_requests(self, rate_limiter: RateLimiter) -> None:
@@ -174,3 +170,105 @@ class TestRateLimiterEdgeCases:
         stats = rate_limiter.get_stats()
         assert stats["current_rpm"] == 1
         assert stats["current_tpm"] == 0
+
+
+class TestTokenBucket:
+    """토큰 버킷 대기열 동작 테스트."""
+
+    @pytest.fixture
+    def limiter(self) -> RateLimiter:
+        """토큰 버킷이 비어 있는 limiter (초당 100토큰 충전)."""
+        return RateLimiter(requests_per_minute=10_000, tokens_per_minute=6_000)
+
+    @pytest.mark.asyncio
+    async def test_waiters_pass_in_fifo_order(self, limiter: RateLimiter) -> None:
+        """큰 요청 뒤에 온 작은 요청도 앞지르지 않는다."""
+        await limiter.acquire(estimated_tokens=6_000)
+        order: list[int] = []
+
+        async def request(index: int, tokens: int) -> None:
+            await limiter.acquire(estimated_tokens=tokens)
+            order.append(index)
+
+        tasks = [asyncio.create_task(request(0, 3)), asyncio.create_task(request(1, 1))]
+        tasks += [asyncio.create_task(request(i, 1)) for i in range(2, 6)]
+        await asyncio.sleep(0)
+        assert limiter.get_stats()["waiting"] == 6
+
+        await asyncio.wait_for(asyncio.gather(*tasks), timeout=2.0)
+
+        assert order == [0, 1, 2, 3, 4, 5]
+
+    @pytest.mark.asyncio
+    async def test_waiting_does_not_block_event_loop(self, limiter: RateLimiter) -> None:
+        """대기 중인 요청이 있어도 다른 작업은 계속 진행된다."""
+        await limiter.acquire(estimated_tokens=6_000)
+        waiter = asyncio.create_task(limiter.acquire(estimated_tokens=20))
+
+        start = time.perf_counter()
+        await asyncio.sleep(0.01)
+        limiter.get_stats()
+        assert time.perf_counter() - start < 0.1
+        assert not waiter.done()
+
+        await asyncio.wait_for(waiter, timeout=2.0)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_is_skipped(self, limiter: RateLimiter) -> None:
+        """취소된 대기 요청은 건너뛰고 뒤의 요청이 통과한다."""
+        await limiter.acquire(estimated_tokens=6_000)
+        first = asyncio.create_task(limiter.acquire(estimated_tokens=3_000))
+        second = asyncio.create_task(limiter.acquire(estimated_tokens=1))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        await asyncio.wait_for(second, timeout=1.0)
+
+        assert first.cancelled()
+        assert limiter.get_stats()["waiting"] == 0
+
+    @pytest.mark.asyncio
+    async def test_reconcile_refunds_overestimate(self) -> None:
+        """실제 사용량이 추정보다 적으면 차이를 돌려준다."""
+        limiter = RateLimiter(requests_per_minute=60, tokens_per_minute=1_000)
+        await limiter.acquire(estimated_tokens=1_000)
+
+        limiter.reconcile(estimated_tokens=1_000, actual_tokens=200)
+
+        assert limiter.get_stats()["current_tpm"] == 200
+
+    @pytest.mark.asyncio
+    async def test_reconcile_charges_underestimate(self) -> None:
+        """실제 사용량이 추정보다 많으면 차이를 더 차감한다."""
+        limiter = RateLimiter(requests_per_minute=60, tokens_per_minute=1_000)
+        await limiter.acquire(estimated_tokens=100)
+
+        limiter.reconcile(estimated_tokens=100, actual_tokens=400)
+
+        assert limiter.get_stats()["current_tpm"] == 400
+
+    @pytest.mark.asyncio
+    async def test_reconcile_wakes_waiters(self) -> None:
+        """보정으로 돌려받은 토큰으로 대기 중인 요청이 바로 통과한다."""
+        limiter = RateLimiter(requests_per_minute=60, tokens_per_minute=1_000)
+        await limiter.acquire(estimated_tokens=1_000)
+        waiter = asyncio.create_task(limiter.acquire(estimated_tokens=500))
+        await asyncio.sleep(0)
+
+        limiter.reconcile(estimated_tokens=1_000, actual_tokens=100)
+
+        await asyncio.wait_for(waiter, timeout=0.5)
+
+    @pytest.mark.asyncio
+    async def test_oversized_request_is_clamped(self) -> None:
+        """TPM 한도보다 큰 요청은 한도로 제한되어 영원히 대기하지 않는다."""
+        limiter = RateLimiter(requests_per_minute=60, tokens_per_minute=100)
+
+        await asyncio.wait_for(limiter.acquire(estimated_tokens=500), timeout=0.5)
+
+        assert limiter.get_stats()["tpm_remaining"] == 0
+
+    def test_invalid_limits(self) -> None:
+        """한도는 1 이상이어야 한다."""
+        with pytest.raises(ValueError):
+            RateLimiter(requests_per_minute=0)
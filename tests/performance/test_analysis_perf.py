@@ -0,0 +1,769 @@
+"""Performance tests for the analysis package.
+
+분석기 입력 표현과 핵심 연산의 성능을 측정한다:
+- list[Post] vs PostCorpus 메모리 사용량과 다중 키워드 트렌드 분석 시간
+- 키워드별 반복 스캔 vs 단일 패스 다중 키워드 카운팅
+- 엔티티 병합의 멘션 수 대비 확장성
+- 대규모 수요 매칭 클러스터링 (MinHash/LSH)
+- 롤링 통계 기반 다중 시계열 이상 탐지
+- 대규모 문서 클러스터링 (MiniBatchKMeans, 표본 실루엣)
+- 희소 동시출현 기반 토픽 coherence
+- 문서별 TF-IDF 상위 키워드 (CSR top-k)
+- 공유 AnalysisContext 유무에 따른 전체 분석 파이프라인 시간
+"""
+
+from __future__ import annotations
+
+import gc
+import os
+import random
+import re
+import string
+import time
+import tracemalloc
+from datetime import UTC, datetime, timedelta
+
+import numpy as np
+import pytest
+from scipy.sparse import random as sparse_random
+
+from reddit_insight.analysis import (
+    ENGLISH_PATTERNS,
+    AnalysisContext,
+    CompetitiveAnalyzer,
+    DemandAnalyzer,
+    DemandClusterer,
+    DemandDetector,
+    DemandMatch,
+    DemandPatternLibrary,
+    EntityRecognizer,
+    EntitySentimentAnalyzer,
+    EntityType,
+    KeywordMatcher,
+    KeywordTrendAnalyzer,
+    PostCorpus,
+    ProductEntity,
+    RuleBasedSentimentAnalyzer,
+    TFIDFAnalyzer,
+    TFIDFConfig,
+    TimeGranularity,
+    TimePoint,
+    TimeSeries,
+    UnifiedKeywordExtractor,
+)
+from reddit_insight.analysis.ml import (
+    AnomalyDetector,
+    AnomalyDetectorConfig,
+    TextClusterer,
+    TextClustererConfig,
+    Topic,
+    TopicModeler,
+)
+from reddit_insight.analysis.tfidf import top_k_per_row
+from reddit_insight.dashboard.services.cluster_service import ClusterService
+from reddit_insight.reddit.models import Post
+
+# =============================================================================
+# HELPERS
+# =============================================================================
+
+
+def make_posts(count: int) -> list[Post]:
+    """벤치마크용 게시물 생성."""
+    base = datetime(2024, 1, 1, tzinfo=UTC)
+    topics = ("python", "rust", "docker", "kubernetes", "postgres")
+    return [
+        Post(
+            id=f"p{i}",
+            title=f"Question about {topics[i % 5]} tooling number {i}",
+            selftext=(
+                f"I need a better way to manage {topics[(i + 1) % 5]} deployments. "
+                "Is there any tool that handles this without too much config? "
+                f"Switched from Jenkins to GitHub Actions but it is too slow {i % 13}."
+            ),
+            author=f"user{i % 97}",
+            subreddit="programming",
+            score=i % 500,
+            num_comments=i % 50,
+            created_utc=base + timedelta(minutes=7 * i),
+            url=f"https://reddit.com/r/programming/comments/p{i}",
+            permalink=f"/r/programming/comments/p{i}",
+        )
+        for i in range(count)
+    ]
+
+
+# =============================================================================
+# POST CORPUS
+# =============================================================================
+
+
+class TestPostCorpusPerformance:
+    """list[Post] 대비 PostCorpus의 메모리와 분석 시간 측정."""
+
+    POST_COUNT = 20_000
+    KEYWORDS = ("python", "rust", "docker", "kubernetes", "postgres", "tool")
+
+    def test_memory_per_post(self) -> None:
+        """PostCorpus가 Post 객체 리스트보다 적은 메모리를 쓰는지 확인."""
+        gc.collect()
+        tracemalloc.start()
+        posts = make_posts(self.POST_COUNT)
+        list_bytes, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        corpus = PostCorpus.from_posts(posts)
+
+        print(
+            f"\nlist[Post]: {list_bytes / self.POST_COUNT:.0f} B/post, "
+            f"PostCorpus: {corpus.nbytes / self.POST_COUNT:.0f} B/post"
+        )
+        assert corpus.nbytes < list_bytes / 3
+
+    def test_multi_keyword_trends(self) -> None:
+        """다중 키워드 트렌드 분석이 corpus 입력에서 더 빠른지 확인."""
+        posts = make_posts(self.POST_COUNT)
+        analyzer = KeywordTrendAnalyzer()
+
+        start = time.perf_counter()
+        from_list = [
+            analyzer.build_keyword_timeseries(posts, kw, TimeGranularity.HOUR)
+            for kw in self.KEYWORDS
+        ]
+        list_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        from_corpus = analyzer.build_multiple_timeseries(
+            posts, list(self.KEYWORDS), TimeGranularity.HOUR
+        )
+        corpus_elapsed = time.perf_counter() - start
+
+        for series in from_list:
+            assert [p.value for p in series.points] == [
+                p.value for p in from_corpus[series.keyword].points
+            ]
+        print(
+            f"\n{len(self.KEYWORDS)} keywords x {self.POST_COUNT} posts: "
+            f"list {list_elapsed:.2f}s, corpus {corpus_elapsed:.2f}s"
+        )
+        assert corpus_elapsed < list_elapsed
+
+
+# =============================================================================
+# SINGLE-PASS KEYWORD COUNTING
+# =============================================================================
+
+
+def make_keywords(count: int) -> list[str]:
+    """겹치는 접두사를 포함한 추적 키워드 생성."""
+    base = ["python", "rust", "docker", "kubernetes", "postgres", "tool", "jenkins"]
+    keywords = list(base)
+    i = 0
+    while len(keywords) < count:
+        keywords.append(f"{base[i % len(base)]}{i}")
+        i += 1
+    return keywords
+
+
+class TestMultiKeywordPerformance:
+    """키워드 수에 따른 다중 키워드 트렌드 분석 시간 측정."""
+
+    POST_COUNT = 100_000
+    KEYWORD_COUNT = 500
+    # 키워드별 반복 스캔은 너무 느려 일부 키워드로 측정 후 외삽한다
+    SAMPLE_KEYWORDS = 10
+
+    @pytest.mark.slow
+    def test_500_keywords_100k_posts(self) -> None:
+        """500개 키워드 x 100k 포스트를 단일 패스로 처리."""
+        corpus = PostCorpus.from_posts(make_posts(self.POST_COUNT))
+        keywords = make_keywords(self.KEYWORD_COUNT)
+        analyzer = KeywordTrendAnalyzer()
+
+        start = time.perf_counter()
+        combined = analyzer.build_multiple_timeseries(
+            corpus, keywords, TimeGranularity.DAY
+        )
+        single_pass_elapsed = time.perf_counter() - start
+
+        # 이전 방식: 키워드마다 전체 corpus를 다시 소문자화하고 find 스캔
+        sample = keywords[: self.SAMPLE_KEYWORDS]
+        texts = list(corpus.texts())
+        start = time.perf_counter()
+        per_keyword = {
+            kw: sum(analyzer._count_keyword_in_text(text, kw) for text in texts)
+            for kw in sample
+        }
+        per_keyword_elapsed = (
+            (time.perf_counter() - start) * self.KEYWORD_COUNT / self.SAMPLE_KEYWORDS
+        )
+
+        for kw in sample:
+            assert sum(p.value for p in combined[kw].points) == per_keyword[kw]
+        print(
+            f"\n{self.KEYWORD_COUNT} keywords x {self.POST_COUNT} posts: "
+            f"single pass {single_pass_elapsed:.2f}s, "
+            f"per keyword ~{per_keyword_elapsed:.2f}s (extrapolated)"
+        )
+        assert single_pass_elapsed < per_keyword_elapsed
+
+    def test_matcher_scales_with_keywords(self) -> None:
+        """키워드 수가 늘어도 단일 패스 시간이 비례해 늘지 않는지 확인."""
+        texts = [text.lower() for text in PostCorpus.from_posts(make_posts(5_000)).texts()]
+
+        timings = {}
+        for count in (5, 500):
+            matcher = KeywordMatcher(make_keywords(count))
+            start = time.perf_counter()
+            for text in texts:
+                for _ in matcher.iter_matches(text):
+                    pass
+            timings[count] = time.perf_counter() - start
+
+        print(f"\nmatcher 5 keywords {timings[5]:.3f}s, 500 keywords {timings[500]:.3f}s")
+        assert timings[500] < timings[5] * 20
+
+
+# =============================================================================
+# ENTITY MERGING
+# =============================================================================
+
+
+def make_entities(count: int, vocabulary: int = 3_000) -> list[ProductEntity]:
+    """고정된 제품명 어휘에서 뽑은 엔티티 멘션 생성."""
+    rng = random.Random(count)
+    names = [
+        "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(4, 12)))
+        for _ in range(vocabulary)
+    ]
+    return [
+        ProductEntity(
+            name=name.title(),
+            normalized_name=name,
+            entity_type=EntityType.PRODUCT,
+            confidence=0.7,
+        )
+        for name in (rng.choice(names) for _ in range(count))
+    ]
+
+
+class TestEntityMergePerformance:
+    """코퍼스 규모 엔티티 병합 시간 측정."""
+
+    SIZES = (50_000, 200_000)
+
+    def test_merge_scales_near_linearly(self) -> None:
+        """멘션 수가 4배가 되어도 병합 시간이 대략 선형으로 늘어나는지 확인."""
+        recognizer = EntityRecognizer()
+
+        timings = {}
+        for size in self.SIZES:
+            entities = make_entities(size)
+            start = time.perf_counter()
+            merged = recognizer._merge_entities(entities)
+            timings[size] = time.perf_counter() - start
+            assert sum(e.mentions for e in merged) == size
+
+        small, large = self.SIZES
+        print(
+            f"\nmerge {small} mentions {timings[small]:.2f}s, "
+            f"{large} mentions {timings[large]:.2f}s"
+        )
+        assert timings[large] < timings[small] * (large / small) * 2
+
+
+# =============================================================================
+# DEMAND CLUSTERING
+# =============================================================================
+
+
+def make_demand_matches(count: int) -> list[DemandMatch]:
+    """주제별 어휘를 섞은 수요 매칭 생성 (컨텍스트당 키워드 10~20개)."""
+    rng = random.Random(count)
+    vocabulary = [
+        "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(4, 9)))
+        for _ in range(20_000)
+    ]
+    topics = [rng.sample(vocabulary, 30) for _ in range(count // 20)]
+    matches = []
+    for _ in range(count):
+        words = rng.sample(rng.choice(topics), rng.randint(10, 20))
+        context = "I wish there was a tool for " + " ".join(words)
+        matches.append(
+            DemandMatch(
+                pattern=ENGLISH_PATTERNS[0],
+                text=context,
+                matched_span=(0, 6),
+                context=context,
+                confidence=rng.random(),
+            )
+        )
+    return matches
+
+
+class TestDemandClusteringPerformance:
+    """LSH 모드의 대규모 수요 클러스터링 시간 측정."""
+
+    @pytest.mark.slow
+    def test_100k_matches_cluster_in_seconds(self) -> None:
+        """100k 수요 매칭을 수 초 안에 클러스터링."""
+        matches = make_demand_matches(100_000)
+        clusterer = DemandClusterer()
+
+        start = time.perf_counter()
+        clusters = clusterer.cluster_demands(matches)
+        elapsed = time.perf_counter() - start
+
+        print(f"\ncluster 100000 matches: {len(clusters)} clusters in {elapsed:.2f}s")
+        assert sum(c.frequency for c in clusters) == len(matches)
+        assert elapsed < 30
+
+    def test_lsh_matches_greedy(self) -> None:
+        """LSH 모드가 전체 쌍 비교와 같은 클러스터를 만드는지 확인."""
+        matches = make_demand_matches(3_000)
+
+        start = time.perf_counter()
+        greedy = DemandClusterer(lsh_min_matches=len(matches) + 1).cluster_demands(matches)
+        greedy_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        lsh = DemandClusterer(lsh_min_matches=0).cluster_demands(matches)
+        lsh_elapsed = time.perf_counter() - start
+
+        print(
+            f"\ncluster 3000 matches: greedy {greedy_elapsed:.2f}s, "
+            f"lsh {lsh_elapsed:.2f}s"
+        )
+        assert [[id(m) for m in c.matches] for c in greedy] == [
+            [id(m) for m in c.matches] for c in lsh
+        ]
+        assert lsh_elapsed < greedy_elapsed
+
+
+# =============================================================================
+# ENTITY SENTIMENT
+# =============================================================================
+
+
+class TestEntitySentimentPerformance:
+    """엔티티 감성 분석의 문서 길이 대비 시간 측정."""
+
+    ENTITY_COUNT = 1_000
+
+    def test_many_entities_scored_from_one_pass(self) -> None:
+        """엔티티마다 정규식 검색과 컨텍스트 재분석을 하는 방식보다 빠른지 확인."""
+        rng = random.Random(5)
+        adjectives = ("great", "terrible", "not good", "really slow", "amazing")
+        text = " ".join(
+            f"I switched to {rng.choice(string.ascii_uppercase)}"
+            f"{''.join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 12)))} "
+            f"and it is {rng.choice(adjectives)}."
+            for _ in range(self.ENTITY_COUNT)
+        )
+        analyzer = EntitySentimentAnalyzer()
+        sentiment = RuleBasedSentimentAnalyzer()
+
+        # 기준: 엔티티마다 패턴을 컴파일해 위치를 찾고 컨텍스트를 다시 분석
+        start = time.perf_counter()
+        entities = analyzer._entity_recognizer.recognize(text)
+        for entity in entities:
+            match = re.compile(re.escape(entity.name), re.IGNORECASE).search(text)
+            context = analyzer._extract_entity_context(text, match.start(), match.end())
+            sentiment.analyze(context)
+        reference_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        results = analyzer.analyze_text(text)
+        fused_elapsed = time.perf_counter() - start
+
+        print(
+            f"\nentity sentiment x {len(entities)} entities: "
+            f"per-entity {reference_elapsed:.2f}s, fused {fused_elapsed:.2f}s"
+        )
+        assert len(results) == len(entities)
+        assert fused_elapsed < reference_elapsed
+
+
+class TestBatchSentimentPerformance:
+    """짧은 댓글 대량 감성 분석 처리량 측정."""
+
+    COMMENT_COUNT = 100_000
+
+    def test_analyze_many_throughput(self) -> None:
+        """일괄 분석이 개별 분석과 같은 결과를 더 빨리 내는지 확인."""
+        rng = random.Random(3)
+        words = [
+            "this", "app", "is", "not", "very", "good", "but", "the", "new", "update", "is",
+            "really", "great", "i", "hate", "how", "slow", "it", "is", "kind", "of", "bad",
+            "and", "works", "fine", "for", "me", ":)",
+        ]
+        comments = [
+            " ".join(rng.choice(words) for _ in range(rng.randint(3, 20)))
+            for _ in range(self.COMMENT_COUNT)
+        ]
+        analyzer = RuleBasedSentimentAnalyzer()
+
+        start = time.perf_counter()
+        expected = [analyzer.analyze(comment) for comment in comments]
+        loop_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        scores = analyzer.analyze_many(comments)
+        batch_elapsed = time.perf_counter() - start
+
+        per_minute = self.COMMENT_COUNT / batch_elapsed * 60
+        print(
+            f"\nsentiment x {self.COMMENT_COUNT} comments: loop {loop_elapsed:.2f}s, "
+            f"batch {batch_elapsed:.2f}s ({per_minute / 1e6:.1f}M/min)"
+        )
+        assert scores == expected
+        assert batch_elapsed < loop_elapsed
+
+
+# =============================================================================
+# DEMAND PATTERN SCANNING
+# =============================================================================
+
+
+class TestDemandScanPerformance:
+    """컴파일된 패턴 스캐너의 탐지 시간 측정."""
+
+    POST_COUNT = 5_000
+
+    def test_scanner_faster_than_per_pattern_finditer(self) -> None:
+        """스캐너가 패턴별 finditer 루프와 같은 결과를 더 빨리 내는지 확인."""
+        library = DemandPatternLibrary.create_multilingual_library()
+        texts = [f"{post.title}\n\n{post.selftext}" for post in make_posts(self.POST_COUNT)]
+        compiled = [
+            (pattern, re.compile(pattern.regex_pattern, re.IGNORECASE))
+            for pattern in library.get_patterns()
+        ]
+
+        start = time.perf_counter()
+        expected = [
+            [(p.pattern_id, m.span()) for p, regex in compiled for m in regex.finditer(text)]
+            for text in texts
+        ]
+        loop_elapsed = time.perf_counter() - start
+
+        scanner = library.get_scanner()
+        start = time.perf_counter()
+        actual = [[(p.pattern_id, m.span()) for p, m in scanner.scan(text)] for text in texts]
+        scan_elapsed = time.perf_counter() - start
+
+        print(
+            f"\nscan {self.POST_COUNT} posts x {len(compiled)} patterns: "
+            f"finditer loop {loop_elapsed:.2f}s, scanner {scan_elapsed:.2f}s"
+        )
+        assert actual == expected
+        assert scan_elapsed < loop_elapsed
+
+
+class TestParallelDemandDetectionPerformance:
+    """프로세스 풀 수요 탐지 시간 측정."""
+
+    POST_COUNT = 100_000
+
+    @pytest.mark.slow
+    @pytest.mark.skipif((os.cpu_count() or 1) < 4, reason="needs at least 4 cores")
+    def test_100k_posts_scale_with_workers(self) -> None:
+        """100k 게시물 탐지가 워커 수에 따라 빨라지고 결과가 같은지 확인."""
+        corpus = PostCorpus.from_posts(make_posts(self.POST_COUNT))
+        detector = DemandDetector()
+        workers = min(os.cpu_count() or 1, 8)
+
+        start = time.perf_counter()
+        serial = detector.detect_in_posts(corpus)
+        serial_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        parallel = detector.detect_in_posts(corpus, workers=workers)
+        parallel_elapsed = time.perf_counter() - start
+
+        print(
+            f"\ndetect {self.POST_COUNT} posts: serial {serial_elapsed:.2f}s, "
+            f"{workers} workers {parallel_elapsed:.2f}s"
+        )
+        assert [(m.pattern.pattern_id, m.matched_span, m.confidence) for m in parallel] == [
+            (m.pattern.pattern_id, m.matched_span, m.confidence) for m in serial
+        ]
+        assert parallel_elapsed < serial_elapsed / 2
+
+
+# =============================================================================
+# ANOMALY DETECTION
+# =============================================================================
+
+
+class TestAnomalyDetectionPerformance:
+    """롤링 통계와 다중 시계열 이상 탐지 시간 측정."""
+
+    SERIES_LENGTH = 50_000
+    WINDOW = 101
+    KEYWORD_COUNT = 5_000
+    DAYS = 90
+
+    def test_rolling_zscore_linear(self) -> None:
+        """누적합 기반 롤링 z-score가 구간별 재계산보다 빠른지 확인."""
+        rng = np.random.default_rng(0)
+        values = rng.poisson(100, size=self.SERIES_LENGTH).astype(float).tolist()
+        now = datetime(2024, 1, 1, tzinfo=UTC)
+        series = TimeSeries(
+            keyword="python",
+            granularity=TimeGranularity.HOUR,
+            points=[
+                TimePoint(timestamp=now + timedelta(hours=i), value=v)
+                for i, v in enumerate(values)
+            ],
+        )
+        detector = AnomalyDetector(
+            AnomalyDetectorConfig(method="zscore", threshold=3.0, window_size=self.WINDOW)
+        )
+
+        start = time.perf_counter()
+        arr = np.array(values)
+        half = self.WINDOW // 2
+        expected = []
+        for i in range(len(arr)):
+            chunk = arr[max(0, i - half) : i + half + 1]
+            std = chunk.std()
+            expected.append(bool(std > 0 and abs(arr[i] - chunk.mean()) / std > 3.0))
+        naive_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        result = detector.detect(series)
+        rolling_elapsed = time.perf_counter() - start
+
+        print(
+            f"\nrolling z-score x {self.SERIES_LENGTH} points (w={self.WINDOW}): "
+            f"naive {naive_elapsed:.2f}s, cumulative sums {rolling_elapsed:.2f}s"
+        )
+        assert [a.is_anomaly for a in result.anomalies] == expected
+        assert rolling_elapsed < naive_elapsed
+
+    def test_detect_many_keywords(self) -> None:
+        """수천 개 키워드 시계열을 한 번의 호출로 탐지하는 시간 측정."""
+        rng = np.random.default_rng(1)
+        matrix = rng.poisson(100, size=(self.KEYWORD_COUNT, self.DAYS)).astype(float)
+        spikes = rng.choice(self.KEYWORD_COUNT, size=50, replace=False)
+        matrix[spikes, 60] = 1_000.0
+        detector = AnomalyDetector(
+            AnomalyDetectorConfig(method="zscore", threshold=3.0, window_size=14)
+        )
+
+        start = time.perf_counter()
+        result = detector.detect_many(matrix)
+        elapsed = time.perf_counter() - start
+
+        print(
+            f"\ndetect_many {self.KEYWORD_COUNT} keywords x {self.DAYS} days: "
+            f"{elapsed * 1000:.0f}ms, {len(result.anomalous_rows())} anomalous series"
+        )
+        assert set(spikes.tolist()) <= set(result.anomalous_rows())
+        assert result.is_anomaly[spikes, 60].all()
+        assert elapsed < 5.0
+
+
+# =============================================================================
+# TEXT CLUSTERING
+# =============================================================================
+
+
+def make_cluster_documents(count: int) -> list[str]:
+    """클러스터링 벤치마크용 문서 생성 (주제별 어휘 + 공통 어휘)."""
+    rng = random.Random(5)
+    topics = [
+        "deploy docker kubernetes container cluster helm",
+        "login auth token password session oauth",
+        "slow memory leak crash freeze performance",
+        "pricing plan subscription billing refund invoice",
+        "database query index postgres migration schema",
+    ]
+    common = [
+        "need", "help", "with", "this", "issue", "today",
+        "anyone", "know", "how", "to", "fix", "it",
+    ]
+    topic_words = [topic.split() for topic in topics]
+    return [
+        " ".join(
+            rng.choice(topic_words[i % len(topics)]) if rng.random() < 0.6 else rng.choice(common)
+            for _ in range(12)
+        )
+        for i in range(count)
+    ]
+
+
+class TestTextClusteringPerformance:
+    """대규모 문서 클러스터링의 k 선택 시간 측정."""
+
+    DENSE_COUNT = 4_000
+    LARGE_COUNT = 30_000
+
+    def test_scalable_k_selection(self) -> None:
+        """희소/축소 경로가 밀집 경로보다 빠르고 대규모 코퍼스를 처리하는지 확인."""
+        documents = make_cluster_documents(self.DENSE_COUNT)
+        config = TextClustererConfig(max_clusters=8, large_corpus_threshold=10**9)
+
+        start = time.perf_counter()
+        dense = TextClusterer(config).cluster(documents)
+        dense_elapsed = time.perf_counter() - start
+
+        config.large_corpus_threshold = 1
+        start = time.perf_counter()
+        scalable = TextClusterer(config).cluster(documents)
+        scalable_elapsed = time.perf_counter() - start
+
+        large = make_cluster_documents(self.LARGE_COUNT)
+        start = time.perf_counter()
+        view = ClusterService().cluster_documents(documents=large)
+        large_elapsed = time.perf_counter() - start
+
+        print(
+            f"\nk selection x {self.DENSE_COUNT} docs: dense {dense_elapsed:.2f}s "
+            f"(k={dense.n_clusters}), scalable {scalable_elapsed:.2f}s "
+            f"(k={scalable.n_clusters}); {self.LARGE_COUNT} docs via service "
+            f"{large_elapsed:.2f}s (k={view.n_clusters})"
+        )
+        assert scalable.parameters["scalable"] is True
+        assert scalable.n_clusters == dense.n_clusters
+        assert scalable_elapsed < dense_elapsed
+        assert view.n_clusters >= 2
+        assert large_elapsed < 60.0
+
+
+# =============================================================================
+# TOPIC COHERENCE
+# =============================================================================
+
+
+class TestTopicCoherencePerformance:
+    """희소 동시출현 coherence 계산 시간 측정."""
+
+    DOC_COUNT = 30_000
+    VOCAB_SIZE = 2_000
+    N_TOPICS = 10
+
+    def test_sparse_coherence(self) -> None:
+        """희소 곱 기반 coherence가 밀집 이중 루프와 같은 값을 더 빨리 내는지 확인."""
+        rng = np.random.default_rng(6)
+        matrix = sparse_random(
+            self.DOC_COUNT, self.VOCAB_SIZE, density=0.01, format="csr", random_state=rng
+        )
+        feature_names = [f"w{i}" for i in range(self.VOCAB_SIZE)]
+        topics = [
+            Topic(id=t, keywords=[f"w{i}" for i in rng.choice(200, size=10, replace=False)])
+            for t in range(self.N_TOPICS)
+        ]
+        modeler = TopicModeler()
+
+        start = time.perf_counter()
+        dense = (matrix > 0).toarray()
+        expected = []
+        for topic in topics:
+            cols = [int(kw[1:]) for kw in topic.keywords]
+            scores = []
+            for i in range(len(cols)):
+                for j in range(i + 1, len(cols)):
+                    both = np.sum(dense[:, cols[i]] & dense[:, cols[j]])
+                    first = np.sum(dense[:, cols[i]])
+                    if first > 0:
+                        scores.append(np.log((both + 1) / first))
+            expected.append(np.mean(scores))
+        dense_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        coherence = modeler._calculate_coherence(topics, matrix, feature_names)
+        sparse_elapsed = time.perf_counter() - start
+
+        print(
+            f"\ncoherence x {self.DOC_COUNT} docs x {self.VOCAB_SIZE} terms: "
+            f"dense {dense_elapsed:.2f}s, sparse {sparse_elapsed * 1000:.0f}ms"
+        )
+        assert coherence == pytest.approx(float(np.mean(expected)))
+        assert sparse_elapsed < dense_elapsed
+
+
+# =============================================================================
+# TF-IDF DOCUMENT KEYWORDS
+# =============================================================================
+
+
+class TestDocumentKeywordsPerformance:
+    """문서별 TF-IDF 상위 키워드 추출 시간 측정."""
+
+    POST_COUNT = 20_000
+
+    def test_sparse_top_k(self) -> None:
+        """CSR 기반 top-k가 행별 밀집 정렬과 같은 결과를 더 빨리 내는지 확인."""
+        rng = random.Random(7)
+        vocabulary = ["".join(rng.choices(string.ascii_lowercase, k=7)) for _ in range(20_000)]
+        texts = [" ".join(rng.choices(vocabulary, k=30)) for _ in range(self.POST_COUNT)]
+        analyzer = TFIDFAnalyzer(
+            TFIDFConfig(max_features=20_000, min_df=1, ngram_range=(1, 1))
+        ).fit(texts)
+        matrix = analyzer.transform(texts)
+
+        start = time.perf_counter()
+        expected = []
+        for i in range(matrix.shape[0]):
+            scores = matrix[i].toarray().ravel()
+            top = scores.argsort(kind="stable")[::-1][:5]
+            expected.append(sorted(float(scores[j]) for j in top if scores[j] > 0))
+        dense_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        indptr, _, top_scores = top_k_per_row(matrix, 5)
+        sparse_elapsed = time.perf_counter() - start
+
+        print(
+            f"\ndocument keywords x {self.POST_COUNT} docs: dense rows {dense_elapsed:.2f}s, "
+            f"sparse top-k {sparse_elapsed * 1000:.0f}ms"
+        )
+        assert [
+            sorted(top_scores[indptr[i] : indptr[i + 1]].tolist())
+            for i in range(self.POST_COUNT)
+        ] == expected
+        assert sparse_elapsed < dense_elapsed
+
+
+# =============================================================================
+# SHARED ANALYSIS CONTEXT
+# =============================================================================
+
+
+def run_full_analysis(corpus: PostCorpus, context: AnalysisContext | None) -> None:
+    """`analyze full`과 같은 순서로 네 분석기를 실행."""
+    keyword_result = UnifiedKeywordExtractor(context=context).extract_from_posts(
+        corpus, num_keywords=20
+    )
+    keywords = [kw.keyword for kw in keyword_result.keywords[:10]]
+    KeywordTrendAnalyzer(context=context).analyze_multiple_keywords(corpus, keywords)
+    DemandAnalyzer(context=context).analyze_posts(corpus)
+    CompetitiveAnalyzer(context=context).analyze_posts(corpus)
+
+
+class TestAnalysisContextPerformance:
+    """공유 컨텍스트의 전체 분석 시간 측정."""
+
+    POST_COUNT = 2_000
+
+    def test_full_analysis_with_shared_context(self) -> None:
+        """공유 컨텍스트를 쓰면 전체 분석이 느려지지 않는지 확인."""
+        corpus = PostCorpus.from_posts(make_posts(self.POST_COUNT))
+
+        start = time.perf_counter()
+        run_full_analysis(corpus, None)
+        plain_elapsed = time.perf_counter() - start
+
+        context = AnalysisContext()
+        start = time.perf_counter()
+        run_full_analysis(corpus, context)
+        shared_elapsed = time.perf_counter() - start
+
+        print(
+            f"\nfull analysis x {self.POST_COUNT} posts: "
+            f"no context {plain_elapsed:.2f}s, shared context {shared_elapsed:.2f}s "
+            f"({context.hits} hits / {context.misses} misses)"
+        )
+        assert context.hits > context.misses
+        assert shared_elapsed < plain_elapsed * 1.1
@@ -0,0 +1,157 @@
+"""Performance tests for the collection pipeline.
+
+수집 파이프라인의 저장 처리량을 측정한다:
+- DataPipeline.process_posts / process_comments bulk ingest (rows/sec)
+"""
+
+from __future__ import annotations
+
+import time
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+
+import pytest
+
+from reddit_insight.pipeline import DataPipeline
+from reddit_insight.reddit.models import Comment, Post
+from reddit_insight.storage.database import Database
+from reddit_insight.storage.repository import PostRepository
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+    from pathlib import Path
+
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+
+def generate_posts(count: int, prefix: str = "p") -> list[Post]:
+    """벤치마크용 게시물을 생성한다."""
+    base = datetime(2024, 1, 1, tzinfo=UTC)
+    return [
+        Post(
+            id=f"{prefix}{i}",
+            title=f"Benchmark post {i} about python tooling",
+            selftext="Looking for a better way to manage dependencies " * 4,
+            author=f"user{i % 97}",
+            subreddit="python",
+            score=i % 500,
+            num_comments=i % 50,
+            created_utc=base + timedelta(minutes=i),
+            url=f"https://reddit.com/r/python/comments/{prefix}{i}",
+            permalink=f"/r/python/comments/{prefix}{i}",
+        )
+        for i in range(count)
+    ]
+
+
+def generate_comments(count: int, post_id: str) -> list[Comment]:
+    """벤치마크용 댓글을 생성한다."""
+    base = datetime(2024, 1, 1, tzinfo=UTC)
+    return [
+        Comment(
+            id=f"c{i}",
+            body=f"Comment {i}: have you tried a lockfile based workflow?",
+            author=f"user{i % 53}",
+            subreddit="python",
+            score=i % 20,
+            created_utc=base + timedelta(seconds=i),
+            parent_id=f"t3_{post_id}",
+            post_id=post_id,
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+async def bench_db(tmp_path: Path) -> AsyncIterator[Database]:
+    """로컬 SQLite 파일 데이터베이스."""
+    db = Database(url=f"sqlite+aiosqlite:///{tmp_path / 'bench.db'}")
+    await db.connect()
+    yield db
+    await db.disconnect()
+
+
+# =============================================================================
+# BULK INGEST THROUGHPUT
+# =============================================================================
+
+
+class TestBulkIngestThroughput:
+    """set 기반 bulk ingest 처리량 측정."""
+
+    ROW_COUNT = 5_000
+    # 보수적인 하한선 (CI 환경 편차 고려)
+    TARGET_ROWS_PER_SEC = 5_000
+
+    @pytest.mark.asyncio
+    async def test_process_posts_throughput(self, bench_db: Database) -> None:
+        """신규 삽입과 재수집(전부 중복) 처리량을 측정한다."""
+        pipeline = DataPipeline(bench_db)
+        posts = generate_posts(self.ROW_COUNT)
+
+        start = time.perf_counter()
+        first = await pipeline.process_posts(posts, "python")
+        insert_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        second = await pipeline.process_posts(posts, "python")
+        upsert_elapsed = time.perf_counter() - start
+
+        assert first.new == self.ROW_COUNT
+        assert second.duplicates == self.ROW_COUNT
+
+        insert_rate = self.ROW_COUNT / insert_elapsed
+        upsert_rate = self.ROW_COUNT / upsert_elapsed
+        print(
+            f"\nprocess_posts: insert {insert_rate:,.0f} rows/s, "
+            f"re-ingest {upsert_rate:,.0f} rows/s"
+        )
+        assert insert_rate > self.TARGET_ROWS_PER_SEC
+        assert upsert_rate > self.TARGET_ROWS_PER_SEC
+
+    @pytest.mark.asyncio
+    async def test_process_comments_throughput(self, bench_db: Database) -> None:
+        """댓글 bulk ingest 처리량을 측정한다."""
+        pipeline = DataPipeline(bench_db)
+        await pipeline.process_posts(generate_posts(1), "python")
+        comments = generate_comments(self.ROW_COUNT, "p0")
+
+        start = time.perf_counter()
+        result = await pipeline.process_comments(comments, "p0")
+        elapsed = time.perf_counter() - start
+
+        assert result.new == self.ROW_COUNT
+        rate = self.ROW_COUNT / elapsed
+        print(f"\nprocess_comments: {rate:,.0f} rows/s")
+        assert rate > self.TARGET_ROWS_PER_SEC
+
+    @pytest.mark.asyncio
+    async def test_set_based_check_vs_per_row_lookup(self, bench_db: Database) -> None:
+        """청크 IN 조회가 행 단위 조회보다 빠른지 비교한다."""
+        pipeline = DataPipeline(bench_db)
+        posts = generate_posts(2_000)
+        await pipeline.process_posts(posts, "python")
+        reddit_ids = [p.id for p in posts]
+
+        async with bench_db.session() as session:
+            repo = PostRepository(session)
+
+            start = time.perf_counter()
+            per_row = {
+                rid for rid in reddit_ids if await repo.get_by_reddit_id(rid) is not None
+            }
+            per_row_elapsed = time.perf_counter() - start
+
+            start = time.perf_counter()
+            set_based = await repo.get_existing_reddit_ids(reddit_ids)
+            set_based_elapsed = time.perf_counter() - start
+
+        assert per_row == set_based
+        print(
+            f"\nexistence check: per-row {per_row_elapsed * 1000:.1f}ms, "
+            f"set-based {set_based_elapsed * 1000:.1f}ms"
+        )
+        assert set_based_elapsed < per_row_elapsed
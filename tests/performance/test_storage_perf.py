@@ -0,0 +1,254 @@
+"""Performance tests for the storage layer.
+
+SQLite 저장소의 동시 읽기 지연과 조회 메모리를 측정한다:
+- default(롤백 저널) vs production(WAL) 읽기 p50/p95 지연
+- 전체 ORM 로드 vs 청크 스트리밍 조회의 최대 메모리 사용량
+"""
+
+from __future__ import annotations
+
+import statistics
+import threading
+import time
+import tracemalloc
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+
+import pytest
+from sqlalchemy import create_engine, select, text
+from sqlalchemy.exc import OperationalError
+
+from reddit_insight.pipeline import DataPipeline
+from reddit_insight.reddit.models import Post
+from reddit_insight.storage import (
+    DEFAULT_PROFILE,
+    PRODUCTION_PROFILE,
+    Database,
+    PostModel,
+    PostRepository,
+    SQLiteProfile,
+    SubredditRepository,
+    apply_sqlite_profile,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+# =============================================================================
+# HELPERS
+# =============================================================================
+
+
+def measure_read_latency_during_ingest(
+    db_path: Path,
+    profile: SQLiteProfile,
+    write_batches: int,
+    batch_size: int,
+) -> tuple[list[float], int]:
+    """쓰기 스레드가 배치를 커밋하는 동안 읽기 지연을 측정한다.
+
+    Returns:
+        (읽기 지연 목록(초), 잠금 오류 수)
+    """
+    url = f"sqlite:///{db_path}"
+    writer = create_engine(url)
+    apply_sqlite_profile(writer, profile)
+    reader = create_engine(url)
+    apply_sqlite_profile(reader, profile, read_only=True)
+
+    with writer.begin() as conn:
+        conn.execute(
+            text(
+                "CREATE TABLE posts (id INTEGER PRIMARY KEY, subreddit TEXT, "
+                "title TEXT, score INTEGER)"
+            )
+        )
+        conn.execute(text("CREATE INDEX ix_posts_subreddit ON posts (subreddit)"))
+
+    done = threading.Event()
+
+    def ingest() -> None:
+        insert = text(
+            "INSERT INTO posts (subreddit, title, score) VALUES (:s, :t, :n)"
+        )
+        for batch in range(write_batches):
+            rows = [
+                {"s": f"sub{i % 10}", "t": f"post {batch}-{i} " * 8, "n": i}
+                for i in range(batch_size)
+            ]
+            with writer.begin() as conn:
+                conn.execute(insert, rows)
+        done.set()
+
+    latencies: list[float] = []
+    lock_errors = 0
+    query = text(
+        "SELECT subreddit, count(*), avg(score) FROM posts "
+        "WHERE subreddit = :s GROUP BY subreddit"
+    )
+
+    thread = threading.Thread(target=ingest)
+    thread.start()
+    with reader.connect() as conn:
+        i = 0
+        while not done.is_set():
+            start = time.perf_counter()
+            try:
+                conn.execute(query, {"s": f"sub{i % 10}"}).all()
+            except OperationalError:
+                lock_errors += 1
+            else:
+                latencies.append(time.perf_counter() - start)
+            conn.rollback()
+            i += 1
+    thread.join()
+
+    writer.dispose()
+    reader.dispose()
+    return latencies, lock_errors
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """정렬 기반 백분위수 (초)."""
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(len(ordered) * pct))
+    return ordered[index]
+
+
+# =============================================================================
+# CONCURRENT READ LATENCY
+# =============================================================================
+
+
+class TestConcurrentReadLatency:
+    """수집 중 대시보드 읽기 지연 측정."""
+
+    WRITE_BATCHES = 200
+    BATCH_SIZE = 200
+    # 보수적인 상한선 (CI 환경 편차 고려)
+    MAX_P95_MS = 50.0
+
+    @pytest.mark.parametrize("profile", [DEFAULT_PROFILE, PRODUCTION_PROFILE])
+    def test_read_latency_during_ingest(
+        self, tmp_path: Path, profile: SQLiteProfile
+    ) -> None:
+        """쓰기 배치가 커밋되는 동안 읽기 p50/p95 지연을 측정한다."""
+        latencies, lock_errors = measure_read_latency_during_ingest(
+            tmp_path / f"{profile.name}.db",
+            profile,
+            self.WRITE_BATCHES,
+            self.BATCH_SIZE,
+        )
+
+        assert latencies
+        p50 = statistics.median(latencies) * 1000
+        p95 = percentile(latencies, 0.95) * 1000
+        print(
+            f"\n{profile.name}: {len(latencies)} reads, "
+            f"p50 {p50:.2f}ms, p95 {p95:.2f}ms, lock errors {lock_errors}"
+        )
+
+        if profile is PRODUCTION_PROFILE:
+            # WAL에서는 읽기가 쓰기 커밋에 막히지 않는다
+            assert lock_errors == 0
+            assert p95 < self.MAX_P95_MS
+
+
+# =============================================================================
+# STREAMING LOADER MEMORY
+# =============================================================================
+
+
+class TestStreamingLoaderMemory:
+    """전체 로드 대비 스트리밍 조회의 최대 메모리 측정."""
+
+    POST_COUNT = 20_000
+    CHUNK_SIZE = 1_000
+
+    @pytest.mark.asyncio
+    async def test_stream_peak_memory_is_flat(self, tmp_path: Path) -> None:
+        """청크 단위로 소비하면 최대 메모리가 전체 로드보다 작은지 확인."""
+        db = Database(url=f"sqlite+aiosqlite:///{tmp_path / 'stream.db'}")
+        await db.connect()
+        base = datetime(2024, 1, 1, tzinfo=UTC)
+        posts = [
+            Post(
+                id=f"p{i}",
+                title=f"Benchmark post {i} about python tooling",
+                selftext="Looking for a better way to manage dependencies " * 8,
+                author=f"user{i % 97}",
+                subreddit="python",
+                score=i % 500,
+                num_comments=i % 50,
+                created_utc=base + timedelta(minutes=i),
+                url=f"https://reddit.com/r/python/comments/p{i}",
+                permalink=f"/r/python/comments/p{i}",
+            )
+            for i in range(self.POST_COUNT)
+        ]
+        await DataPipeline(db).process_posts(posts, "python")
+        del posts
+
+        try:
+            async with db.session() as session:
+                subreddit = await SubredditRepository(session).get_by_name("python")
+                assert subreddit is not None
+                subreddit_id = subreddit.id
+
+            # 기존 방식: ORM 객체 전체 로드 후 Post 변환
+            tracemalloc.start()
+            start = time.perf_counter()
+            async with db.session() as session:
+                result = await session.execute(
+                    select(PostModel)
+                    .where(PostModel.subreddit_id == subreddit_id)
+                    .order_by(PostModel.reddit_created_utc.desc())
+                )
+                models = result.scalars().all()
+                loaded = [
+                    Post(
+                        id=m.reddit_id,
+                        title=m.title,
+                        selftext=m.selftext or "",
+                        author=m.author,
+                        subreddit="python",
+                        score=m.score,
+                        num_comments=m.num_comments,
+                        created_utc=m.reddit_created_utc,
+                        url=m.url,
+                        permalink=m.permalink,
+                        is_self=m.is_self,
+                    )
+                    for m in models
+                ]
+                full_count = len(loaded)
+                del models, loaded
+            full_elapsed = time.perf_counter() - start
+            _, full_peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            # 스트리밍: 청크 단위 소비 (집계만 유지)
+            tracemalloc.start()
+            start = time.perf_counter()
+            stream_count = 0
+            total_score = 0
+            async with db.session() as session:
+                repo = PostRepository(session)
+                async for chunk in repo.stream_by_subreddit(
+                    subreddit_id, "python", chunk_size=self.CHUNK_SIZE
+                ):
+                    stream_count += len(chunk)
+                    total_score += sum(p.score for p in chunk)
+            stream_elapsed = time.perf_counter() - start
+            _, stream_peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        finally:
+            await db.disconnect()
+
+        assert full_count == stream_count == self.POST_COUNT
+        print(
+            f"\nfull load: peak {full_peak / 1e6:.1f}MB, {full_elapsed:.2f}s; "
+            f"stream: peak {stream_peak / 1e6:.1f}MB, {stream_elapsed:.2f}s"
+        )
+        assert stream_peak < full_peak / 3
@@ -10,6 +10,7 @@ v2.0에서 추가된 기능들의 성능을 측정한다:
 
 from __future__ import annotations
 
+import asyncio
 import gc
 import os
 import time
@@ -518,6 +519,46 @@ class TestRateLimiterPerformance:
         except ImportError:
             pytest.skip("RateLimiter not available")
 
+    def test_rate_limiter_concurrent_acquire(self) -> None:
+        """여유가 있을 때 10,000개 동시 acquire가 즉시 통과하는지 테스트한다."""
+        from reddit_insight.llm.rate_limiter import RateLimiter
+
+        limiter = RateLimiter(requests_per_minute=1_000_000, tokens_per_minute=100_000_000)
+
+        async def run() -> None:
+            await asyncio.gather(*(limiter.acquire(estimated_tokens=100) for _ in range(10_000)))
+
+        start = time.perf_counter()
+        asyncio.run(run())
+        elapsed = time.perf_counter() - start
+
+        assert limiter.get_stats()["waiting"] == 0
+        # 10,000번 acquire가 1초 이내여야 함
+        assert elapsed < 1.0, f"Concurrent acquire too slow: {elapsed:.2f}s for 10000 calls"
+
+    def test_rate_limiter_contended_acquire(self) -> None:
+        """버킷이 빈 상태에서 10,000개 대기 요청이 충전 속도대로 FIFO 통과하는지 테스트한다."""
+        from reddit_insight.llm.rate_limiter import RateLimiter
+
+        # 초당 10,000토큰 충전: 10,000개 x 1토큰 요청은 약 1초 걸려야 한다
+        limiter = RateLimiter(requests_per_minute=1_000_000, tokens_per_minute=600_000)
+        order: list[int] = []
+
+        async def request(index: int) -> None:
+            await limiter.acquire(estimated_tokens=1)
+            order.append(index)
+
+        async def run() -> None:
+            await limiter.acquire(estimated_tokens=600_000)
+            await asyncio.gather(*(request(i) for i in range(10_000)))
+
+        start = time.perf_counter()
+        asyncio.run(run())
+        elapsed = time.perf_counter() - start
+
+        assert order == list(range(10_000))
+        assert elapsed < 2.0, f"Contended acquire too slow: {elapsed:.2f}s for 10000 waiters"
+
     def test_rate_limiter_token_estimation(self) -> None:
         """Rate limiter 토큰 추정 성능을 테스트한다."""
         try:
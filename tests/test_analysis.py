@@ -10,18 +10,30 @@ from datetime import UTC, datetime, timedelta
 import pytest
 
 from reddit_insight.analysis import (
+    AnalysisContext,
+    CompetitiveAnalyzer,
+    DemandAnalyzer,
+    DemandDetector,
+    DocumentKeywords,
+    KeywordMatcher,
     KeywordTrendAnalyzer,
+    PostCorpus,
     RedditTokenizer,
     RisingConfig,
     RisingKeywordDetector,
     RisingScore,
     RisingScoreCalculator,
+    TFIDFAnalyzer,
+    TFIDFConfig,
+    TimeGranularity,
     TrendCalculator,
     TrendDirection,
     TrendReport,
     TrendReporter,
     UnifiedKeywordExtractor,
     YAKEExtractor,
+    bucket_timestamp,
+    iter_post_texts,
 )
 from reddit_insight.reddit.models import Post
 
@@ -337,6 +349,287 @@ class TestKeywordTrendAnalyzer:
         assert hasattr(result.metrics, "direction")
 
 
+class TestKeywordMatcher:
+    """Test suite for KeywordMatcher."""
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "Python or PyPy? I prefer python3 over py2.",
+            "aaaa banana bananas",
+            "",
+            "nothing to see here",
+        ],
+    )
+    @pytest.mark.parametrize("extra", [[], ["over", "see", "here", "ere"]])
+    def test_matches_repeated_find(self, text, extra):
+        """Test counts equal overlapping str.find counts per keyword."""
+        # Few keywords use find loops, more use the compiled trie pattern
+        keywords = ["py", "python", "PYTHON3", "aa", "ana", "banana", "", *extra]
+        analyzer = KeywordTrendAnalyzer()
+        counts = KeywordMatcher(keywords).count(text)
+
+        for keyword in keywords:
+            if keyword:
+                assert counts[keyword.lower()] == analyzer._count_keyword_in_text(
+                    text, keyword
+                )
+
+    def test_deduplicates_keywords(self):
+        """Test that keywords are lowercased and deduplicated."""
+        matcher = KeywordMatcher(["Rust", "rust", "", "Go"])
+
+        assert matcher.keywords == ["rust", "go"]
+        assert len(matcher) == 2
+        assert matcher.index_of("GO") == 1
+        assert matcher.index_of("") is None
+
+    def test_multiple_timeseries_single_pass(self, sample_posts):
+        """Test build_multiple_timeseries against per-keyword series."""
+        keywords = ["python", "Python", "learn", "data", "", "missing"]
+        analyzer = KeywordTrendAnalyzer()
+
+        combined = analyzer.build_multiple_timeseries(
+            sample_posts, keywords, TimeGranularity.HOUR
+        )
+
+        assert list(combined) == keywords
+        for keyword in keywords:
+            expected = analyzer.build_keyword_timeseries(
+                sample_posts, keyword, TimeGranularity.HOUR
+            )
+            assert [(p.timestamp, p.value, p.count) for p in expected.points] == [
+                (p.timestamp, p.value, p.count) for p in combined[keyword].points
+            ]
+
+        empty = analyzer.build_multiple_timeseries([], keywords)
+        assert all(series.points == [] for series in empty.values())
+
+
+class TestTFIDFAnalyzer:
+    """Test suite for per-document TF-IDF keywords."""
+
+    @pytest.fixture
+    def analyzer(self):
+        """Create an analyzer fitted on a small corpus."""
+        corpus = [
+            "python programming language for data science",
+            "data science with python and pandas",
+            "rust programming language memory safety",
+            "python data pipelines and rust extensions",
+            "memory leaks in python services",
+        ]
+        return TFIDFAnalyzer(TFIDFConfig(min_df=1, ngram_range=(1, 1))).fit(corpus)
+
+    @pytest.mark.parametrize("n", [0, 1, 3, 50])
+    def test_matches_dense_reference(self, analyzer, n):
+        """Test sparse top-k equals sorting the dense score vectors."""
+        texts = ["python data science", "", "rust memory safety python", "unknown words"]
+        dense = analyzer.transform(texts).toarray()
+
+        result = analyzer.get_keywords_by_document(texts, n=n)
+
+        names = analyzer._feature_names
+        for scores, keywords in zip(dense, result, strict=True):
+            order = sorted(
+                (i for i in range(len(scores)) if scores[i] > 0),
+                key=lambda i: (-scores[i], i),
+            )[:n]
+            assert [kw.keyword for kw in keywords] == [names[i] for i in order]
+            assert [kw.score for kw in keywords] == pytest.approx([scores[i] for i in order])
+
+    def test_keyword_table_rows(self, analyzer):
+        """Test the array table and on-demand Keyword materialization."""
+        texts = ["python data science", "", "rust memory"]
+        table = analyzer.get_document_keyword_table(texts, n=2)
+
+        assert isinstance(table, DocumentKeywords)
+        assert len(table) == 3
+        assert table.indptr.tolist()[:2] == [0, 2]
+        term_ids, scores = table.row(1)
+        assert len(term_ids) == len(scores) == 0
+        assert table.keywords(0) == analyzer.get_document_keywords(texts[0], n=2)
+
+
+class TestPostCorpus:
+    """Test suite for PostCorpus."""
+
+    @pytest.fixture
+    def corpus_posts(self, sample_posts):
+        """Sample posts plus one without selftext, spread over months."""
+        base = datetime(2024, 1, 29, 23, 30, tzinfo=UTC)
+        extra = [
+            Post(
+                id=f"extra{i}",
+                title=f"Python tooling question {i}",
+                selftext="" if i % 2 else "Need a python packaging tool",
+                author="user",
+                subreddit="python",
+                score=i,
+                num_comments=i,
+                created_utc=base + timedelta(hours=17 * i),
+                url=f"https://example.com/e{i}",
+                permalink=f"https://reddit.com/r/python/e{i}",
+            )
+            for i in range(12)
+        ]
+        return sample_posts + extra
+
+    def test_text_round_trip(self, corpus_posts):
+        """Test that texts, titles and selftexts are recovered."""
+        corpus = PostCorpus.from_posts(corpus_posts)
+
+        assert len(corpus) == len(corpus_posts)
+        assert list(corpus.texts()) == list(iter_post_texts(corpus_posts))
+        for i, post in enumerate(corpus_posts):
+            assert corpus.title(i) == post.title
+            assert corpus.selftext(i) == post.selftext
+            assert corpus.subreddit(i) == post.subreddit
+            assert corpus.created_at(i) == post.created_utc
+        assert corpus.score.tolist() == [p.score for p in corpus_posts]
+
+    @pytest.mark.parametrize("granularity", list(TimeGranularity))
+    def test_bucket_index_matches_bucket_timestamp(self, corpus_posts, granularity):
+        """Test vectorized bucketing against bucket_timestamp."""
+        corpus = PostCorpus.from_posts(corpus_posts)
+        buckets, bucket_of_post = corpus.bucket_index(granularity)
+
+        assert buckets == sorted(buckets)
+        for i, post in enumerate(corpus_posts):
+            expected = bucket_timestamp(post.created_utc, granularity)
+            assert buckets[bucket_of_post[i]] == expected
+
+    def test_between_and_take(self, corpus_posts):
+        """Test time-range selection."""
+        corpus = PostCorpus.from_posts(corpus_posts)
+        start = datetime(2024, 1, 30, tzinfo=UTC)
+        end = datetime(2024, 2, 1, tzinfo=UTC)
+
+        selected = corpus.between(start, end)
+        expected = [p.id for p in corpus_posts if start <= p.created_utc < end]
+
+        assert selected.ids == expected
+        assert corpus.take([2, 0]).ids == [corpus.ids[2], corpus.ids[0]]
+
+    def test_analyzers_accept_corpus(self, corpus_posts):
+        """Test that list and corpus inputs give the same results."""
+        corpus = PostCorpus.from_posts(corpus_posts)
+
+        analyzer = KeywordTrendAnalyzer()
+        for granularity in (TimeGranularity.HOUR, TimeGranularity.WEEK):
+            from_list = analyzer.build_keyword_timeseries(
+                corpus_posts, "python", granularity
+            )
+            from_corpus = analyzer.build_keyword_timeseries(corpus, "python", granularity)
+            assert [(p.timestamp, p.value, p.count) for p in from_list.points] == [
+                (p.timestamp, p.value, p.count) for p in from_corpus.points
+            ]
+
+        extractor = UnifiedKeywordExtractor()
+        assert [k.keyword for k in extractor.extract_from_posts(corpus_posts).keywords] == [
+            k.keyword for k in extractor.extract_from_posts(corpus).keywords
+        ]
+
+        detector = DemandDetector()
+        assert [
+            (m.text, m.context) for m in detector.detect_in_posts(corpus_posts)
+        ] == [(m.text, m.context) for m in detector.detect_in_posts(corpus)]
+
+
+class TestAnalysisContext:
+    """Test suite for AnalysisContext."""
+
+    @pytest.fixture
+    def texts(self):
+        """Texts with complaints, comparisons and demand expressions."""
+        return [
+            "I wish there was a better tool for tracking habits. Slack is too slow!",
+            "Switched from Evernote to Notion.\nNotion is great but crashes often :(",
+            "Is there an app that syncs notes? I need something like Obsidian.",
+            "Looking for an alternative to Jira. Jira is so expensive and confusing.",
+        ]
+
+    def test_memo_computes_once(self):
+        """Test that each view is computed once per text."""
+        context = AnalysisContext()
+        calls = []
+
+        def compute(text):
+            calls.append(text)
+            return text.upper()
+
+        assert context.memo("upper", "abc", compute) == "ABC"
+        assert context.memo("upper", "abc", compute) == "ABC"
+        assert context.memo("other", "abc", compute) == "ABC"
+        assert calls == ["abc", "abc"]
+        assert (context.hits, context.misses) == (1, 2)
+
+    def test_builtin_views(self):
+        """Test lowercase, words, tokens and sentence boundaries."""
+        context = AnalysisContext()
+        text = "Python is GREAT. Really?\nYes!"
+
+        assert context.lower(text) == text.lower()
+        assert context.words(text) == text.lower().split()
+        assert context.tokens(text) == RedditTokenizer().tokenize(text)
+        assert context.sentence_boundaries(text) == [15, 23, 24, 28]
+
+    def test_pickle_drops_caches(self):
+        """Test that pickling keeps no cached views."""
+        import pickle
+
+        context = AnalysisContext()
+        context.lower("Some Text")
+        restored = pickle.loads(pickle.dumps(context))
+
+        assert restored.memo("lower", "Some Text", lambda t: "fresh") == "fresh"
+
+    def test_shared_context_gives_same_results(self, texts):
+        """Test that analyzers give identical results with a shared context."""
+        context = AnalysisContext()
+
+        plain_demand = DemandAnalyzer().analyze_texts(texts)
+        shared_demand = DemandAnalyzer(context=context).analyze_texts(texts)
+        assert plain_demand.total_demands == shared_demand.total_demands
+        assert [o.cluster.representative for o in plain_demand.top_opportunities] == [
+            o.cluster.representative for o in shared_demand.top_opportunities
+        ]
+
+        plain_keywords = UnifiedKeywordExtractor().extract_keywords(texts)
+        shared_keywords = UnifiedKeywordExtractor(context=context).extract_keywords(texts)
+        assert [k.keyword for k in plain_keywords.keywords] == [
+            k.keyword for k in shared_keywords.keywords
+        ]
+
+        assert context.hits > 0
+
+    def test_competitive_with_context(self, sample_posts):
+        """Test competitive analysis results with a shared context."""
+        posts = [
+            *sample_posts,
+            sample_posts[0].model_copy(
+                update={
+                    "id": "post4",
+                    "title": "Switched from Evernote to Notion",
+                    "selftext": "Evernote is too slow and keeps crashing. Notion is great!",
+                }
+            ),
+        ]
+        context = AnalysisContext()
+
+        plain = CompetitiveAnalyzer().analyze_posts(posts)
+        shared = CompetitiveAnalyzer(context=context).analyze_posts(posts)
+
+        assert plain.entities_analyzed == shared.entities_analyzed
+        assert plain.popular_switches == shared.popular_switches
+        assert [(c.text, c.severity) for c in plain.top_complaints] == [
+            (c.text, c.severity) for c in shared.top_complaints
+        ]
+        assert [i.overall_sentiment.compound for i in plain.insights] == [
+            i.overall_sentiment.compound for i in shared.insights
+        ]
+
+
 class TestIntegration:
     """Integration tests for the complete analysis pipeline."""
 
@@ -97,6 +97,42 @@ class TestPostCollector:
         assert isinstance(posts[0], Post)
         mock_subreddit.new.assert_called_once_with(limit=1)
 
+    def test_get_new_stops_at_watermark(self, mock_reddit_client):
+        """get_new가 워터마크보다 오래된 게시물에서 멈추는지 테스트."""
+        submissions = []
+        for i, created in enumerate([1704070800.0, 1704067200.0, 1704063600.0]):
+            mock = MagicMock()
+            mock.id = f"p{i}"
+            mock.title = f"Post {i}"
+            mock.selftext = ""
+            mock.author.name = "author"
+            mock.subreddit.display_name = "test_subreddit"
+            mock.score = 1
+            mock.num_comments = 0
+            mock.created_utc = created
+            mock.url = "https://example.com"
+            mock.permalink = f"/r/test_subreddit/comments/p{i}/"
+            mock.is_self = True
+            submissions.append(mock)
+
+        consumed = []
+
+        def listing(limit):
+            for submission in submissions:
+                consumed.append(submission.id)
+                yield submission
+
+        mock_subreddit = MagicMock()
+        mock_subreddit.new.side_effect = listing
+        mock_reddit_client.get_subreddit.return_value = mock_subreddit
+
+        collector = PostCollector(mock_reddit_client)
+        since = datetime(2024, 1, 1, tzinfo=UTC)  # == p1 작성 시각
+        posts = collector.get_new("test_subreddit", limit=100, since=since)
+
+        assert [p.id for p in posts] == ["p0", "p1"]
+        assert consumed == ["p0", "p1", "p2"]
+
     def test_get_top_with_time_filter(self, mock_reddit_client, mock_submission):
         """get_top이 time_filter를 올바르게 전달하는지 테스트."""
         mock_subreddit = MagicMock()
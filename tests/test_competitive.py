@@ -5,15 +5,17 @@ Tests entity recognition, sentiment analysis, complaint extraction,
 alternative comparison, and competitive analyzer.
 """
 
-import pytest
+import random
+import sys
 from datetime import datetime
 
-import sys
+import pytest
 
 sys.path.insert(0, "src")
 
 from reddit_insight.analysis.entity_recognition import (
     EntityRecognizer,
+    EntityRecognizerConfig,
     EntityType,
     ProductEntity,
     EntityMention,
@@ -23,6 +25,7 @@ from reddit_insight.analysis.sentiment import (
     RuleBasedSentimentAnalyzer,
     EntitySentimentAnalyzer,
     Sentiment,
+    SentimentAnalyzerConfig,
     SentimentScore,
 )
 from reddit_insight.analysis.competitive import (
@@ -88,6 +91,42 @@ class TestEntityRecognition:
         entities = recognizer.recognize("   ")
         assert entities == []
 
+    @pytest.mark.parametrize("threshold", [0.3, 0.6, 0.75, 0.8, 0.9, 1.0, 1.1])
+    def test_indexed_merge_matches_linear_scan(self, threshold):
+        """Test indexed merging against the original linear scan."""
+        rng = random.Random(threshold)
+        stems = ["slack", "notion", "jira", "trello", "asana", "figma", "sla", "no"]
+        names = [
+            rng.choice(stems) + rng.choice(["", "s", "app", "hq", "x", "ion", "ck"])
+            for _ in range(400)
+        ]
+        entities = [
+            ProductEntity(
+                name=name.title(),
+                normalized_name=name,
+                entity_type=EntityType.PRODUCT,
+                confidence=rng.choice([0.5, 0.7, 0.9]),
+            )
+            for name in names
+        ]
+        recognizer = EntityRecognizer(
+            config=EntityRecognizerConfig(similarity_threshold=threshold)
+        )
+
+        # Reference: compare each entity to every merged key in order
+        expected: dict[str, list[str]] = {}
+        for name in names:
+            for key in expected:
+                if recognizer._calculate_similarity(name, key) >= threshold:
+                    expected[key].append(name)
+                    break
+            else:
+                expected[name] = [name]
+
+        merged = recognizer._merge_entities(entities)
+        assert len(merged) == len(expected)
+        assert [e.mentions for e in merged] == [len(v) for v in expected.values()]
+
 
 # =============================================================================
 # Sentiment Analysis Tests
@@ -131,6 +170,82 @@ class TestSentimentAnalysis:
         results = analyzer.analyze_text("Slack is great but Notion is even better")
         assert len(results) >= 0  # May or may not detect entities depending on patterns
 
+    def test_analyze_span_matches_window_analysis(self):
+        """Test that span scoring equals analyzing the window on its own."""
+        rng = random.Random(7)
+        vocabulary = [
+            "not", "never", "very", "really", "kind", "of", "a", "bit",
+            "great", "terrible", "good", "slow", "love", "hate", "the", "app",
+            "don't", "well-made", ":)", ":(", "xD", "xDrive", "great:D",
+        ]
+        analyzer = RuleBasedSentimentAnalyzer()
+        for _ in range(300):
+            text = " ".join(rng.choice(vocabulary) for _ in range(30)) + "."
+            start = rng.randint(0, len(text) - 1)
+            end = rng.randint(start, len(text))
+            # Align the window to word boundaries, as entity contexts are
+            while start > 0 and text[start - 1].isalnum():
+                start -= 1
+            while end < len(text) and text[end].isalnum():
+                end += 1
+            expected = analyzer.analyze(text[start:end])
+            assert analyzer.analyze_span(text, start, end) == expected
+
+    @pytest.mark.parametrize(
+        "config",
+        [
+            SentimentAnalyzerConfig(),
+            SentimentAnalyzerConfig(use_negation=False),
+            SentimentAnalyzerConfig(use_intensifiers=False),
+        ],
+    )
+    def test_analyze_many_matches_analyze(self, config):
+        """Test that batch scoring returns the same scores as analyze."""
+        from reddit_insight.analysis.sentiment import (
+            DIMINISHERS,
+            INTENSIFIERS,
+            NEGATIVE_EMOTICONS,
+            NEGATIVE_WORDS,
+            NEGATORS,
+            POSITIVE_EMOTICONS,
+            POSITIVE_WORDS,
+        )
+
+        rng = random.Random(11)
+        vocabulary = [
+            *sorted(POSITIVE_WORDS)[:30],
+            *sorted(NEGATIVE_WORDS)[:30],
+            *INTENSIFIERS,
+            *DIMINISHERS,
+            *NEGATORS,
+            *POSITIVE_EMOTICONS,
+            *NEGATIVE_EMOTICONS,
+            "the", "app", "Great", "NOT", "a", "of", "xDrive", "--", "!!!",
+        ]
+        texts = [
+            " ".join(rng.choice(vocabulary) for _ in range(rng.randint(0, 20)))
+            for _ in range(500)
+        ]
+        texts += ["", "   ", "...", "not", "not very good"]
+
+        analyzer = RuleBasedSentimentAnalyzer(config=config)
+        assert analyzer.analyze_many(texts) == [analyzer.analyze(t) for t in texts]
+
+    def test_entity_sentiment_uses_mention_position(self):
+        """Test that entity context comes from the recognized mention."""
+        analyzer = EntitySentimentAnalyzer()
+        text = (
+            "Our team tried many tools over the years and most were fine. "
+            "I switched to vscode and it is great, really love it."
+        )
+        results = analyzer.analyze_text(text)
+        by_name = {r.entity.name: r for r in results}
+
+        assert "VS Code" in by_name
+        vscode = by_name["VS Code"]
+        assert "vscode" in vscode.context
+        assert vscode.sentiment.compound > 0
+
     def test_empty_text_sentiment(self):
         """Test sentiment analysis of empty text."""
         analyzer = RuleBasedSentimentAnalyzer()
@@ -6,6 +6,9 @@ Tests for DemandPatterns, DemandDetector, and DemandAnalyzer.
 
 from __future__ import annotations
 
+import random
+import re
+
 import pytest
 from datetime import UTC, datetime
 
@@ -232,6 +235,80 @@ class TestDemandPatternLibrary:
         assert library.language == "multi"
         assert len(library) > 0
 
+    @pytest.mark.parametrize("case_sensitive", [False, True])
+    def test_scanner_matches_finditer(self, case_sensitive: bool) -> None:
+        """Test that the scanner finds exactly what per-pattern finditer finds."""
+        library = DemandPatternLibrary.create_multilingual_library()
+        texts = [
+            "I wish there was a better way. It'd be GREAT if it had sync!",
+            "WHY ISN'T THERE a dark mode? I hate how slow it is.",
+            "Any suggestions for a cheaper alternative? I'd pay $20 for it.",
+            "Shut up and take my money. Looking for a replacement for Jira.",
+            "\u0130 W\u0130SH there was a tool. \u0131 wish someone would build it.",
+            "이런 기능이 있었으면 좋겠어요. 정리할 수 있는 앱 없나요",
+            "The weather is nice today.",
+            "",
+        ]
+        flags = 0 if case_sensitive else re.IGNORECASE
+        scanner = library.get_scanner(case_sensitive=case_sensitive)
+        assert len(scanner) == len(library)
+        for text in texts:
+            expected = [
+                (pattern.pattern_id, match.span())
+                for pattern in library.get_patterns()
+                for match in re.finditer(pattern.regex_pattern, text, flags)
+            ]
+            actual = [
+                (pattern.pattern_id, match.span()) for pattern, match in scanner.scan(text)
+            ]
+            assert actual == expected
+
+    def test_required_literals_occur_in_every_match(self) -> None:
+        """Test that each default pattern's required literals cover its example matches."""
+        library = DemandPatternLibrary.create_multilingual_library()
+        for pattern in library.get_patterns():
+            assert pattern.required_literals, pattern.pattern_id
+            literals = "|".join(map(re.escape, pattern.required_literals))
+            for example in pattern.examples:
+                for match in re.finditer(pattern.regex_pattern, example, re.IGNORECASE):
+                    assert re.search(literals, match.group(), re.IGNORECASE), (
+                        pattern.pattern_id,
+                        match.group(),
+                    )
+
+    def test_scanner_checks_patterns_without_literals(
+        self, english_library: DemandPatternLibrary
+    ) -> None:
+        """Test that patterns without required literals are always scanned."""
+        english_library.add_pattern(
+            DemandPattern(
+                pattern_id="custom_no_literals",
+                category=DemandCategory.FEATURE_REQUEST,
+                regex_pattern=r"plz add \w+",
+            )
+        )
+        scanner = english_library.get_scanner()
+
+        hits = [pattern.pattern_id for pattern, _ in scanner.scan("PLZ ADD export")]
+
+        assert hits == ["custom_no_literals"]
+
+    def test_scanner_cache_invalidated(self, english_library: DemandPatternLibrary) -> None:
+        """Test that adding a pattern rebuilds cached scanners."""
+        before = english_library.get_scanner()
+        assert english_library.get_scanner() is before
+
+        english_library.add_pattern(
+            DemandPattern(
+                pattern_id="custom_plz_add",
+                category=DemandCategory.FEATURE_REQUEST,
+                regex_pattern=r"plz add \w+",
+            )
+        )
+        after = english_library.get_scanner()
+        assert after is not before
+        assert [p.pattern_id for p, _ in after.scan("plz add tags")] == ["custom_plz_add"]
+
 
 # =============================================================================
 # TEST: DEMAND DETECTOR
@@ -292,6 +369,46 @@ class TestDemandDetector:
         matches = detector.detect(text)
         assert len(matches) == 0
 
+    def test_case_sensitive_detection(self) -> None:
+        """Test that case_sensitive config disables case-insensitive matching."""
+        sensitive = DemandDetector(config=DemandDetectorConfig(case_sensitive=True))
+        assert sensitive.detect("I WISH THERE WAS a better tool") == []
+        assert len(sensitive.detect("i wish there was a better tool")) > 0
+
+    def test_deduplicate_matches_keeps_best_non_overlapping(
+        self, detector: DemandDetector
+    ) -> None:
+        """Test deduplication against a pairwise overlap check."""
+        rng = random.Random(13)
+        pattern = ENGLISH_PATTERNS[0]
+        for _ in range(50):
+            matches = []
+            for _ in range(rng.randint(1, 40)):
+                start = rng.randint(0, 60)
+                end = start + rng.randint(0, 10)
+                matches.append(
+                    DemandMatch(
+                        pattern=pattern,
+                        text="",
+                        matched_span=(start, end),
+                        context="",
+                        confidence=rng.choice([0.2, 0.5, 0.8]),
+                    )
+                )
+
+            expected: list[DemandMatch] = []
+            for match in sorted(matches, key=lambda m: m.confidence, reverse=True):
+                start, end = match.matched_span
+                if all(
+                    end <= kept.matched_span[0] or start >= kept.matched_span[1]
+                    for kept in expected
+                ):
+                    expected.append(match)
+            expected.sort(key=lambda m: m.matched_span[0])
+
+            actual = detector._deduplicate_matches(matches)
+            assert [id(m) for m in actual] == [id(m) for m in expected]
+
     def test_match_confidence(self, detector: DemandDetector) -> None:
         """Test that matches have confidence scores."""
         text = "I wish there was a better tool"
@@ -321,6 +438,28 @@ class TestDemandDetector:
         matches = detector.detect_in_posts(sample_posts)
         assert len(matches) > 0
 
+    def test_detect_in_posts_parallel_matches_serial(
+        self, detector: DemandDetector, sample_posts: list[Post]
+    ) -> None:
+        """Test that process-pool detection returns the serial results."""
+        posts = sample_posts * 5
+        serial = detector.detect_in_posts(posts)
+        parallel = detector.detect_in_posts(posts, workers=2)
+
+        def key(m: DemandMatch) -> tuple:
+            return (m.pattern.pattern_id, m.text, m.matched_span, m.context, m.confidence)
+
+        assert [key(m) for m in parallel] == [key(m) for m in serial]
+        patterns = detector.library.get_patterns()
+        assert all(any(m.pattern is p for p in patterns) for m in parallel)
+
+    def test_detect_in_posts_invalid_workers(
+        self, detector: DemandDetector, sample_posts: list[Post]
+    ) -> None:
+        """Test that a worker count below one is rejected."""
+        with pytest.raises(ValueError):
+            detector.detect_in_posts(sample_posts, workers=0)
+
     def test_get_category_stats(
         self, detector: DemandDetector, sample_texts: list[str]
     ) -> None:
@@ -413,6 +552,36 @@ class TestDemandClusterer:
         for cluster in clusters:
             assert len(cluster.categories) > 0
 
+    def test_lsh_mode_matches_greedy(self) -> None:
+        """Test that LSH clustering gives the greedy result on small inputs."""
+        import random
+
+        rng = random.Random(7)
+        pattern = ENGLISH_PATTERNS[0]
+        words = [
+            "tracking", "habits", "budget", "notes", "calendar", "sync",
+            "offline", "team", "invoices", "recipes", "workouts", "reminders",
+        ]
+        matches = []
+        for _ in range(300):
+            context = " ".join(rng.sample(words, rng.randint(0, 5)))
+            matches.append(
+                DemandMatch(
+                    pattern=pattern,
+                    text=context,
+                    matched_span=(0, 0),
+                    context=context,
+                    confidence=round(rng.random(), 1),
+                )
+            )
+
+        for threshold in (0.5, 0.7, 1.0):
+            greedy = DemandClusterer(similarity_threshold=threshold)
+            lsh = DemandClusterer(similarity_threshold=threshold, lsh_min_matches=0)
+            assert [
+                [id(m) for m in c.matches] for c in greedy.cluster_demands(matches)
+            ] == [[id(m) for m in c.matches] for c in lsh.cluster_demands(matches)]
+
 
 # =============================================================================
 # TEST: PRIORITY CALCULATOR
@@ -511,6 +680,16 @@ class TestDemandAnalyzer:
         assert isinstance(report, DemandReport)
         assert report.total_demands > 0
 
+    def test_analyze_posts_parallel(
+        self, analyzer: DemandAnalyzer, sample_posts: list[Post]
+    ) -> None:
+        """Test that parallel detection produces the same report."""
+        serial = analyzer.analyze_posts(sample_posts)
+        parallel = analyzer.analyze_posts(sample_posts, workers=2)
+        assert parallel.total_demands == serial.total_demands
+        assert parallel.total_clusters == serial.total_clusters
+        assert parallel.by_category == serial.by_category
+
     def test_report_has_opportunities(
         self, analyzer: DemandAnalyzer, sample_texts: list[str]
     ) -> None:
@@ -6,6 +6,7 @@ TextPreprocessor, Collector, DataPipeline 테스트를 포함한다.
 from __future__ import annotations
 
 from datetime import UTC, datetime
+from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -14,12 +15,16 @@ from reddit_insight.pipeline import (
     Collector,
     CollectorConfig,
     CollectorResult,
+    DataPipeline,
     ProcessingResult,
     SimpleScheduler,
     ScheduleConfig,
     TextPreprocessor,
 )
 
+if TYPE_CHECKING:
+    from reddit_insight.reddit.models import Comment, Post
+
 
 # ========== TextPreprocessor 테스트 ==========
 
@@ -292,6 +297,339 @@ class TestCollector:
             collector._ensure_connected()
 
 
+class TestCollectorConcurrency:
+    """Collector 동시 수집 테스트."""
+
+    @staticmethod
+    def _make_collector(max_concurrency: int, delay: float = 0.05) -> tuple[Collector, dict]:
+        """지연과 실패를 흉내내는 데이터 소스로 Collector 구성."""
+        import asyncio
+
+        stats = {"in_flight": 0, "peak": 0}
+
+        async def get_hot_posts(subreddit: str, limit: int = 100) -> list:
+            stats["in_flight"] += 1
+            stats["peak"] = max(stats["peak"], stats["in_flight"])
+            try:
+                await asyncio.sleep(delay)
+                if subreddit == "broken":
+                    raise RuntimeError("boom")
+                return []
+            finally:
+                stats["in_flight"] -= 1
+
+        data_source = MagicMock()
+        data_source.get_subreddit_info = AsyncMock(return_value=None)
+        data_source.get_hot_posts = get_hot_posts
+
+        collector = Collector(
+            database=MagicMock(), data_source=data_source, max_concurrency=max_concurrency
+        )
+        collector._pipeline = MagicMock()
+        collector._pipeline.process_posts = AsyncMock(
+            return_value=ProcessingResult(total=0)
+        )
+        return collector, stats
+
+    def test_invalid_concurrency_raises(self) -> None:
+        """max_concurrency가 1 미만이면 예외가 발생하는지 확인."""
+        with pytest.raises(ValueError):
+            Collector(max_concurrency=0)
+
+    @pytest.mark.asyncio
+    async def test_results_keep_input_order_and_isolate_failures(self) -> None:
+        """결과 순서가 입력 순서와 같고 실패가 격리되는지 확인."""
+        collector, _ = self._make_collector(max_concurrency=3)
+        names = ["python", "broken", "rust", "golang"]
+
+        results = await collector.collect_from_list(names)
+
+        assert [r.subreddit for r in results] == names
+        assert [r.success for r in results] == [True, False, True, True]
+        assert results[1].error == "boom"
+        assert all(r.duration_seconds > 0 for r in results)
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self) -> None:
+        """동시 작업 수가 max_concurrency를 넘지 않는지 확인."""
+        collector, stats = self._make_collector(max_concurrency=2)
+        configs = [CollectorConfig(subreddit=f"sub{i}") for i in range(6)]
+
+        await collector.collect_multiple(configs)
+
+        assert stats["peak"] == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_run_overlaps_fetches(self) -> None:
+        """동시 수집이 순차 합계보다 빠르게 끝나는지 확인."""
+        import time
+
+        collector, _ = self._make_collector(max_concurrency=8, delay=0.1)
+        configs = [CollectorConfig(subreddit=f"sub{i}") for i in range(8)]
+        completed: list[str] = []
+
+        start = time.monotonic()
+        results = await collector.collect_multiple(
+            configs, on_result=lambda r: completed.append(r.subreddit)
+        )
+        elapsed = time.monotonic() - start
+
+        assert elapsed < sum(r.duration_seconds for r in results) / 2
+        assert sorted(completed) == sorted(c.subreddit for c in configs)
+
+
+# ========== DataPipeline bulk ingest 테스트 ==========
+
+
+def _make_post(
+    post_id: str,
+    title: str = "Sample title",
+    score: int = 1,
+    created_utc: datetime | None = None,
+) -> Post:
+    """테스트용 Post 생성."""
+    from reddit_insight.reddit.models import Post
+
+    return Post(
+        id=post_id,
+        title=title,
+        selftext="body",
+        author="tester",
+        subreddit="python",
+        score=score,
+        num_comments=0,
+        created_utc=created_utc or datetime(2024, 1, 1, tzinfo=UTC),
+        url=f"https://reddit.com/r/python/{post_id}",
+        permalink=f"/r/python/comments/{post_id}",
+    )
+
+
+def _make_comment(comment_id: str, post_id: str, body: str = "Nice post") -> Comment:
+    """테스트용 Comment 생성."""
+    from reddit_insight.reddit.models import Comment
+
+    return Comment(
+        id=comment_id,
+        body=body,
+        author="tester",
+        subreddit="python",
+        score=1,
+        created_utc=datetime(2024, 1, 1, tzinfo=UTC),
+        parent_id=f"t3_{post_id}",
+        post_id=post_id,
+    )
+
+
+class TestDataPipelineBulkIngest:
+    """DataPipeline의 set 기반 bulk ingest 테스트."""
+
+    @pytest.fixture
+    async def database(self, tmp_path):
+        """임시 SQLite 파일 데이터베이스."""
+        from reddit_insight.storage.database import Database
+
+        db = Database(url=f"sqlite+aiosqlite:///{tmp_path / 'ingest.db'}")
+        await db.connect()
+        yield db
+        await db.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_process_posts_counts_new_duplicate_filtered(self, database) -> None:
+        """new/duplicates/filtered 집계가 정확한지 확인."""
+        pipeline = DataPipeline(database, chunk_size=3)
+
+        first = [_make_post(f"p{i}") for i in range(5)]
+        result = await pipeline.process_posts(first, "python")
+        assert result.to_dict() == {
+            "total": 5, "new": 5, "duplicates": 0, "filtered": 0, "errors": 0,
+        }
+
+        second = [
+            *[_make_post(f"p{i}", score=10) for i in range(3, 5)],
+            *[_make_post(f"p{i}") for i in range(5, 9)],
+            _make_post("p5"),  # 배치 내 반복
+            _make_post("gone", title="[deleted]"),
+        ]
+        result = await pipeline.process_posts(second, "python")
+        assert result.total == 8
+        assert result.new == 4
+        assert result.duplicates == 3
+        assert result.filtered == 1
+
+    @pytest.mark.asyncio
+    async def test_process_posts_upserts_changed_fields(self, database) -> None:
+        """중복 게시물의 score가 업데이트되는지 확인."""
+        from reddit_insight.storage.repository import PostRepository
+
+        pipeline = DataPipeline(database, chunk_size=2)
+        await pipeline.process_posts([_make_post("a"), _make_post("b")], "python")
+        await pipeline.process_posts([_make_post("a", score=42)], "python")
+
+        async with database.session() as session:
+            repo = PostRepository(session)
+            post = await repo.get_by_reddit_id("a")
+            assert post is not None
+            assert post.score == 42
+            assert await repo.get_existing_reddit_ids(["a", "b", "c"]) == {"a", "b"}
+
+    @pytest.mark.asyncio
+    async def test_process_comments_counts_new_and_duplicates(self, database) -> None:
+        """댓글 처리 결과 집계가 정확한지 확인."""
+        pipeline = DataPipeline(database, chunk_size=2)
+        await pipeline.process_posts([_make_post("p1")], "python")
+
+        comments = [_make_comment(f"c{i}", "p1") for i in range(5)]
+        result = await pipeline.process_comments(comments, "p1")
+        assert result.new == 5
+        assert result.duplicates == 0
+
+        again = [*comments[:2], _make_comment("c9", "p1"), _make_comment("cx", "p1", body="[removed]")]
+        result = await pipeline.process_comments(again, "p1")
+        assert result.total == 4
+        assert result.new == 1
+        assert result.duplicates == 2
+        assert result.filtered == 1
+
+    @pytest.mark.asyncio
+    async def test_process_comments_unknown_post_counts_errors(self, database) -> None:
+        """게시물이 없으면 댓글이 errors로 집계되는지 확인."""
+        pipeline = DataPipeline(database)
+        result = await pipeline.process_comments([_make_comment("c1", "nope")], "nope")
+        assert result.errors == 1
+        assert result.new == 0
+
+    @pytest.mark.asyncio
+    async def test_collect_comments_batches_across_posts(self, database) -> None:
+        """댓글 fetch를 병렬로 수행하고 여러 게시물을 묶어 저장하는지 확인."""
+        import asyncio
+
+        pipeline = DataPipeline(database)
+        post_ids = [f"p{i}" for i in range(10)]
+        await pipeline.process_posts([_make_post(pid) for pid in post_ids], "python")
+
+        in_flight = 0
+        peak = 0
+
+        async def get_post_comments(post_id: str, limit: int | None = None) -> list:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            try:
+                await asyncio.sleep(0.01)
+                if post_id == "p3":
+                    raise RuntimeError("fetch failed")
+                return [_make_comment(f"{post_id}_c{i}", post_id) for i in range(3)]
+            finally:
+                in_flight -= 1
+
+        data_source = MagicMock()
+        data_source.get_post_comments = get_post_comments
+
+        with patch.object(
+            pipeline, "process_comment_batch", wraps=pipeline.process_comment_batch
+        ) as batch_spy:
+            result = await pipeline.collect_comments(
+                data_source, post_ids, concurrency=4, batch_size=12
+            )
+
+        assert peak == 4
+        assert result.total == 27
+        assert result.new == 27
+        assert result.errors == 1
+        # 9개 게시물 x 3개 댓글을 12개 단위로 묶으면 3번 저장
+        assert batch_spy.call_count == 3
+
+
+class TestIncrementalCollection:
+    """워터마크 기반 증분 수집 테스트."""
+
+    @pytest.fixture
+    async def database(self, tmp_path):
+        """임시 SQLite 파일 데이터베이스."""
+        from reddit_insight.storage.database import Database
+
+        db = Database(url=f"sqlite+aiosqlite:///{tmp_path / 'watermark.db'}")
+        await db.connect()
+        yield db
+        await db.disconnect()
+
+    @staticmethod
+    def _posts(start: int, stop: int) -> list[Post]:
+        """start..stop-1 분에 작성된 게시물 (최신순)."""
+        from datetime import timedelta
+
+        base = datetime(2024, 1, 1, tzinfo=UTC)
+        return [
+            _make_post(f"p{i}", created_utc=base + timedelta(minutes=i))
+            for i in reversed(range(start, stop))
+        ]
+
+    @pytest.mark.asyncio
+    async def test_watermark_only_moves_forward(self, database) -> None:
+        """워터마크가 가장 최신 게시물로만 전진하는지 확인."""
+        pipeline = DataPipeline(database)
+        assert await pipeline.get_watermark("Python") is None
+
+        await pipeline.advance_watermark("Python", self._posts(0, 5))
+        first = await pipeline.get_watermark("python")
+        assert first == datetime(2024, 1, 1, 0, 4, tzinfo=UTC)
+
+        await pipeline.advance_watermark("python", self._posts(0, 2))
+        assert await pipeline.get_watermark("python") == first
+
+        await pipeline.advance_watermark("python", self._posts(5, 7))
+        assert await pipeline.get_watermark("python") == datetime(2024, 1, 1, 0, 6, tzinfo=UTC)
+
+    @pytest.mark.asyncio
+    async def test_collect_new_posts_passes_watermark(self, database) -> None:
+        """두 번째 수집부터 워터마크를 since로 전달하는지 확인."""
+        from reddit_insight.pipeline import Collector, CollectorConfig
+
+        data_source = MagicMock()
+        data_source.get_subreddit_info = AsyncMock(return_value=None)
+        data_source.get_new_posts = AsyncMock(
+            side_effect=[self._posts(0, 5), self._posts(4, 8)]
+        )
+
+        collector = Collector(database=database, data_source=data_source)
+        await collector.connect()
+        config = CollectorConfig(subreddit="python", sort="new", limit=50)
+
+        first = await collector.collect_subreddit(config)
+        second = await collector.collect_subreddit(config)
+
+        first_call, second_call = data_source.get_new_posts.await_args_list
+        assert first_call.kwargs["since"] is None
+        assert second_call.kwargs["since"] == datetime(2024, 1, 1, 0, 4, tzinfo=UTC)
+        assert first.posts_result.new == 5
+        # 워터마크 시각의 게시물(p4)은 다시 받아 중복으로 처리된다
+        assert second.posts_result.new == 3
+        assert second.posts_result.duplicates == 1
+        assert await collector._pipeline.get_watermark("python") == datetime(
+            2024, 1, 1, 0, 7, tzinfo=UTC
+        )
+
+    @pytest.mark.asyncio
+    async def test_non_incremental_ignores_watermark(self, database) -> None:
+        """incremental=False이면 워터마크 없이 수집하는지 확인."""
+        from reddit_insight.pipeline import Collector, CollectorConfig
+
+        pipeline = DataPipeline(database)
+        await pipeline.advance_watermark("python", self._posts(0, 5))
+
+        data_source = MagicMock()
+        data_source.get_subreddit_info = AsyncMock(return_value=None)
+        data_source.get_new_posts = AsyncMock(return_value=self._posts(0, 3))
+
+        collector = Collector(database=database, data_source=data_source)
+        await collector.connect()
+        await collector.collect_subreddit(
+            CollectorConfig(subreddit="python", sort="new", incremental=False)
+        )
+
+        assert "since" not in data_source.get_new_posts.await_args.kwargs
+
+
 # ========== SimpleScheduler 테스트 ==========
 
 
@@ -330,6 +668,7 @@ class TestSimpleScheduler:
         assert len(results) == 1
         assert results[0].subreddit == "python"
         assert len(scheduler.run_history) == 1
+        assert mock_collector.collect_multiple.call_args.kwargs["max_concurrency"] == 4
 
         status = scheduler.get_status()
         assert status.total_runs == 1
@@ -0,0 +1,269 @@
+"""Scraping 모듈 테스트.
+
+ScrapingClient의 조건부 요청 HTTP 캐시와 RedditScraper 증분 수집 테스트를 포함한다.
+"""
+
+from __future__ import annotations
+
+import threading
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+
+import httpx
+import pytest
+
+from reddit_insight.scraping import (
+    HTTPResponseCache,
+    RateLimiter,
+    RedditScraper,
+    ScrapingClient,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from reddit_insight.scraping.http_cache import CachedResponse
+
+
+LISTING_URL = "https://old.reddit.com/r/python/new.json"
+
+
+class FakeRedditServer:
+    """ETag 기반 조건부 요청을 지원하는 가짜 서버."""
+
+    def __init__(self, body: bytes = b'{"data": {"children": []}}') -> None:
+        self.body = body
+        self.version = 1
+        self.requests: list[httpx.Request] = []
+
+    @property
+    def etag(self) -> str:
+        return f'"v{self.version}"'
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.headers.get("If-None-Match") == self.etag:
+            return httpx.Response(304, headers={"ETag": self.etag})
+        return httpx.Response(
+            200,
+            headers={"ETag": self.etag, "Content-Type": "application/json"},
+            content=self.body,
+        )
+
+
+def make_client(server: FakeRedditServer, cache: HTTPResponseCache | None) -> ScrapingClient:
+    """가짜 서버에 연결된 ScrapingClient 생성."""
+    client = ScrapingClient(
+        rate_limiter=RateLimiter(requests_per_minute=10_000, min_delay=0.0),
+        cache=cache,
+    )
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(server.handler))
+    return client
+
+
+class TestHTTPResponseCache:
+    """HTTPResponseCache 테스트 클래스."""
+
+    def test_make_key_ignores_param_order(self) -> None:
+        """파라미터 순서와 무관하게 같은 키를 만드는지 확인."""
+        a = HTTPResponseCache.make_key(LISTING_URL, {"limit": 100, "after": "t3_x"})
+        b = HTTPResponseCache.make_key(LISTING_URL, {"after": "t3_x", "limit": 100})
+        c = HTTPResponseCache.make_key(LISTING_URL, {"limit": 50})
+
+        assert a == b
+        assert a != c
+
+    def test_store_requires_validator(self, tmp_path: Path) -> None:
+        """검증자가 없는 응답은 저장하지 않는지 확인."""
+        cache = HTTPResponseCache(tmp_path)
+        request = httpx.Request("GET", LISTING_URL)
+
+        plain = httpx.Response(200, content=b"{}", request=request)
+        tagged = httpx.Response(200, headers={"ETag": '"a"'}, content=b"{}", request=request)
+
+        assert cache.store("plain", plain) is False
+        assert cache.store("tagged", tagged) is True
+        assert len(cache) == 1
+
+    def test_lru_eviction_by_size(self, tmp_path: Path) -> None:
+        """크기 상한을 넘으면 가장 오래 사용되지 않은 항목이 제거되는지 확인."""
+        cache = HTTPResponseCache(tmp_path, max_bytes=250)
+        request = httpx.Request("GET", LISTING_URL)
+
+        def response() -> httpx.Response:
+            return httpx.Response(
+                200, headers={"ETag": '"a"'}, content=b"x" * 100, request=request
+            )
+
+        cache.store("a", response())
+        cache.store("b", response())
+        cache.get("a")  # a를 최근 사용으로 표시
+        cache.store("c", response())
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+        assert cache.total_bytes == 200
+        assert cache.stats.evictions == 1
+        assert not (tmp_path / "b.body").exists()
+
+    def test_index_restored_from_disk(self, tmp_path: Path) -> None:
+        """재시작 후에도 디스크 항목을 다시 사용하는지 확인."""
+        request = httpx.Request("GET", LISTING_URL)
+        first = HTTPResponseCache(tmp_path)
+        first.store(
+            "k", httpx.Response(200, headers={"ETag": '"a"'}, content=b"body", request=request)
+        )
+
+        second = HTTPResponseCache(tmp_path)
+        cached = second.get("k")
+
+        assert cached is not None
+        assert cached.content == b"body"
+        assert cached.etag == '"a"'
+
+
+class TestScrapingClientCache:
+    """ScrapingClient 조건부 요청 테스트 클래스."""
+
+    @pytest.mark.asyncio
+    async def test_not_modified_served_from_disk(self, tmp_path: Path) -> None:
+        """304 응답을 디스크 본문으로 재구성하는지 확인."""
+        server = FakeRedditServer()
+        cache = HTTPResponseCache(tmp_path)
+
+        async with make_client(server, cache) as client:
+            first = await client.get_json(LISTING_URL)
+            second = await client.get_json(LISTING_URL)
+
+        assert first == second == {"data": {"children": []}}
+        assert "If-None-Match" not in server.requests[0].headers
+        assert server.requests[1].headers["If-None-Match"] == '"v1"'
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+        assert cache.stats.bytes_saved == len(server.body)
+
+    @pytest.mark.asyncio
+    async def test_changed_resource_replaces_entry(self, tmp_path: Path) -> None:
+        """리소스가 바뀌면 새 본문으로 캐시를 갱신하는지 확인."""
+        server = FakeRedditServer()
+        cache = HTTPResponseCache(tmp_path)
+
+        async with make_client(server, cache) as client:
+            await client.get(LISTING_URL)
+            server.version = 2
+            server.body = b'{"data": {"children": [1]}}'
+            changed = await client.get_json(LISTING_URL)
+            cached = await client.get_json(LISTING_URL)
+
+        assert changed == cached == {"data": {"children": [1]}}
+        assert cache.stats.misses == 2
+        assert cache.stats.hits == 1
+        assert len(cache) == 1
+
+    @pytest.mark.asyncio
+    async def test_disk_io_runs_off_event_loop(self, tmp_path: Path) -> None:
+        """캐시 디스크 조회/저장이 이벤트 루프 스레드 밖에서 실행되는지 확인."""
+        server = FakeRedditServer()
+        loop_thread = threading.get_ident()
+        io_threads: list[int] = []
+
+        class RecordingCache(HTTPResponseCache):
+            def get(self, key: str) -> CachedResponse | None:
+                io_threads.append(threading.get_ident())
+                return super().get(key)
+
+            def store(self, key: str, response: httpx.Response) -> bool:
+                io_threads.append(threading.get_ident())
+                return super().store(key, response)
+
+        cache = RecordingCache(tmp_path)
+        async with make_client(server, cache) as client:
+            await client.get(LISTING_URL)
+            await client.get(LISTING_URL)
+
+        assert len(io_threads) == 3
+        assert loop_thread not in io_threads
+
+    @pytest.mark.asyncio
+    async def test_no_cache_sends_plain_requests(self) -> None:
+        """캐시가 없으면 조건부 헤더를 보내지 않는지 확인."""
+        server = FakeRedditServer()
+
+        async with make_client(server, None) as client:
+            await client.get(LISTING_URL)
+            await client.get(LISTING_URL)
+
+        assert all("If-None-Match" not in r.headers for r in server.requests)
+
+
+class TestRedditScraperWatermark:
+    """RedditScraper 워터마크 수집 테스트 클래스."""
+
+    @staticmethod
+    def _listing_handler(
+        pages: list[list[int]], requests: list[httpx.Request]
+    ) -> httpx.MockTransport:
+        """created_utc 목록 페이지를 순서대로 반환하는 transport."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            index = len(requests)
+            requests.append(request)
+            children = [
+                {
+                    "kind": "t3",
+                    "data": {
+                        "id": f"p{created}",
+                        "title": f"Post {created}",
+                        "author": "author",
+                        "subreddit": "python",
+                        "created_utc": created,
+                        "permalink": f"/r/python/comments/p{created}/",
+                        "url": "https://example.com",
+                    },
+                }
+                for created in pages[index]
+            ]
+            after = f"t3_page{index}" if index + 1 < len(pages) else None
+            return httpx.Response(
+                200, json={"kind": "Listing", "data": {"children": children, "after": after}}
+            )
+
+        return httpx.MockTransport(handler)
+
+    @pytest.mark.asyncio
+    async def test_get_new_stops_paging_at_watermark(self) -> None:
+        """워터마크를 지나는 페이지 이후 요청하지 않는지 확인."""
+        pages = [[1000, 990, 980], [970, 960, 950], [940, 930, 920]]
+        requests: list[httpx.Request] = []
+
+        client = ScrapingClient(
+            rate_limiter=RateLimiter(requests_per_minute=10_000, min_delay=0.0)
+        )
+        client._client = httpx.AsyncClient(transport=self._listing_handler(pages, requests))
+
+        async with RedditScraper(client) as scraper:
+            since = datetime.fromtimestamp(960, tz=UTC)
+            posts = await scraper.get_new("python", limit=100, since=since)
+        await client.close()
+
+        assert [p.id for p in posts] == ["p1000", "p990", "p980", "p970", "p960"]
+        assert len(requests) == 2
+
+    @pytest.mark.asyncio
+    async def test_get_new_without_watermark_reads_all_pages(self) -> None:
+        """워터마크가 없으면 기존처럼 limit까지 페이지를 읽는지 확인."""
+        pages = [[1000, 990], [980, 970], [960, 950]]
+        requests: list[httpx.Request] = []
+
+        client = ScrapingClient(
+            rate_limiter=RateLimiter(requests_per_minute=10_000, min_delay=0.0)
+        )
+        client._client = httpx.AsyncClient(transport=self._listing_handler(pages, requests))
+
+        async with RedditScraper(client) as scraper:
+            posts = await scraper.get_new("python", limit=100)
+        await client.close()
+
+        assert len(posts) == 6
+        assert len(requests) == 3
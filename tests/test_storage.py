@@ -0,0 +1,198 @@
+"""Storage 모듈 테스트.
+
+SQLite 연결 프로파일, Database 연결 설정, 게시물 스트리밍 조회 테스트를 포함한다.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from reddit_insight.pipeline import DataPipeline
+from reddit_insight.reddit.models import Post
+from reddit_insight.storage import (
+    DEFAULT_PROFILE,
+    PRODUCTION_PROFILE,
+    Database,
+    PostRepository,
+    SubredditRepository,
+    apply_sqlite_profile,
+    get_profile,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+    from pathlib import Path
+
+
+class TestSQLiteProfile:
+    """SQLiteProfile 테스트 클래스."""
+
+    def test_get_profile(self) -> None:
+        """이름으로 프로파일을 조회하는지 확인."""
+        assert get_profile("production") is PRODUCTION_PROFILE
+        assert get_profile("default") is DEFAULT_PROFILE
+
+        with pytest.raises(ValueError, match="Unknown SQLite profile"):
+            get_profile("turbo")
+
+    def test_default_profile_has_no_pragmas(self) -> None:
+        """default 프로파일은 SQLite 기본값을 유지하는지 확인."""
+        assert DEFAULT_PROFILE.pragmas() == []
+        assert DEFAULT_PROFILE.pragmas(read_only=True) == ["PRAGMA query_only=ON"]
+
+    def test_read_only_pragmas_skip_journal_mode(self) -> None:
+        """읽기 전용 연결은 journal_mode를 바꾸지 않는지 확인."""
+        pragmas = PRODUCTION_PROFILE.pragmas(read_only=True)
+
+        assert not any("journal_mode" in p for p in pragmas)
+        assert pragmas[-1] == "PRAGMA query_only=ON"
+
+    def test_production_profile_applied_on_connect(self, tmp_path: Path) -> None:
+        """connect 이벤트로 PRAGMA가 적용되는지 확인."""
+        engine = create_engine(f"sqlite:///{tmp_path / 'profile.db'}")
+        apply_sqlite_profile(engine, PRODUCTION_PROFILE)
+
+        with engine.connect() as conn:
+            assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+            assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+            assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 5000
+            assert conn.execute(text("PRAGMA cache_size")).scalar() == -65536
+        engine.dispose()
+
+    def test_read_only_engine_rejects_writes(self, tmp_path: Path) -> None:
+        """읽기 전용 연결에서 쓰기가 거부되는지 확인."""
+        url = f"sqlite:///{tmp_path / 'ro.db'}"
+        writer = create_engine(url)
+        apply_sqlite_profile(writer, PRODUCTION_PROFILE)
+        reader = create_engine(url)
+        apply_sqlite_profile(reader, PRODUCTION_PROFILE, read_only=True)
+
+        with writer.begin() as conn:
+            conn.execute(text("CREATE TABLE t (x INTEGER)"))
+            conn.execute(text("INSERT INTO t VALUES (1)"))
+
+        with reader.connect() as conn:
+            assert conn.execute(text("SELECT count(*) FROM t")).scalar() == 1
+            with pytest.raises(OperationalError):
+                conn.execute(text("INSERT INTO t VALUES (2)"))
+
+        writer.dispose()
+        reader.dispose()
+
+
+class TestDatabaseProfile:
+    """Database 연결 프로파일 테스트 클래스."""
+
+    @pytest.mark.asyncio
+    async def test_connect_applies_profile(self, tmp_path: Path) -> None:
+        """비동기 엔진 연결에도 프로파일이 적용되는지 확인."""
+        db = Database(
+            url=f"sqlite+aiosqlite:///{tmp_path / 'async.db'}",
+            profile=PRODUCTION_PROFILE,
+        )
+        await db.connect()
+        try:
+            async with db.session() as session:
+                mode = (await session.execute(text("PRAGMA journal_mode"))).scalar()
+                assert mode == "wal"
+        finally:
+            await db.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_default_profile_keeps_rollback_journal(self, tmp_path: Path) -> None:
+        """default 프로파일은 롤백 저널을 유지하는지 확인."""
+        db = Database(
+            url=f"sqlite+aiosqlite:///{tmp_path / 'plain.db'}",
+            profile=DEFAULT_PROFILE,
+        )
+        await db.connect()
+        try:
+            assert db.profile is DEFAULT_PROFILE
+            async with db.session() as session:
+                mode = (await session.execute(text("PRAGMA journal_mode"))).scalar()
+                assert mode == "delete"
+        finally:
+            await db.disconnect()
+
+
+class TestPostStreaming:
+    """PostRepository.stream_by_subreddit 테스트 클래스."""
+
+    POST_COUNT = 25
+
+    @pytest.fixture
+    async def database(self, tmp_path: Path) -> AsyncIterator[Database]:
+        """게시물이 저장된 임시 데이터베이스."""
+        db = Database(url=f"sqlite+aiosqlite:///{tmp_path / 'stream.db'}")
+        await db.connect()
+
+        base = datetime(2024, 1, 1, tzinfo=UTC)
+        posts = [
+            Post(
+                id=f"p{i}",
+                title=f"Post {i}",
+                selftext="" if i % 2 else f"body {i}",
+                author="tester",
+                subreddit="python",
+                score=i,
+                num_comments=i % 3,
+                created_utc=base + timedelta(minutes=i),
+                url=f"https://reddit.com/r/python/p{i}",
+                permalink=f"/r/python/comments/p{i}",
+            )
+            for i in range(self.POST_COUNT)
+        ]
+        await DataPipeline(db).process_posts(posts, "python")
+        yield db
+        await db.disconnect()
+
+    async def _stream(self, db: Database, **kwargs: object) -> list[list[Post]]:
+        async with db.session() as session:
+            subreddit = await SubredditRepository(session).get_by_name("python")
+            assert subreddit is not None
+            repo = PostRepository(session)
+            return [
+                chunk
+                async for chunk in repo.stream_by_subreddit(
+                    subreddit.id, subreddit.name, **kwargs
+                )
+            ]
+
+    @pytest.mark.asyncio
+    async def test_streams_in_chunks_newest_first(self, database: Database) -> None:
+        """chunk_size 단위로 최신순 게시물을 반환하는지 확인."""
+        chunks = await self._stream(database, chunk_size=10)
+
+        assert [len(c) for c in chunks] == [10, 10, 5]
+        ids = [p.id for chunk in chunks for p in chunk]
+        assert ids == [f"p{i}" for i in reversed(range(self.POST_COUNT))]
+
+    @pytest.mark.asyncio
+    async def test_projected_fields(self, database: Database) -> None:
+        """조회한 컬럼으로 Post 필드를 채우는지 확인."""
+        (first, *_), *_ = await self._stream(database, chunk_size=5)
+
+        assert first.id == "p24"
+        assert first.subreddit == "python"
+        assert first.selftext == "body 24"
+        assert first.score == 24
+        assert first.num_comments == 0
+        assert first.permalink == "/r/python/comments/p24"
+
+    @pytest.mark.asyncio
+    async def test_limit(self, database: Database) -> None:
+        """limit만큼만 스트리밍하는지 확인."""
+        chunks = await self._stream(database, limit=12, chunk_size=5)
+
+        assert [len(c) for c in chunks] == [5, 5, 2]
+
+    @pytest.mark.asyncio
+    async def test_invalid_chunk_size(self, database: Database) -> None:
+        """chunk_size가 1 미만이면 ValueError."""
+        with pytest.raises(ValueError):
+            await self._stream(database, chunk_size=0)